@@ -0,0 +1,163 @@
+# Import necessary packages here
+import argparse
+import gzip
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    archive_benchmark.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file compares the size and the export and import times of the task
+#          archive format with a copy of the raw database file and a gzip of it
+# Instruction: python benchmarks/archive_benchmark.py --tasks 1000000
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+WORDS = ["Mow", "lawn", "Pay", "bills", "Call", "Wash", "car", "Email", "report", "Fix"]
+
+
+def build_database(db_name: str, n_tasks: int, years: int) -> None:
+    """
+    Creates a database of tasks spread over a number of years, with the tasks
+    completed more than a year ago moved into tasks_archive
+
+    :param db_name: The name and path length to the SQLite database
+    :param n_tasks: The number of tasks to create
+    :param years: The number of years the tasks are spread over
+    """
+    database = ToDoDatabase(db_name)
+    database.open_db()
+    database.create_tasks_table()
+    database.remove_db()
+
+    rng = random.Random(42)
+    first = date.today() - timedelta(days=365 * years)
+
+    def rows():
+        for _ in range(n_tasks):
+            start = first + timedelta(days=rng.randrange(365 * years))
+            end = None
+            if rng.random() > 0.01:
+                end = (start + timedelta(days=rng.randrange(30))).isoformat()
+            task = " ".join(rng.choices(WORDS, k=rng.randrange(2, 6)))
+            yield task, start.isoformat(), end
+
+    connection = sqlite3.connect(db_name)
+    with connection:
+        connection.executemany(
+            "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);", rows()
+        )
+    connection.close()
+
+    database = ToDoDatabase(db_name)
+    database.open_db()
+    database.archive_tasks((date.today() - timedelta(days=365)).isoformat())
+    database.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def timed(func, *args) -> tuple[float, object]:
+    """
+    Calls func and returns the elapsed seconds and its result
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def gzip_file(source: str, dest: str) -> None:
+    """
+    Writes a gzip compressed copy of a file
+    """
+    with open(source, "rb") as file, gzip.open(dest, "wb", compresslevel=6) as output:
+        shutil.copyfileobj(file, output, 1 << 20)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def export_archive(db_name: str, dest: str) -> int:
+    """
+    Exports a database with ToDoDatabase.export_archive
+    """
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    success, message, count = database.export_archive(dest)
+    database.remove_db()
+    if not success:
+        raise RuntimeError(message)
+    return count
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def import_archive(db_name: str, source: str) -> int:
+    """
+    Imports an archive into a new database with ToDoDatabase.import_archive
+    """
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    success, message, count = database.import_archive(source)
+    database.remove_db()
+    if not success:
+        raise RuntimeError(message)
+    return count
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--years", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_name = os.path.join(directory, "benchmark.db")
+        build_database(db_name, args.tasks, args.years)
+        copy_name = os.path.join(directory, "copy.db")
+        gzip_name = os.path.join(directory, "benchmark.db.gz")
+        archive_name = os.path.join(directory, "benchmark.tda")
+        restored_name = os.path.join(directory, "restored.db")
+
+        copy_s, _ = timed(shutil.copyfile, db_name, copy_name)
+        gzip_s, _ = timed(gzip_file, db_name, gzip_name)
+        export_s, count = timed(export_archive, db_name, archive_name)
+        import_s, _ = timed(import_archive, restored_name, archive_name)
+        sizes = [os.path.getsize(name) for name in [db_name, gzip_name, archive_name]]
+
+    mb = 1024 * 1024
+    print(f"{count} tasks over {args.years} years")
+    print(f"Raw database: {sizes[0] / mb:8.2f} MB, copied in {copy_s:6.2f} s")
+    print(f"Gzip of file: {sizes[1] / mb:8.2f} MB, written in {gzip_s:6.2f} s")
+    print(f"Task archive: {sizes[2] / mb:8.2f} MB, written in {export_s:6.2f} s")
+    print(f"Import of the task archive into a new database: {import_s:6.2f} s")
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,119 @@
+# Import necessary packages here
+import argparse
+import os
+import tempfile
+import time
+
+from todo_six.database import TaskColumns, ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    backend_benchmark.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file compares the row throughput of large selects through the qt and
+#          sqlite3 storage backends, with and without the columnar fetch
+# Instruction: python benchmarks/backend_benchmark.py --tasks 1000000
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+def build_database(db_name: str, n_tasks: int) -> None:
+    """
+    Creates a database of tasks in which every other task has been completed
+
+    :param db_name: The name and path length to the SQLite database
+    :param n_tasks: The number of tasks to create
+    """
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    database.create_tasks_table()
+    rows = (
+        (f"Task {index}", "2023-01-01", None if index % 2 else "2023-02-01")
+        for index in range(n_tasks)
+    )
+    query = "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);"
+    success, message = database.db_executemany(query, rows)
+    database.remove_db()
+    if not success:
+        raise RuntimeError(message)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def result_bytes(result) -> int:
+    """
+    Returns the memory held by a dataframe or TaskColumns result
+    """
+    if isinstance(result, TaskColumns):
+        return result.task_id.nbytes + result.start_day.nbytes + result.end_day.nbytes
+    return int(result.memory_usage(deep=True).sum())
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def time_selects(
+    db_name: str, backend: str, repeats: int, columnar: bool = False
+) -> tuple[float, int, int]:
+    """
+    Times the open and closed task selects of a backend
+
+    :return: The best time in seconds to select every task, the number of rows and
+             the bytes held by the results
+    """
+    database = ToDoDatabase(db_name, backend=backend)
+    database.open_db()
+    best = float("inf")
+    rows = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        _, open_tasks, _ = database.select_open_tasks(columnar=columnar)
+        _, closed_tasks, _ = database.select_closed_tasks("ALL", columnar=columnar)
+        best = min(best, time.perf_counter() - start)
+        rows = len(open_tasks) + len(closed_tasks)
+    size = result_bytes(open_tasks) + result_bytes(closed_tasks)
+    database.remove_db()
+    return best, rows, size
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_name = os.path.join(directory, "benchmark.db")
+        start = time.perf_counter()
+        build_database(db_name, args.tasks)
+        print(f"Built {args.tasks} tasks in {time.perf_counter() - start:.1f} s")
+
+        results = {}
+        for backend in ["qt", "sqlite3"]:
+            for columnar in [False, True]:
+                label = f"{backend} {'columnar' if columnar else 'rows'}"
+                results[label] = time_selects(db_name, backend, args.repeats, columnar)
+
+    for label, (seconds, rows, size) in results.items():
+        rate = rows / seconds
+        print(f"{label:18s} {seconds:8.3f} s {rate:14,.0f} rows/s {size / 1e6:8.1f} MB")
+    speed_up = results["qt rows"][0] / results["sqlite3 rows"][0]
+    print(f"sqlite3 speed up: {speed_up:.1f}x")
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
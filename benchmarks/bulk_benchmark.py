@@ -0,0 +1,109 @@
+# Import necessary packages here
+import argparse
+import os
+import tempfile
+import time
+
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    bulk_benchmark.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file times the retirement and deletion of many selected tasks one at a
+#          time, each followed by the full refresh the Tab used to make, and in bulk
+# Instruction: python benchmarks/bulk_benchmark.py --tasks 5000 --selected 500
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+def build_database(db_name: str, n_tasks: int) -> ToDoDatabase:
+    """
+    Creates a database of open tasks
+
+    :param db_name: The name and path length to the SQLite database
+    :param n_tasks: The number of tasks to create
+    :return: The open ToDoDatabase object
+    """
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    database.create_tasks_table()
+    database.db_executemany(
+        "INSERT INTO tasks (task, start_date) VALUES (?, date('now'));",
+        [(f"Task {index}",) for index in range(n_tasks)],
+    )
+    return database
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def one_at_a_time(database: ToDoDatabase, task_ids: list[int]) -> float:
+    """
+    Completes and then deletes each task with its own transaction and reads both
+    lists after each change
+
+    :return: The elapsed time in milliseconds
+    """
+    start = time.perf_counter()
+    for method in (database.complete_task, database.delete_task):
+        for task_id in task_ids:
+            method(task_id)
+            database.select_open_tasks()
+            database.select_closed_tasks("DAY")
+    return (time.perf_counter() - start) * 1000
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def in_bulk(database: ToDoDatabase, task_ids: list[int]) -> float:
+    """
+    Completes and then deletes the tasks with one call each
+
+    :return: The elapsed time in milliseconds
+    """
+    start = time.perf_counter()
+    for method in (database.complete_tasks, database.delete_tasks):
+        success, message = method(task_ids)
+        if not success:
+            raise RuntimeError(message)
+    return (time.perf_counter() - start) * 1000
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--selected", type=int, default=500)
+    args = parser.parse_args()
+
+    task_ids = list(range(1, args.selected + 1))
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        for name, run in [("one at a time", one_at_a_time), ("in bulk", in_bulk)]:
+            database = build_database(
+                os.path.join(directory, f"{run.__name__}.db"), args.tasks
+            )
+            results[name] = run(database, task_ids)
+            database.remove_db()
+
+    print(f"Retire and delete {args.selected} of {args.tasks} tasks:")
+    for name, elapsed in results.items():
+        print(f"  {name:14s} {elapsed:10.1f} ms")
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
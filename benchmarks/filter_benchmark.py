@@ -0,0 +1,184 @@
+# Import necessary packages here
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    filter_benchmark.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file times the filtered and sorted select of open tasks on a large
+#          database, and the same sorts read from the table without the covering indexes
+# Instruction: python benchmarks/filter_benchmark.py --tasks 1000000 --open 0.02
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+TAGS = ["garden", "bills", "errands", "work", "house", "car", "health", "family"]
+FILTERS = {
+    "all, added": {},
+    "all, priority": {"order_by": "priority"},
+    "all, due date": {"order_by": "due"},
+    "high, due date": {"priority": "high", "order_by": "due"},
+    "due this week": {"due_by": (date.today() + timedelta(days=6)).isoformat()},
+    "tag, priority": {"tag": "garden", "order_by": "priority"},
+}
+
+
+def build_database(db_name: str, n_tasks: int, open_share: float) -> None:
+    """
+    Creates a database of tasks with random priorities, due dates and tags, of which
+    a share is still open, and refreshes the planner statistics as the maintenance
+    scheduler does
+
+    :param db_name: The name and path length to the SQLite database
+    :param n_tasks: The number of tasks to create
+    :param open_share: The share of the tasks that are still open
+    """
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    database.create_tasks_table()
+    database.remove_db()
+
+    rng = random.Random(42)
+    today = date.today()
+
+    def rows():
+        for index in range(n_tasks):
+            end = None if rng.random() < open_share else "2024-01-02"
+            due = None
+            if rng.random() < 0.5:
+                due = (today + timedelta(days=rng.randrange(-30, 60))).isoformat()
+            yield f"Task {index}", "2024-01-01", end, rng.randrange(4), due
+
+    connection = sqlite3.connect(db_name)
+    with connection:
+        connection.executemany(
+            "INSERT INTO tasks (task, start_date, end_date, priority, due_date) "
+            "VALUES (?, ?, ?, ?, ?);",
+            rows(),
+        )
+        connection.executemany(
+            "INSERT INTO tags (name) VALUES (?);", [(tag,) for tag in TAGS]
+        )
+        connection.execute(
+            "INSERT INTO task_tags (tag_id, task_id) SELECT abs(random()) % 8 + 1, "
+            "task_id FROM tasks WHERE end_date IS NULL;"
+        )
+    connection.execute("ANALYZE;")
+    connection.close()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def time_filters(db_name: str, repeats: int) -> dict[str, tuple[float, int]]:
+    """
+    Times ToDoDatabase.select_filtered_tasks for each entry of FILTERS
+
+    :return: A dictionary of the median time in milliseconds and the number of
+             tasks selected
+    """
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    results = {}
+    for name, filters in FILTERS.items():
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            _, df, _ = database.select_filtered_tasks(**filters)
+            times.append((time.perf_counter() - start) * 1000)
+        results[name] = statistics.median(times), len(df)
+    database.remove_db()
+    return results
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def time_query(db_name: str, query: str, repeats: int) -> float:
+    """
+    Times a query run with the sqlite3 module, without building a dataframe
+
+    :return: The median time in milliseconds
+    """
+    connection = sqlite3.connect(db_name)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        connection.execute(query).fetchall()
+        times.append((time.perf_counter() - start) * 1000)
+    connection.close()
+    return statistics.median(times)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def time_sorts(db_name: str, repeats: int) -> dict[str, tuple[float, float]]:
+    """
+    Times the sorted selects of the open tasks read from their covering index and
+    read through the end date index with a sort in a temporary b-tree
+
+    :return: A dictionary of the two median times in milliseconds for each order
+    """
+    results = {}
+    for name, order_by in [
+        ("added", "task_id"),
+        ("priority", "priority DESC, task_id"),
+        ("due date", "due_date NULLS LAST, task_id"),
+    ]:
+        query = (
+            "SELECT task_id, task, priority, due_date FROM tasks{} "
+            f"WHERE end_date IS NULL ORDER BY {order_by};"
+        )
+        results[name] = (
+            time_query(db_name, query.format(""), repeats),
+            time_query(db_name, query.format(" INDEXED BY tasks_end_date"), repeats),
+        )
+    return results
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--open", type=float, default=0.02)
+    parser.add_argument("--repeats", type=int, default=25)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_name = os.path.join(directory, "filters.db")
+        build_database(db_name, args.tasks, args.open)
+        results = time_filters(db_name, args.repeats)
+        sorts = time_sorts(db_name, args.repeats)
+
+    print(f"{args.tasks} tasks, {args.open:.0%} open")
+    print("select_filtered_tasks, including the dataframe:")
+    for name, (elapsed, count) in results.items():
+        print(f"  {name:16s} {elapsed:8.3f} ms, {count} tasks")
+    print("SQL of every open task, covering index / end date index and sort:")
+    for name, (covering_ms, sorted_ms) in sorts.items():
+        print(f"  by {name:13s} {covering_ms:8.3f} ms / {sorted_ms:8.3f} ms")
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,122 @@
+# Import necessary packages here
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    interval_index_benchmark.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file compares point-in-time history queries served by the tasks_interval
+#          index with the full table scan used by databases without the index
+# Instruction: python benchmarks/interval_index_benchmark.py --tasks 1000000
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+def build_database(db_name: str, n_tasks: int, years: int) -> None:
+    """
+    Creates a database of tasks spread over a number of years.  Most tasks are
+    closed within a few weeks and a small fraction are never closed.
+
+    :param db_name: The name and path length to the SQLite database
+    :param n_tasks: The number of tasks to create
+    :param years: The number of years the tasks are spread over
+    """
+    database = ToDoDatabase(db_name)
+    database.open_db()
+    database.create_tasks_table()
+    database.remove_db()
+
+    rng = random.Random(42)
+    first = date.today() - timedelta(days=365 * years)
+
+    def rows():
+        for index in range(n_tasks):
+            start = first + timedelta(days=rng.randrange(365 * years))
+            end = None
+            if rng.random() > 0.01:
+                end = (start + timedelta(days=rng.randrange(30))).isoformat()
+            yield f"Task {index}", start.isoformat(), end
+
+    # The stdlib driver is used for bulk loading; the triggers keep the index in sync
+    connection = sqlite3.connect(db_name)
+    with connection:
+        connection.executemany(
+            "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);", rows()
+        )
+    connection.close()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def time_queries(query_func, dates: list[str]) -> tuple[float, int]:
+    """
+    Times a query function over a list of dates
+
+    :return: The mean time per query in milliseconds and the total rows returned
+    """
+    rows = 0
+    start = time.perf_counter()
+    for day in dates:
+        success, df, message = query_func(day)
+        if not success:
+            raise RuntimeError(message)
+        rows += len(df)
+    return (time.perf_counter() - start) * 1000 / len(dates), rows
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_name = os.path.join(directory, "benchmark.db")
+        start = time.perf_counter()
+        build_database(db_name, args.tasks, args.years)
+        print(f"Built {args.tasks} tasks in {time.perf_counter() - start:.1f} s")
+
+        rng = random.Random(7)
+        first = date.today() - timedelta(days=365 * args.years)
+        dates = [
+            (first + timedelta(days=rng.randrange(365 * args.years))).isoformat()
+            for _ in range(args.queries)
+        ]
+
+        database = ToDoDatabase(db_name)
+        database.open_db()
+        indexed_ms, indexed_rows = time_queries(database.get_former_open_tasks, dates)
+        scan_ms, scan_rows = time_queries(database._scan_former_open_tasks, dates)
+        database.remove_db()
+
+    assert indexed_rows == scan_rows
+    print(f"Interval index: {indexed_ms:8.2f} ms per query")
+    print(f"Table scan:     {scan_ms:8.2f} ms per query")
+    print(f"Speed up:       {scan_ms / indexed_ms:8.1f}x ({indexed_rows} rows returned)")
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
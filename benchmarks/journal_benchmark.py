@@ -0,0 +1,145 @@
+# Import necessary packages here
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    journal_benchmark.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file times task inserts, completions and deletions with and without the
+#          undo journal, the undo of every operation and the space the journal uses
+# Instruction: python benchmarks/journal_benchmark.py --operations 5000
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+def open_database(db_name: str, journal: bool) -> ToDoDatabase:
+    """
+    Creates a database and drops its journal table if the journal is not wanted
+
+    :param db_name: The name and path length to the SQLite database
+    :param journal: False to drop the journal table
+    :return: The open ToDoDatabase object
+    """
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    database.create_tasks_table()
+    database.remove_db()
+    if not journal:
+        connection = sqlite3.connect(db_name)
+        connection.execute("DROP TABLE journal;")
+        connection.close()
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    return database
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def time_operations(database: ToDoDatabase, n_operations: int) -> dict[str, float]:
+    """
+    Times the insert, completion and deletion of tasks in one outer transaction, so
+    the times measure the statements rather than the disk syncs
+
+    :return: A dictionary of the time per operation in microseconds
+    """
+    results = {}
+    database.con.transaction()
+    start = time.perf_counter()
+    task_ids = [database.insert_task(f"Task {index}")[2] for index in range(n_operations)]
+    results["insert"] = time.perf_counter() - start
+    start = time.perf_counter()
+    half = n_operations // 2
+    for task_id in task_ids[:half]:
+        database.complete_task(task_id)
+    results["complete"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for task_id in task_ids[half:]:
+        database.delete_task(task_id)
+    results["delete"] = time.perf_counter() - start
+    database.con.commit()
+    counts = {"insert": n_operations, "complete": half, "delete": n_operations - half}
+    return {name: elapsed * 1e6 / counts[name] for name, elapsed in results.items()}
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def time_undo(database: ToDoDatabase, n_operations: int) -> float:
+    """
+    Times the undo of every operation of the journal, one by one
+
+    :return: The time per undo in microseconds
+    """
+    database.con.transaction()
+    start = time.perf_counter()
+    for _ in range(n_operations):
+        success, message, _ = database.undo()
+        if not success:
+            raise RuntimeError(message)
+    elapsed = time.perf_counter() - start
+    database.con.commit()
+    return elapsed * 1e6 / n_operations
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def journal_bytes(db_name: str) -> int:
+    """
+    Returns the bytes used by the journal table and its index
+    """
+    connection = sqlite3.connect(db_name)
+    query = "SELECT SUM(pgsize) FROM dbstat WHERE name IN ('journal', 'journal_undone');"
+    size = connection.execute(query).fetchone()[0]
+    connection.close()
+    return size or 0
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operations", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        for journal in (False, True):
+            db_name = os.path.join(directory, f"journal_{journal}.db")
+            database = open_database(db_name, journal)
+            results[journal] = time_operations(database, args.operations)
+            if journal:
+                recorded = 2 * args.operations
+                undo_us = time_undo(database, recorded)
+                size = journal_bytes(db_name)
+            database.remove_db()
+
+    print(f"{args.operations} tasks, time per operation without / with the journal:")
+    for name in ("insert", "complete", "delete"):
+        print(
+            f"  {name:9s} {results[False][name]:8.1f} us / {results[True][name]:8.1f} us"
+        )
+    print(f"Undo of {recorded} operations: {undo_us:8.1f} us each")
+    print(f"Journal size: {size / recorded:.1f} bytes per operation")
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
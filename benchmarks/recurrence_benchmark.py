@@ -0,0 +1,143 @@
+# Import necessary packages here
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    recurrence_benchmark.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file times the daily materialization of recurring tasks across many
+#          databases, and the read of the due rules with and without the next_due index
+# Instruction: python benchmarks/recurrence_benchmark.py --databases 20 --rules 5000
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+FREQUENCIES = ["DAY", "WEEK", "WEEK", "MONTH", "MONTH", "YEAR"]
+
+
+def build_database(db_name: str, n_rules: int, seed: int) -> None:
+    """
+    Creates a database of recurrence rules whose next occurrences are spread over
+    the coming year, as they are once the rules have been running for a while
+
+    :param db_name: The name and path length to the SQLite database
+    :param n_rules: The number of rules to create
+    :param seed: The seed of the random rules
+    """
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    database.create_tasks_table()
+    database.remove_db()
+
+    rng = random.Random(seed)
+    today = date.today()
+
+    def rows():
+        for index in range(n_rules):
+            frequency = rng.choice(FREQUENCIES)
+            horizon = {"DAY": 1, "WEEK": 7, "MONTH": 30, "YEAR": 365}[frequency]
+            next_due = today + timedelta(days=rng.randrange(horizon))
+            anchor = next_due - timedelta(days=horizon * 4)
+            yield f"Chore {index}", frequency, anchor.isoformat(), next_due.isoformat()
+
+    connection = sqlite3.connect(db_name)
+    with connection:
+        connection.executemany(
+            "INSERT INTO recurrences (task, frequency, interval, anchor, next_due) "
+            "VALUES (?, ?, 1, ?, ?);",
+            rows(),
+        )
+    connection.close()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def time_due_read(db_name: str, indexed: bool, repeats: int) -> float:
+    """
+    Times the read of the rules due today
+
+    :return: The median time in milliseconds
+    """
+    hint = "" if indexed else " NOT INDEXED"
+    query = f"SELECT * FROM recurrences{hint} WHERE next_due <= ?;"
+    connection = sqlite3.connect(db_name)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        connection.execute(query, (date.today().isoformat(),)).fetchall()
+        times.append((time.perf_counter() - start) * 1000)
+    connection.close()
+    return statistics.median(times)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def materialize(db_names: list[str]) -> tuple[float, int]:
+    """
+    Runs ToDoDatabase.materialize_recurrences on every database
+
+    :return: The elapsed time in milliseconds and the number of tasks added
+    """
+    total = 0
+    start = time.perf_counter()
+    for db_name in db_names:
+        database = ToDoDatabase(db_name, backend="sqlite3")
+        database.open_db()
+        success, message, count = database.materialize_recurrences()
+        database.remove_db()
+        if not success:
+            raise RuntimeError(message)
+        total += count
+    return (time.perf_counter() - start) * 1000, total
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--databases", type=int, default=20)
+    parser.add_argument("--rules", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=25)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_names = []
+        for index in range(args.databases):
+            db_name = os.path.join(directory, f"chores_{index}.db")
+            build_database(db_name, args.rules, index)
+            db_names.append(db_name)
+        indexed_ms = time_due_read(db_names[0], True, args.repeats)
+        scan_ms = time_due_read(db_names[0], False, args.repeats)
+        first_ms, first_count = materialize(db_names)
+        second_ms, second_count = materialize(db_names)
+
+    rules = args.databases * args.rules
+    print(f"Due rule read, indexed:   {indexed_ms:8.3f} ms ({args.rules} rules)")
+    print(f"Due rule read, full scan: {scan_ms:8.3f} ms")
+    print(f"Materialize {rules} rules: {first_ms:8.1f} ms, {first_count} tasks added")
+    print(f"Second run the same day: {second_ms:8.1f} ms, {second_count} tasks added")
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,140 @@
+# Import necessary packages here
+import argparse
+import http.client
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+
+from todo_six.database import ToDoDatabase
+from todo_six.server import TaskServer
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    server_load.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file measures the requests per second served by the todo_six server
+#          against a synthetic database, with a configurable mix of reads and writes
+# Instruction: python benchmarks/server_load.py --clients 8 --seconds 10
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+def build_database(db_name: str, n_tasks: int, n_open: int) -> None:
+    """
+    Creates a database of completed tasks and a smaller number of open tasks
+
+    :param db_name: The name and path length to the SQLite database
+    :param n_tasks: The number of tasks to create
+    :param n_open: The number of those tasks that are still open
+    """
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    database.create_tasks_table()
+    rows = (
+        (f"Task {index}", "2023-01-01", None if index < n_open else "2023-02-01")
+        for index in range(n_tasks)
+    )
+    query = "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);"
+    success, message = database.db_executemany(query, rows)
+    database.remove_db()
+    if not success:
+        raise RuntimeError(message)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def run_client(
+    address: tuple, seconds: float, write_ratio: float, seed: int, latencies: list
+) -> None:
+    """
+    Sends requests over one keep-alive connection until the time runs out.  Writes
+    insert a task and complete it, reads select the open tasks.
+    """
+    rng = random.Random(seed)
+    connection = http.client.HTTPConnection(*address)
+    headers = {"Content-Type": "application/json"}
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        if rng.random() < write_ratio:
+            body = json.dumps({"task": f"Load {seed}"})
+            connection.request("POST", "/databases/load/tasks", body, headers)
+            task_id = json.loads(connection.getresponse().read())["task_id"]
+            connection.request("POST", f"/databases/load/tasks/{task_id}/complete")
+            connection.getresponse().read()
+        else:
+            connection.request("GET", "/databases/load/tasks/open")
+            connection.getresponse().read()
+        latencies.append(time.perf_counter() - start)
+    connection.close()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--open", type=int, default=100)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_name = os.path.join(directory, "load.db")
+        build_database(db_name, args.tasks, args.open)
+        server = TaskServer([db_name], port=0, readers=args.readers)
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.start()
+
+        latencies = [[] for _ in range(args.clients)]
+        clients = [
+            threading.Thread(
+                target=run_client,
+                args=(
+                    server.server_address[:2],
+                    args.seconds,
+                    args.write_ratio,
+                    index,
+                    latencies[index],
+                ),
+            )
+            for index in range(args.clients)
+        ]
+        start = time.perf_counter()
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        elapsed = time.perf_counter() - start
+
+        server.shutdown()
+        server.server_close()
+        server_thread.join()
+
+    samples = sorted(latency for client in latencies for latency in client)
+    p50 = samples[len(samples) // 2] * 1000
+    p99 = samples[int(len(samples) * 0.99)] * 1000
+    print(f"{len(samples)} requests from {args.clients} clients in {elapsed:.1f} s")
+    print(f"Throughput: {len(samples) / elapsed:10.0f} requests/s")
+    print(f"Latency:    {p50:10.2f} ms p50 {p99:8.2f} ms p99")
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,148 @@
+# Import necessary packages here
+import argparse
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QApplication
+
+from todo_six.database import ToDoDatabase
+from todo_six.widgets import Tab
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    tab_open_benchmark.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file times the creation of a Tab for an existing database, comparing
+#          ToDoDatabase.bootstrap with the separate calls it replaces and with the
+#          read-only and immutable open modes
+# Instruction: python benchmarks/tab_open_benchmark.py --tasks 100000
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+def build_database(db_name: str, n_tasks: int) -> None:
+    """
+    Creates a database in which one task in a hundred is still open
+
+    :param db_name: The name and path length to the SQLite database
+    :param n_tasks: The number of tasks to create
+    """
+    database = ToDoDatabase(db_name)
+    database.open_db()
+    database.create_tasks_table()
+    database.remove_db()
+
+    rows = (
+        (f"Task {index}", "2023-01-01", None if index % 100 == 0 else "2023-02-01")
+        for index in range(n_tasks)
+    )
+    connection = sqlite3.connect(db_name)
+    with connection:
+        connection.executemany(
+            "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);", rows
+        )
+    connection.close()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def separate_calls(database: ToDoDatabase) -> None:
+    """
+    The sequence of calls made before bootstrap, each in its own transaction
+    """
+    database.create_tasks_table()
+    database.get_oldest_date()
+    database.select_open_tasks()
+    database.select_closed_tasks("DAY")
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def bootstrap(database: ToDoDatabase) -> None:
+    """
+    The single call that replaces separate_calls
+    """
+    success, _, message = database.bootstrap("DAY", create=False)
+    if not success:
+        raise RuntimeError(message)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def open_tab(database: ToDoDatabase) -> None:
+    """
+    Creates a Tab for the database and stops its timers
+    """
+    tab = Tab(QFont(), "benchmark", database)
+    tab.monitor.stop()
+    tab.maintenance.stop()
+    tab.deleteLater()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def time_open(db_name: str, func, repeats: int, **options) -> float:
+    """
+    Times a fresh connection to the database followed by func
+
+    :param options: The read_only and immutable arguments of ToDoDatabase
+    :return: The median time in milliseconds
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        database = ToDoDatabase(db_name, **options)
+        database.open_db()
+        func(database)
+        times.append((time.perf_counter() - start) * 1000)
+        database.remove_db()
+    return statistics.median(times)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=25)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    with tempfile.TemporaryDirectory() as directory:
+        db_name = os.path.join(directory, "benchmark.db")
+        build_database(db_name, args.tasks)
+        separate_ms = time_open(db_name, separate_calls, args.repeats)
+        bootstrap_ms = time_open(db_name, bootstrap, args.repeats)
+        tab_ms = time_open(db_name, open_tab, args.repeats)
+        read_only_ms = time_open(db_name, bootstrap, args.repeats, read_only=True)
+        immutable_ms = time_open(db_name, bootstrap, args.repeats, immutable=True)
+        app.processEvents()
+
+    print(f"Separate calls: {separate_ms:8.2f} ms")
+    print(f"Bootstrap:      {bootstrap_ms:8.2f} ms")
+    print(f"Tab creation:   {tab_ms:8.2f} ms ({args.tasks} tasks)")
+    print(f"Read-only:      {read_only_ms:8.2f} ms")
+    print(f"Immutable:      {immutable_ms:8.2f} ms")
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,146 @@
+# Import necessary packages here
+import math
+
+import numpy as np
+import pytest
+
+from todo_six.analytics import (
+    NULL_DAY,
+    count_completed_per_period,
+    count_open_on_date,
+    file_statistics,
+    read_task_days,
+    scan_directory,
+    to_day_number,
+)
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    analytics_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the functions and classes in the analytics.py file
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+TEST_DIRECTORY = "data/test"
+
+
+@pytest.mark.analytics
+def test_count_open_on_date():
+    start = np.array([to_day_number("2023-06-01")] * 3, dtype=np.int64)
+    end = np.array(
+        [to_day_number("2023-06-05"), to_day_number("2023-06-10"), NULL_DAY],
+        dtype=np.int64,
+    )
+    assert count_open_on_date(start, end, to_day_number("2023-05-31")) == 0
+    assert count_open_on_date(start, end, to_day_number("2023-06-05")) == 2
+    assert count_open_on_date(start, end, to_day_number("2023-06-20")) == 1
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.analytics
+def test_count_completed_per_period():
+    end = np.array(
+        [
+            to_day_number("2023-06-14"),
+            to_day_number("2023-06-16"),
+            to_day_number("2023-07-01"),
+            NULL_DAY,
+        ],
+        dtype=np.int64,
+    )
+    assert count_completed_per_period(end, "MONTH") == {"2023-06": 2, "2023-07": 1}
+    assert count_completed_per_period(end, "WEEK") == {"2023-06-12": 2, "2023-06-26": 1}
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.analytics
+def test_file_statistics():
+    success, stats, _ = file_statistics(
+        f"{TEST_DIRECTORY}/house_chores.db", on_date="2023-06-14"
+    )
+    assert success
+    assert stats.tasks == 5
+    assert stats.completed_tasks == 3
+    assert stats.open_on_date == 2
+    assert stats.mean_time_to_close == 0.0
+    assert stats.completed_per_period == {"2023-06": 3}
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.analytics
+def test_read_task_days_includes_archive(tmp_path):
+    db_name = str(tmp_path / "archived.db")
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    database.create_tasks_table()
+    query = "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);"
+    database.db_query(query, ("Old", "2023-05-20", "2023-05-25"))
+    database.db_query(query, ("Open", "2023-06-01", None))
+    database.archive_tasks("2023-06-01")
+    database.remove_db()
+    start, end = read_task_days(db_name)
+    assert sorted(start) == [to_day_number("2023-05-20"), to_day_number("2023-06-01")]
+    assert sorted(end) == [NULL_DAY, to_day_number("2023-05-25")]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.analytics
+def test_scan_directory_skips_bad_rows_and_files(tmp_path):
+    directory = tmp_path / "100% #chores?"
+    directory.mkdir()
+    database = ToDoDatabase(str(directory / "chores.db"), backend="sqlite3")
+    database.open_db()
+    database.create_tasks_table()
+    query = "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);"
+    database.db_query(query, ("Mow lawn", "2023-06-01", "2023-06-02"))
+    database.db_query(query, ("Wash car", "June 3rd", None))
+    database.remove_db()
+    (directory / "broken.db").write_bytes(b"not a database" * 100)
+
+    success, result, _ = scan_directory(str(directory), max_workers=2)
+    assert not success
+    assert result["total"].tasks == 1
+    assert list(result["errors"]) == [str(directory / "broken.db")]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.analytics
+def test_scan_directory():
+    success, result, _ = scan_directory(TEST_DIRECTORY, max_workers=2)
+    assert success
+    total = result["total"]
+    assert total.files == 5
+    assert total.tasks == 14
+    assert total.completed_tasks == 7
+    assert total.open_tasks == 7
+    assert len(result["files"]) == 5
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.analytics
+def test_empty_database_statistics():
+    success, stats, _ = file_statistics(f"{TEST_DIRECTORY}/test_two.db")
+    assert success
+    assert stats.tasks == 0
+    assert math.isnan(stats.mean_time_to_close)
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
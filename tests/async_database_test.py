@@ -0,0 +1,106 @@
+# Import necessary packages here
+import asyncio
+import sqlite3
+
+import pytest
+
+from todo_six.async_database import AsyncToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    async_database_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the methods and classes in the async_database.py file
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+@pytest.mark.asyncdatabase
+@pytest.mark.parametrize("backend", ["qt", "sqlite3"])
+def test_async_insert_and_select(tmp_path, backend):
+    async def session():
+        db_name = str(tmp_path / "async_test.db")
+        async with AsyncToDoDatabase(db_name, readers=2, backend=backend) as db:
+            success, _ = await db.create_tasks_table()
+            assert success
+            for task in ["Mow lawn", "Wash car", "Clean gutters"]:
+                success, _, _ = await db.insert_task(task)
+                assert success
+            success, _ = await db.complete_task(2)
+            assert success
+            return await asyncio.gather(
+                db.select_open_tasks(),
+                db.select_closed_tasks("ALL"),
+                db.table_exists("tasks"),
+            )
+
+    open_tasks, closed_tasks, exists = asyncio.run(session())
+    assert open_tasks[1]["task"].tolist() == ["Mow lawn", "Clean gutters"]
+    assert closed_tasks[1]["task"].tolist() == ["Wash car"]
+    assert exists[0]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.asyncdatabase
+def test_async_concurrent_reads(tmp_path):
+    async def session():
+        async with AsyncToDoDatabase(str(tmp_path / "async_test.db"), readers=3) as db:
+            await db.create_tasks_table()
+            await db.insert_task("Mow lawn")
+            results = await asyncio.gather(*(db.select_open_tasks() for _ in range(12)))
+            rows = await db.db_query("SELECT task FROM tasks;")
+        return results, rows
+
+    results, rows = asyncio.run(session())
+    assert all(len(df) == 1 for _, df, _ in results)
+    assert rows[1] == [("Mow lawn",)]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.asyncdatabase
+def test_async_backup_runs_beside_writes(tmp_path):
+    dest = str(tmp_path / "copy.db")
+
+    async def session():
+        async with AsyncToDoDatabase(str(tmp_path / "async_test.db"), readers=2) as db:
+            await db.create_tasks_table()
+            await db.insert_task("Mow lawn")
+            return await asyncio.gather(
+                db.backup(dest, pages_per_step=1, sleep=0),
+                db.insert_task("Wash car"),
+            )
+
+    (success, _), (inserted, _, _) = asyncio.run(session())
+    assert success and inserted
+    connection = sqlite3.connect(dest)
+    tasks = [row[0] for row in connection.execute("SELECT task FROM tasks;")]
+    connection.close()
+    assert tasks[0] == "Mow lawn"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.asyncdatabase
+def test_async_close_twice(tmp_path):
+    async def session():
+        db = AsyncToDoDatabase(str(tmp_path / "async_test.db"), readers=2)
+        await db.open_db()
+        first = await db.close_db()
+        second = await db.close_db()
+        return first, second
+
+    first, second = asyncio.run(session())
+    assert first[0]
+    assert not second[0]
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
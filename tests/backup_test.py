@@ -0,0 +1,136 @@
+# Import necessary packages here
+import os
+import sqlite3
+
+import pytest
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from todo_six.backup import BackupScheduler, list_backups, rolling_backup
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    backup_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests SQLiteManager.backup and the functions and classes in the
+#          backup.py file
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+# Enough tasks to span many pages
+TASKS = [(f"Task {index} " + "x" * 100, "2023-01-01", None) for index in range(2000)]
+
+
+@pytest.mark.backup
+@pytest.mark.parametrize("backend", ["qt", "sqlite3"])
+def test_backup_copies_database(tmp_path, backend, task_database, read_tasks):
+    database = task_database("tasks.db", TASKS, backend)
+    db_name = database.db_name
+    dest = str(tmp_path / "copy.db")
+    steps = []
+    success, _ = database.backup(dest, 8, 0, lambda left, total: steps.append(left))
+    database.remove_db()
+    assert success
+    assert len(steps) > 1 and steps[-1] == 0
+    assert not os.path.exists(f"{dest}.part")
+    assert read_tasks(dest) == read_tasks(db_name)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.backup
+def test_backup_does_not_block_writers(tmp_path, task_database, read_tasks):
+    database = task_database("busy.db", TASKS, "qt")
+    db_name = database.db_name
+    dest = str(tmp_path / "copy.db")
+    writer = sqlite3.connect(db_name, timeout=0, isolation_level=None)
+    written = []
+
+    def write(remaining, total):
+        if not written:
+            # Fails with "database is locked" if the backup holds its lock
+            writer.execute("INSERT INTO tasks (task) VALUES ('Written during backup');")
+            written.append(remaining)
+
+    success, _ = database.backup(dest, 4, 0, write)
+    writer.close()
+    database.remove_db()
+    assert success
+    assert written
+    assert read_tasks(dest) == read_tasks(db_name)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.backup
+def test_backup_finishes_under_constant_writes(tmp_path, task_database, read_tasks):
+    database = task_database("busy.db", TASKS, "qt")
+    db_name = database.db_name
+    dest = str(tmp_path / "copy.db")
+    writer = sqlite3.connect(db_name, timeout=0, isolation_level=None)
+
+    def write(remaining, total):
+        if remaining > 0:
+            writer.execute("INSERT INTO tasks (task) VALUES ('Written during backup');")
+
+    success, _ = database.backup(dest, 4, 0, write, max_restarts=2)
+    writer.close()
+    database.remove_db()
+    assert success
+    assert read_tasks(dest) == read_tasks(db_name)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.backup
+def test_rolling_backup_keeps_recent(tmp_path, task_database, read_tasks):
+    directory = tmp_path / "backups"
+    directory.mkdir()
+    for stamp in ["20240101-000000", "20250101-000000", "20250601-120000"]:
+        (directory / f"tasks-{stamp}.db").write_bytes(b"")
+    (directory / "notes-20200101-000000.db").write_bytes(b"")
+    database = task_database("tasks.db", TASKS)
+
+    success, dest, _ = rolling_backup(database, str(directory), keep=2)
+    database.remove_db()
+    assert success
+    backups = list_backups(str(tmp_path / "tasks.db"), str(directory))
+    assert [os.path.basename(name) for name in backups] == [
+        "tasks-20250601-120000.db",
+        os.path.basename(dest),
+    ]
+    assert (directory / "notes-20200101-000000.db").exists()
+    assert len(read_tasks(dest)["tasks"]) == 2000
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.backup
+def test_scheduler_publishes_backup(tmp_path, capsys, task_database, read_tasks):
+    app = QApplication.instance() or QApplication([])
+    database = task_database("scheduled.db", TASKS)
+    database.remove_db()
+    db_name = database.db_name
+    thread_pool = QThreadPool()
+    scheduler = BackupScheduler(str(tmp_path / "backups"), thread_pool=thread_pool)
+    backups = []
+    scheduler.finished.connect(backups.append)
+    scheduler.add_database(db_name)
+    scheduler.run_now()
+    thread_pool.waitForDone()
+    app.processEvents()
+    assert len(backups) == 1
+    assert read_tasks(backups[0]) == read_tasks(db_name)
+    assert capsys.readouterr().out == ""
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
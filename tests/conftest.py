@@ -0,0 +1,85 @@
+# Import necessary packages here
+import sqlite3
+
+import pytest
+
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    conftest.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the fixtures shared by the test files
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+@pytest.fixture
+def task_database(tmp_path):
+    """
+    Returns a function that creates an open database in tmp_path holding tasks.
+    Each task is a tuple of its text, start date and end date.  ``keep`` deletes
+    every task after the first ``keep`` to leave free pages, and ``legacy`` creates
+    another table before the tasks table, so the database does not use
+    auto_vacuum, like the databases created before it was enabled.
+    """
+
+    def create(
+        name: str,
+        tasks: list[tuple],
+        backend: str = "sqlite3",
+        keep: int = None,
+        legacy: bool = False,
+    ) -> ToDoDatabase:
+        database = ToDoDatabase(str(tmp_path / name), backend=backend)
+        database.open_db()
+        if legacy:
+            database.create_table("notes", ["note"], ["TEXT"])
+        database.create_tasks_table()
+        query = "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);"
+        database.db_executemany(query, tasks)
+        if keep is not None:
+            database.db_query("DELETE FROM tasks WHERE task_id > ?;", (keep,))
+        return database
+
+    return create
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def read_tasks():
+    """
+    Returns a function that reads the columns of each table of a database file
+    through the sqlite3 module, and the tags of each task if ``tags`` is True
+    """
+
+    def read(
+        db_name: str,
+        columns: str = "task_id, task",
+        tables: tuple = ("tasks",),
+        tags: bool = False,
+    ) -> dict[str, list[tuple]]:
+        connection = sqlite3.connect(db_name)
+        rows = {}
+        for table in tables:
+            query = f"SELECT {columns} FROM {table} ORDER BY 1;"
+            rows[table] = connection.execute(query).fetchall()
+        if tags:
+            query = (
+                "SELECT task_id, name FROM task_tags JOIN tags USING (tag_id) "
+                "ORDER BY 1, 2;"
+            )
+            rows["task_tags"] = connection.execute(query).fetchall()
+        connection.close()
+        return rows
+
+    return read
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -3,6 +3,8 @@ import os
 import time
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from todo_six.database import SQLiteManager, ToDoDatabase
@@ -34,11 +36,14 @@ from todo_six.database import SQLiteManager, ToDoDatabase
 # ==========================================================================================
 # Insert Code here
 
+# Every test runs once with each storage backend
+BACKENDS = ["qt", "sqlite3"]
 
-@pytest.fixture(scope="module")
-def db_manager():
-    db_path = "test_db.sqlite"
-    manager = SQLiteManager(db_path)
+
+@pytest.fixture(scope="module", params=BACKENDS)
+def db_manager(request):
+    db_path = f"test_db_{request.param}.sqlite"
+    manager = SQLiteManager(db_path, backend=request.param)
     yield manager
     if manager.con.isOpen():
         manager.remove_db()  # Here, replace close_db() with remove_db()
@@ -152,15 +157,35 @@ def test_db_query(db_manager):
     assert success
 
 
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.sqlitemanager
+def test_schema_cache_sees_external_changes(db_manager):
+    success, _ = db_manager.open_db()
+    assert success
+    exists, _ = db_manager.table_exists("cached")
+    assert not exists
+    # Tables created outside of create_table must still invalidate the cache
+    success, _, _ = db_manager.db_query("CREATE TABLE cached (id INTEGER, note TEXT);")
+    assert success
+    exists, _ = db_manager.table_exists("cached")
+    assert exists
+    success, schema, _ = db_manager.table_schema("cached")
+    assert schema == {"id": "INTEGER", "note": "TEXT"}
+    success, _ = db_manager.close_db()
+    assert success
+
+
 # ==========================================================================================
 # ==========================================================================================
 # Test ToDoDatabase class
 
 
-@pytest.fixture(scope="module")
-def tododb_manager():
-    db_path = "test.db"
-    tododb_manager = ToDoDatabase(db_path)
+@pytest.fixture(scope="module", params=BACKENDS)
+def tododb_manager(request):
+    db_path = f"test_{request.param}.db"
+    tododb_manager = ToDoDatabase(db_path, backend=request.param)
     tododb_manager.open_db()
     yield tododb_manager
     if tododb_manager.con.isOpen():
@@ -181,6 +206,111 @@ def test_create_tasks_table(tododb_manager):
 # ------------------------------------------------------------------------------------------
 
 
+@pytest.mark.tododatabase
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bootstrap(backend, tmp_path):
+    db_path = str(tmp_path / "bootstrap_test.db")
+    database = ToDoDatabase(db_path, backend=backend)
+    database.open_db()
+    success, snapshot, _ = database.bootstrap(create=True)
+    assert success
+    assert snapshot["open_tasks"].empty
+    database.insert_task("Open")
+    _, _, task_id = database.insert_task("Closed")
+    database.complete_task(task_id)
+    database.remove_db()
+
+    database = ToDoDatabase(db_path, backend=backend)
+    database.open_db()
+    success, snapshot, _ = database.bootstrap("DAY", create=False)
+    database.remove_db()
+    assert success
+    assert snapshot["oldest_date"] == datetime.now().strftime("%Y-%m-%d")
+    assert list(snapshot["open_tasks"]["task"]) == ["Open"]
+    assert list(snapshot["closed_tasks"]["task"]) == ["Closed"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bootstrap_rejects_other_databases(backend, tmp_path):
+    database = ToDoDatabase(str(tmp_path / "notes.db"), backend=backend)
+    database.open_db()
+    database.db_query("CREATE TABLE notes (note TEXT);")
+    success, snapshot, _ = database.bootstrap(create=False)
+    exists, _ = database.table_exists("tasks")
+    database.remove_db()
+    assert not success
+    assert snapshot == {}
+    assert not exists
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("immutable", [False, True])
+def test_read_only_database(backend, immutable, tmp_path):
+    db_path = str(tmp_path / "read_only_test.db")
+    database = ToDoDatabase(db_path, backend=backend)
+    database.open_db()
+    database.create_tasks_table()
+    database.insert_task("Archived")
+    database.remove_db()
+    modified = os.path.getmtime(db_path)
+
+    database = ToDoDatabase(db_path, backend=backend, read_only=True, immutable=immutable)
+    success, _ = database.open_db()
+    assert success
+    success, snapshot, _ = database.bootstrap(create=False)
+    assert success
+    assert list(snapshot["open_tasks"]["task"]) == ["Archived"]
+    _, result, _ = database.db_query("PRAGMA mmap_size;")
+    assert result.next() and result.value(0) > 0
+    success, _, _ = database.insert_task("New")
+    assert not success
+    database.remove_db()
+    assert os.path.getmtime(db_path) == modified
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_read_only_database_is_not_migrated(backend, tmp_path):
+    db_path = str(tmp_path / "old_schema.db")
+    database = ToDoDatabase(db_path, backend=backend)
+    database.open_db()
+    database.create_table(
+        "tasks",
+        ["task_id", "task", "start_date", "end_date"],
+        ["INTEGER PRIMARY KEY", "TEXT NOT NULL", "DATE", "DATE"],
+    )
+    database.db_query(
+        "INSERT INTO tasks (task, start_date, end_date) "
+        "VALUES ('Old', '2020-01-01', '2020-01-02');"
+    )
+    database.remove_db()
+
+    database = ToDoDatabase(db_path, backend=backend, read_only=True)
+    database.open_db()
+    success, snapshot, _ = database.bootstrap("ALL", create=False)
+    _, result, _ = database.db_query("PRAGMA user_version;")
+    version = result.value(0) if result.next() else None
+    database.remove_db()
+    assert success
+    assert snapshot["oldest_date"] == "2020-01-01"
+    assert list(snapshot["closed_tasks"]["task"]) == ["Old"]
+    assert version == 0
+
+
+# ------------------------------------------------------------------------------------------
+
+
 @pytest.mark.tododatabase
 def test_insert_task(tododb_manager):
     success, _, task_id = tododb_manager.insert_task("Test Task1")
@@ -264,6 +394,596 @@ def test_get_oldest_date(tododb_manager):
     assert oldest_date == expected_oldest_date
 
 
+# ==========================================================================================
+# ==========================================================================================
+# Test ToDoDatabase history methods
+
+
+@pytest.fixture(scope="module", params=BACKENDS)
+def history_db(request):
+    db_path = f"history_test_{request.param}.db"
+    history_db = ToDoDatabase(db_path, backend=request.param)
+    history_db.open_db()
+    history_db.create_tasks_table()
+    tasks = [
+        ("Old", "2023-05-20", "2023-05-25"),
+        ("Spans", "2023-05-30", "2023-06-03"),
+        ("Closed", "2023-06-01", "2023-06-02"),
+        ("Open", "2023-06-02", None),
+    ]
+    query = "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);"
+    for task in tasks:
+        history_db.db_query(query, task)
+    yield history_db
+    if history_db.con.isOpen():
+        history_db.remove_db()
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_backlog_series(history_db):
+    success, backlog, durations, _ = history_db.backlog_series("2023-06-01", "2023-06-04")
+    assert success
+    assert list(backlog["open_tasks"]) == [2, 2, 1, 1]
+    assert str(backlog["date"].iloc[0].date()) == "2023-06-01"
+    assert durations.to_dict() == {1: 1, 4: 1}
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_backlog_series_matches_former_open_tasks(history_db):
+    _, backlog, _, _ = history_db.backlog_series("2023-05-19", "2023-06-05")
+    for date, open_tasks in zip(backlog["date"], backlog["open_tasks"]):
+        _, df, _ = history_db.get_former_open_tasks(date.strftime("%Y-%m-%d"))
+        assert len(df) == open_tasks
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_backlog_series_invalid_range(history_db):
+    success, _, _, _ = history_db.backlog_series("2023-06-04", "2023-06-01")
+    assert not success
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_migrate_sets_schema_version(history_db):
+    success, _ = history_db.migrate()
+    assert success
+    _, result, _ = history_db.db_query("PRAGMA user_version;")
+    assert result.next()
+    assert result.value(0) == ToDoDatabase.SCHEMA_VERSION
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_former_open_tasks_index_matches_scan(history_db):
+    history_db.complete_task(4)
+    for date in ["2023-05-19", "2023-05-22", "2023-06-01", "2023-06-02", "2023-06-03"]:
+        _, indexed, _ = history_db.get_former_open_tasks(date)
+        _, scanned, _ = history_db._scan_former_open_tasks(date)
+        assert list(indexed["task_id"]) == sorted(scanned["task_id"])
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_columnar_select_matches_rows(history_db):
+    selects = [
+        lambda columnar: history_db.select_open_tasks(columnar=columnar),
+        lambda columnar: history_db.select_closed_tasks("ALL", columnar=columnar),
+        lambda columnar: history_db.get_former_open_tasks("2023-06-01", columnar),
+    ]
+    for select in selects:
+        success, df, _ = select(False)
+        assert success
+        success, columns, _ = select(True)
+        assert success
+        assert columns.task_id.dtype == np.int64
+        expected = df.sort_values("task_id").reset_index(drop=True)
+        pd.testing.assert_frame_equal(columns.to_frame(), expected, check_dtype=False)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_columnar_select_dates(history_db):
+    success, columns, _ = history_db.get_former_open_tasks("2023-06-01", True)
+    assert success
+    assert list(columns.start_date.astype(str)) == ["2023-05-30", "2023-06-01"]
+    assert list(columns.end_day - columns.start_day) == [4, 1]
+    success, columns, _ = history_db.select_closed_tasks("DAY", "1999-01-01", True)
+    assert success
+    assert len(columns) == 0
+    assert len(columns.tasks()) == 0
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_db_executemany(history_db):
+    rows = [("Bulk 1", "2023-06-05"), ("Bulk 2", "2023-06-06")]
+    query = "INSERT INTO tasks (task, start_date) VALUES (?, ?);"
+    success, _ = history_db.db_executemany(query, rows)
+    assert success
+    _, df, _ = history_db.get_former_open_tasks("2023-06-07")
+    assert {"Bulk 1", "Bulk 2"} <= set(df["task"])
+    success, _ = history_db.db_executemany("INSERT INTO missing VALUES (?);", [(1,)])
+    assert not success
+
+
+# ==========================================================================================
+# ==========================================================================================
+# Test ToDoDatabase archive methods
+
+
+@pytest.fixture(params=BACKENDS)
+def archive_db(request, tmp_path):
+    archive_db = ToDoDatabase(str(tmp_path / "archive_test.db"), backend=request.param)
+    archive_db.open_db()
+    archive_db.create_tasks_table()
+    tasks = [
+        ("Open", "2023-05-01", None),
+        ("Spans", "2023-05-30", "2023-06-03"),
+        ("Recent", "2023-06-10", "2023-06-12"),
+        ("Old", "2023-05-20", "2023-05-25"),
+    ]
+    query = "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);"
+    for task in tasks:
+        archive_db.db_query(query, task)
+    yield archive_db
+    archive_db.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _history(database):
+    """
+    Returns the results of the queries that must not change when tasks are archived
+    """
+    results = [database.get_oldest_date()[1]]
+    for time_frame, date in [("ALL", "2023-06-12"), ("MONTH", "2023-05-31")]:
+        _, df, _ = database.select_closed_tasks(time_frame, date)
+        results.append(sorted(df["task"]))
+        _, columns, _ = database.select_closed_tasks(time_frame, date, columnar=True)
+        results.append(list(columns.tasks()))
+    for date in ["2023-05-22", "2023-06-01", "2023-06-11"]:
+        _, df, _ = database.get_former_open_tasks(date)
+        results.append(list(df["task"]))
+        _, columns, _ = database.get_former_open_tasks(date, columnar=True)
+        results.append(list(columns.tasks()))
+    _, backlog, durations, _ = database.backlog_series("2023-05-01", "2023-06-15")
+    results.extend([list(backlog["open_tasks"]), durations.to_dict()])
+    return results
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_archive_tasks_preserves_history(archive_db):
+    expected = _history(archive_db)
+    success, _, archived = archive_db.archive_tasks("2023-06-05")
+    assert success
+    assert archived == 2
+    _, result, _ = archive_db.db_query("SELECT task FROM tasks ORDER BY task_id;")
+    assert archive_db.backend.fetch_rows(result) == [("Open",), ("Recent",)]
+    assert _history(archive_db) == expected
+    _, df, _ = archive_db.select_closed_tasks("WEEK", "2023-06-12")
+    assert list(df["task"]) == ["Recent"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_archive_tasks_ids_are_not_reused(archive_db):
+    archive_db.archive_tasks("2023-06-05")
+    success, _, task_id = archive_db.insert_task("New")
+    assert success
+    assert task_id == 5
+    success, _ = archive_db.delete_task(4)
+    assert success
+    _, df, _ = archive_db.select_closed_tasks("ALL")
+    assert sorted(df["task"]) == ["Recent", "Spans"]
+    success, _, _ = archive_db.archive_tasks("June")
+    assert not success
+
+
+# ==========================================================================================
+# ==========================================================================================
+# Test ToDoDatabase metadata methods
+
+
+def _scan_metadata(database):
+    """
+    Returns the counts and date bounds computed by reading every task
+    """
+    query = (
+        "SELECT SUM(end_date IS NULL), SUM(end_date IS NOT NULL), MIN(start_date), "
+        "MAX(start_date), MIN(end_date), MAX(end_date) FROM (SELECT * FROM tasks "
+        "UNION ALL SELECT * FROM tasks_archive);"
+    )
+    _, result, _ = database.db_query(query)
+    row = database.backend.fetch_rows(result)[0]
+    _, result, _ = database.db_query("SELECT COUNT(*) FROM tasks_archive;")
+    archived = database.backend.fetch_rows(result)[0][0]
+    counts = {"open": row[0] or 0, "closed": row[1] or 0, "archived": archived}
+    keys = ["min_start", "max_start", "min_end", "max_end"]
+    return counts, dict(zip(keys, row[2:]))
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_metadata_follows_changes(archive_db):
+    changes = [
+        lambda: None,
+        lambda: archive_db.insert_task("New"),
+        lambda: archive_db.complete_task(1),
+        lambda: archive_db.archive_tasks("2023-06-05"),
+        lambda: archive_db.delete_task(2),
+        lambda: archive_db.db_query("UPDATE tasks SET start_date = '2023-04-01';"),
+        lambda: archive_db.db_query("DELETE FROM tasks;"),
+    ]
+    for change in changes:
+        change()
+        counts, bounds = _scan_metadata(archive_db)
+        assert archive_db.get_task_counts()[1] == counts
+        assert archive_db.get_date_bounds()[1] == bounds
+        assert archive_db.get_oldest_date()[1] == bounds["min_start"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_metadata_empty_database(backend, tmp_path):
+    database = ToDoDatabase(str(tmp_path / "empty.db"), backend=backend)
+    database.open_db()
+    database.create_tasks_table()
+    _, counts, _ = database.get_task_counts()
+    _, bounds, _ = database.get_date_bounds()
+    database.remove_db()
+    assert counts == {"open": 0, "closed": 0, "archived": 0}
+    assert set(bounds.values()) == {None}
+
+
+# ==========================================================================================
+# ==========================================================================================
+# Test ToDoDatabase priority, due date and tag methods
+
+
+@pytest.fixture(params=BACKENDS)
+def attribute_db(request, tmp_path):
+    attribute_db = ToDoDatabase(
+        str(tmp_path / "attribute_test.db"), backend=request.param
+    )
+    attribute_db.open_db()
+    attribute_db.create_tasks_table()
+    for task, priority, due_date, tags in [
+        ("Wash car", None, None, []),
+        ("Mow lawn", "high", "2026-10-20", ["garden"]),
+        ("Pay rent", "medium", "2026-11-01", ["bills"]),
+        ("Weed", "low", "2026-10-18", ["Garden", "weekend"]),
+    ]:
+        _, _, task_id = attribute_db.insert_task(task)
+        if priority:
+            attribute_db.set_priority(task_id, priority)
+        attribute_db.set_due_date(task_id, due_date)
+        attribute_db.add_tags(task_id, tags)
+    yield attribute_db
+    attribute_db.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        ({}, ["Wash car", "Mow lawn", "Pay rent", "Weed"]),
+        ({"order_by": "priority"}, ["Mow lawn", "Pay rent", "Weed", "Wash car"]),
+        ({"order_by": "due"}, ["Weed", "Mow lawn", "Pay rent", "Wash car"]),
+        ({"priority": "medium"}, ["Mow lawn", "Pay rent"]),
+        ({"priority": 1, "order_by": "due"}, ["Weed", "Mow lawn", "Pay rent"]),
+        ({"due_by": "2026-10-20"}, ["Mow lawn", "Weed"]),
+        ({"tag": "GARDEN", "order_by": "priority"}, ["Mow lawn", "Weed"]),
+        ({"tag": "garden", "due_by": "2026-10-19"}, ["Weed"]),
+        ({"tag": "chores"}, []),
+    ],
+)
+def test_select_filtered_tasks(attribute_db, filters, expected):
+    success, df, _ = attribute_db.select_filtered_tasks(**filters)
+    assert success
+    assert df["task"].tolist() == expected
+    assert list(df.columns) == ["task_id", "task", "priority", "due_date"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_task_attributes(attribute_db):
+    _, df, _ = attribute_db.select_filtered_tasks(order_by="due")
+    assert df["priority"].tolist() == [1, 3, 2, 0]
+    assert df["due_date"].tolist() == ["2026-10-18", "2026-10-20", "2026-11-01", None]
+    assert attribute_db.select_tags()[1] == ["bills", "garden", "weekend"]
+
+    attribute_db.complete_task(2)
+    _, df, _ = attribute_db.select_filtered_tasks(tag="garden")
+    assert df["task"].tolist() == ["Weed"]
+    attribute_db.remove_tag(4, "weekend")
+    attribute_db.delete_task(3)
+    assert attribute_db.select_tags()[1] == ["garden"]
+    attribute_db.set_due_date(4, None)
+    _, df, _ = attribute_db.select_filtered_tasks(due_by="2026-12-31")
+    assert df.empty
+
+    assert not attribute_db.set_priority(1, "urgent")[0]
+    assert not attribute_db.set_due_date(1, "tomorrow")[0]
+    assert not attribute_db.select_filtered_tasks(order_by="name")[0]
+    assert not attribute_db.select_filtered_tasks(priority=7)[0]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_rows_keep_empty_strings_apart_from_null(attribute_db):
+    attribute_db.db_query("UPDATE tasks SET task = '' WHERE task_id = 1;")
+    query = "SELECT task, due_date FROM tasks WHERE task_id = 1;"
+    _, result, _ = attribute_db.db_query(query)
+    assert attribute_db.backend.fetch_rows(result) == [("", None)]
+    assert attribute_db._read_value(query)[:2] == (True, "")
+    _, df, _ = attribute_db.select_filtered_tasks()
+    assert df.loc[df["task_id"] == 1, "task"].tolist() == [""]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_archive_tasks_keeps_attributes(attribute_db):
+    attribute_db.db_query("UPDATE tasks SET end_date = '2023-01-01' WHERE task_id = 2;")
+    success, _, archived = attribute_db.archive_tasks("2023-06-01")
+    assert success and archived == 1
+    query = "SELECT priority, due_date FROM tasks_archive WHERE task_id = 2;"
+    _, result, _ = attribute_db.db_query(query)
+    assert attribute_db.backend.fetch_rows(result) == [(3, "2026-10-20")]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+@pytest.mark.parametrize(
+    "order_by, index",
+    [
+        ("task_id", "tasks_open_added"),
+        ("priority DESC, task_id", "tasks_open_priority"),
+        ("due_date NULLS LAST, task_id", "tasks_open_due"),
+    ],
+)
+def test_filtered_select_reads_covering_index(attribute_db, order_by, index):
+    rows = [(f"Task {i}", "2024-01-01", "2024-02-01") for i in range(2000)]
+    attribute_db.db_executemany(
+        "INSERT INTO tasks (task, start_date, end_date) VALUES (?, ?, ?);", rows
+    )
+    attribute_db.db_query("ANALYZE;")
+    query = (
+        "EXPLAIN QUERY PLAN SELECT task_id, task, priority, due_date FROM tasks "
+        f"WHERE end_date IS NULL ORDER BY {order_by};"
+    )
+    _, result, _ = attribute_db.db_query(query)
+    plan = " ".join(str(row[-1]) for row in attribute_db.backend.fetch_rows(result))
+    assert f"COVERING INDEX {index}" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+# ==========================================================================================
+# ==========================================================================================
+# Test ToDoDatabase journal methods
+
+
+def _task_state(database):
+    """
+    Returns every task with its attributes and the tags in use
+    """
+    query = (
+        "SELECT task_id, task, COALESCE(end_date, ''), priority FROM tasks "
+        "ORDER BY task_id;"
+    )
+    _, result, _ = database.db_query(query)
+    return database.backend.fetch_rows(result), database.select_tags()[1]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_undo_and_redo(attribute_db):
+    states = [_task_state(attribute_db)]
+    for change in [
+        lambda: attribute_db.complete_task(1),
+        lambda: attribute_db.delete_task(2),
+        lambda: attribute_db.insert_task("Rake leaves"),
+    ]:
+        change()
+        states.append(_task_state(attribute_db))
+
+    for state in reversed(states[:-1]):
+        success, _, count = attribute_db.undo()
+        assert success and count == 1
+        assert _task_state(attribute_db) == state
+    for state in states[1:]:
+        attribute_db.redo()
+        assert _task_state(attribute_db) == state
+    assert attribute_db.redo()[1:] == ("Nothing to redo", 0)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_new_operation_discards_redo(attribute_db):
+    attribute_db.delete_task(3)
+    attribute_db.undo()
+    attribute_db.insert_task("Rake leaves")
+    assert attribute_db.redo()[2] == 0
+    _, result, _ = attribute_db.db_query("SELECT COUNT(*) FROM journal;")
+    assert attribute_db.backend.fetch_rows(result) == [(5,)]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_undo_of_changed_task_fails(attribute_db):
+    attribute_db.complete_task(2)
+    attribute_db.db_query("UPDATE tasks SET end_date = '2023-01-01' WHERE task_id = 2;")
+    attribute_db.archive_tasks("2023-06-01")
+    state = _task_state(attribute_db)
+    success, _, count = attribute_db.undo()
+    assert not success and count == 0
+    assert _task_state(attribute_db) == state
+    assert not attribute_db.undo()[0]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_prune_journal(attribute_db):
+    success, _, pruned = attribute_db.prune_journal(keep=2)
+    assert success and pruned == 2
+    assert attribute_db.undo()[0] and attribute_db.undo()[0]
+    assert attribute_db.undo()[1] == "Nothing to undo"
+    _, df, _ = attribute_db.select_open_tasks()
+    assert df["task"].tolist() == ["Wash car", "Mow lawn"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_undo_restores_archived_task_to_archive(attribute_db):
+    attribute_db.db_query(
+        "UPDATE tasks SET end_date = '2023-01-02', start_date = '2023-01-01' "
+        "WHERE task_id = 2;"
+    )
+    attribute_db.archive_tasks("2023-06-01")
+    attribute_db.delete_task(2)
+    query = "SELECT {} FROM {} WHERE task_id = 2;"
+    success, _, _ = attribute_db.undo()
+    assert success
+    _, result, _ = attribute_db.db_query(query.format("task, priority", "tasks_archive"))
+    assert attribute_db.backend.fetch_rows(result) == [("Mow lawn", 3)]
+    _, result, _ = attribute_db.db_query(query.format("task", "tasks"))
+    assert attribute_db.backend.fetch_rows(result) == []
+    assert "garden" in attribute_db.select_tags()[1]
+    assert attribute_db.redo()[2] == 1
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_journal_redo_check_reads_index(attribute_db):
+    query = "EXPLAIN QUERY PLAN DELETE FROM journal WHERE undone = 1;"
+    _, result, _ = attribute_db.db_query(query)
+    plan = " ".join(str(row[-1]) for row in attribute_db.backend.fetch_rows(result))
+    assert "journal_undone" in plan
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_completion_that_changes_nothing_is_not_journaled(attribute_db):
+    before = _task_state(attribute_db)
+    attribute_db.delete_task(1)
+    success, _ = attribute_db.complete_task(999)
+    assert not success
+    attribute_db.complete_task(2)
+    assert not attribute_db.complete_task(2)[0]
+    assert attribute_db.complete_tasks([2, 3])[1] == "1 tasks completed"
+
+    assert attribute_db.undo()[2] == 1
+    assert attribute_db.undo()[2] == 1
+    success, _, count = attribute_db.undo()
+    assert success and count == 1
+    assert _task_state(attribute_db) == before
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_deletion_skips_missing_ids_in_journal(attribute_db):
+    before = _task_state(attribute_db)
+    success, message = attribute_db.delete_tasks([999, 2, 3])
+    assert success
+    assert [row[0] for row in _task_state(attribute_db)[0]] == [1, 4]
+
+    success, _, count = attribute_db.undo()
+    assert success and count == 2
+    assert _task_state(attribute_db) == before
+    assert not attribute_db.delete_tasks([998, 999])[0]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_bulk_operations_report_tasks_changed(attribute_db):
+    assert attribute_db.delete_tasks([2, 999, 3]) == (True, "2 tasks deleted")
+    assert attribute_db.complete_tasks([1, 2, 4]) == (True, "2 tasks completed")
+    for method in (attribute_db.complete_tasks, attribute_db.delete_tasks):
+        assert method([]) == (False, "No task ids given")
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tododatabase
+def test_bulk_operations_are_undone_together(attribute_db):
+    initial = _task_state(attribute_db)
+    success, message = attribute_db.complete_tasks([1, 2, 3])
+    assert success and message == "3 tasks completed"
+    completed = _task_state(attribute_db)
+    assert [row[2] != "" for row in completed[0]] == [True, True, True, False]
+
+    success, message = attribute_db.delete_tasks([2, 4])
+    assert success and message == "2 tasks deleted"
+    assert [row[0] for row in _task_state(attribute_db)[0]] == [1, 3]
+    assert _task_state(attribute_db)[1] == ["bills"]
+
+    assert attribute_db.undo()[2] == 2
+    assert _task_state(attribute_db) == completed
+    assert attribute_db.undo()[2] == 3
+    assert _task_state(attribute_db) == initial
+
+
 # ==========================================================================================
 # ==========================================================================================
 # eof
@@ -0,0 +1,131 @@
+# Import necessary packages here
+import time
+
+import pytest
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from todo_six.maintenance import (
+    INCREMENTAL,
+    MaintenanceScheduler,
+    format_report,
+    measure_fragmentation,
+    run_maintenance,
+)
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    maintenance_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the functions and classes in the maintenance.py file
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+# Tasks of which all but the first 500 are deleted to leave free pages
+TASKS = [(f"Task {index} " + "x" * 200, "2023-01-01", None) for index in range(5000)]
+
+
+@pytest.mark.maintenance
+@pytest.mark.parametrize("backend", ["qt", "sqlite3"])
+def test_incremental_vacuum_releases_free_pages(backend, task_database):
+    database = task_database("churn.db", TASKS, backend, keep=500)
+    success, before, _ = measure_fragmentation(database)
+    assert success
+    assert before["auto_vacuum"] == INCREMENTAL
+    assert before["freelist_count"] > 0
+
+    success, report, _ = run_maintenance(database)
+    assert success
+    assert report["integrity"] == "ok"
+    assert report["after"]["freelist_count"] == 0
+    assert report["after"]["file_bytes"] < before["file_bytes"]
+    assert set(report["timings"]) == {
+        "prune_journal",
+        "vacuum",
+        "analyze",
+        "quick_check",
+        "total",
+    }
+    assert "free pages" in format_report(report)
+    _, result, _ = database.db_query("SELECT COUNT(*) FROM sqlite_stat1;")
+    assert result.next() and result.value(0) > 0
+    database.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.maintenance
+def test_full_vacuum_converts_legacy_database(task_database):
+    database = task_database("legacy.db", TASKS, keep=500, legacy=True)
+    _, before, _ = measure_fragmentation(database)
+    assert before["auto_vacuum"] == 0
+
+    success, report, _ = run_maintenance(database, full_vacuum_ratio=None, check=False)
+    assert success
+    assert report["after"]["auto_vacuum"] == 0
+    assert report["after"]["freelist_count"] > 0
+
+    success, report, _ = run_maintenance(database)
+    assert success
+    assert report["after"]["auto_vacuum"] == INCREMENTAL
+    assert report["after"]["freelist_count"] == 0
+    database.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.maintenance
+def test_scheduler_runs_maintenance_on_worker(task_database):
+    app = QApplication.instance() or QApplication([])
+    database = task_database("scheduled.db", TASKS, keep=500)
+    database.remove_db()
+    db_name = database.db_name
+    thread_pool = QThreadPool()
+    scheduler = MaintenanceScheduler(db_name, idle_interval=10, thread_pool=thread_pool)
+    reports = []
+    scheduler.finished.connect(reports.append)
+    scheduler.start()
+    scheduler.touch()
+
+    deadline = time.monotonic() + 10
+    while not reports and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert len(reports) == 1
+    assert reports[0]["after"]["freelist_count"] == 0
+    assert not scheduler.is_running()
+    scheduler.stop()
+    thread_pool.waitForDone()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.maintenance
+def test_scheduler_finish_runs_light_maintenance_quietly(task_database, capsys):
+    app = QApplication.instance() or QApplication([])
+    database = task_database("closing.db", TASKS, keep=500)
+    database.remove_db()
+    db_name = database.db_name
+    thread_pool = QThreadPool()
+    scheduler = MaintenanceScheduler(db_name, thread_pool=thread_pool)
+    reports = []
+    scheduler.finished.connect(reports.append)
+    scheduler.start()
+    scheduler.finish()
+    assert scheduler.is_running()
+    thread_pool.waitForDone()
+    app.processEvents()
+    assert len(reports) == 1
+    assert "quick_check" not in reports[0]["timings"]
+    assert capsys.readouterr().out == ""
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
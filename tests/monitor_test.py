@@ -0,0 +1,91 @@
+# Import necessary packages here
+import sqlite3
+
+import pytest
+
+from todo_six.database import ToDoDatabase
+from todo_six.monitor import ChangeMonitor
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    monitor_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the methods and classes in the monitor.py file
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+@pytest.fixture
+def monitored_db(tmp_path):
+    db = ToDoDatabase(str(tmp_path / "monitor_test.db"))
+    db.open_db()
+    db.create_tasks_table()
+    monitor = ChangeMonitor(db)
+    monitor.start()
+    yield db, monitor
+    monitor.stop()
+    db.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.monitor
+def test_monitor_ignores_idle_database(monitored_db):
+    _, monitor = monitored_db
+    emitted = []
+    monitor.changed.connect(lambda: emitted.append(True))
+    assert monitor.is_active()
+    assert not monitor.check()
+    assert not emitted
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.monitor
+def test_monitor_ignores_own_commits(monitored_db):
+    db, monitor = monitored_db
+    emitted = []
+    monitor.changed.connect(lambda: emitted.append(True))
+    db.insert_task("Mow lawn")
+    assert not monitor.check()
+    assert not emitted
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.monitor
+def test_monitor_detects_other_connection(monitored_db):
+    db, monitor = monitored_db
+    emitted = []
+    monitor.changed.connect(lambda: emitted.append(True))
+    with sqlite3.connect(db.db_name) as other:
+        other.execute(
+            "INSERT INTO tasks (task, start_date) VALUES (?, date('now'));",
+            ("Wash car",),
+        )
+    other.close()
+    assert monitor.check()
+    assert emitted == [True]
+    assert not monitor.check()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.monitor
+def test_monitor_stops_when_database_closes(monitored_db):
+    db, monitor = monitored_db
+    db.close_db()
+    assert not monitor.check()
+    assert not monitor.is_active()
+    db.open_db()
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,199 @@
+# Import necessary packages here
+from datetime import date
+
+import pytest
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from todo_six.database import ToDoDatabase
+from todo_six.recurrence import due_occurrences, occurrence
+from todo_six.recurrence_scheduler import RecurrenceScheduler
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    recurrence_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the functions in the recurrence.py file, the recurrence
+#          methods of ToDoDatabase and the RecurrenceScheduler class
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+BACKENDS = ["qt", "sqlite3"]
+
+
+@pytest.fixture(params=BACKENDS)
+def recurrence_db(request, tmp_path):
+    database = ToDoDatabase(str(tmp_path / "recurrence_test.db"), backend=request.param)
+    database.open_db()
+    database.create_tasks_table()
+    yield database
+    database.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _tasks(database: ToDoDatabase) -> list[tuple]:
+    """
+    Returns the text and start date of every task
+    """
+    _, result, _ = database.db_query("SELECT task, start_date FROM tasks ORDER BY 2, 1;")
+    return database.backend.fetch_rows(result)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.recurrence
+def test_monthly_occurrences_keep_day_of_month():
+    anchor = date(2024, 1, 31)
+    dates = [occurrence(anchor, "MONTH", 1, index) for index in range(4)]
+    assert dates == [
+        date(2024, 1, 31),
+        date(2024, 2, 29),
+        date(2024, 3, 31),
+        date(2024, 4, 30),
+    ]
+    assert occurrence(date(2024, 2, 29), "YEAR", 1, 1) == date(2025, 2, 28)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.recurrence
+@pytest.mark.parametrize(
+    "frequency, interval, last, following",
+    [
+        ("DAY", 1, date(2024, 3, 10), date(2024, 3, 11)),
+        ("DAY", 3, date(2024, 3, 8), date(2024, 3, 11)),
+        ("WEEK", 1, date(2024, 3, 8), date(2024, 3, 15)),
+        ("MONTH", 1, date(2024, 2, 29), date(2024, 3, 31)),
+        ("YEAR", 1, date(2024, 1, 31), date(2025, 1, 31)),
+    ],
+)
+def test_due_occurrences(frequency, interval, last, following):
+    anchor = date(2024, 1, 31) if frequency in ("MONTH", "YEAR") else date(2024, 1, 5)
+    due = due_occurrences(anchor, frequency, interval, date(2024, 3, 10))
+    assert due == (last, following)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.recurrence
+def test_materialize_recurrences(recurrence_db):
+    recurrence_db.add_recurrence("Water plants", "DAY", "2026-10-01")
+    recurrence_db.add_recurrence("Take out trash", "WEEK", "2026-10-05")
+    recurrence_db.add_recurrence("Pay rent", "MONTH", "2026-11-01")
+
+    success, _, count = recurrence_db.materialize_recurrences("2026-10-05")
+    assert success and count == 2
+    assert _tasks(recurrence_db) == [
+        ("Take out trash", "2026-10-05"),
+        ("Water plants", "2026-10-05"),
+    ]
+    _, _, count = recurrence_db.materialize_recurrences("2026-10-05")
+    assert count == 0
+
+    # Missed occurrences are collapsed into one task dated on the latest of them
+    _, _, count = recurrence_db.materialize_recurrences("2026-10-09")
+    assert count == 1
+    assert _tasks(recurrence_db)[-1] == ("Water plants", "2026-10-09")
+    _, rules, _ = recurrence_db.select_recurrences()
+    assert rules["next_due"].tolist() == ["2026-10-10", "2026-10-12", "2026-11-01"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.recurrence
+def test_recurrence_until_and_delete(recurrence_db):
+    _, _, rule_id = recurrence_db.add_recurrence(
+        "Sprint review", "WEEK", "2026-10-01", interval=2, until="2026-10-20"
+    )
+    _, _, other_id = recurrence_db.add_recurrence("Stretch", "DAY", "2026-10-01")
+    recurrence_db.materialize_recurrences("2026-10-16")
+    _, rules, _ = recurrence_db.select_recurrences()
+    assert rules["rule_id"].tolist() == [other_id]
+    assert ("Sprint review", "2026-10-15") in _tasks(recurrence_db)
+
+    success, _ = recurrence_db.delete_recurrence(other_id)
+    _, rules, _ = recurrence_db.select_recurrences()
+    assert success and rules.empty
+    assert rule_id != other_id
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.recurrence
+def test_recurrence_rejects_invalid_rules(recurrence_db):
+    success, _, _ = recurrence_db.add_recurrence("Nap", "HOURLY")
+    assert not success
+    success, _, _ = recurrence_db.add_recurrence("Nap", "DAY", interval=0)
+    assert not success
+    for due_by in ["2026-13-01", "next week"]:
+        assert recurrence_db.materialize_recurrences(due_by) == (
+            False,
+            "Invalid date format",
+            0,
+        )
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.recurrence
+def test_due_rules_are_read_through_index(recurrence_db):
+    query = "EXPLAIN QUERY PLAN SELECT rule_id FROM recurrences WHERE next_due <= ?;"
+    _, result, _ = recurrence_db.db_query(query, ("2026-10-19",))
+    plan = " ".join(str(row[-1]) for row in recurrence_db.backend.fetch_rows(result))
+    assert "recurrences_next_due" in plan
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.recurrence
+def test_bootstrap_materializes_due_tasks(recurrence_db):
+    recurrence_db.add_recurrence("Feed cat", "DAY", "2020-01-01")
+    success, snapshot, _ = recurrence_db.bootstrap(create=False)
+    assert success
+    assert snapshot["open_tasks"]["task"].tolist() == ["Feed cat"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.recurrence
+def test_scheduler_publishes_materialized_tasks(tmp_path, capsys):
+    app = QApplication.instance() or QApplication([])
+    db_name = str(tmp_path / "scheduled.db")
+    database = ToDoDatabase(db_name, backend="sqlite3")
+    database.open_db()
+    database.create_tasks_table()
+    database.add_recurrence("Feed cat", "DAY", "2020-01-01")
+    thread_pool = QThreadPool()
+    scheduler = RecurrenceScheduler(thread_pool)
+    results = []
+    scheduler.materialized.connect(lambda name, count: results.append((name, count)))
+    scheduler.add_database(db_name)
+    scheduler.run_now()
+    thread_pool.waitForDone()
+    app.processEvents()
+    assert results == [(db_name, 1)]
+    assert capsys.readouterr().out == ""
+    _, df, _ = database.select_open_tasks()
+    database.remove_db()
+    assert df["task"].tolist() == ["Feed cat"]
+    scheduler.start()
+    assert scheduler.is_active()
+    scheduler.stop()
+    thread_pool.waitForDone()
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,147 @@
+# Import necessary packages here
+import http.client
+import json
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from todo_six.server import DatabaseService, TaskServer
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    server_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the methods and classes in the server.py file
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+@pytest.fixture
+def client(tmp_path):
+    server = TaskServer([str(tmp_path / "chores.db")], port=0, readers=2)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    connection = http.client.HTTPConnection(*server.server_address[:2])
+
+    def request(verb, path, body=None):
+        data = None if body is None else json.dumps(body)
+        connection.request(verb, path, body=data)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    yield request
+    connection.close()
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.server
+def test_server_insert_complete_delete(client):
+    status, payload = client("POST", "/databases/chores/tasks", {"task": "Mow lawn"})
+    assert status == 201
+    task_id = payload["task_id"]
+    client("POST", "/databases/chores/tasks", {"task": "Wash car"})
+
+    status, payload = client("POST", f"/databases/chores/tasks/{task_id}/complete")
+    assert status == 200
+    _, payload = client("GET", "/databases/chores/tasks/closed?time_frame=ALL")
+    assert [task["task"] for task in payload["tasks"]] == ["Mow lawn"]
+
+    status, _ = client("DELETE", f"/databases/chores/tasks/{task_id}")
+    assert status == 200
+    _, payload = client("GET", "/databases/chores/tasks/open")
+    assert [task["task"] for task in payload["tasks"]] == ["Wash car"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.server
+def test_server_closed_tasks_default_to_current_day(client, monkeypatch):
+    client("POST", "/databases/chores/tasks", {"task": "Mow lawn"})
+    client("POST", "/databases/chores/tasks/1/complete")
+    _, payload = client("GET", "/databases/chores/tasks/closed")
+    assert [task["task"] for task in payload["tasks"]] == ["Mow lawn"]
+
+    class Tomorrow(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(days=1)
+
+    monkeypatch.setattr("todo_six.server.datetime", Tomorrow)
+    _, payload = client("GET", "/databases/chores/tasks/closed")
+    assert payload["success"] and payload["tasks"] == []
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.server
+def test_server_batch(client):
+    operations = [
+        {"op": "insert_task", "task": "Mow lawn"},
+        {"op": "insert_task", "task": "Wash car"},
+        {"op": "complete_task", "task_id": 1},
+    ]
+    status, payload = client(
+        "POST", "/databases/chores/batch", {"operations": operations}
+    )
+    assert status == 200
+    assert len(payload["results"]) == 3
+    _, payload = client("GET", "/databases/chores/tasks/open")
+    assert [task["task"] for task in payload["tasks"]] == ["Wash car"]
+
+    status, payload = client("POST", "/databases/chores/batch", {"operations": [{}]})
+    assert status == 400
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.server
+def test_server_errors(client):
+    status, payload = client("GET", "/databases")
+    assert payload["databases"] == ["chores"]
+    status, payload = client("GET", "/databases/missing/tasks/open")
+    assert status == 404
+    assert not payload["success"]
+    status, _ = client("GET", "/databases/chores/tasks/history")
+    assert status == 400
+    status, _ = client("GET", "/databases/chores/backlog?start=2023-06-04&end=2023-06-01")
+    assert status == 400
+    status, _ = client("GET", "/nowhere")
+    assert status == 404
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.server
+def test_service_group_commit(tmp_path):
+    service = DatabaseService(str(tmp_path / "chores.db"), readers=2)
+    success, _ = service.start()
+    assert success
+    threads = [
+        threading.Thread(target=service.write, args=("insert_task", f"Task {index}"))
+        for index in range(50)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    success, df, _ = service.read("select_open_tasks")
+    service.stop()
+    assert success
+    assert len(df) == 50
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
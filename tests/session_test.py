@@ -0,0 +1,71 @@
+# Import necessary packages here
+import pytest
+from PyQt6.QtCore import QSettings
+
+from todo_six.session import SessionState
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    session_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the methods and classes in the session.py file
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+@pytest.fixture
+def session(tmp_path):
+    settings = QSettings(str(tmp_path / "session.ini"), QSettings.Format.IniFormat)
+    return SessionState(settings)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.session
+def test_load_defaults(session):
+    state = session.load()
+    assert state == {
+        "databases": [],
+        "current_database": "",
+        "time_frame": "Day",
+        "theme": "day",
+        "opacity": 100,
+        "write_behind": False,
+        "backup_directory": "",
+        "read_only_databases": [],
+    }
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.session
+def test_save_and_load(session):
+    databases = ["/tmp/chores.db", "/tmp/work.db"]
+    session.save(
+        databases,
+        "/tmp/work.db",
+        "Week",
+        "night",
+        85,
+        True,
+        "/tmp/backups",
+        ["/tmp/chores.db"],
+    )
+    state = session.load()
+    assert state["databases"] == databases
+    assert state["current_database"] == "/tmp/work.db"
+    assert state["time_frame"] == "Week"
+    assert state["theme"] == "night"
+    assert state["opacity"] == 85
+    assert state["write_behind"] is True
+    assert state["backup_directory"] == "/tmp/backups"
+    assert state["read_only_databases"] == ["/tmp/chores.db"]
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,212 @@
+# Import necessary packages here
+import io
+import struct
+import zlib
+from functools import partial
+
+import numpy as np
+import pytest
+
+from todo_six.database import ToDoDatabase
+from todo_six.task_archive import MAGIC, ArchiveWriter, date_strings, read_archive
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    task_archive_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the functions and classes in the task_archive.py file and
+#          the ToDoDatabase export_archive and import_archive methods
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+TASKS = [
+    ("Mow lawn", "2022-03-01", "2022-03-04"),
+    ("Wäsche waschen ✓", "2022-12-30", "2023-01-02"),
+    ("Pay bills", "2023-01-01", None),
+    ("", "2023-02-14", "2023-02-14"),
+] + [(f"Task {index}", "2023-05-01", "2023-05-02") for index in range(300)]
+
+
+@pytest.fixture
+def source_database(task_database):
+    """
+    Returns a function that creates an open database holding open, closed and
+    archived tasks with priorities, due dates and tags
+    """
+
+    def create(backend: str = "sqlite3") -> ToDoDatabase:
+        database = task_database("tasks.db", TASKS, backend)
+        database.set_priority(1, "high")
+        database.set_due_date(1, "2026-10-30")
+        database.add_tags(1, ["yard", "weekend"])
+        database.set_priority(3, "low")
+        database.add_tags(3, ["bills"])
+        database.archive_tasks("2023-01-01")
+        return database
+
+    return create
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def read_tables(read_tasks):
+    """
+    Returns a function that reads both task tables of a database file with the
+    attributes of each task
+    """
+    columns = "task_id, task, start_date, end_date, priority, due_date"
+    return partial(
+        read_tasks, columns=columns, tables=("tasks", "tasks_archive"), tags=True
+    )
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskarchive
+def test_writer_round_trip():
+    buffer = io.BytesIO()
+    with ArchiveWriter(buffer) as writer:
+        writer.write_chunk([3, 7], [19000, 19001], [19002, None], [0, 1], ["a", "ß"])
+        writer.write_chunk([8], [None], [None], [0], ["c"])
+    buffer.seek(0)
+    chunks = list(read_archive(buffer))
+    assert len(chunks) == 2
+    assert chunks[0]["task_id"].tolist() == [3, 7]
+    assert chunks[0]["task"] == ["a", "ß"]
+    assert chunks[0]["archived"].tolist() == [0, 1]
+    assert date_strings(chunks[0]["start_day"]) == ["2022-01-08", "2022-01-09"]
+    assert date_strings(chunks[0]["end_day"]) == ["2022-01-10", None]
+    assert date_strings(chunks[1]["start_day"]) == [None]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskarchive
+@pytest.mark.parametrize("backend", ["qt", "sqlite3"])
+def test_export_import_round_trip(
+    tmp_path, backend, task_database, source_database, read_tables
+):
+    database = source_database(backend)
+    db_name = database.db_name
+    dest = str(tmp_path / "tasks.tda")
+    success, _, count = database.export_archive(dest, chunk_size=64)
+    _, counts, _ = database.get_task_counts()
+    database.remove_db()
+    assert success and count == 304
+
+    copy = task_database("copy.db", [], backend)
+    copy_name = copy.db_name
+    success, _, count = copy.import_archive(dest)
+    _, copy_counts, _ = copy.get_task_counts()
+    copy.remove_db()
+    assert success and count == 304
+    tables = read_tables(copy_name)
+    assert tables == read_tables(db_name)
+    assert copy_counts == counts and counts["archived"] == 1
+    assert tables["tasks_archive"][0] == (
+        1,
+        "Mow lawn",
+        "2022-03-01",
+        "2022-03-04",
+        3,
+        "2026-10-30",
+    )
+    assert tables["tasks"][1][:1] + tables["tasks"][1][4:] == (3, 1, None)
+    assert tables["task_tags"] == [(1, "weekend"), (1, "yard"), (3, "bills")]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskarchive
+def test_import_reads_version_1_archive(tmp_path, task_database, read_tables):
+    ids = np.array([2, 3], dtype=np.int64)
+    payload = b"".join(
+        [
+            np.diff(ids, prepend=0).tobytes(),
+            np.array([19000, 19001], dtype=np.int32).tobytes(),
+            np.array([2, -(2**31)], dtype=np.int32).tobytes(),
+            np.array([1, 0], dtype=np.uint8).tobytes(),
+            np.array([1, 2], dtype=np.uint32).tobytes(),
+            "aß".encode("utf-8"),
+        ]
+    )
+    source = tmp_path / "version1.tda"
+    source.write_bytes(
+        struct.pack("<8sH", MAGIC, 1)
+        + struct.pack(
+            "<4sIII", b"CHNK", 2, len(zlib.compress(payload)), zlib.crc32(payload)
+        )
+        + zlib.compress(payload)
+        + struct.pack("<4sQ", b"DONE", 2)
+    )
+
+    copy = task_database("copy.db", [])
+    copy_name = copy.db_name
+    success, _, count = copy.import_archive(str(source))
+    copy.remove_db()
+    assert success and count == 2
+    assert read_tables(copy_name) == {
+        "tasks": [(3, "ß", "2022-01-09", None, 0, None)],
+        "tasks_archive": [(2, "a", "2022-01-08", "2022-01-10", 0, None)],
+        "task_tags": [],
+    }
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskarchive
+@pytest.mark.parametrize("damage", ["truncate", "flip", "magic"])
+def test_import_rejects_damaged_archive(
+    tmp_path, damage, task_database, source_database, read_tables
+):
+    database = source_database()
+    dest = str(tmp_path / "tasks.tda")
+    database.export_archive(dest, chunk_size=64)
+    database.remove_db()
+    with open(dest, "rb") as file:
+        data = bytearray(file.read())
+    if damage == "truncate":
+        data = data[: len(data) - 40]
+    elif damage == "flip":
+        data[len(data) // 2] ^= 0xFF
+    else:
+        data[0:8] = b"NOTANARC"
+    with open(dest, "wb") as file:
+        file.write(data)
+
+    copy = task_database("copy.db", [])
+    copy_name = copy.db_name
+    success, _, count = copy.import_archive(dest)
+    copy.remove_db()
+    assert not success and count == 0
+    assert read_tables(copy_name) == {"tasks": [], "tasks_archive": [], "task_tags": []}
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskarchive
+def test_import_rolls_back_duplicate_ids(tmp_path, source_database, read_tables):
+    database = source_database()
+    db_name = database.db_name
+    dest = str(tmp_path / "tasks.tda")
+    database.export_archive(dest)
+    before = read_tables(db_name)
+    success, _, count = database.import_archive(dest)
+    database.remove_db()
+    assert not success and count == 0
+    assert read_tables(db_name) == before
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,104 @@
+# Import necessary packages here
+import pytest
+
+from todo_six.task_store import TaskStore
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    task_store_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the methods and classes in the task_store.py file
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+@pytest.fixture
+def store():
+    task_store = TaskStore()
+    task_store.load([4, 7, 9], ["Wash car", "Mow lawn", "Café run"])
+    return task_store
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskstore
+def test_load_and_lookup(store):
+    assert len(store) == 3
+    assert store.task_id(1) == 4
+    assert store.text(2) == "Mow lawn"
+    assert store.text(3) == "Café run"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskstore
+def test_append(store):
+    ordinal = store.append(12, "Clean gutters")
+    assert ordinal == 4
+    assert store.task_id(4) == 12
+    assert store.text(4) == "Clean gutters"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskstore
+def test_out_of_range(store):
+    with pytest.raises(IndexError):
+        store.text(0)
+    with pytest.raises(IndexError):
+        store.task_id(4)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskstore
+def test_replace_ids(store):
+    assert store.replace_ids({7: 70, 99: 100}) == 1
+    assert [store.task_id(ordinal) for ordinal in range(1, 4)] == [4, 70, 9]
+    assert store.text(2) == "Mow lawn"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskstore
+def test_remove_range(store):
+    store.extend([12, 15], ["Clean gutters", "Weed"])
+    assert store.ordinals([15, 7, 99]) == [2, 5]
+    store.remove_range(2, 3)
+    assert [store.task_id(ordinal) for ordinal in range(1, 4)] == [4, 12, 15]
+    assert [store.text(ordinal) for ordinal in range(1, 4)] == [
+        "Wash car",
+        "Clean gutters",
+        "Weed",
+    ]
+    store.remove_range(3, 3)
+    assert store.append(20, "Rake") == 3
+    assert store.text(3) == "Rake"
+    with pytest.raises(IndexError):
+        store.remove_range(2, 4)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.taskstore
+def test_memory_report(store):
+    report = store.memory_report()
+    text_bytes = len("".join(["Wash car", "Mow lawn", "Café run"]).encode("utf-8"))
+    assert report["tasks"] == 3
+    assert report["text_bytes"] == text_bytes
+    assert report["budget_bytes"] == 3 * TaskStore.BYTES_PER_TASK + text_bytes
+    store.clear()
+    assert store.memory_report()["tasks"] == 0
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
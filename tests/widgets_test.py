@@ -1,15 +1,26 @@
 # Import necessary packages here
 import pytest
+from PyQt6.QtCore import QDate, QItemSelectionModel
 from PyQt6.QtGui import QFont
-from PyQt6.QtWidgets import QApplication, QLineEdit, QListWidgetItem
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QLineEdit,
+    QListWidgetItem,
+    QMessageBox,
+)
 
+from todo_six.database import ToDoDatabase
 from todo_six.widgets import (
+    AggregateTab,
     DayNightRadioButton,
     DropDownMenu,
     LineEdit,
     ListWidget,
     OpacitySlider,
     PushButton,
+    Tab,
+    TaskList,
 )
 
 # ==========================================================================================
@@ -302,6 +313,85 @@ def test_remove_item(list_widget):
     assert list_widget.count() == 1  # Now there should be one item in the list
 
 
+# ==========================================================================================
+# ==========================================================================================
+# Test TaskList class
+
+
+@pytest.fixture
+def task_list(app):
+    font = QFont("Arial", 14)
+    return TaskList(font)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tasklist
+def test_tasklist_load_tasks(task_list):
+    """
+    Test that loaded tasks are labelled with their display ordinal
+    """
+    task_list.load_tasks([11, 12], ["Wash car", "Mow lawn"])
+    assert task_list.count() == 2
+    index = task_list.model().index(1, 0)
+    assert task_list.model().data(index) == "2. Mow lawn"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tasklist
+def test_tasklist_add_task(task_list):
+    """
+    Test that an added task is appended and can be selected by database id
+    """
+    task_list.load_tasks([11], ["Wash car"])
+    ordinal = task_list.add_task(15, "Clean gutters")
+    assert ordinal == 2
+    task_list.setCurrentIndex(task_list.model().index(1, 0))
+    assert task_list.current_task_id() == 15
+    assert task_list.selected_task_ids() == [15]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tasklist
+def test_tasklist_remove_tasks_keeps_selection(task_list):
+    """
+    Test that removing tasks removes their rows in runs and keeps the selection
+    """
+    task_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+    task_list.load_tasks(range(1, 7), ["a", "b", "c", "d", "e", "f"])
+    _select(task_list, [1, 5])
+    removed_rows, resets = [], []
+    model = task_list.model()
+    model.rowsRemoved.connect(lambda parent, first, last: removed_rows.append(first))
+    model.modelReset.connect(lambda: resets.append(True))
+    assert task_list.remove_tasks([1, 3, 4, 99]) == 3
+    assert removed_rows == [2, 0]
+    assert not resets
+    assert task_list.selected_task_ids() == [2, 6]
+    assert _tasks(task_list) == ["b", "e", "f"]
+    assert model.data(model.index(2, 0)) == "3. f"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tasklist
+def test_tasklist_clear(task_list):
+    """
+    Test that clearing the list releases every task
+    """
+    task_list.load_tasks([11, 12], ["Wash car", "Mow lawn"])
+    task_list.clear()
+    assert task_list.count() == 0
+    assert task_list.current_task_id() is None
+    assert task_list.memory_report()["text_bytes"] == 0
+
+
 # ==========================================================================================
 # ==========================================================================================
 # Test OpacitySlider class
@@ -408,6 +498,198 @@ def test_button_enabled(push_button):
     assert push_button.isEnabled()
 
 
+# ==========================================================================================
+# ==========================================================================================
+# Test Tab class
+
+
+@pytest.fixture
+def tab(app, tmp_path):
+    database = ToDoDatabase(str(tmp_path / "tab_test.db"))
+    database.open_db()
+    database.create_tasks_table()
+    tab = Tab(QFont(), "tab_test", database)
+    yield tab
+    tab.monitor.stop()
+    tab.maintenance.stop()
+    database.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _tasks(task_list):
+    """
+    Returns the text of the tasks shown in a TaskList
+    """
+    return [task_list.store.text(ordinal) for ordinal in range(1, task_list.count() + 1)]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tab
+def test_tab_parse_entry():
+    """
+    Test that the priority, tags and due date are split out of a new task
+    """
+    text, attributes = Tab._parse_entry("Mow  lawn -- !High #garden due:2026-10-24 #Yard")
+    assert text == "Mow  lawn"
+    assert attributes == {
+        "priority": "high",
+        "tags": ["garden", "Yard"],
+        "due_date": "2026-10-24",
+    }
+    assert Tab._parse_entry("Buy  # -- ") == ("Buy  # -- ", {})
+    assert Tab._parse_entry("Call -- due:soon !urgent") == (
+        "Call -- due:soon !urgent",
+        {},
+    )
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tab
+@pytest.mark.parametrize(
+    "text",
+    ["Fix bug #123", "Say hi  to Bob !high", "Pay rent due:2026-10-24", "a -- b #c"],
+)
+def test_tab_parse_entry_keeps_plain_text(text):
+    """
+    Test that text with a literal # or ! and no metadata section is left unchanged
+    """
+    assert Tab._parse_entry(text) == (text, {})
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tab
+def test_tab_filter_bar(tab):
+    """
+    Test that the filter bar narrows and sorts the open tasks
+    """
+    today = QDate.currentDate().toString("yyyy-MM-dd")
+    for text in [
+        "Wash car",
+        f"Mow lawn -- !high #garden due:{today}",
+        "Weed -- !low #Garden",
+    ]:
+        tab.widgets["entry_field"].setText(text)
+        tab._add_task()
+    todo_list = tab.widgets["todo_list"]
+    assert _tasks(todo_list) == ["Wash car", "Mow lawn", "Weed"]
+    tag_filter = tab.widgets["tag_filter"]
+    assert [tag_filter.itemText(i) for i in range(tag_filter.count())] == [
+        "Any tag",
+        "garden",
+    ]
+
+    tab.widgets["sort_menu"].set_selected_option("Sort by priority")
+    assert _tasks(todo_list) == ["Mow lawn", "Weed", "Wash car"]
+    tag_filter.set_selected_option("garden")
+    assert _tasks(todo_list) == ["Mow lawn", "Weed"]
+    tab.widgets["due_filter"].set_selected_option("Due today")
+    assert _tasks(todo_list) == ["Mow lawn"]
+    tab.widgets["entry_field"].setText("Rake leaves")
+    tab._add_task()
+    assert _tasks(todo_list) == ["Mow lawn"]
+    tab.widgets["due_filter"].set_selected_option("Any due date")
+    tag_filter.set_selected_option("Any tag")
+    assert todo_list.count() == 4
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tab
+def test_tab_undo_and_redo(tab):
+    """
+    Test that undo and redo restore the task lists
+    """
+    for text in ["Wash car", "Mow lawn"]:
+        tab.widgets["entry_field"].setText(text)
+        tab._add_task()
+    todo_list = tab.widgets["todo_list"]
+    todo_list.setCurrentIndex(todo_list.model().index(0, 0))
+    tab._retire_task()
+    assert _tasks(todo_list) == ["Mow lawn"]
+
+    success, _ = tab.undo()
+    assert success
+    assert _tasks(todo_list) == ["Wash car", "Mow lawn"]
+    assert tab.widgets["completed_list"].count() == 0
+    tab.redo()
+    assert _tasks(todo_list) == ["Mow lawn"]
+    assert _tasks(tab.widgets["completed_list"]) == ["Wash car"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _select(task_list: TaskList, rows: list[int]) -> None:
+    """
+    Adds rows of a task list to its selection
+    """
+    flags = QItemSelectionModel.SelectionFlag
+    for row in rows:
+        index = task_list.model().index(row, 0)
+        task_list.selectionModel().select(index, flags.Select | flags.Rows)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tab
+def test_tab_bulk_retire_and_delete(tab, monkeypatch):
+    """
+    Test that the selected tasks are retired and deleted together
+    """
+    for text in ["Wash car", "Mow lawn", "Pay rent", "Weed"]:
+        tab.widgets["entry_field"].setText(text)
+        tab._add_task()
+    todo_list = tab.widgets["todo_list"]
+    completed_list = tab.widgets["completed_list"]
+    _select(todo_list, [0, 2, 3])
+    tab._retire_task()
+    assert _tasks(todo_list) == ["Mow lawn"]
+    assert _tasks(completed_list) == ["Wash car", "Pay rent", "Weed"]
+
+    _select(todo_list, [0])
+    _select(completed_list, [0, 2])
+    assert todo_list.selected_task_ids() == []
+    monkeypatch.setattr(
+        QMessageBox, "question", lambda *args: QMessageBox.StandardButton.Yes
+    )
+    tab._delete_task()
+    assert _tasks(completed_list) == ["Pay rent"]
+    _, df, _ = tab.db.select_closed_tasks("ALL")
+    assert df["task"].tolist() == ["Pay rent"]
+
+    tab.undo()
+    assert _tasks(completed_list) == ["Wash car", "Pay rent", "Weed"]
+    tab.undo()
+    assert _tasks(todo_list) == ["Wash car", "Mow lawn", "Pay rent", "Weed"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.tab
+def test_aggregate_tab_selects_tasks_completed_on_date(tab):
+    """
+    Test that the aggregate view reads the tasks completed on the date it is given
+    """
+    _, _, task_id = tab.db.insert_task("Mow lawn")
+    tab.db.complete_task(task_id)
+    today = QDate.currentDate()
+    for day, expected in [(today, ["Mow lawn"]), (today.addDays(1), [])]:
+        date = day.toString("yyyy-MM-dd")
+        success, (_, closed), _ = AggregateTab._select_tasks("DAY", date, tab.db)
+        assert success and closed["task"].tolist() == expected
+
+
 # ==========================================================================================
 # ==========================================================================================
 # eof
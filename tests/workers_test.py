@@ -0,0 +1,96 @@
+# Import necessary packages here
+import pytest
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from todo_six.workers import DatabaseScheduler
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    workers_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the DatabaseScheduler class in the workers.py file
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+class _CountScheduler(DatabaseScheduler):
+    """
+    Scheduler that counts the open tasks of each database
+    """
+
+    _label = "Count"
+
+    def __init__(self, thread_pool: QThreadPool):
+        super().__init__(thread_pool)
+        self.counts = {}
+
+    def _job(self):
+        def count(database):
+            success, df, message = database.select_open_tasks()
+            return success, len(df) if success else 0, message
+
+        return count
+
+    def _publish(self, key: str, count: int) -> None:
+        self.counts[key] = count
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.workers
+def test_scheduler_runs_job_of_each_database_on_worker(tmp_path, capsys, task_database):
+    app = QApplication.instance() or QApplication([])
+    database = task_database("chores.db", [("Mow lawn", "2026-10-19", None)])
+    database.remove_db()
+    db_name = database.db_name
+    broken = str(tmp_path / "missing" / "broken.db")
+
+    thread_pool = QThreadPool()
+    scheduler = _CountScheduler(thread_pool)
+    failures = []
+    scheduler.failed.connect(failures.append)
+    for name in [db_name, broken, db_name]:
+        scheduler.add_database(name)
+    scheduler.run_now()
+    scheduler.run_now()
+    assert scheduler.is_running()
+    thread_pool.waitForDone()
+    app.processEvents()
+
+    assert scheduler.counts == {db_name: 1}
+    assert len(failures) == 1
+    assert not scheduler.is_running()
+    assert f"Count of {broken} failed" in capsys.readouterr().err
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.workers
+def test_scheduler_stop_discards_outstanding_jobs(task_database):
+    app = QApplication.instance() or QApplication([])
+    database = task_database("chores.db", [("Mow lawn", "2026-10-19", None)])
+    database.remove_db()
+    db_name = database.db_name
+    thread_pool = QThreadPool()
+    scheduler = _CountScheduler(thread_pool)
+    scheduler.add_database(db_name)
+    scheduler.remove_database(db_name)
+    scheduler.run_now()
+    assert not scheduler.is_running()
+
+    scheduler.add_database(db_name)
+    scheduler.run_now()
+    scheduler.stop()
+    thread_pool.waitForDone()
+    app.processEvents()
+    assert scheduler.counts == {} and not scheduler.is_running()
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,174 @@
+# Import necessary packages here
+import pytest
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QApplication
+
+from todo_six.database import ToDoDatabase
+from todo_six.widgets import Tab
+from todo_six.write_behind import WriteBehindQueue
+
+# ==========================================================================================
+# ==========================================================================================
+# File:    write_behind_test.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file tests the methods and classes in the write_behind.py file
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = ToDoDatabase(str(tmp_path / "write_behind_test.db"))
+    db.open_db()
+    db.create_tasks_table()
+    yield db
+    db.remove_db()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.fixture
+def write_queue(app, database):
+    writes = WriteBehindQueue(database.db_name, interval=2)
+    success, _ = writes.start()
+    assert success
+    yield writes
+    writes.close()
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.writebehind
+def test_insert_is_committed_after_flush(app, database, write_queue):
+    committed = {}
+    write_queue.committed.connect(committed.update)
+    first = write_queue.insert_task("Mow lawn")
+    second = write_queue.insert_task("Wash car")
+    assert (first, second) == (-1, -2)
+    assert write_queue.pending() == 2
+
+    assert write_queue.flush(timeout=5)
+    app.processEvents()
+    assert write_queue.pending() == 0
+    _, df, _ = database.select_open_tasks()
+    assert df["task"].tolist() == ["Mow lawn", "Wash car"]
+    assert committed == dict(zip([first, second], df["task_id"].tolist()))
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.writebehind
+def test_provisional_ids_can_be_completed_and_deleted(app, database, write_queue):
+    done = write_queue.insert_task("Mow lawn")
+    removed = write_queue.insert_task("Wash car")
+    write_queue.complete_task(done)
+    write_queue.delete_task(removed)
+    assert write_queue.flush(timeout=5)
+    app.processEvents()
+
+    _, open_tasks, _ = database.select_open_tasks()
+    _, closed_tasks, _ = database.select_closed_tasks("ALL")
+    assert open_tasks.empty
+    assert closed_tasks["task"].tolist() == ["Mow lawn"]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.writebehind
+def test_bulk_writes_use_provisional_ids(app, database, write_queue):
+    task_ids = [
+        write_queue.insert_task(task) for task in ["Mow lawn", "Wash car", "Weed"]
+    ]
+    write_queue.complete_tasks(task_ids[:2])
+    write_queue.delete_tasks(task_ids[2:])
+    assert write_queue.flush(timeout=5)
+    _, df, _ = database.select_closed_tasks("ALL")
+    assert sorted(df["task"]) == ["Mow lawn", "Wash car"]
+    _, df, _ = database.select_open_tasks()
+    assert df.empty
+    assert database.undo()[2] == 1
+    assert database.undo()[2] == 2
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.writebehind
+def test_failed_write_is_rolled_back_alone(app, database, write_queue):
+    failures = []
+    write_queue.failed.connect(failures.append)
+    for task in ["Mow lawn", "Wash car", "Weed"]:
+        database.insert_task(task)
+    database.db_query(
+        "CREATE TRIGGER refuse_task BEFORE INSERT ON journal WHEN NEW.task_id = 2 "
+        "BEGIN SELECT RAISE(ABORT, 'refused'); END;"
+    )
+    write_queue.complete_tasks([1, 2])
+    write_queue.complete_task(3)
+    assert write_queue.flush(timeout=5)
+    app.processEvents()
+    _, df, _ = database.select_closed_tasks("ALL")
+    assert df["task"].tolist() == ["Weed"]
+    assert len(failures) == 1
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.writebehind
+def test_close_commits_queued_writes(app, database):
+    writes = WriteBehindQueue(database.db_name, interval=1000)
+    writes.start()
+    writes.insert_task("Mow lawn")
+    writes.close()
+    assert not writes.is_active()
+    _, df, _ = database.select_open_tasks()
+    assert df["task"].tolist() == ["Mow lawn"]
+    with pytest.raises(RuntimeError):
+        writes.insert_task("Wash car")
+
+
+# ------------------------------------------------------------------------------------------
+
+
+@pytest.mark.writebehind
+def test_tab_shows_tasks_before_commit(app, database):
+    tab = Tab(QFont(), "write_behind_test", database, write_behind=True)
+    todo_list = tab.widgets["todo_list"]
+    tab.widgets["entry_field"].setText("Mow lawn")
+    tab._add_task()
+    assert todo_list.count() == 1
+    assert todo_list.store.task_id(1) < 0
+
+    assert tab.write_queue.flush(timeout=5)
+    app.processEvents()
+    _, df, _ = database.select_open_tasks()
+    assert todo_list.store.task_id(1) == df["task_id"].iloc[0]
+
+    todo_list.setCurrentIndex(todo_list.model().index(0, 0))
+    tab._retire_task()
+    assert todo_list.count() == 0
+    assert tab.widgets["completed_list"].count() == 1
+    tab.close_write_queue()
+    _, df, _ = database.select_closed_tasks("ALL")
+    assert df["task"].tolist() == ["Mow lawn"]
+    tab.monitor.stop()
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
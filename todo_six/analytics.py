@@ -0,0 +1,364 @@
+# Import necessary packages here
+import glob
+import os
+import sqlite3
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from todo_six.backends import read_only_uri
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    analytics.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains functions that compute completion statistics over one
+#          or many todo_six databases with vectorized NumPy operations
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+# Dates are handled as integer day numbers counted from 1970-01-01, which is also the
+# integer representation of a NumPy datetime64[D].  Tasks without an end date carry
+# NULL_DAY, which NumPy interprets as NaT.
+NULL_DAY = int(np.iinfo(np.int64).min)
+PERIODS = {"DAY": "D", "WEEK": "W", "MONTH": "M", "YEAR": "Y"}
+
+_DAY_QUERY = (
+    "SELECT CAST(julianday(start_date) - 2440587.5 AS INTEGER), "
+    "COALESCE(CAST(julianday(end_date) - 2440587.5 AS INTEGER), ?) "
+    "FROM {} WHERE julianday(start_date) IS NOT NULL;"
+)
+
+
+class TaskStatistics:
+    """
+    Class that holds completion statistics for one database, or the merged
+    statistics of several databases.  Every attribute is a count or a sum, so
+    statistics from separate files can be merged without revisiting the data.
+
+    :param files: The number of databases the statistics describe
+    """
+
+    def __init__(self, files: int = 0):
+        self.files = files
+        self.tasks = 0
+        self.open_tasks = 0
+        self.completed_tasks = 0
+        self.open_on_date = 0
+        self.close_days_total = 0
+        self.completed_per_period = Counter()
+
+    # ------------------------------------------------------------------------------------------
+
+    @property
+    def mean_time_to_close(self) -> float:
+        """
+        The mean number of days between the start and end date of completed tasks,
+        or NaN if no task has been completed
+        """
+        if self.completed_tasks == 0:
+            return float("nan")
+        return self.close_days_total / self.completed_tasks
+
+    # ------------------------------------------------------------------------------------------
+
+    def merge(self, other: "TaskStatistics") -> None:
+        """
+        Method to add the statistics of another database to these statistics
+
+        :param other: A TaskStatistics object
+        """
+        self.files += other.files
+        self.tasks += other.tasks
+        self.open_tasks += other.open_tasks
+        self.completed_tasks += other.completed_tasks
+        self.open_on_date += other.open_on_date
+        self.close_days_total += other.close_days_total
+        self.completed_per_period.update(other.completed_per_period)
+
+    # ------------------------------------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        """
+        Method to return the statistics as a dictionary
+
+        :return: A dictionary of every statistic, including the mean time to close
+        """
+        return {
+            "files": self.files,
+            "tasks": self.tasks,
+            "open_tasks": self.open_tasks,
+            "completed_tasks": self.completed_tasks,
+            "open_on_date": self.open_on_date,
+            "mean_time_to_close": self.mean_time_to_close,
+            "completed_per_period": dict(sorted(self.completed_per_period.items())),
+        }
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+def to_day_number(date: str) -> int:
+    """
+    Function to convert a date string to a day number
+
+    :param date: A date string in the format "%Y-%m-%d"
+    :return: The number of days between 1970-01-01 and the date
+    """
+    return int(np.datetime64(date, "D").astype(np.int64))
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def read_task_days(
+    db_name: str, chunk_size: int = 65536
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Function to read the start and end dates of every task as day numbers.  The
+    database is opened read-only and rows are fetched in chunks of ``chunk_size``,
+    so no more than one chunk of rows exists as Python objects at a time.  Tasks
+    moved to the tasks_archive table are read as well, and tasks whose start date
+    is not a valid date are skipped.
+
+    :param db_name: The name and path length to the SQLite database
+    :param chunk_size: The number of rows fetched per chunk
+    :return: Two int64 arrays containing the start and end day numbers.  Tasks
+             that are still open have an end day of NULL_DAY
+    """
+    connection = sqlite3.connect(read_only_uri(db_name), uri=True)
+    try:
+        tables = ["tasks"]
+        archive = "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?;"
+        if connection.execute(archive, ("tasks_archive",)).fetchone():
+            tables.insert(0, "tasks_archive")
+        chunks = []
+        for table in tables:
+            cursor = connection.execute(_DAY_QUERY.format(table), (NULL_DAY,))
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                chunks.append(np.array(rows, dtype=np.int64))
+    finally:
+        connection.close()
+    if not chunks:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+    days = np.concatenate(chunks)
+    return np.ascontiguousarray(days[:, 0]), np.ascontiguousarray(days[:, 1])
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def count_open_on_date(start_days: np.ndarray, end_days: np.ndarray, day: int) -> int:
+    """
+    Function to count the tasks that were open on a day.  A task is open on a day
+    if it started on or before the day and was not completed by the day.
+
+    :param start_days: An array of start day numbers
+    :param end_days: An array of end day numbers, NULL_DAY for open tasks
+    :param day: The day number to test
+    :return: The number of tasks open on the day
+    """
+    still_open = (end_days > day) | (end_days == NULL_DAY)
+    return int(np.count_nonzero((start_days <= day) & still_open))
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def count_open_per_day(
+    start_days: np.ndarray, end_days: np.ndarray, first_day: int, last_day: int
+) -> np.ndarray:
+    """
+    Function to count the tasks open on every day of a date range with a single
+    sweep.  Each task adds one to the day it started and subtracts one on the day it
+    was completed, and a cumulative sum of those changes gives the open count, so
+    the cost is O(tasks + days) rather than one pass over the tasks per day.
+
+    :param start_days: An array of start day numbers
+    :param end_days: An array of end day numbers, NULL_DAY for open tasks
+    :param first_day: The day number of the first day in the range
+    :param last_day: The day number of the last day in the range
+    :return: An int64 array with the number of open tasks on each day of the range
+    """
+    n_days = last_day - first_day + 1
+    if n_days <= 0:
+        return np.zeros(0, dtype=np.int64)
+    # Tasks that started before the range are counted as starting on its first day,
+    # and changes after the range fall into a final bucket that is discarded
+    started = start_days <= last_day
+    start_index = np.maximum(start_days[started] - first_day, 0)
+    ends = end_days[started]
+    ends = ends[ends != NULL_DAY]
+    end_index = np.clip(ends - first_day, 0, n_days)
+    delta = np.bincount(start_index, minlength=n_days + 1)
+    delta -= np.bincount(end_index, minlength=n_days + 1)
+    return np.cumsum(delta[:n_days])
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def close_durations(start_days: np.ndarray, end_days: np.ndarray) -> np.ndarray:
+    """
+    Function to compute the number of days each completed task was open
+
+    :param start_days: An array of start day numbers
+    :param end_days: An array of end day numbers, NULL_DAY for open tasks
+    :return: An int64 array with one duration per completed task
+    """
+    completed = end_days != NULL_DAY
+    return end_days[completed] - start_days[completed]
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def count_completed_per_period(end_days: np.ndarray, period: str = "MONTH") -> Counter:
+    """
+    Function to count the tasks completed in each day, week, month or year
+
+    :param end_days: An array of end day numbers, NULL_DAY for open tasks
+    :param period: 'DAY', 'WEEK', 'MONTH' or 'YEAR'
+    :return: A Counter mapping the ISO label of each period to the number of
+             tasks completed in that period.  Weeks are labelled by their Monday.
+    """
+    period = period.upper()
+    if period not in PERIODS:
+        raise ValueError("period not correctly formatted")
+    completed = end_days[end_days != NULL_DAY]
+    if period == "WEEK":
+        # Day 0 (1970-01-01) was a Thursday, so shift by 3 days to start on Monday
+        keys = (completed + 3) // 7 * 7 - 3
+        dates = keys.astype("datetime64[D]")
+    else:
+        dates = completed.astype("datetime64[D]").astype(f"datetime64[{PERIODS[period]}]")
+    labels, counts = np.unique(dates, return_counts=True)
+    return Counter(dict(zip(labels.astype(str).tolist(), counts.tolist())))
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def file_statistics(
+    db_name: str, period: str = "MONTH", on_date: str = None
+) -> tuple[bool, TaskStatistics, str]:
+    """
+    Function to compute the completion statistics of a single database
+
+    :param db_name: The name and path length to the SQLite database
+    :param period: 'DAY', 'WEEK', 'MONTH' or 'YEAR', the period used to count
+                   completed tasks
+    :param on_date: A date string in the format "%Y-%m-%d" used to count the tasks
+                    open on that date, today if None
+    :return: A tuple containing a boolean, a TaskStatistics object and a string.
+             A boolean of True indicates the operation was successful, and the
+             string contains a description of the result
+    """
+    if period.upper() not in PERIODS:
+        return False, TaskStatistics(), "period not correctly formatted"
+    day = (
+        to_day_number(on_date) if on_date else to_day_number(str(np.datetime64("today")))
+    )
+    try:
+        start_days, end_days = read_task_days(db_name)
+    except (sqlite3.Error, TypeError, ValueError) as error:
+        return False, TaskStatistics(), f"Failed to read {db_name}: {error}"
+
+    durations = close_durations(start_days, end_days)
+    stats = TaskStatistics(files=1)
+    stats.tasks = len(start_days)
+    stats.completed_tasks = len(durations)
+    stats.open_tasks = stats.tasks - stats.completed_tasks
+    stats.open_on_date = count_open_on_date(start_days, end_days, day)
+    stats.close_days_total = int(durations.sum())
+    stats.completed_per_period = count_completed_per_period(end_days, period)
+    return True, stats, f"Statistics computed for {db_name}"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def scan_directory(
+    directory: str,
+    period: str = "MONTH",
+    on_date: str = None,
+    pattern: str = "*.db",
+    max_workers: int = None,
+) -> tuple[bool, dict, str]:
+    """
+    Function to compute completion statistics for every database in a directory.
+    Each database is processed independently in a process pool, so the work scales
+    with the number of cores, and the per-file statistics are merged as they
+    complete.
+
+    :param directory: The directory containing the databases
+    :param period: 'DAY', 'WEEK', 'MONTH' or 'YEAR', the period used to count
+                   completed tasks
+    :param on_date: A date string in the format "%Y-%m-%d" used to count the tasks
+                    open on that date, today if None
+    :param pattern: The glob pattern used to find databases in the directory
+    :param max_workers: The number of worker processes, the number of cores if None
+    :return: A tuple containing a boolean, a dictionary and a string.  The
+             dictionary contains the key ``files`` mapping each database to its
+             TaskStatistics, ``total`` containing the merged TaskStatistics and
+             ``errors`` mapping each database that could not be read to a
+             description of the failure
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.analytics import scan_directory
+
+        success, result, message = scan_directory("archive", period="YEAR")
+        print(result["total"].to_dict())
+
+        >> {'files': 212, 'tasks': 48120, 'open_tasks': 311, ...}
+    """
+    if not os.path.isdir(directory):
+        return False, {}, f"{directory} is not a directory"
+    if period.upper() not in PERIODS:
+        return False, {}, "period not correctly formatted"
+
+    db_names = sorted(glob.glob(os.path.join(directory, pattern)))
+    result = {"files": {}, "total": TaskStatistics(), "errors": {}}
+    if not db_names:
+        return True, result, f"No databases found in {directory}"
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(file_statistics, db_name, period, on_date): db_name
+            for db_name in db_names
+        }
+        for future in as_completed(futures):
+            db_name = futures[future]
+            try:
+                success, stats, message = future.result()
+            except Exception as error:
+                success, stats, message = (
+                    False,
+                    None,
+                    f"Failed to read {db_name}: {error}",
+                )
+            if success:
+                result["files"][db_name] = stats
+                result["total"].merge(stats)
+            else:
+                result["errors"][db_name] = message
+
+    msg = f"Statistics computed for {len(result['files'])} of {len(db_names)} databases"
+    return not result["errors"], result, msg
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,565 @@
+# Import necessary packages here
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pandas as pd
+
+from todo_six.database import JOURNAL_LIMIT, ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    async_database.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains an asyncio interface to the ToDoDatabase class for
+#          scripts and services that run on an event loop
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+class AsyncToDoDatabase:
+    """
+    Class that exposes the ToDoDatabase methods as coroutines.
+
+    Qt SQL and sqlite3 connections may only be used from the thread that created
+    them, so every connection is opened and used by a single executor thread.
+    Methods that modify the database run on one writer thread that owns its own
+    connection, which keeps writes in the order they were awaited.  Methods that
+    only read the database run on a pool of ``readers`` threads, each with its own
+    connection, so several reads can run at the same time as each other and as a
+    write.  Each coroutine returns
+    the same tuple as the ToDoDatabase method of the same name.
+
+    The coroutines wait on ``concurrent.futures`` objects, so they can be awaited
+    from any asyncio event loop, including a qasync loop driving the Qt user
+    interface.
+
+    :param db_name: The name and path length to the SQLite database
+    :param readers: The number of threads, and connections, used for reads
+    :param backend: 'qt' or 'sqlite3', the storage backend of each connection
+
+    Example:
+
+    .. code-block::
+
+        import asyncio
+        from todo_six.async_database import AsyncToDoDatabase
+
+        async def main():
+            async with AsyncToDoDatabase("chores.db") as db:
+                await db.create_tasks_table()
+                await db.insert_task("Mow lawn")
+                success, df, message = await db.select_open_tasks()
+                print(df)
+
+        asyncio.run(main())
+
+        >>    task_id      task  start_date
+        >> 0        1  Mow lawn  2026-10-19
+    """
+
+    def __init__(self, db_name: str, readers: int = 4, backend: str = "qt"):
+        if readers < 1:
+            raise ValueError("readers must be at least 1")
+        self.db_name = db_name
+        self.readers = readers
+        self.backend = backend
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="todo_six-writer")
+        self._reader = ThreadPoolExecutor(readers, thread_name_prefix="todo_six-reader")
+        self._writer_db = None
+        self._local = threading.local()
+        self._closed = False
+
+    # ------------------------------------------------------------------------------------------
+
+    async def __aenter__(self) -> "AsyncToDoDatabase":
+        success, message = await self.open_db()
+        if not success:
+            await self.close_db()
+            raise ConnectionError(message)
+        return self
+
+    # ------------------------------------------------------------------------------------------
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close_db()
+
+    # ------------------------------------------------------------------------------------------
+
+    async def open_db(self) -> tuple[bool, str]:
+        """
+        Method to open the connection of the writer thread.  The reader connections
+        are opened the first time each reader thread is used.
+
+        :return: A tuple containing a boolean and a string.  A boolean of True
+                 indicates the operation was successful, and the string contains a
+                 description of the result
+        """
+        return await self._run(self._writer, self._open_writer)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def close_db(self) -> tuple[bool, str]:
+        """
+        Method to close every connection and stop the executor threads.  Pending
+        calls are completed first, and the object cannot be used afterwards.
+
+        :return: A tuple containing a boolean and a string.  A boolean of True
+                 indicates the operation was successful, and the string contains a
+                 description of the result
+        """
+        if self._closed:
+            return False, f"{self.db_name} database is not open"
+        self._closed = True
+        # Each reader connection must be removed by the thread that created it, so
+        # one job per thread waits at a barrier until every thread holds one
+        barrier = threading.Barrier(self.readers)
+        jobs = [
+            self._run(self._reader, self._close_reader, barrier)
+            for _ in range(self.readers)
+        ]
+        jobs.append(self._run(self._writer, self._close_writer))
+        await asyncio.gather(*jobs)
+        self._reader.shutdown()
+        self._writer.shutdown()
+        return True, f"{self.db_name} database succesfully closed"
+
+    # ------------------------------------------------------------------------------------------
+
+    async def db_query(self, query: str, params: tuple = None) -> tuple[bool, list, str]:
+        """
+        Method to execute a query on the writer thread.  A query object cannot leave
+        the thread of its connection, so the rows of the result are returned as a
+        list of tuples rather than as a query object.
+
+        :param query: A string query of a database
+        :param params: A tuple containing parameters to be included in the query
+        :return: A tuple containing a boolean, a list of row tuples and a string
+        """
+        return await self._run(self._writer, self._fetch_rows, query, params)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def table_schema(self, table_name: str) -> tuple[bool, dict[str, str], str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.table_schema`
+        """
+        return await self._read("table_schema", table_name)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def db_schema(self) -> tuple[bool, dict[str, dict[str, str]], str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.db_schema`
+        """
+        return await self._read("db_schema")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def create_table(
+        self, table_name: str, column_names: list[str], data_types: list[str]
+    ) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.create_table`
+        """
+        return await self._write("create_table", table_name, column_names, data_types)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def table_exists(self, table_name: str) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.table_exists`
+        """
+        return await self._read("table_exists", table_name)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def backup(
+        self,
+        dest: str,
+        pages_per_step: int = 256,
+        sleep: float = 0.005,
+        progress: Callable[[int, int], None] = None,
+        max_restarts: int = 3,
+    ) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.backup`.  The copy is made on a
+        reader thread, which also calls ``progress``, so writes keep being served
+        while a large database is copied.
+        """
+        return await self._read(
+            "backup", dest, pages_per_step, sleep, progress, max_restarts
+        )
+
+    # ------------------------------------------------------------------------------------------
+
+    async def create_tasks_table(self) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.create_tasks_table`
+        """
+        return await self._write("create_tasks_table")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def migrate(self) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.migrate`
+        """
+        return await self._write("migrate")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def insert_task(self, task: str) -> tuple[bool, str, int]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.insert_task`
+        """
+        return await self._write("insert_task", task)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def complete_task(self, task_id: int) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.complete_task`
+        """
+        return await self._write("complete_task", task_id)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def delete_task(self, task_id: int) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.delete_task`
+        """
+        return await self._write("delete_task", task_id)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def complete_tasks(self, task_ids: list[int]) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.complete_tasks`
+        """
+        return await self._write("complete_tasks", task_ids)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def delete_tasks(self, task_ids: list[int]) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.delete_tasks`
+        """
+        return await self._write("delete_tasks", task_ids)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def select_open_tasks(self) -> tuple[bool, pd.DataFrame, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.select_open_tasks`
+        """
+        return await self._read("select_open_tasks")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def select_closed_tasks(
+        self, time_frame: str, date: str = None
+    ) -> tuple[bool, pd.DataFrame, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.select_closed_tasks`
+
+        :param time_frame: 'DAY', 'WEEEK', 'MONTH', 'YEAR', 'ALL'
+        :param date: A date string in the format "%Y-%m-%d", the default date of
+                     ToDoDatabase.select_closed_tasks if None
+        """
+        if date is None:
+            return await self._read("select_closed_tasks", time_frame)
+        return await self._read("select_closed_tasks", time_frame, date)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def get_oldest_date(self) -> tuple[bool, str, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.get_oldest_date`
+        """
+        return await self._read("get_oldest_date")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def get_task_counts(self) -> tuple[bool, dict[str, int], str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.get_task_counts`
+        """
+        return await self._read("get_task_counts")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def get_date_bounds(self) -> tuple[bool, dict[str, str], str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.get_date_bounds`
+        """
+        return await self._read("get_date_bounds")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def get_former_open_tasks(self, date: str) -> tuple[bool, pd.DataFrame, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.get_former_open_tasks`
+        """
+        return await self._read("get_former_open_tasks", date)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def backlog_series(
+        self, start: str, end: str
+    ) -> tuple[bool, pd.DataFrame, pd.Series, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.backlog_series`
+        """
+        return await self._read("backlog_series", start, end)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def archive_tasks(self, cutoff: str) -> tuple[bool, str, int]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.archive_tasks`
+        """
+        return await self._write("archive_tasks", cutoff)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def export_archive(
+        self, dest: str, chunk_size: int = 65536, level: int = 6
+    ) -> tuple[bool, str, int]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.export_archive`
+        """
+        return await self._read("export_archive", dest, chunk_size, level)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def import_archive(self, source: str) -> tuple[bool, str, int]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.import_archive`
+        """
+        return await self._write("import_archive", source)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def add_recurrence(
+        self,
+        task: str,
+        frequency: str,
+        start: str = None,
+        interval: int = 1,
+        until: str = None,
+    ) -> tuple[bool, str, int]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.add_recurrence`
+        """
+        return await self._write(
+            "add_recurrence", task, frequency, start, interval, until
+        )
+
+    # ------------------------------------------------------------------------------------------
+
+    async def delete_recurrence(self, rule_id: int) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.delete_recurrence`
+        """
+        return await self._write("delete_recurrence", rule_id)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def select_recurrences(self) -> tuple[bool, pd.DataFrame, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.select_recurrences`
+        """
+        return await self._read("select_recurrences")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def materialize_recurrences(self, date: str = None) -> tuple[bool, str, int]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.materialize_recurrences`
+        """
+        return await self._write("materialize_recurrences", date)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def set_priority(self, task_id: int, priority: int | str) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.set_priority`
+        """
+        return await self._write("set_priority", task_id, priority)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def set_due_date(self, task_id: int, due_date: str = None) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.set_due_date`
+        """
+        return await self._write("set_due_date", task_id, due_date)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def add_tags(self, task_id: int, tags: list[str]) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.add_tags`
+        """
+        return await self._write("add_tags", task_id, tags)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def remove_tag(self, task_id: int, tag: str) -> tuple[bool, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.remove_tag`
+        """
+        return await self._write("remove_tag", task_id, tag)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def select_tags(self) -> tuple[bool, list[str], str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.select_tags`
+        """
+        return await self._read("select_tags")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def select_filtered_tasks(
+        self,
+        priority: int | str = None,
+        due_by: str = None,
+        tag: str = None,
+        order_by: str = "added",
+    ) -> tuple[bool, pd.DataFrame, str]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.select_filtered_tasks`
+        """
+        return await self._read("select_filtered_tasks", priority, due_by, tag, order_by)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def undo(self) -> tuple[bool, str, int]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.undo`
+        """
+        return await self._write("undo")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def redo(self) -> tuple[bool, str, int]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.redo`
+        """
+        return await self._write("redo")
+
+    # ------------------------------------------------------------------------------------------
+
+    async def prune_journal(self, keep: int = JOURNAL_LIMIT) -> tuple[bool, str, int]:
+        """
+        Awaitable version of :meth:`ToDoDatabase.prune_journal`
+        """
+        return await self._write("prune_journal", keep)
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    async def _run(self, executor: ThreadPoolExecutor, func: Callable, *args) -> Any:
+        """
+        Runs a function on an executor and waits for it without blocking the loop
+        """
+        return await asyncio.wrap_future(executor.submit(func, *args))
+
+    # ------------------------------------------------------------------------------------------
+
+    async def _write(self, method: str, *args) -> tuple:
+        """
+        Calls a ToDoDatabase method on the writer connection
+        """
+        return await self._run(self._writer, self._call_writer, method, args)
+
+    # ------------------------------------------------------------------------------------------
+
+    async def _read(self, method: str, *args) -> tuple:
+        """
+        Calls a ToDoDatabase method on the connection of a reader thread
+        """
+        return await self._run(self._reader, self._call_reader, method, args)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _open_writer(self) -> tuple[bool, str]:
+        """
+        Opens the writer connection, runs on the writer thread
+        """
+        if self._writer_db is None:
+            self._writer_db = ToDoDatabase(self.db_name, self.backend)
+        if self._writer_db.con.isOpen():
+            return True, f"{self.db_name} database is already open"
+        return self._writer_db.open_db()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _call_writer(self, method: str, args: tuple) -> tuple:
+        """
+        Calls a method on the writer connection, runs on the writer thread
+        """
+        if self._writer_db is None:
+            self._open_writer()
+        return getattr(self._writer_db, method)(*args)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _call_reader(self, method: str, args: tuple) -> tuple:
+        """
+        Calls a method on the connection of the current reader thread, opening the
+        connection the first time the thread is used
+        """
+        database = getattr(self._local, "database", None)
+        if database is None:
+            database = ToDoDatabase(self.db_name, self.backend)
+            database.open_db()
+            self._local.database = database
+        return getattr(database, method)(*args)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _fetch_rows(self, query: str, params: tuple) -> tuple[bool, list, str]:
+        """
+        Executes a query on the writer connection and reads every row of the result
+        """
+        if self._writer_db is None:
+            self._open_writer()
+        success, result, message = self._writer_db.db_query(query, params)
+        if not success:
+            return False, [], message
+        return True, self._writer_db.backend.fetch_rows(result), message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _close_reader(self, barrier: threading.Barrier) -> None:
+        """
+        Removes the connection of the current reader thread
+        """
+        barrier.wait()
+        database = getattr(self._local, "database", None)
+        if database is not None:
+            database.remove_db()
+            self._local.database = None
+
+    # ------------------------------------------------------------------------------------------
+
+    def _close_writer(self) -> None:
+        """
+        Removes the writer connection, runs on the writer thread
+        """
+        if self._writer_db is not None:
+            self._writer_db.remove_db()
+            self._writer_db = None
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,638 @@
+# Import necessary packages here
+import sqlite3
+from array import array
+from collections.abc import Iterable
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    backends.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the storage backends used by the SQLiteManager class to
+#          talk to a SQLite database through QtSql or the Python sqlite3 module
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+class QtSqlBackend:
+    """
+    Backend that stores data through the QSQLITE driver of QtSql.  QtSql is imported
+    when the backend is created, so programs that use the sqlite3 backend never load
+    it.  Connections are ``QSqlDatabase`` objects and queries are ``QSqlQuery``
+    objects.
+    """
+
+    name = "qt"
+
+    def __init__(self):
+        from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+        self._database = QSqlDatabase
+        self._query = QSqlQuery
+
+    # ------------------------------------------------------------------------------------------
+
+    def connect(
+        self,
+        db_name: str,
+        connection_name: str,
+        read_only: bool = False,
+        immutable: bool = False,
+    ):
+        """
+        Method to create a closed connection to a database
+
+        :param db_name: The name and path length to the SQLite database
+        :param connection_name: A unique name for the connection
+        :param read_only: If True the database is opened through a ``mode=ro`` URI
+        :param immutable: If True the read-only URI also carries ``immutable=1``
+        :return: A QSqlDatabase object
+        """
+        connection = self._database.addDatabase("QSQLITE", connection_name)
+        if read_only or immutable:
+            connection.setConnectOptions("QSQLITE_OPEN_URI;QSQLITE_OPEN_READONLY")
+            connection.setDatabaseName(read_only_uri(db_name, immutable))
+        else:
+            connection.setDatabaseName(db_name)
+        return connection
+
+    # ------------------------------------------------------------------------------------------
+
+    def query(self, connection):
+        """
+        Method to create a query on a connection
+
+        :param connection: A QSqlDatabase object
+        :return: A QSqlQuery object
+        """
+        return self._query(connection)
+
+    # ------------------------------------------------------------------------------------------
+
+    def fetch_rows(self, query) -> list[tuple]:
+        """
+        Method to read the remaining rows of an executed query
+
+        :param query: An executed QSqlQuery object
+        :return: A list with one tuple per row.  NULL values are returned as None
+        """
+        columns = range(query.record().count())
+        rows = []
+        while query.next():
+            rows.append(
+                tuple(
+                    None if query.isNull(index) else query.value(index)
+                    for index in columns
+                )
+            )
+        return rows
+
+    # ------------------------------------------------------------------------------------------
+
+    def fetch_block(self, query, size: int) -> list[tuple]:
+        """
+        Method to read up to ``size`` of the remaining rows of an executed query, so
+        a large result can be processed a block at a time
+
+        :param query: An executed QSqlQuery object
+        :param size: The largest number of rows to return
+        :return: A list with one tuple per row, empty once every row has been read.
+                 NULL values are returned as None
+        """
+        columns = range(query.record().count())
+        rows = []
+        while len(rows) < size and query.next():
+            rows.append(
+                tuple(
+                    None if query.isNull(index) else query.value(index)
+                    for index in columns
+                )
+            )
+        return rows
+
+    # ------------------------------------------------------------------------------------------
+
+    def fetch_columns(self, query, chunk_size: int = 65536) -> np.ndarray:
+        """
+        Method to read the remaining rows of an executed query whose columns are all
+        integers.  The values are written straight into a typed ``array('q')``, so
+        no Python object is kept per row.
+
+        :param query: An executed QSqlQuery object
+        :param chunk_size: Unused, QtSql returns one row at a time
+        :return: An int64 array with one row per result row and one column per
+                 result column
+        """
+        columns = query.record().count()
+        values = array("q")
+        while query.next():
+            values.extend(int(query.value(index)) for index in range(columns))
+        return np.frombuffer(values, dtype=np.int64).reshape(-1, columns)
+
+    # ------------------------------------------------------------------------------------------
+
+    def executemany(
+        self, connection, statement: str, rows: Iterable[tuple]
+    ) -> tuple[bool, str]:
+        """
+        Method to execute a statement once for each row of parameters
+
+        :param connection: An open QSqlDatabase object
+        :param statement: A SQL statement with ``?`` placeholders
+        :param rows: An iterable of parameter tuples
+        :return: A tuple containing a boolean and a string describing the result
+        """
+        rows = list(rows)
+        if not rows:
+            return True, "No rows to execute"
+        query = self._query(connection)
+        query.prepare(statement)
+        for column in zip(*rows):
+            query.addBindValue(list(column))
+        if not query.execBatch():
+            return False, f"Error executing query: {query.lastError().text()}"
+        return True, f"{len(rows)} rows executed"
+
+    # ------------------------------------------------------------------------------------------
+
+    def null_connection(self):
+        """
+        Method to create the invalid connection held once a connection is removed
+
+        :return: An invalid QSqlDatabase object
+        """
+        return self._database()
+
+    # ------------------------------------------------------------------------------------------
+
+    def remove(self, connection_name: str) -> None:
+        """
+        Method to remove a connection.  Every reference to the connection must be
+        released first, and the connection must be removed by the thread that
+        created it.
+
+        :param connection_name: The name of the connection
+        """
+        self._database.removeDatabase(connection_name)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class SQLite3Error:
+    """
+    Error description returned by :meth:`SQLite3Query.lastError`, mirroring the
+    ``isValid`` and ``text`` methods of a QSqlError
+
+    :param message: The error message, or an empty string if there is no error
+    """
+
+    def __init__(self, message: str = ""):
+        self.message = message
+
+    # ------------------------------------------------------------------------------------------
+
+    def isValid(self) -> bool:
+        return bool(self.message)
+
+    # ------------------------------------------------------------------------------------------
+
+    def text(self) -> str:
+        return self.message
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class SQLite3Record:
+    """
+    Column description returned by :meth:`SQLite3Query.record`
+
+    :param description: The ``description`` attribute of a sqlite3 cursor
+    """
+
+    def __init__(self, description: tuple = None):
+        self.description = description or ()
+
+    # ------------------------------------------------------------------------------------------
+
+    def count(self) -> int:
+        return len(self.description)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class SQLite3Connection:
+    """
+    Connection to a SQLite database through the Python sqlite3 module, with the
+    subset of the QSqlDatabase interface used by SQLiteManager.  The connection is
+    opened in autocommit mode, matching QtSql, so a transaction only exists between
+    :meth:`transaction` and :meth:`commit` or :meth:`rollback`.
+
+    :param db_name: The name and path length to the SQLite database
+    :param connection_name: A unique name for the connection
+    :param read_only: If True the database is opened through a ``mode=ro`` URI
+    :param immutable: If True the read-only URI also carries ``immutable=1``
+    """
+
+    def __init__(
+        self,
+        db_name: str,
+        connection_name: str,
+        read_only: bool = False,
+        immutable: bool = False,
+    ):
+        self.db_name = db_name
+        self.connection_name = connection_name
+        self.read_only = read_only or immutable
+        self.immutable = immutable
+        self.connection = None
+
+    # ------------------------------------------------------------------------------------------
+
+    def open(self) -> bool:
+        if self.connection is not None:
+            return True
+        try:
+            if self.read_only:
+                uri = read_only_uri(self.db_name, self.immutable)
+                self.connection = sqlite3.connect(uri, isolation_level=None, uri=True)
+            else:
+                self.connection = sqlite3.connect(self.db_name, isolation_level=None)
+        except sqlite3.Error:
+            return False
+        return True
+
+    # ------------------------------------------------------------------------------------------
+
+    def isOpen(self) -> bool:
+        return self.connection is not None
+
+    # ------------------------------------------------------------------------------------------
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    # ------------------------------------------------------------------------------------------
+
+    def connectionName(self) -> str:
+        return self.connection_name
+
+    # ------------------------------------------------------------------------------------------
+
+    def databaseName(self) -> str:
+        return self.db_name
+
+    # ------------------------------------------------------------------------------------------
+
+    def transaction(self) -> bool:
+        return self._execute("BEGIN;")
+
+    # ------------------------------------------------------------------------------------------
+
+    def commit(self) -> bool:
+        return self._execute("COMMIT;")
+
+    # ------------------------------------------------------------------------------------------
+
+    def rollback(self) -> bool:
+        return self._execute("ROLLBACK;")
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _execute(self, statement: str) -> bool:
+        """
+        Executes a statement without parameters, returning False if it failed
+        """
+        if self.connection is None:
+            return False
+        try:
+            self.connection.execute(statement)
+        except sqlite3.Error:
+            return False
+        return True
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class SQLite3Query:
+    """
+    Query on a SQLite3Connection with the subset of the QSqlQuery interface used by
+    SQLiteManager.  Rows are read from the cursor in blocks of ``arraysize`` with
+    ``fetchmany`` as :meth:`next` advances through the result.
+
+    :param connection: A SQLite3Connection object
+    :param arraysize: The number of rows read from the cursor at a time
+    """
+
+    def __init__(self, connection: SQLite3Connection, arraysize: int = 1024):
+        self.connection = connection
+        self.arraysize = arraysize
+        self._statement = None
+        self._params = []
+        self._cursor = None
+        self._rows = []
+        self._position = 0
+        self._row = None
+        self._error = SQLite3Error()
+
+    # ------------------------------------------------------------------------------------------
+
+    def prepare(self, statement: str) -> bool:
+        self._statement = statement
+        self._params = []
+        return True
+
+    # ------------------------------------------------------------------------------------------
+
+    def addBindValue(self, value: Any) -> None:
+        self._params.append(value)
+
+    # ------------------------------------------------------------------------------------------
+
+    def exec(self, statement: str = None) -> bool:
+        if statement is not None:
+            self.prepare(statement)
+        self._rows = []
+        self._position = 0
+        self._row = None
+        self._error = SQLite3Error()
+        if self.connection.connection is None:
+            self._error = SQLite3Error("Driver not loaded")
+            return False
+        try:
+            self._cursor = self.connection.connection.execute(
+                self._statement, self._params
+            )
+        except sqlite3.Error as error:
+            self._cursor = None
+            self._error = SQLite3Error(str(error))
+            return False
+        self._cursor.arraysize = self.arraysize
+        return True
+
+    # ------------------------------------------------------------------------------------------
+
+    def next(self) -> bool:
+        if self._position >= len(self._rows):
+            if self._cursor is None:
+                self._row = None
+                return False
+            self._rows = self._cursor.fetchmany()
+            self._position = 0
+            if not self._rows:
+                self._row = None
+                return False
+        self._row = self._rows[self._position]
+        self._position += 1
+        return True
+
+    # ------------------------------------------------------------------------------------------
+
+    def value(self, index: int) -> Any:
+        if self._row is None:
+            return None
+        return self._row[index]
+
+    # ------------------------------------------------------------------------------------------
+
+    def lastInsertId(self) -> int:
+        return None if self._cursor is None else self._cursor.lastrowid
+
+    # ------------------------------------------------------------------------------------------
+
+    def lastError(self) -> SQLite3Error:
+        return self._error
+
+    # ------------------------------------------------------------------------------------------
+
+    def record(self) -> SQLite3Record:
+        return SQLite3Record(None if self._cursor is None else self._cursor.description)
+
+    # ------------------------------------------------------------------------------------------
+
+    def fetch_block(self, size: int) -> list[tuple]:
+        """
+        Method to read up to ``size`` of the rows that :meth:`next` has not yet
+        returned
+
+        :param size: The largest number of rows to return
+        :return: A list with one tuple per row, empty once every row has been read
+        """
+        position = self._position
+        if position < len(self._rows):
+            rows = self._rows[position:]
+            self._rows = []
+            self._position = 0
+            self._row = None
+            return rows
+        self._row = None
+        if self._cursor is None:
+            return []
+        return self._cursor.fetchmany(size)
+
+    # ------------------------------------------------------------------------------------------
+
+    def fetch_remaining(self) -> list[tuple]:
+        """
+        Method to read every row that :meth:`next` has not yet returned
+
+        :return: A list with one tuple per row
+        """
+        rows = []
+        while True:
+            block = self.fetch_block(self.arraysize)
+            if not block:
+                return rows
+            rows.extend(block)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class SQLite3Backend:
+    """
+    Backend that stores data through the Python sqlite3 module.  It does not import
+    any part of Qt, so it suits scripts, services and worker processes that have no
+    user interface.
+    """
+
+    name = "sqlite3"
+
+    def connect(
+        self,
+        db_name: str,
+        connection_name: str,
+        read_only: bool = False,
+        immutable: bool = False,
+    ) -> SQLite3Connection:
+        """
+        Method to create a closed connection to a database
+
+        :param db_name: The name and path length to the SQLite database
+        :param connection_name: A unique name for the connection
+        :param read_only: If True the database is opened through a ``mode=ro`` URI
+        :param immutable: If True the read-only URI also carries ``immutable=1``
+        :return: A SQLite3Connection object
+        """
+        return SQLite3Connection(db_name, connection_name, read_only, immutable)
+
+    # ------------------------------------------------------------------------------------------
+
+    def query(self, connection: SQLite3Connection) -> SQLite3Query:
+        """
+        Method to create a query on a connection
+
+        :param connection: A SQLite3Connection object
+        :return: A SQLite3Query object
+        """
+        return SQLite3Query(connection)
+
+    # ------------------------------------------------------------------------------------------
+
+    def fetch_rows(self, query: SQLite3Query) -> list[tuple]:
+        """
+        Method to read the remaining rows of an executed query
+
+        :param query: An executed SQLite3Query object
+        :return: A list with one tuple per row
+        """
+        return query.fetch_remaining()
+
+    # ------------------------------------------------------------------------------------------
+
+    def fetch_block(self, query: SQLite3Query, size: int) -> list[tuple]:
+        """
+        Method to read up to ``size`` of the remaining rows of an executed query, so
+        a large result can be processed a block at a time
+
+        :param query: An executed SQLite3Query object
+        :param size: The largest number of rows to return
+        :return: A list with one tuple per row, empty once every row has been read
+        """
+        return query.fetch_block(size)
+
+    # ------------------------------------------------------------------------------------------
+
+    def fetch_columns(self, query: SQLite3Query, chunk_size: int = 65536) -> np.ndarray:
+        """
+        Method to read the remaining rows of an executed query whose columns are all
+        integers.  Rows are read in chunks of ``chunk_size``, so no more than one
+        chunk of rows exists as Python objects at a time.
+
+        :param query: An executed SQLite3Query object
+        :param chunk_size: The number of rows read per chunk
+        :return: An int64 array with one row per result row and one column per
+                 result column
+        """
+        columns = query.record().count()
+        chunks = []
+        while True:
+            rows = query.fetch_block(chunk_size)
+            if not rows:
+                break
+            values = chain.from_iterable(rows)
+            chunk = np.fromiter(values, dtype=np.int64, count=len(rows) * columns)
+            chunks.append(chunk.reshape(-1, columns))
+        if not chunks:
+            return np.empty((0, columns), dtype=np.int64)
+        return np.concatenate(chunks)
+
+    # ------------------------------------------------------------------------------------------
+
+    def executemany(
+        self, connection: SQLite3Connection, statement: str, rows: Iterable[tuple]
+    ) -> tuple[bool, str]:
+        """
+        Method to execute a statement once for each row of parameters
+
+        :param connection: An open SQLite3Connection object
+        :param statement: A SQL statement with ``?`` placeholders
+        :param rows: An iterable of parameter tuples
+        :return: A tuple containing a boolean and a string describing the result
+        """
+        try:
+            cursor = connection.connection.executemany(statement, rows)
+        except sqlite3.Error as error:
+            return False, f"Error executing query: {error}"
+        return True, f"{cursor.rowcount} rows executed"
+
+    # ------------------------------------------------------------------------------------------
+
+    def null_connection(self) -> SQLite3Connection:
+        """
+        Method to create the closed connection held once a connection is removed
+
+        :return: A closed SQLite3Connection object
+        """
+        return SQLite3Connection("", "")
+
+    # ------------------------------------------------------------------------------------------
+
+    def remove(self, connection_name: str) -> None:
+        """
+        Method to remove a connection.  A sqlite3 connection holds no resources once
+        it is closed, so there is nothing to remove.
+
+        :param connection_name: The name of the connection
+        """
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+BACKENDS = {"qt": QtSqlBackend, "sqlite3": SQLite3Backend}
+
+
+def read_only_uri(db_name: str, immutable: bool = False) -> str:
+    """
+    Function to build the URI that opens a database read-only.  With ``immutable``
+    SQLite also skips all file locking and change detection, so it must only be
+    used for files that no process will modify while they are open.
+
+    :param db_name: The name and path length to the SQLite database
+    :param immutable: If True ``immutable=1`` is added to the URI
+    :return: A ``file:`` URI with ``mode=ro``
+    """
+    uri = f"{Path(db_name).absolute().as_uri()}?mode=ro"
+    if immutable:
+        uri += "&immutable=1"
+    return uri
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def get_backend(name: str):
+    """
+    Function to create a storage backend by name
+
+    :param name: 'qt' or 'sqlite3'
+    :return: A QtSqlBackend or SQLite3Backend object
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(BACKENDS)}")
+    return BACKENDS[name]()
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,195 @@
+# Import necessary packages here
+import os
+import sys
+from datetime import datetime
+from functools import partial
+
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+
+from todo_six.database import SQLiteManager
+from todo_six.workers import DatabaseScheduler
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    backup.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the functions and class that copy todo_six databases
+#          with the SQLite online backup API while they remain in use
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+# Pages copied per step of a backup, 1 MB with the default 4096 byte pages
+PAGES_PER_STEP = 256
+# Format of the time stamp added to the name of each rolling backup
+STAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+
+def write_backup(
+    database: SQLiteManager, dest: str, pages_per_step: int = PAGES_PER_STEP
+) -> tuple[bool, str, str]:
+    """
+    Copies an open database to a file with :meth:`SQLiteManager.backup`.  The
+    function can be run as a DatabaseWorker job.
+
+    :param database: An open SQLiteManager or ToDoDatabase object
+    :param dest: The name and path length of the backup file
+    :param pages_per_step: The number of pages copied per step
+    :return: A tuple containing a boolean, the name of the backup file and a
+             string describing the result
+    """
+    success, message = database.backup(dest, pages_per_step)
+    if not success:
+        return False, "", message
+    return True, dest, message
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def list_backups(db_name: str, directory: str) -> list[str]:
+    """
+    Lists the rolling backups of a database held in a directory
+
+    :param db_name: The name and path length of the database
+    :param directory: The directory holding the backups
+    :return: The name and path length of each backup, oldest first
+    """
+    stem = os.path.splitext(os.path.basename(db_name))[0]
+    if not os.path.isdir(directory):
+        return []
+    backups = []
+    for name in os.listdir(directory):
+        base, extension = os.path.splitext(name)
+        prefix, _, stamp = base.rpartition("-")
+        prefix, _, day = prefix.rpartition("-")
+        if extension != ".db" or prefix != stem:
+            continue
+        try:
+            datetime.strptime(f"{day}-{stamp}", STAMP_FORMAT)
+        except ValueError:
+            continue
+        backups.append(os.path.join(directory, name))
+    return sorted(backups)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def rolling_backup(
+    database: SQLiteManager,
+    directory: str,
+    keep: int = 7,
+    pages_per_step: int = PAGES_PER_STEP,
+) -> tuple[bool, str, str]:
+    """
+    Copies an open database into a directory under a time stamped name and removes
+    all but the ``keep`` most recent backups of the database.  The function can be
+    run as a DatabaseWorker job.
+
+    :param database: An open SQLiteManager or ToDoDatabase object
+    :param directory: The directory holding the backups, created if it is missing
+    :param keep: The number of backups of the database to keep
+    :param pages_per_step: The number of pages copied per step
+    :return: A tuple containing a boolean, the name of the new backup file and a
+             string describing the result
+    """
+    stem = os.path.splitext(os.path.basename(database.db_name))[0]
+    stamp = datetime.now().strftime(STAMP_FORMAT)
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError as error:
+        return False, "", f"Failed to create {directory}: {error}"
+    dest = os.path.join(directory, f"{stem}-{stamp}.db")
+    success, dest, message = write_backup(database, dest, pages_per_step)
+    if not success:
+        return False, "", message
+
+    backups = list_backups(database.db_name, directory)
+    for old_backup in backups[: max(len(backups) - keep, 0)]:
+        try:
+            os.remove(old_backup)
+        except OSError as error:
+            sys.stderr.write(f"Failed to remove {old_backup}: {error}\n")
+    return True, dest, message
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class BackupScheduler(DatabaseScheduler):
+    """
+    Class that makes a rolling backup of each registered database every
+    ``interval`` ms.  Each backup runs on its own connection in a QThreadPool and
+    copies the database a few pages at a time with the SQLite online backup API, so
+    neither the user interface nor other writers wait for a large database to be
+    copied.  The name of each new backup is emitted through ``finished``.
+
+    :param directory: The directory holding the backups
+    :param interval: The milliseconds between backups
+    :param keep: The number of backups kept for each database
+    :param thread_pool: The QThreadPool used to run the backups, the global thread
+                        pool is used if None
+    :param parent: The parent QObject
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.backup import BackupScheduler
+
+        scheduler = BackupScheduler("/home/user/backups", interval=3600000)
+        scheduler.finished.connect(print)
+        scheduler.add_database("chores.db")
+        scheduler.start()
+    """
+
+    finished = pyqtSignal(str)
+    _label = "Backup"
+
+    def __init__(
+        self,
+        directory: str,
+        interval: int = 3600000,
+        keep: int = 7,
+        thread_pool: QThreadPool = None,
+        parent: QObject = None,
+    ):
+        super().__init__(thread_pool, parent)
+        self.directory = directory
+        self.keep = keep
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.run_now)
+
+    # ------------------------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """
+        Method to begin making backups every interval
+        """
+        self._timer.start()
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _job(self):
+        """
+        Method to return the backup job run against each database
+        """
+        return partial(rolling_backup, directory=self.directory, keep=self.keep)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _publish(self, key: str, dest: str) -> None:
+        """
+        Method to publish a finished backup
+        """
+        self.finished.emit(dest)
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
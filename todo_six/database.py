@@ -1,10 +1,25 @@
 # Import necessary packages here
+import os
+import sqlite3
 import sys
 import uuid
+from collections.abc import Callable, Iterable
+from contextlib import closing
 from datetime import datetime, timedelta
+from typing import Any
 
+import numpy as np
 import pandas as pd
-from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from todo_six.analytics import (
+    NULL_DAY,
+    close_durations,
+    count_open_per_day,
+    to_day_number,
+)
+from todo_six.backends import get_backend, read_only_uri
+from todo_six.recurrence import FREQUENCIES, due_occurrences
+from todo_six.task_archive import ArchiveWriter, date_strings, read_archive
 
 # ==========================================================================================
 # ==========================================================================================
@@ -18,8 +33,23 @@ from PyQt6.QtSql import QSqlDatabase, QSqlQuery
 # ==========================================================================================
 # Insert Code here
 
+# Bytes of a read-only database mapped into memory, larger files are mapped in part
+READ_ONLY_MMAP_SIZE = 256 * 1024 * 1024
+# Operations kept in the undo journal by ToDoDatabase.prune_journal
+JOURNAL_LIMIT = 1000
+
+
+class _BackupRestarted(Exception):
+    """
+    Raised to abandon a step by step backup that other connections keep restarting
+    """
+
+
+# ==========================================================================================
+# ==========================================================================================
+
 
-class SQLiteManager(QSqlDatabase):
+class SQLiteManager:
     """
     Class to manage generic SQLite functions
 
@@ -29,6 +59,15 @@ class SQLiteManager(QSqlDatabase):
     :param hostname: The hostname for the database, set to None for SQLite
     :param username: The username for database access, set to None for SQLite
     :param pwd: The password associated with the username, set to None for SQLite
+    :param backend: 'qt' to use the QSQLITE driver of QtSql or 'sqlite3' to use the
+                    Python sqlite3 module, which does not load any part of Qt
+    :param read_only: If True the database is opened with ``mode=ro`` and read
+                      through memory-mapped I/O, and every write fails
+    :param immutable: If True the database is also opened with ``immutable=1``, so
+                      SQLite takes no locks and never checks the file for changes.
+                      This implies ``read_only`` and must only be used for files
+                      that no process modifies while they are open, such as
+                      archived databases
 
     The SQLiteManager code examples assumes the existence of a SQLite database named
     'data.db' which contains a table named 'inventory' with the following structure:
@@ -59,6 +98,9 @@ class SQLiteManager(QSqlDatabase):
         hostname: str = None,
         username: str = None,
         pwd: str = None,
+        backend: str = "qt",
+        read_only: bool = False,
+        immutable: bool = False,
     ):
         msg = "Hostname, Username, and Password are no required in SQLite\n"
         if hostname is not None or username is not None or pwd is not None:
@@ -66,15 +108,22 @@ class SQLiteManager(QSqlDatabase):
         if connection_name is None:
             connection_name = str(uuid.uuid4())  # use a UUID as a unique connection name
         self.db_name = db_name
-        self.con = self.addDatabase("QSQLITE", connection_name)
-        self.con.setDatabaseName(db_name)
-        super().__init__()
+        self.read_only = read_only or immutable
+        self.immutable = immutable
+        self.backend = get_backend(backend)
+        self.con = self.backend.connect(
+            db_name, connection_name, self.read_only, immutable
+        )
+        # Schema catalog cached per connection and the schema_version it describes
+        self._catalog = None
+        self._catalog_version = None
 
     # ------------------------------------------------------------------------------------------
 
     def open_db(self) -> tuple[bool, str]:
         """
-        Method to open an existing database.
+        Method to open an existing database.  A read-only database is mapped into
+        memory up to READ_ONLY_MMAP_SIZE bytes, so pages are read without a copy.
 
         :return result: A tuple containing a boolean and a string.  A boolean of
                         True indicates the operation was successful, and the string
@@ -102,6 +151,9 @@ class SQLiteManager(QSqlDatabase):
             # Write to stderr for debugging
             sys.stderr.write(f"{self.db_name} database does not exist\n")
             return False, f"{self.db_name} database does not exist"
+        if self.read_only:
+            self.db_query(f"PRAGMA mmap_size = {READ_ONLY_MMAP_SIZE};")
+            return True, f"{self.db_name} database sucessfully opened read-only"
         return True, f"{self.db_name} database sucessfully opened"
 
     # ------------------------------------------------------------------------------------------
@@ -138,20 +190,23 @@ class SQLiteManager(QSqlDatabase):
             sys.stderr.write(f"{self.db_name} database is not open\n")
             return False, f"{self.db_name} database is not open"
         self.con.close()
+        self._catalog = None
         return True, f"{self.db_name} database succesfully closed"
 
     # ------------------------------------------------------------------------------------------
 
-    def db_query(self, query: str, params: tuple = None) -> tuple[bool, QSqlQuery, str]:
+    def db_query(self, query: str, params: tuple = None) -> tuple[bool, Any, str]:
         """
         Method to query a database
 
         :param query: A string query of a database
         :param params: A tuple containing parameters to be included in the query
-        :return result: A tuple containing a boolean, a QSqlQuery object, and a string.
+        :return result: A tuple containing a boolean, a query object, and a string.
                         The boolean indicates the operation was successful,
-                        the QSqlQuery object contains the query results (if any),
+                        the query object contains the query results (if any),
                         and the string contains a description of the result.
+                        The query object is a QSqlQuery for the qt backend and a
+                        SQLite3Query with the same interface for the sqlite3 backend
 
         .. code-block::
 
@@ -164,7 +219,7 @@ class SQLiteManager(QSqlDatabase):
             print(message)
 
             # - Example 1: Execute UPDATE statement with parameters
-            #  (does not return QSqlQuery object)
+            #  (does not return a query object)
             query = "UPDATE inventory SET Number = ? WHERE Product = ?;"
             params = (50, 'A')
             success, result, message = db_manager.db_query(query, params)
@@ -173,7 +228,7 @@ class SQLiteManager(QSqlDatabase):
             else:
                 print("Update failed:", message)
 
-            # Example 2: Execute SELECT statement (returns QSqlQuery object)
+            # Example 2: Execute SELECT statement (returns a query object)
             query = "SELECT * FROM inventory WHERE Product = ?;"
             params = ('A', )
             success, result, message = db_manager.db_query(query, params)
@@ -195,9 +250,10 @@ class SQLiteManager(QSqlDatabase):
         if not self.con.isOpen():
             # Write to stderr for debugging
             sys.stderr.write(f"{self.db_name} database is not open\n")
-            return False, QSqlQuery(), f"{self.db_name} database is not open"
+            message = f"{self.db_name} database is not open"
+            return False, self.backend.query(self.con), message
 
-        q = QSqlQuery(self.con)
+        q = self.backend.query(self.con)
 
         q.prepare(query)
 
@@ -210,12 +266,56 @@ class SQLiteManager(QSqlDatabase):
         if not success:
             error_message = q.lastError().text()
             sys.stderr.write(f"Error executing query: {error_message}\n")
-            return False, QSqlQuery(), f"Error executing query: {error_message}"
+            message = f"Error executing query: {error_message}"
+            return False, self.backend.query(self.con), message
 
         return True, q, f"Query executed successfully on {self.db_name} database"
 
     # ------------------------------------------------------------------------------------------
 
+    def db_executemany(self, query: str, rows: Iterable[tuple]) -> tuple[bool, str]:
+        """
+        Method to execute a statement once for each row of parameters.  The rows are
+        written in a single transaction unless a transaction is already open, in
+        which case they become part of it.
+
+        :param query: A string statement with ``?`` placeholders
+        :param rows: An iterable of tuples, each containing the parameters of one
+                     execution of the statement
+        :return: A tuple containing a boolean and a string. A boolean of
+                 True indicates the operation was successful, and the string
+                 contains a description of the result
+
+        Example:
+
+        .. code-block::
+
+            from todo_six.database import SQLiteManager
+
+            db_manager = SQLiteManager('data.db', backend='sqlite3')
+            db_manager.open_db()
+            rows = [(6, 'F', 35.5), (7, 'G', 40.0)]
+            query = "INSERT INTO inventory (ID, Product, Number) VALUES (?, ?, ?);"
+            success, message = db_manager.db_executemany(query, rows)
+            db_manager.close_db()
+        """
+        if not self.con.isOpen():
+            sys.stderr.write(f"{self.db_name} database is not open\n")
+            return False, f"{self.db_name} database is not open"
+
+        owns_transaction = self.con.transaction()
+        success, message = self.backend.executemany(self.con, query, rows)
+        if owns_transaction:
+            if success:
+                self.con.commit()
+            else:
+                self.con.rollback()
+        if not success:
+            sys.stderr.write(f"{message}\n")
+        return success, message
+
+    # ------------------------------------------------------------------------------------------
+
     def table_schema(self, table_name: str) -> tuple[bool, dict[str, str], str]:
         """
         Method to return the column names and datatypes for a table
@@ -246,20 +346,11 @@ class SQLiteManager(QSqlDatabase):
             >> {'ID': 'INTEGER', 'Product': 'TEXT', 'Number': 'REAL'}
 
         """
-        if not self.con.isOpen():
-            sys.stderr.write(f"{self.db_name} database is not open\n")
-            return False, {}, f"{self.db_name} database is not open"
-
-        query = QSqlQuery(self.con)
-        query_str = f"PRAGMA table_info({table_name})"
-        query.exec(query_str)
-
-        result = {}
-        while query.next():
-            column_name = query.value("name")
-            column_type = query.value("type")
-            result[column_name] = column_type
+        success, catalog, message = self._schema_catalog()
+        if not success:
+            return False, {}, message
 
+        result = dict(catalog.get(table_name, {}))
         return True, result, f"{self.db_name} queried for {table_name} schema"
 
     # ------------------------------------------------------------------------------------------
@@ -295,25 +386,11 @@ class SQLiteManager(QSqlDatabase):
             >> {'inventory': {'ID': 'INTEGER', 'Product': 'TEXT', 'Number': 'REAL'}}
 
         """
-        if not self.con.isOpen():
-            sys.stderr.write(f"{self.db_name} database is not open\n")
-            return False, {}, f"{self.db_name} database is not open"
-
-        table_query = QSqlQuery(self.con)
-        table_query.exec("SELECT name FROM sqlite_master WHERE type='table';")
-
-        result = {}
-        while table_query.next():
-            table_name = table_query.value("name")
-            column_query = QSqlQuery(self.con)
-            column_query.exec(f"PRAGMA table_info({table_name})")
-            table_schema = {}
-            while column_query.next():
-                column_name = column_query.value("name")
-                column_type = column_query.value("type")
-                table_schema[column_name] = column_type
-            result[table_name] = table_schema
+        success, catalog, message = self._schema_catalog()
+        if not success:
+            return False, {}, message
 
+        result = {name: dict(columns) for name, columns in catalog.items()}
         return True, result, f"{self.db_name} database schema queried"
 
     # ------------------------------------------------------------------------------------------
@@ -367,13 +444,15 @@ class SQLiteManager(QSqlDatabase):
         column_query = ", ".join(column_query_parts)
         query_str = f"CREATE TABLE {table_name} ({column_query});"
 
-        query = QSqlQuery(self.con)
+        query = self.backend.query(self.con)
         query.exec(query_str)
 
         msg = f"Failed to create table {table_name}: {query.lastError().text()}"
         if query.lastError().isValid():
             return False, msg
 
+        self._catalog = None
+
         return True, f"Table {table_name} successfully created"
 
     # ------------------------------------------------------------------------------------------
@@ -385,46 +464,402 @@ class SQLiteManager(QSqlDatabase):
         :param table_name: The name of the table
         :return: True if the table exists, False otherwise
         """
-        if not self.con.isOpen():
-            sys.stderr.write(f"{self.db_name} database is not open\n")
-            return False, f"{self.db_name} database is not open"
-
-        query = QSqlQuery(self.con)
-        query_str = "SELECT name FROM sqlite_master WHERE "
-        query_str += f"type='table' AND name='{table_name}';"
-        query.exec(query_str)
+        success, catalog, message = self._schema_catalog()
+        if not success:
+            return False, message
 
-        if query.next():
+        if table_name in catalog:
             return True, f"Table {table_name} exists in {self.db_name} database"
         else:
             return False, f"Table {table_name} does not exist in {self.db_name} database"
 
     # ------------------------------------------------------------------------------------------
 
+    def backup(
+        self,
+        dest: str,
+        pages_per_step: int = 256,
+        sleep: float = 0.005,
+        progress: Callable[[int, int], None] = None,
+        max_restarts: int = 3,
+    ) -> tuple[bool, str]:
+        """
+        Method to copy the database to a file with the SQLite online backup API.
+        The copy is made ``pages_per_step`` pages at a time and the database is
+        released for ``sleep`` seconds between steps, so other connections keep
+        reading and writing while a large database is copied.  If another
+        connection commits during the copy, SQLite restarts the copy from the first
+        page, while commits made through the connection being copied are applied to
+        the copy as it runs.  A database written to so often that the copy has
+        restarted ``max_restarts`` times is copied in a single step instead, which
+        holds a read lock for the length of the copy.  The copy is written to
+        ``dest`` with a ``.part`` suffix and renamed once it is complete, so
+        ``dest`` never holds a partial copy.
+
+        :param dest: The name and path length of the backup file, which is replaced
+                     if it exists
+        :param pages_per_step: The number of pages copied per step
+        :param sleep: The seconds waited between steps
+        :param progress: A callable accepting the number of pages remaining and the
+                         total number of pages, called after each step
+        :param max_restarts: The number of restarts allowed before the remaining
+                             copy is made in one step
+        :return: A tuple containing a boolean and a string.  A boolean of True
+                 indicates the operation was successful, and the string contains a
+                 description of the result
+
+        Example:
+
+        .. code-block::
+
+            from todo_six.database import SQLiteManager
+
+            db_manager = SQLiteManager('data.db')
+            db_manager.open_db()
+            success, message = db_manager.backup('data-backup.db')
+            print(message)
+
+            >> data.db backed up to data-backup.db
+        """
+        if not self.con.isOpen():
+            sys.stderr.write(f"{self.db_name} database is not open\n")
+            return False, f"{self.db_name} database is not open"
+        if self.backend.name != "sqlite3" and self.db_name in ("", ":memory:"):
+            return False, "An in-memory database can only be backed up by sqlite3"
+
+        # The sqlite3 backend copies through its own connection, the QtSql driver
+        # does not expose the backup API, so a separate connection is used
+        partial = f"{dest}.part"
+        args = (pages_per_step, sleep, max_restarts, progress)
+        try:
+            with closing(sqlite3.connect(partial)) as target:
+                if self.backend.name == "sqlite3":
+                    self._copy_pages(self.con.connection, target, *args)
+                else:
+                    with closing(self._backup_source()) as source:
+                        self._copy_pages(source, target, *args)
+            os.replace(partial, dest)
+        except (sqlite3.Error, OSError) as error:
+            if os.path.exists(partial):
+                os.remove(partial)
+            return False, f"Failed to back up {self.db_name}: {error}"
+        return True, f"{self.db_name} backed up to {dest}"
+
+    # ------------------------------------------------------------------------------------------
+
     def remove_db(self) -> None:
         """
         If the connection has been terminated, the database object is still persistent.
         This method removed the database object, so it does not get mangled with
-        other objects.
+        other objects.  Connections created in worker threads must be removed from
+        the thread that created them.
         """
-        if self.isOpen():
+        if self.con.isOpen():
             self.close_db()
-        QSqlDatabase.removeDatabase(self.connectionName())
+        connection_name = self.con.connectionName()
+        # Release the last reference to the connection before removing it
+        self.con = self.backend.null_connection()
+        self.backend.remove(connection_name)
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _backup_source(self) -> sqlite3.Connection:
+        """
+        Opens a sqlite3 connection to the database for a backup, read-only when the
+        database was opened read-only
+        """
+        if self.read_only:
+            return sqlite3.connect(read_only_uri(self.db_name, self.immutable), uri=True)
+        return sqlite3.connect(self.db_name)
+
+    # ------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _copy_pages(
+        source: sqlite3.Connection,
+        target: sqlite3.Connection,
+        pages_per_step: int,
+        sleep: float,
+        max_restarts: int,
+        progress: Callable[[int, int], None],
+    ) -> None:
+        """
+        Runs the online backup from source to target a step at a time, finishing in
+        a single step once other connections have restarted it max_restarts times
+        """
+        steps = {"remaining": None, "restarts": 0}
+
+        def step(status, remaining, total):
+            # The remaining page count only grows when the copy has restarted
+            if steps["remaining"] is not None and remaining > steps["remaining"]:
+                steps["restarts"] += 1
+                if steps["restarts"] > max_restarts:
+                    raise _BackupRestarted
+            steps["remaining"] = remaining
+            if progress is not None:
+                progress(remaining, total)
+
+        try:
+            source.backup(target, pages=pages_per_step, progress=step, sleep=sleep)
+        except _BackupRestarted:
+            source.backup(target)
+            if progress is not None:
+                progress(0, steps["remaining"])
+
+    # ------------------------------------------------------------------------------------------
+
+    def _schema_catalog(self) -> tuple[bool, dict[str, dict[str, str]], str]:
+        """
+        Method to return the column names and types of every table.  The catalog is
+        cached for the connection and read again only when ``PRAGMA schema_version``
+        shows that the schema has changed, so repeated schema lookups cost a single
+        pragma rather than a query per table.
+        """
+        if not self.con.isOpen():
+            sys.stderr.write(f"{self.db_name} database is not open\n")
+            return False, {}, f"{self.db_name} database is not open"
+
+        query = self.backend.query(self.con)
+        query.exec("PRAGMA schema_version;")
+        version = query.value(0) if query.next() else None
+        if self._catalog is not None and version == self._catalog_version:
+            return True, self._catalog, f"{self.db_name} schema catalog is current"
+
+        query.exec(
+            "SELECT m.name, p.name, p.type FROM sqlite_master AS m "
+            "JOIN pragma_table_info(m.name) AS p WHERE m.type = 'table' "
+            "ORDER BY m.rowid, p.cid;"
+        )
+        catalog = {}
+        while query.next():
+            catalog.setdefault(query.value(0), {})[query.value(1)] = query.value(2)
+        if query.lastError().isValid():
+            message = f"Failed to read schema: {query.lastError().text()}"
+            return False, {}, message
+
+        self._catalog = catalog
+        self._catalog_version = version
+        return True, catalog, f"{self.db_name} schema catalog read"
 
 
 # ==========================================================================================
 # ==========================================================================================
 
 
+# Day number expression used by the interval index, counted from 1970-01-01
+_DAY = "CAST(julianday({}) - 2440587.5 AS INTEGER)"
+# rtree_i32 coordinate used as the end day of tasks that are still open
+OPEN_DAY = 2**31 - 1
+# Columns of tasks_metadata that describe the table named in its source column
+_METADATA_COLUMNS = (
+    "open_tasks",
+    "closed_tasks",
+    "min_start",
+    "max_start",
+    "min_end",
+    "max_end",
+)
+# Every task, archived or not, with the archived tasks first.  SQLite applies the
+# WHERE clause of an outer query to each arm, so the indexes of both tables are used
+_ALL_TASKS = (
+    "(SELECT task_id, task, start_date, end_date FROM tasks_archive "
+    "UNION ALL SELECT task_id, task, start_date, end_date FROM tasks)"
+)
+# Priority levels of a task, a task without a priority has priority 0
+PRIORITIES = {"none": 0, "low": 1, "medium": 2, "high": 3}
+# ORDER BY clauses of select_filtered_tasks, each served by a covering index
+_TASK_ORDERS = {
+    "added": "task_id",
+    "priority": "priority DESC, task_id",
+    "due": "due_date NULLS LAST, task_id",
+}
+# Kinds of operation recorded in the journal table
+_INSERT, _COMPLETE, _DELETE = 0, 1, 2
+# The columns of a task saved in the journal, with its tags joined by newlines and a
+# flag of the table the task was read from, 1 for tasks_archive
+_SNAPSHOT = " UNION ALL ".join(
+    "SELECT task, start_date, end_date, priority, due_date, (SELECT "
+    "group_concat(name, char(10)) FROM task_tags JOIN tags USING (tag_id) "
+    f"WHERE task_tags.task_id = t.task_id), {archived} FROM {table} AS t "
+    "WHERE task_id = ?"
+    for archived, table in enumerate(["tasks", "tasks_archive"])
+)
+_SNAPSHOT_COLUMNS = "task, start_date, end_date, priority, due_date, tags, archived"
+
+
+class TaskColumns:
+    """
+    Class that holds the result of a columnar select.  The task ids and the start
+    and end dates are NumPy int64 arrays, with dates stored as day numbers counted
+    from 1970-01-01 and NULL_DAY marking a missing date, so millions of tasks are
+    held without a Python object per task.  The task text is only read from the
+    database when :meth:`tasks` or :meth:`to_frame` is first called, which requires
+    the connection that produced the columns to still be open.
+
+    :param task_id: An int64 array of task ids in ascending order
+    :param start_day: An int64 array of start day numbers
+    :param end_day: An int64 array of end day numbers, NULL_DAY for open tasks
+    :param db: The ToDoDatabase the columns were read from
+    :param where: The WHERE clause that selected the tasks
+    :param params: The parameters of the WHERE clause
+    :param source: The table or subquery the tasks were selected from
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.database import ToDoDatabase
+
+        db = ToDoDatabase("archive.db", backend="sqlite3")
+        db.open_db()
+        success, columns, message = db.select_closed_tasks("ALL", columnar=True)
+        days_open = columns.end_day - columns.start_day
+        print(len(columns), days_open.mean(), columns.end_date.max())
+        print(columns.tasks()[days_open.argmax()])
+        db.close_db()
+    """
+
+    def __init__(
+        self,
+        task_id: np.ndarray = None,
+        start_day: np.ndarray = None,
+        end_day: np.ndarray = None,
+        db: "ToDoDatabase" = None,
+        where: str = "",
+        params: tuple = (),
+        source: str = "tasks",
+    ):
+        empty = np.empty(0, dtype=np.int64)
+        self.task_id = empty if task_id is None else task_id
+        self.start_day = empty.copy() if start_day is None else start_day
+        self.end_day = empty.copy() if end_day is None else end_day
+        self._db = db
+        self._where = where
+        self._params = params
+        self._source = source
+        self._tasks = None
+
+    # ------------------------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.task_id)
+
+    # ------------------------------------------------------------------------------------------
+
+    @property
+    def start_date(self) -> np.ndarray:
+        """
+        The start dates as a datetime64[D] array, NaT where the date is missing
+        """
+        return self.start_day.astype("datetime64[D]")
+
+    # ------------------------------------------------------------------------------------------
+
+    @property
+    def end_date(self) -> np.ndarray:
+        """
+        The end dates as a datetime64[D] array, NaT for tasks that are still open
+        """
+        return self.end_day.astype("datetime64[D]")
+
+    # ------------------------------------------------------------------------------------------
+
+    def tasks(self) -> np.ndarray:
+        """
+        Method to return the text of each task, reading it from the database the
+        first time it is requested.  A task deleted since the columns were read has
+        the text None.
+
+        :return: An object array with the text of each task, in the order of
+                 ``task_id``
+        """
+        if self._tasks is not None:
+            return self._tasks
+        texts = np.full(len(self.task_id), None, dtype=object)
+        if len(self.task_id) and self._db is not None:
+            query = (
+                f"SELECT task_id, task FROM {self._source} WHERE {self._where} "
+                "ORDER BY task_id;"
+            )
+            success, result, message = self._db.db_query(query, self._params)
+            if not success:
+                raise RuntimeError(message)
+            rows = self._db.backend.fetch_rows(result)
+            if rows:
+                ids = np.fromiter((row[0] for row in rows), np.int64, len(rows))
+                values = np.empty(len(rows), dtype=object)
+                values[:] = [row[1] for row in rows]
+                position = np.minimum(np.searchsorted(ids, self.task_id), len(ids) - 1)
+                found = ids[position] == self.task_id
+                texts[found] = values[position[found]]
+        self._tasks = texts
+        return texts
+
+    # ------------------------------------------------------------------------------------------
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Method to return the tasks as the dataframe returned by a row select
+
+        :return: A pandas dataframe with the columns ``task_id`` and ``task``
+        """
+        return pd.DataFrame({"task_id": self.task_id, "task": self.tasks()})
+
+
 class ToDoDatabase(SQLiteManager):
     """
     Class to handle database manager for Todo application
 
+    The schema of a database is versioned with ``PRAGMA user_version``.  Each entry
+    of ``_MIGRATIONS`` names the method that upgrades the schema by one version, and
+    :meth:`migrate` applies the entries a database has not yet received.
+
+    Completed tasks can be moved out of the ``tasks`` table into ``tasks_archive``
+    with :meth:`archive_tasks`, which keeps the table and its indexes used by the
+    day-to-day operations small.  The closed task, former open task, oldest date and
+    backlog queries read the archive as well whenever their dates reach into it.
+
+    A database opened with ``read_only`` is never migrated.  A schema older than
+    SCHEMA_VERSION is read as it is, with the tables and indexes it lacks detected
+    when they are first needed.
+
     :param db_name: The database name
+    :param backend: 'qt' to use the QSQLITE driver of QtSql or 'sqlite3' to use the
+                    Python sqlite3 module
+    :param read_only: If True the database is opened read-only, see SQLiteManager
+    :param immutable: If True the database is opened read-only and immutable, see
+                      SQLiteManager
     """
 
-    def __init__(self, db_name: str):
-        super().__init__(db_name)
+    _MIGRATIONS = (
+        "_create_interval_index",
+        "_create_end_date_index",
+        "_create_archive_table",
+        "_create_start_date_index",
+        "_create_metadata_table",
+        "_create_recurrence_table",
+        "_create_task_attributes",
+        "_create_journal_table",
+    )
+    SCHEMA_VERSION = len(_MIGRATIONS)
+
+    def __init__(
+        self,
+        db_name: str,
+        backend: str = "qt",
+        read_only: bool = False,
+        immutable: bool = False,
+    ):
+        super().__init__(
+            db_name, backend=backend, read_only=read_only, immutable=immutable
+        )
+        self._has_interval_index = None
+        self._has_archive = None
+        self._has_metadata = None
+        self._has_recurrences = None
+        self._has_attributes = None
+        self._has_journal = None
 
     # ------------------------------------------------------------------------------------------
 
@@ -437,22 +872,114 @@ class ToDoDatabase(SQLiteManager):
                   contains a description of the result
         """
         # Check to see if table already exists
-        success, msg = self.table_exists("tasks")
-        if success:
-            return success, msg
+        exists, msg = self.table_exists("tasks")
+        if not exists:
+            # Free pages can be released without rebuilding the file, this only
+            # takes effect while the database has no tables
+            self.db_query("PRAGMA auto_vacuum = INCREMENTAL;")
+            # Create table if it does not already exist
+            table_name = "tasks"
+            cols = ["task_id", "task", "start_date", "end_date"]
+            types = ["INTEGER PRIMARY KEY", "TEXT NOT NULL", "DATE", "DATE"]
+            success, msg = self.create_table(table_name, cols, types)
+            if not success:
+                return success, msg
+
+        # Bring the schema of new and existing tables up to date
+        success, message = self.migrate()
+        if not success:
+            return success, message
+        return True, msg
+
+    # ------------------------------------------------------------------------------------------
 
-        # Create table if it does not already exist
-        table_name = "tasks"
-        cols = ["task_id", "task", "start_date", "end_date"]
-        types = ["INTEGER PRIMARY KEY", "TEXT NOT NULL", "DATE", "DATE"]
-        success, msg = self.create_table(table_name, cols, types)
-        return success, msg
+    def migrate(self) -> tuple[bool, str]:
+        """
+        Method to upgrade the schema of the database to SCHEMA_VERSION.  Each
+        upgrade runs in its own transaction, so a failed upgrade leaves the database
+        at the last version that completed.
+
+        :return: A tuple containing a boolean and a string. A boolean of
+                  True indicates the operation was successful, and the string
+                  contains a description of the result
+        """
+        success, result, message = self.db_query("PRAGMA user_version;")
+        if not success:
+            return False, message
+        version = result.value(0) if result.next() else 0
+
+        for step in range(version, self.SCHEMA_VERSION):
+            self.con.transaction()
+            success, message = getattr(self, self._MIGRATIONS[step])()
+            if success:
+                success, _, message = self.db_query(f"PRAGMA user_version = {step + 1};")
+            if not success:
+                self.con.rollback()
+                return False, f"Failed to upgrade {self.db_name} schema: {message}"
+            self.con.commit()
+        return True, f"{self.db_name} schema is at version {self.SCHEMA_VERSION}"
+
+    # ------------------------------------------------------------------------------------------
+
+    def bootstrap(
+        self, time_frame: str = "DAY", create: bool = True
+    ) -> tuple[bool, dict, str]:
+        """
+        Method to prepare an open database for display and read everything a Tab
+        needs in one pass.  The schema version is read first and the tasks table
+        check, table creation and migrations only run when the database is behind
+        SCHEMA_VERSION.  The oldest date and the open and completed tasks are then
+        read in a single read transaction, so they describe the same state of the
+        database.
+
+        :param time_frame: 'DAY', 'WEEEK', 'MONTH', 'YEAR', 'ALL', the time frame of
+                           the completed tasks
+        :param create: If True a missing tasks table is created, if False a
+                       database without one is rejected.  A read-only database
+                       is neither created nor migrated
+        :return: A tuple containing a boolean, a dictionary and a string.  The
+                 dictionary contains the keys ``oldest_date``, ``open_tasks`` and
+                 ``closed_tasks`` expected by Tab.finish_loading
+        """
+        success, result, message = self.db_query("PRAGMA user_version;")
+        if not success:
+            return False, {}, message
+        version = result.value(0) if result.next() else 0
+
+        if version < self.SCHEMA_VERSION:
+            exists, message = self.table_exists("tasks")
+            if not exists and (self.read_only or not create):
+                return False, {}, f"{self.db_name} is not a todo database"
+            if not self.read_only:
+                success, message = self.create_tasks_table()
+                if not success:
+                    return False, {}, message
+        else:
+            # Every migration has been applied, so the tables they create exist
+            self._has_interval_index = True
+            self._has_archive = True
+            self._has_metadata = True
+            self._has_recurrences = True
+            self._has_attributes = True
+            self._has_journal = True
+
+        if not self.read_only:
+            self.materialize_recurrences()
+
+        owns_transaction = self.con.transaction()
+        success, snapshot, message = self._read_snapshot(time_frame)
+        if owns_transaction:
+            self.con.commit()
+        if not success:
+            return False, {}, message
+        return True, snapshot, f"{self.db_name} loaded"
 
     # ------------------------------------------------------------------------------------------
 
     def insert_task(self, task) -> tuple[bool, str, int]:
         """
-        Method to insert a task to the tasks table of a database
+        Method to insert a task to the tasks table of a database.  The insert is
+        recorded in the journal, see :meth:`undo`.
 
         :param task: A todo list task represented as a character string
         :return: A tuple containing a boolean and a string. A boolean of
@@ -460,32 +987,37 @@ class ToDoDatabase(SQLiteManager):
                   contains a description of the result
         """
         start_date = datetime.now().strftime("%Y-%m-%d")
-        query = QSqlQuery(self.con)
-        query.prepare("INSERT INTO tasks (task, start_date) VALUES (?, ?);")
+        owns_transaction = self.con.transaction()
+        query = self.backend.query(self.con)
+        query.prepare(self._insert_statement())
         query.addBindValue(task)
         query.addBindValue(start_date)
         success = query.exec()
         if success:
             task_id = query.lastInsertId()
+            success, message = self._record(_INSERT, [task_id])
+        else:
+            message = query.lastError().text()
+        success, message = self._end_transaction(owns_transaction, success, message)
+        if success:
             return True, f"Task '{task}' successfully added to tasks.", task_id
         else:
-            return False, query.lastError().text(), 0
+            return False, message, 0
 
     # ------------------------------------------------------------------------------------------
 
     def complete_task(self, task_id: int) -> tuple[bool, str]:
         """
-        Method to complete task by entering its end date
+        Method to complete task by entering its end date.  The completion is
+        recorded in the journal, see :meth:`undo`.  A task that does not exist or
+        is already completed is left unchanged and False is returned.
 
         :param task_id: The interger id associated with a task
         :return: A tuple containing a boolean and a string. A boolean of
                   True indicates the operation was successful, and the string
                   contains a description of the result
         """
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        query = "UPDATE tasks SET end_date=? WHERE task_id=?;"
-        params = (end_date, task_id)
-        success, _, message = self.db_query(query, params)
+        success, message = self.complete_tasks([task_id])
         if success:
             return True, f"Task id {task_id} successfully completed."
         else:
@@ -493,18 +1025,70 @@ class ToDoDatabase(SQLiteManager):
 
     # ------------------------------------------------------------------------------------------
 
+    def complete_tasks(self, task_ids: list[int]) -> tuple[bool, str]:
+        """
+        Method to complete several tasks in one transaction.  Tasks that are not
+        open are skipped, and only the tasks completed are recorded in the journal,
+        as one operation, so they are undone together, see :meth:`undo`.  False is
+        returned if no task is completed, including for an empty list.
+
+        :param task_ids: The integer ids of the tasks
+        :return: A tuple containing a boolean and a string. A boolean of
+                  True indicates the operation was successful, and the string
+                  contains a description of the result
+
+        Example:
+
+        .. code-block::
+
+            from todo_six.database import ToDoDatabase
+
+            db = ToDoDatabase("chores.db")
+            db.open_db()
+            success, message = db.complete_tasks([3, 7, 12])
+            print(message)
+            db.close_db()
+
+            >> 3 tasks completed
+        """
+        if not task_ids:
+            return False, "No task ids given"
+        end_date = datetime.now().strftime("%Y-%m-%d")
+        owns_transaction = self.con.transaction()
+        query = "UPDATE tasks SET end_date=? WHERE task_id=? AND end_date IS NULL;"
+        success, message = True, ""
+        completed = []
+        for task_id in task_ids:
+            success, changed, message = self._count_changes(query, (end_date, task_id))
+            if not success:
+                break
+            if changed:
+                completed.append(task_id)
+        if success and not completed:
+            success = False
+            message = f"No open task with id {', '.join(map(str, task_ids))}"
+        if success:
+            success, message = self._record(_COMPLETE, completed, end_date)
+        success, message = self._end_transaction(owns_transaction, success, message)
+        if success:
+            return True, f"{len(completed)} tasks completed"
+        else:
+            return False, message
+
+    # ------------------------------------------------------------------------------------------
+
     def delete_task(self, task_id: int) -> tuple[bool, str]:
         """
-        Method to delete a task from the tasks table of a database.
+        Method to delete a task from the tasks table of a database, or from the
+        archive if the task has been archived.  The task is saved in the journal,
+        so the deletion can be undone, see :meth:`undo`.
 
         :param task_id: The integer id associated with a task
         :return: A tuple containing a boolean and a string. A boolean of
                   True indicates the operation was successful, and the string
                   contains a description of the result
         """
-        query = "DELETE FROM tasks WHERE task_id=?;"
-        params = (task_id,)
-        success, _, message = self.db_query(query, params)
+        success, message = self.delete_tasks([task_id])
         if success:
             return True, f"Task id {task_id} successfully deleted."
         else:
@@ -512,22 +1096,57 @@ class ToDoDatabase(SQLiteManager):
 
     # ------------------------------------------------------------------------------------------
 
-    def select_open_tasks(self) -> tuple[bool, pd.DataFrame, str]:
+    def delete_tasks(self, task_ids: list[int]) -> tuple[bool, str]:
+        """
+        Method to delete several tasks, open, completed or archived, in one
+        transaction.  Ids of tasks that do not exist are skipped, and the tasks
+        deleted are saved in the journal as one operation, so the deletion is
+        undone in one step, see :meth:`undo`.  False is returned if no task is
+        deleted, including for an empty list.
+
+        :param task_ids: The integer ids of the tasks
+        :return: A tuple containing a boolean and a string. A boolean of
+                  True indicates the operation was successful, and the string
+                  contains a description of the result
+        """
+        if not task_ids:
+            return False, "No task ids given"
+        owns_transaction = self.con.transaction()
+        success, existing, message = self._existing_task_ids(task_ids)
+        if success and not existing:
+            success = False
+            message = f"No task with id {', '.join(map(str, task_ids))}"
+        if success:
+            success, message = self._record(_DELETE, existing)
+        deleted = 0
+        if success:
+            success, deleted, message = self._delete_rows(existing)
+        success, message = self._end_transaction(owns_transaction, success, message)
+        if success:
+            return True, f"{deleted} tasks deleted"
+        else:
+            return False, message
+
+    # ------------------------------------------------------------------------------------------
+
+    def select_open_tasks(self, columnar: bool = False) -> tuple[bool, pd.DataFrame, str]:
         """
         Method to select all tasks that are still open.
 
-        :param task_id: The integer id associated with a task
+        :param columnar: If True the tasks are returned as a TaskColumns object
+                         instead of a dataframe
         :return: A tuple containing a boolean, a pandas dataframe and a string.
                  A boolean of True indicates the operation was successful, the pandas
                  dataframe contains the results of the query, and the string
                  contains a description of the result
         """
-        tasks = []
+        if columnar:
+            msg = "Successfully retrieved open tasks."
+            return self._select_columns("end_date IS NULL", (), msg)
         query = "SELECT task_id, task FROM tasks WHERE end_date IS NULL"
         success, result, message = self.db_query(query, None)
         if success:
-            while result.next():
-                tasks.append([result.value(0), result.value(1)])  # get the task text
+            tasks = self.backend.fetch_rows(result)
             df = pd.DataFrame(tasks, columns=["task_id", "task"])
             return True, df, message
         else:
@@ -536,7 +1155,10 @@ class ToDoDatabase(SQLiteManager):
     # ------------------------------------------------------------------------------------------
 
     def select_closed_tasks(
-        self, time_frame: str, date=datetime.now().strftime("%Y-%m-%d")
+        self,
+        time_frame: str,
+        date=datetime.now().strftime("%Y-%m-%d"),
+        columnar: bool = False,
     ) -> tuple[bool, pd.DataFrame, str]:
         """
         Method to select all tasks that have been closed within a certain time frame
@@ -544,6 +1166,8 @@ class ToDoDatabase(SQLiteManager):
 
         :param time_frame: 'DAY', 'WEEEK', 'MONTH', 'YEAR', 'ALL'
         :param date: A datetime object in the format strftime("%Y-%m-%d")
+        :param columnar: If True the tasks are returned as a TaskColumns object
+                         instead of a dataframe
         :return: A tuple containing a boolean, a pandas dataframe and a string.
                  A boolean of True indicates the operation was successful, the pandas
                  dataframe contains the results of the query, and the string
@@ -555,36 +1179,35 @@ class ToDoDatabase(SQLiteManager):
             return False, pd.DataFrame(), "time_frame not correctly formatted"
 
         if time_frame == "DAY":
-            query = "SELECT task_id, task FROM tasks WHERE end_date=?;"
+            where = "end_date=?"
             params = (date,)
         elif time_frame == "WEEK":
             date = datetime.strptime(date, "%Y-%m-%d")
             start_date = (date - timedelta(days=date.weekday())).strftime("%Y-%m-%d")
-            query = "SELECT task_id, task FROM tasks WHERE end_date BETWEEN "
-            query += "? AND ?;"
+            where = "end_date BETWEEN ? AND ?"
             params = (start_date, date.strftime("%Y-%m-%d"))
         elif time_frame == "MONTH":
             date = datetime.strptime(date, "%Y-%m-%d")
             start_date = date.replace(day=1).strftime("%Y-%m-%d")
-            query = "SELECT task_id, task FROM tasks WHERE end_date BETWEEN "
-            query += "? AND ?;"
+            where = "end_date BETWEEN ? AND ?"
             params = (start_date, date.strftime("%Y-%m-%d"))
         elif time_frame == "YEAR":
             date = datetime.strptime(date, "%Y-%m-%d")
             start_date = date.replace(day=1, month=1).strftime("%Y-%m-%d")
-            query = "SELECT task_id, task FROM tasks WHERE end_date BETWEEN "
-            query += "? AND ?;"
+            where = "end_date BETWEEN ? AND ?"
             params = (start_date, date.strftime("%Y-%m-%d"))
         else:
-            query = "SELECT task_id, task FROM tasks WHERE end_date IS NOT NULL;"
-            params = None
+            where = "end_date IS NOT NULL"
+            params = ()
 
-        success, result, message = self.db_query(query, params)
-        tasks = []
         msg = f"Successfully retrieved tasks for time_frame: {time_frame}."
+        source = self._task_source(params[0] if params else "")
+        if columnar:
+            return self._select_columns(where, params, msg, source)
+        query = f"SELECT task_id, task FROM {source} WHERE {where};"
+        success, result, message = self.db_query(query, params)
         if success:
-            while result.next():
-                tasks.append([result.value(0), result.value(1)])  # get the task text
+            tasks = self.backend.fetch_rows(result)
             df = pd.DataFrame(tasks, columns=["task_id", "task"])
             return True, df, msg
         else:
@@ -594,7 +1217,8 @@ class ToDoDatabase(SQLiteManager):
 
     def get_oldest_date(self) -> tuple[bool, str, str]:
         """
-        Method to get the oldest start_date from the tasks table.
+        Method to get the oldest start_date from the tasks table and the archive.
+        The date is read from the tasks_metadata table when the schema includes it.
 
         :return: A tuple containing a boolean, a string and a string.
                  A boolean of True indicates the operation was successful,
@@ -603,6 +1227,13 @@ class ToDoDatabase(SQLiteManager):
                  and the second string contains a description of the result.
         """
         query = "SELECT MIN(start_date) FROM tasks;"
+        if self._metadata_exists():
+            query = "SELECT MIN(min_start) FROM tasks_metadata;"
+        elif self._archive_exists():
+            query = (
+                "SELECT MIN(oldest) FROM (SELECT MIN(start_date) AS oldest FROM tasks "
+                "UNION ALL SELECT MIN(start_date) FROM tasks_archive);"
+            )
         success, result, message = self.db_query(query, None)
         if success:
             oldest_date = ""
@@ -614,31 +1245,1621 @@ class ToDoDatabase(SQLiteManager):
 
     # ------------------------------------------------------------------------------------------
 
-    def get_former_open_tasks(self, date) -> tuple[bool, pd.DataFrame, str]:
+    def get_task_counts(self) -> tuple[bool, dict[str, int], str]:
         """
-        Method to select all tasks that were open on a certain date
+        Method to count the open, completed and archived tasks.  The counts are
+        read from the tasks_metadata table, so no task is read.
+
+        :return: A tuple containing a boolean, a dictionary and a string.  A boolean
+                 of True indicates the operation was successful, the dictionary
+                 contains the keys ``open``, ``closed`` and ``archived``, where
+                 ``closed`` includes the archived tasks, and the string contains a
+                 description of the result
+        """
+        success, rows, message = self._read_metadata()
+        if not success:
+            return False, {}, message
+        counts = {"open": 0, "closed": 0, "archived": 0}
+        for source, row in rows.items():
+            counts["open"] += row["open_tasks"]
+            counts["closed"] += row["closed_tasks"]
+            if source == "tasks_archive":
+                counts["archived"] += row["closed_tasks"]
+        return True, counts, "Successfully retrieved the task counts."
+
+    # ------------------------------------------------------------------------------------------
+
+    def get_date_bounds(self) -> tuple[bool, dict[str, str], str]:
+        """
+        Method to get the earliest and latest start and end dates of all tasks,
+        including archived tasks.  The dates are read from the tasks_metadata
+        table, so no task is read.
+
+        :return: A tuple containing a boolean, a dictionary and a string.  A boolean
+                 of True indicates the operation was successful, the dictionary
+                 contains the keys ``min_start``, ``max_start``, ``min_end`` and
+                 ``max_end`` with dates in the format "YYYY-MM-DD", or None if no
+                 task has the date, and the string contains a description of the
+                 result
+        """
+        success, rows, message = self._read_metadata()
+        if not success:
+            return False, {}, message
+        bounds = {}
+        for key, bound in [
+            ("min_start", min),
+            ("max_start", max),
+            ("min_end", min),
+            ("max_end", max),
+        ]:
+            dates = [row[key] for row in rows.values() if row[key]]
+            bounds[key] = bound(dates) if dates else None
+        return True, bounds, "Successfully retrieved the date bounds."
+
+    # ------------------------------------------------------------------------------------------
+
+    def get_former_open_tasks(
+        self, date, columnar: bool = False
+    ) -> tuple[bool, pd.DataFrame, str]:
+        """
+        Method to select all tasks that were open on a certain date.  The query is
+        served by the tasks_interval index when the database schema includes it,
+        and archived tasks are included when the date is within the archive.
 
         :param date: A datetime string in the format "%Y-%m-%d"
+        :param columnar: If True the tasks are returned as a TaskColumns object
+                         instead of a dataframe
         :return: A tuple containing a boolean, a pandas dataframe and a string.
                  A boolean of True indicates the operation was successful, the pandas
                  dataframe contains the results of the query, and the string
                 contains a description of the result
         """
+        if not self._interval_index_exists():
+            if columnar:
+                where = "start_date <= ? AND (end_date > ? OR end_date IS NULL)"
+                msg = "Successfully retrieved tasks open on the provided date."
+                return self._select_columns(where, (date, date), msg)
+            return self._scan_former_open_tasks(date)
+        try:
+            day = to_day_number(date)
+        except ValueError:
+            if columnar:
+                return False, TaskColumns(), "Invalid date format"
+            return False, pd.DataFrame(), "Invalid date format"
+        source = self._task_source(date)
+        archived = source != "tasks"
+        if columnar:
+            where = (
+                "SELECT task_id FROM tasks_interval WHERE start_day <= ? AND end_day > ?"
+            )
+            params = (day, day)
+            if archived:
+                where += (
+                    " UNION ALL SELECT task_id FROM tasks_archive "
+                    "WHERE end_date > ? AND start_date <= ?"
+                )
+                params += (date, date)
+            msg = "Successfully retrieved tasks open on the provided date."
+            return self._select_columns(f"task_id IN ({where})", params, msg, source)
+
+        # The interval index answers the two-sided range test that no single B-tree
+        # index on start_date or end_date can serve
         query = (
-            "SELECT task_id, task FROM tasks "
-            "WHERE start_date <= ? AND (end_date > ? OR end_date IS NULL);"
+            "SELECT t.task_id, t.task FROM tasks_interval AS i "
+            "JOIN tasks AS t ON t.task_id = i.task_id "
+            "WHERE i.start_day <= ? AND i.end_day > ?"
         )
-        params = (date, date)
+        params = (day, day)
+        if archived:
+            # Archived tasks were removed from the interval index, and the end date
+            # index narrows the archive to tasks completed after the date
+            query = (
+                "SELECT task_id, task FROM tasks_archive "
+                f"WHERE end_date > ? AND start_date <= ? UNION ALL {query}"
+            )
+            params = (date, date) + params
+        query += " ORDER BY 1;"
         success, result, message = self.db_query(query, params)
-        tasks = []
         if success:
-            while result.next():
-                tasks.append([result.value(0), result.value(1)])  # get the task text
+            tasks = self.backend.fetch_rows(result)
             df = pd.DataFrame(tasks, columns=["task_id", "task"])
             return True, df, "Successfully retrieved tasks open on the provided date."
         else:
             return False, pd.DataFrame(), message
 
+    # ------------------------------------------------------------------------------------------
+
+    def backlog_series(
+        self, start: str, end: str
+    ) -> tuple[bool, pd.DataFrame, pd.Series, str]:
+        """
+        Method to compute the number of open tasks on every day between two dates,
+        and the time-to-close distribution of the tasks completed between them.  The
+        start and end dates of the tasks, including archived tasks, are read once
+        and both results are computed with vectorized NumPy operations.
+
+        :param start: The first date of the series in the format "%Y-%m-%d"
+        :param end: The last date of the series in the format "%Y-%m-%d"
+        :return: A tuple containing a boolean, a pandas dataframe, a pandas series
+                 and a string.  A boolean of True indicates the operation was
+                 successful, the dataframe contains the columns ``date`` and
+                 ``open_tasks`` with one row per day, the series maps the number of
+                 days a task was open to the number of tasks completed in the
+                 range that took that long, and the string contains a description
+                 of the result
+
+        Example:
+
+        .. code-block::
+
+            from todo_six.database import ToDoDatabase
+
+            db = ToDoDatabase("chores.db")
+            db.open_db()
+            success, backlog, durations, message = db.backlog_series(
+                "2023-01-01", "2023-12-31"
+            )
+            print(backlog["open_tasks"].max(), durations.idxmax())
+            db.close_db()
+        """
+        try:
+            first_day = to_day_number(start)
+            last_day = to_day_number(end)
+        except ValueError:
+            return False, pd.DataFrame(), pd.Series(dtype="int64"), "Invalid date format"
+        if first_day > last_day:
+            msg = "The start date must not be after the end date"
+            return False, pd.DataFrame(), pd.Series(dtype="int64"), msg
+
+        success, start_days, end_days, message = self._select_task_days()
+        if not success:
+            return False, pd.DataFrame(), pd.Series(dtype="int64"), message
+
+        open_tasks = count_open_per_day(start_days, end_days, first_day, last_day)
+        days = np.arange(first_day, last_day + 1, dtype=np.int64)
+        backlog = pd.DataFrame(
+            {"date": days.astype("datetime64[D]"), "open_tasks": open_tasks}
+        )
+
+        in_range = (end_days >= first_day) & (end_days <= last_day)
+        durations = close_durations(start_days[in_range], end_days[in_range])
+        durations = durations[durations >= 0]
+        counts = np.bincount(durations)
+        nonzero = np.flatnonzero(counts)
+        distribution = pd.Series(
+            counts[nonzero], index=pd.Index(nonzero, name="days_to_close"), name="tasks"
+        )
+        msg = f"Successfully computed the backlog from {start} to {end}."
+        return True, backlog, distribution, msg
+
+    # ------------------------------------------------------------------------------------------
+
+    def archive_tasks(self, cutoff: str) -> tuple[bool, str, int]:
+        """
+        Method to move the tasks completed before a date from the tasks table into
+        the tasks_archive table.  Archived tasks keep their ids and dates and are
+        still returned by the closed task, former open task and backlog queries of
+        the dates they cover, while the open task select and the indexes used every
+        day only hold the recent tasks.  The move is made in one transaction.
+
+        :param cutoff: A date string in the format "%Y-%m-%d", tasks with an end date
+                       before this date are archived
+        :return: A tuple containing a boolean, a string and an integer.  A boolean of
+                 True indicates the operation was successful, the string contains a
+                 description of the result and the integer is the number of tasks
+                 archived
+
+        Example:
+
+        .. code-block::
+
+            from todo_six.database import ToDoDatabase
+
+            db = ToDoDatabase("chores.db")
+            db.open_db()
+            success, message, archived = db.archive_tasks("2026-01-01")
+            print(message)
+            db.close_db()
+
+            >> 1520 tasks completed before 2026-01-01 archived
+        """
+        try:
+            to_day_number(cutoff)
+        except ValueError:
+            return False, "Invalid date format", 0
+        if not self._archive_exists():
+            return False, f"{self.db_name} schema does not include an archive", 0
+
+        columns = "task_id, task, start_date, end_date"
+        if self._attributes_exist():
+            columns += ", priority, due_date"
+        owns_transaction = self.con.transaction()
+        statements = [
+            f"INSERT INTO tasks_archive ({columns}) "
+            f"SELECT {columns} FROM tasks WHERE end_date < ?;",
+            "DELETE FROM tasks WHERE end_date < ?;",
+        ]
+        for statement in statements:
+            success, _, message = self.db_query(statement, (cutoff,))
+            if not success:
+                if owns_transaction:
+                    self.con.rollback()
+                return False, message, 0
+        success, result, message = self.db_query("SELECT changes();")
+        archived = int(result.value(0)) if success and result.next() else 0
+        if owns_transaction and not self.con.commit():
+            self.con.rollback()
+            return False, f"Failed to commit the archive of {self.db_name}", 0
+        return True, f"{archived} tasks completed before {cutoff} archived", archived
+
+    # ------------------------------------------------------------------------------------------
+
+    def export_archive(
+        self, dest: str, chunk_size: int = 65536, level: int = 6
+    ) -> tuple[bool, str, int]:
+        """
+        Method to write every task, including archived tasks, to a compressed file
+        in the format of :mod:`todo_six.task_archive`, with the priority, due date
+        and tags of each task.  The tasks are read and
+        written ``chunk_size`` at a time, so the memory used does not grow with the
+        database.  Indexes, free pages and other tables are not written, so the file
+        is a fraction of the size of the database.  The file is written with a
+        ``.part`` suffix and renamed once it is complete.
+
+        :param dest: The name and path length of the archive file
+        :param chunk_size: The number of tasks compressed together
+        :param level: The zlib compression level from 0 to 9
+        :return: A tuple containing a boolean, a string and an integer.  A boolean of
+                 True indicates the operation was successful, the string contains a
+                 description of the result and the integer is the number of tasks
+                 written
+
+        Example:
+
+        .. code-block::
+
+            from todo_six.database import ToDoDatabase
+
+            db = ToDoDatabase("chores.db")
+            db.open_db()
+            success, message, count = db.export_archive("chores.tda")
+            print(message)
+            db.close_db()
+
+            >> 20150 tasks exported to chores.tda
+        """
+        columns = (
+            f"task_id, {_DAY.format('start_date')}, {_DAY.format('end_date')}, "
+            "{} AS archived, task"
+        )
+        if self._attributes_exist():
+            columns += (
+                f", priority, {_DAY.format('due_date')}, (SELECT group_concat(name, "
+                "char(10)) FROM task_tags JOIN tags USING (tag_id) "
+                "WHERE task_tags.task_id = t.task_id)"
+            )
+        query = f"SELECT {columns.format(0)} FROM tasks AS t"
+        if self._archive_exists():
+            query += f" UNION ALL SELECT {columns.format(1)} FROM tasks_archive AS t"
+        success, result, message = self.db_query(f"{query} ORDER BY task_id;")
+        if not success:
+            return False, message, 0
+
+        partial = f"{dest}.part"
+        try:
+            with open(partial, "wb") as file, ArchiveWriter(file, level) as writer:
+                while True:
+                    rows = self.backend.fetch_block(result, chunk_size)
+                    if not rows:
+                        break
+                    chunk = list(zip(*rows))
+                    if len(chunk) > 7:
+                        chunk[7] = [
+                            names.split("\n") if names else [] for names in chunk[7]
+                        ]
+                    writer.write_chunk(*chunk)
+            os.replace(partial, dest)
+        except (OSError, ValueError) as error:
+            if os.path.exists(partial):
+                os.remove(partial)
+            return False, f"Failed to export {self.db_name}: {error}", 0
+        return True, f"{writer.rows} tasks exported to {dest}", writer.rows
+
+    # ------------------------------------------------------------------------------------------
+
+    def import_archive(self, source: str) -> tuple[bool, str, int]:
+        """
+        Method to add the tasks of a file written by :meth:`export_archive` to the
+        database, keeping their ids, dates, priorities, due dates, tags and archive
+        state.  Files written before priorities and tags were exported are read
+        as well, and their tasks are added without them.  The file is read a
+        chunk at a time and every task is added in one transaction, so a file that
+        is corrupt or holds an id already in the database leaves the database
+        unchanged.
+
+        :param source: The name and path length of the archive file
+        :return: A tuple containing a boolean, a string and an integer.  A boolean of
+                 True indicates the operation was successful, the string contains a
+                 description of the result and the integer is the number of tasks
+                 added
+        """
+        success, message = self.create_tasks_table()
+        if not success:
+            return False, message, 0
+
+        owns_transaction = self.con.transaction()
+        count = 0
+        try:
+            with open(source, "rb") as file:
+                for chunk in read_archive(file):
+                    success, message = self._import_chunk(chunk)
+                    if not success:
+                        raise ValueError(message)
+                    count += len(chunk["task"])
+        except (OSError, ValueError) as error:
+            if owns_transaction:
+                self.con.rollback()
+            return False, f"Failed to import {source}: {error}", 0
+        if owns_transaction and not self.con.commit():
+            self.con.rollback()
+            return False, f"Failed to commit the import of {source}", 0
+        return True, f"{count} tasks imported from {source}", count
+
+    # ------------------------------------------------------------------------------------------
+
+    def add_recurrence(
+        self,
+        task: str,
+        frequency: str,
+        start: str = None,
+        interval: int = 1,
+        until: str = None,
+    ) -> tuple[bool, str, int]:
+        """
+        Method to add a rule that creates a task every ``interval`` days, weeks,
+        months or years.  Occurrences are added to the tasks table by
+        :meth:`materialize_recurrences`, which is run when a database is loaded and
+        each day by the RecurrenceScheduler.
+
+        :param task: The text of each task the rule creates
+        :param frequency: 'DAY', 'WEEK', 'MONTH' or 'YEAR'
+        :param start: The date of the first occurrence in the format "%Y-%m-%d",
+                      today if None
+        :param interval: The number of frequency units between occurrences
+        :param until: The date of the last possible occurrence, or None if the rule
+                      never ends
+        :return: A tuple containing a boolean, a string and an integer.  A boolean of
+                 True indicates the operation was successful, the string contains a
+                 description of the result and the integer is the id of the rule
+
+        Example:
+
+        .. code-block::
+
+            from todo_six.database import ToDoDatabase
+
+            db = ToDoDatabase("chores.db")
+            db.open_db()
+            db.add_recurrence("Take out trash", "WEEK", "2026-10-19")
+            success, message, count = db.materialize_recurrences()
+            print(message)
+            db.close_db()
+
+            >> 1 recurring tasks added
+        """
+        frequency = frequency.upper()
+        if frequency not in FREQUENCIES:
+            return False, f"frequency must be one of {', '.join(FREQUENCIES)}", 0
+        if interval < 1:
+            return False, "interval must be at least 1", 0
+        start = start or datetime.now().strftime("%Y-%m-%d")
+        if not self._recurrence_exists():
+            return False, f"{self.db_name} has no recurrences table", 0
+        query = self.backend.query(self.con)
+        query.prepare(
+            "INSERT INTO recurrences (task, frequency, interval, anchor, next_due, "
+            "until) VALUES (?, ?, ?, ?, ?, ?);"
+        )
+        for value in [task, frequency, interval, start, start, until]:
+            query.addBindValue(value)
+        if not query.exec():
+            return False, query.lastError().text(), 0
+        rule_id = query.lastInsertId()
+        return True, f"Recurring task '{task}' added", rule_id
+
+    # ------------------------------------------------------------------------------------------
+
+    def delete_recurrence(self, rule_id: int) -> tuple[bool, str]:
+        """
+        Method to delete a recurrence rule.  Tasks the rule has already created are
+        kept.
+
+        :param rule_id: The id returned by :meth:`add_recurrence`
+        :return: A tuple containing a boolean and a string. A boolean of
+                  True indicates the operation was successful, and the string
+                  contains a description of the result
+        """
+        query = "DELETE FROM recurrences WHERE rule_id = ?;"
+        success, _, message = self.db_query(query, (rule_id,))
+        if not success:
+            return False, message
+        return True, f"Recurrence {rule_id} deleted"
+
+    # ------------------------------------------------------------------------------------------
+
+    def select_recurrences(self) -> tuple[bool, pd.DataFrame, str]:
+        """
+        Method to select every recurrence rule
+
+        :return: A tuple containing a boolean, a pandas dataframe and a string.
+                 The dataframe contains the columns rule_id, task, frequency,
+                 interval, anchor, next_due and until, ordered by next_due
+        """
+        columns = ["rule_id", "task", "frequency", "interval", "anchor", "next_due"]
+        columns.append("until")
+        if not self._recurrence_exists():
+            return True, pd.DataFrame(columns=columns), "No recurrences table"
+        query = f"SELECT {', '.join(columns)} FROM recurrences ORDER BY next_due;"
+        success, result, message = self.db_query(query)
+        if not success:
+            return False, pd.DataFrame(), message
+        rows = self.backend.fetch_rows(result)
+        return True, pd.DataFrame(rows, columns=columns), message
+
+    # ------------------------------------------------------------------------------------------
+
+    def materialize_recurrences(self, date: str = None) -> tuple[bool, str, int]:
+        """
+        Method to add a task for every recurrence rule that is due.  Only the rules
+        whose ``next_due`` date has been reached are read, through the index on
+        ``next_due``, so the cost grows with the number of due rules rather than
+        the number of rules.  A rule that was missed several times, because the
+        database was not opened, creates a single task dated on its latest
+        occurrence.  The tasks are inserted and the rules advanced in bulk, in one
+        transaction.
+
+        :param date: The date occurrences are due by in the format "%Y-%m-%d",
+                     today if None
+        :return: A tuple containing a boolean, a string and an integer.  A boolean of
+                 True indicates the operation was successful, the string contains a
+                 description of the result and the integer is the number of tasks
+                 added
+        """
+        try:
+            today = datetime.strptime(date, "%Y-%m-%d") if date else datetime.now()
+        except ValueError:
+            return False, "Invalid date format", 0
+        today = today.date()
+        if not self._recurrence_exists():
+            return True, "No recurring tasks", 0
+
+        owns_transaction = self.con.transaction()
+        query = (
+            "SELECT rule_id, task, frequency, interval, anchor, until FROM recurrences "
+            "WHERE next_due <= ?;"
+        )
+        success, result, message = self.db_query(query, (today.isoformat(),))
+        tasks = []
+        if success:
+            tasks, advanced, expired = self._due_occurrences(
+                self.backend.fetch_rows(result), today
+            )
+            for statement, rows in [
+                (self._insert_statement(), tasks),
+                ("UPDATE recurrences SET next_due = ? WHERE rule_id = ?;", advanced),
+                ("DELETE FROM recurrences WHERE rule_id = ?;", expired),
+            ]:
+                if rows:
+                    success, message = self.db_executemany(statement, rows)
+                if not success:
+                    break
+        success, message = self._end_transaction(owns_transaction, success, message)
+        if not success:
+            return False, message, 0
+        return True, f"{len(tasks)} recurring tasks added", len(tasks)
+
+    # ------------------------------------------------------------------------------------------
+
+    def set_priority(self, task_id: int, priority: int | str) -> tuple[bool, str]:
+        """
+        Method to set the priority of a task
+
+        :param task_id: The integer id associated with a task
+        :param priority: 'none', 'low', 'medium' or 'high', or the matching integer
+                         from 0 to 3
+        :return: A tuple containing a boolean and a string. A boolean of
+                  True indicates the operation was successful, and the string
+                  contains a description of the result
+        """
+        level = self._priority_level(priority)
+        if level is None:
+            return False, f"priority must be one of {', '.join(PRIORITIES)}"
+        query = "UPDATE tasks SET priority = ? WHERE task_id = ?;"
+        success, _, message = self.db_query(query, (level, task_id))
+        if not success:
+            return False, message
+        return True, f"Task id {task_id} priority set to {level}"
+
+    # ------------------------------------------------------------------------------------------
+
+    def set_due_date(self, task_id: int, due_date: str = None) -> tuple[bool, str]:
+        """
+        Method to set or clear the due date of a task
+
+        :param task_id: The integer id associated with a task
+        :param due_date: A date string in the format "%Y-%m-%d", or None to remove
+                         the due date
+        :return: A tuple containing a boolean and a string. A boolean of
+                  True indicates the operation was successful, and the string
+                  contains a description of the result
+        """
+        if due_date is not None:
+            try:
+                to_day_number(due_date)
+            except ValueError:
+                return False, "Invalid date format"
+        query = "UPDATE tasks SET due_date = ? WHERE task_id = ?;"
+        success, _, message = self.db_query(query, (due_date, task_id))
+        if not success:
+            return False, message
+        return True, f"Task id {task_id} due date set to {due_date}"
+
+    # ------------------------------------------------------------------------------------------
+
+    def add_tags(self, task_id: int, tags: Iterable[str]) -> tuple[bool, str]:
+        """
+        Method to attach tags to a task.  Tags are matched without regard to case,
+        new tags are created and tags the task already has are ignored.  The tags
+        are added in one transaction.
+
+        :param task_id: The integer id associated with a task
+        :param tags: The names of the tags
+        :return: A tuple containing a boolean and a string. A boolean of
+                  True indicates the operation was successful, and the string
+                  contains a description of the result
+        """
+        tags = [tag.strip() for tag in tags if tag.strip()]
+        if not self._attributes_exist():
+            return False, f"{self.db_name} schema does not include tags"
+        owns_transaction = self.con.transaction()
+        success, message = self._insert_tags(task_id, tags)
+        success, message = self._end_transaction(owns_transaction, success, message)
+        if not success:
+            return False, message
+        return True, f"{len(tags)} tags added to task id {task_id}"
+
+    # ------------------------------------------------------------------------------------------
+
+    def remove_tag(self, task_id: int, tag: str) -> tuple[bool, str]:
+        """
+        Method to detach a tag from a task
+
+        :param task_id: The integer id associated with a task
+        :param tag: The name of the tag
+        :return: A tuple containing a boolean and a string. A boolean of
+                  True indicates the operation was successful, and the string
+                  contains a description of the result
+        """
+        query = (
+            "DELETE FROM task_tags WHERE task_id = ? "
+            "AND tag_id = (SELECT tag_id FROM tags WHERE name = ?);"
+        )
+        success, _, message = self.db_query(query, (task_id, tag))
+        if not success:
+            return False, message
+        return True, f"Tag '{tag}' removed from task id {task_id}"
+
+    # ------------------------------------------------------------------------------------------
+
+    def select_tags(self) -> tuple[bool, list[str], str]:
+        """
+        Method to select the names of the tags attached to at least one task
+
+        :return: A tuple containing a boolean, a list and a string.  The list
+                 contains the tag names in alphabetical order
+        """
+        if not self._attributes_exist():
+            return True, [], "No tags table"
+        query = (
+            "SELECT name FROM tags WHERE tag_id IN (SELECT tag_id FROM task_tags) "
+            "ORDER BY name;"
+        )
+        success, result, message = self.db_query(query)
+        if not success:
+            return False, [], message
+        return True, [row[0] for row in self.backend.fetch_rows(result)], message
+
+    # ------------------------------------------------------------------------------------------
+
+    def select_filtered_tasks(
+        self,
+        priority: int | str = None,
+        due_by: str = None,
+        tag: str = None,
+        order_by: str = "added",
+    ) -> tuple[bool, pd.DataFrame, str]:
+        """
+        Method to select the open tasks that match a set of filters, sorted in
+        SQL.  A partial index of the open tasks in each order holds every column
+        returned, so the tasks are read from an index in the requested order
+        without touching the table or sorting, and completed tasks add nothing to
+        the cost however many there are.
+
+        :param priority: The lowest priority selected, as a name or an integer,
+                         or None for every priority
+        :param due_by: A date string in the format "%Y-%m-%d", only tasks due on or
+                       before it are selected, or None for every task
+        :param tag: The name of a tag the tasks must have, or None for every task
+        :param order_by: 'added', 'priority' or 'due'.  Tasks without a due date
+                         are placed last when sorted by due date
+        :return: A tuple containing a boolean, a pandas dataframe and a string.
+                 The dataframe contains the columns task_id, task, priority and
+                 due_date
+
+        Example:
+
+        .. code-block::
+
+            from todo_six.database import ToDoDatabase
+
+            db = ToDoDatabase("chores.db")
+            db.open_db()
+            success, df, message = db.select_filtered_tasks(
+                priority="medium", tag="garden", order_by="due"
+            )
+            print(df)
+            db.close_db()
+
+            >>    task_id         task  priority    due_date
+            >> 0       12    Mow lawn         3  2026-10-20
+            >> 1        4  Trim hedge         2        None
+        """
+        columns = ["task_id", "task", "priority", "due_date"]
+        if order_by not in _TASK_ORDERS:
+            return (
+                False,
+                pd.DataFrame(),
+                f"order_by must be one of {', '.join(_TASK_ORDERS)}",
+            )
+        if not self._attributes_exist():
+            msg = f"{self.db_name} schema does not include task attributes"
+            return False, pd.DataFrame(), msg
+        where, params = ["end_date IS NULL"], []
+        if priority is not None:
+            level = self._priority_level(priority)
+            if level is None:
+                msg = f"priority must be one of {', '.join(PRIORITIES)}"
+                return False, pd.DataFrame(), msg
+            where.append("priority >= ?")
+            params.append(level)
+        if due_by is not None:
+            where.append("due_date <= ?")
+            params.append(due_by)
+        if tag is not None:
+            where.append(
+                "task_id IN (SELECT task_id FROM task_tags WHERE tag_id = "
+                "(SELECT tag_id FROM tags WHERE name = ?))"
+            )
+            params.append(tag)
+        query = (
+            f"SELECT {', '.join(columns)} FROM tasks WHERE {' AND '.join(where)} "
+            f"ORDER BY {_TASK_ORDERS[order_by]};"
+        )
+        success, result, message = self.db_query(query, tuple(params))
+        if not success:
+            return False, pd.DataFrame(), message
+        rows = self.backend.fetch_rows(result)
+        return True, pd.DataFrame(rows, columns=columns), message
+
+    # ------------------------------------------------------------------------------------------
+
+    def undo(self) -> tuple[bool, str, int]:
+        """
+        Method to undo the latest task insert, completion or deletion recorded in
+        the journal that has not been undone.  Operations recorded together, such
+        as a bulk completion, are undone together.  The inverse operations are
+        applied in one transaction, so an operation that can no longer be undone,
+        for instance because the task has since been archived, leaves the database
+        unchanged.  Undone operations can be redone until a new operation is
+        recorded.
+
+        :return: A tuple containing a boolean, a string and an integer.  A boolean of
+                 True indicates the operation was successful, the string contains a
+                 description of the result and the integer is the number of
+                 operations undone, 0 if there was nothing to undo
+
+        Example:
+
+        .. code-block::
+
+            from todo_six.database import ToDoDatabase
+
+            db = ToDoDatabase("chores.db")
+            db.open_db()
+            db.delete_task(12)
+            success, message, count = db.undo()
+            print(message)
+            db.close_db()
+
+            >> 1 operations undone
+        """
+        return self._replay_group(True)
+
+    # ------------------------------------------------------------------------------------------
+
+    def redo(self) -> tuple[bool, str, int]:
+        """
+        Method to apply again the operations most recently undone by :meth:`undo`
+
+        :return: A tuple containing a boolean, a string and an integer.  A boolean of
+                 True indicates the operation was successful, the string contains a
+                 description of the result and the integer is the number of
+                 operations redone, 0 if there was nothing to redo
+        """
+        return self._replay_group(False)
+
+    # ------------------------------------------------------------------------------------------
+
+    def prune_journal(self, keep: int = JOURNAL_LIMIT) -> tuple[bool, str, int]:
+        """
+        Method to remove all but the latest operations from the journal.  A group
+        of operations cut by the limit is removed whole.  The function is run with
+        the database maintenance, see :func:`todo_six.maintenance.run_maintenance`.
+
+        :param keep: The number of operations to keep
+        :return: A tuple containing a boolean, a string and an integer.  A boolean of
+                 True indicates the operation was successful, the string contains a
+                 description of the result and the integer is the number of
+                 operations removed
+        """
+        if not self._journal_exists():
+            return True, "No journal", 0
+        owns_transaction = self.con.transaction()
+        pruned = 0
+        for statement, params in [
+            (
+                "DELETE FROM journal "
+                "WHERE op_id <= (SELECT MAX(op_id) FROM journal) - ?;",
+                (keep,),
+            ),
+            (
+                "DELETE FROM journal WHERE op_id < COALESCE((SELECT MIN(op_id) FROM "
+                "journal WHERE grouped = 0), (SELECT MAX(op_id) + 1 FROM journal));",
+                (),
+            ),
+        ]:
+            success, count, message = self._count_changes(statement, params)
+            if not success:
+                break
+            pruned += count
+        success, message = self._end_transaction(owns_transaction, success, message)
+        if not success:
+            return False, message, 0
+        return True, f"{pruned} operations pruned from the journal", pruned
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _scan_former_open_tasks(self, date) -> tuple[bool, pd.DataFrame, str]:
+        """
+        Method to select the tasks open on a date without the interval index, used
+        for databases whose schema has not been upgraded
+        """
+        query = (
+            "SELECT task_id, task FROM tasks "
+            "WHERE start_date <= ? AND (end_date > ? OR end_date IS NULL);"
+        )
+        params = (date, date)
+        success, result, message = self.db_query(query, params)
+        if success:
+            tasks = self.backend.fetch_rows(result)
+            df = pd.DataFrame(tasks, columns=["task_id", "task"])
+            return True, df, "Successfully retrieved tasks open on the provided date."
+        else:
+            return False, pd.DataFrame(), message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _interval_index_exists(self) -> bool:
+        """
+        Method to determine if the tasks_interval index exists, remembering a
+        positive answer for the life of the connection
+        """
+        if not self._has_interval_index:
+            self._has_interval_index, _ = self.table_exists("tasks_interval")
+        return self._has_interval_index
+
+    # ------------------------------------------------------------------------------------------
+
+    def _create_interval_index(self) -> tuple[bool, str]:
+        """
+        Migration that creates an R*Tree index over the [start, end) day interval of
+        every task, kept in sync with the tasks table by triggers
+        """
+        start_day = f"COALESCE({_DAY.format('NEW.start_date')}, {OPEN_DAY})"
+        end_day = f"MAX({start_day}, COALESCE({_DAY.format('NEW.end_date')}, {OPEN_DAY}))"
+        backfill_start = f"COALESCE({_DAY.format('start_date')}, {OPEN_DAY})"
+        backfill_end = (
+            f"MAX({backfill_start}, COALESCE({_DAY.format('end_date')}, {OPEN_DAY}))"
+        )
+        statements = [
+            "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_interval "
+            "USING rtree_i32(task_id, start_day, end_day);",
+            f"INSERT INTO tasks_interval SELECT task_id, {backfill_start}, "
+            f"{backfill_end} FROM tasks;",
+            "CREATE TRIGGER IF NOT EXISTS tasks_interval_insert AFTER INSERT ON tasks "
+            f"BEGIN INSERT INTO tasks_interval VALUES (NEW.task_id, {start_day}, "
+            f"{end_day}); END;",
+            "CREATE TRIGGER IF NOT EXISTS tasks_interval_update "
+            "AFTER UPDATE OF task_id, start_date, end_date ON tasks "
+            "BEGIN DELETE FROM tasks_interval WHERE task_id = OLD.task_id; "
+            f"INSERT INTO tasks_interval VALUES (NEW.task_id, {start_day}, "
+            f"{end_day}); END;",
+            "CREATE TRIGGER IF NOT EXISTS tasks_interval_delete AFTER DELETE ON tasks "
+            "BEGIN DELETE FROM tasks_interval WHERE task_id = OLD.task_id; END;",
+        ]
+        for statement in statements:
+            success, _, message = self.db_query(statement)
+            if not success:
+                return False, message
+        self._has_interval_index = True
+        return True, "Interval index created"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _metadata_exists(self) -> bool:
+        """
+        Method to determine if the tasks_metadata table exists, remembering a
+        positive answer for the life of the connection
+        """
+        if not self._has_metadata:
+            self._has_metadata, _ = self.table_exists("tasks_metadata")
+        return self._has_metadata
+
+    # ------------------------------------------------------------------------------------------
+
+    def _read_metadata(self) -> tuple[bool, dict[str, dict], str]:
+        """
+        Method to read the rows of the tasks_metadata table, keyed by the table
+        each row describes
+        """
+        if not self._metadata_exists():
+            return False, {}, f"{self.db_name} has no tasks_metadata table"
+        query = f"SELECT source, {', '.join(_METADATA_COLUMNS)} FROM tasks_metadata;"
+        success, result, message = self.db_query(query)
+        if not success:
+            return False, {}, message
+        rows = {
+            row[0]: dict(zip(_METADATA_COLUMNS, row[1:]))
+            for row in self.backend.fetch_rows(result)
+        }
+        return True, rows, message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _create_metadata_table(self) -> tuple[bool, str]:
+        """
+        Migration that creates the tasks_metadata table, which holds the number of
+        open and completed tasks and the earliest and latest dates of the tasks and
+        tasks_archive tables, one row per table.  Triggers keep each row in step
+        with its table.  An insert only compares the new dates with the stored
+        ones, while an update or delete reads the affected bounds again from the
+        start and end date indexes, so no trigger scans a table.
+        """
+        statements = [
+            "CREATE TABLE IF NOT EXISTS tasks_metadata (source TEXT PRIMARY KEY, "
+            "open_tasks INTEGER NOT NULL, closed_tasks INTEGER NOT NULL, "
+            "min_start DATE, max_start DATE, min_end DATE, max_end DATE);"
+        ]
+        for table in ["tasks", "tasks_archive"]:
+            bounds = (
+                f"min_start = (SELECT MIN(start_date) FROM {table}), "
+                f"max_start = (SELECT MAX(start_date) FROM {table}), "
+                f"min_end = (SELECT MIN(end_date) FROM {table}), "
+                f"max_end = (SELECT MAX(end_date) FROM {table})"
+            )
+            statements += [
+                "INSERT OR REPLACE INTO tasks_metadata SELECT "
+                f"'{table}', COALESCE(SUM(end_date IS NULL), 0), "
+                "COALESCE(SUM(end_date IS NOT NULL), 0), MIN(start_date), "
+                f"MAX(start_date), MIN(end_date), MAX(end_date) FROM {table};",
+                f"CREATE TRIGGER IF NOT EXISTS {table}_metadata_insert "
+                f"AFTER INSERT ON {table} BEGIN UPDATE tasks_metadata SET "
+                "open_tasks = open_tasks + (NEW.end_date IS NULL), "
+                "closed_tasks = closed_tasks + (NEW.end_date IS NOT NULL), "
+                "min_start = COALESCE(MIN(min_start, NEW.start_date), min_start, "
+                "NEW.start_date), "
+                "max_start = COALESCE(MAX(max_start, NEW.start_date), max_start, "
+                "NEW.start_date), "
+                "min_end = COALESCE(MIN(min_end, NEW.end_date), min_end, NEW.end_date), "
+                "max_end = COALESCE(MAX(max_end, NEW.end_date), max_end, NEW.end_date) "
+                f"WHERE source = '{table}'; END;",
+                f"CREATE TRIGGER IF NOT EXISTS {table}_metadata_update "
+                f"AFTER UPDATE OF start_date, end_date ON {table} BEGIN "
+                "UPDATE tasks_metadata SET "
+                "open_tasks = open_tasks + (NEW.end_date IS NULL) "
+                "- (OLD.end_date IS NULL), "
+                "closed_tasks = closed_tasks + (NEW.end_date IS NOT NULL) "
+                f"- (OLD.end_date IS NOT NULL), {bounds} "
+                f"WHERE source = '{table}'; END;",
+                f"CREATE TRIGGER IF NOT EXISTS {table}_metadata_delete "
+                f"AFTER DELETE ON {table} BEGIN UPDATE tasks_metadata SET "
+                "open_tasks = open_tasks - (OLD.end_date IS NULL), "
+                f"closed_tasks = closed_tasks - (OLD.end_date IS NOT NULL), {bounds} "
+                f"WHERE source = '{table}'; END;",
+            ]
+        for statement in statements:
+            success, _, message = self.db_query(statement)
+            if not success:
+                return False, message
+        self._has_metadata = True
+        return True, "Metadata table created"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _read_snapshot(self, time_frame: str) -> tuple[bool, dict, str]:
+        """
+        Method to read the oldest date and the open and completed tasks shown when
+        a database is first displayed
+        """
+        success, oldest_date, message = self.get_oldest_date()
+        if not success:
+            return False, {}, message
+        success, open_tasks, message = self.select_open_tasks()
+        if not success:
+            return False, {}, message
+        success, closed_tasks, message = self.select_closed_tasks(time_frame)
+        if not success:
+            return False, {}, message
+        snapshot = {
+            "oldest_date": oldest_date,
+            "open_tasks": open_tasks,
+            "closed_tasks": closed_tasks,
+        }
+        return True, snapshot, message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _insert_statement(self) -> str:
+        """
+        Method to return the statement that inserts a task from its text and start
+        date
+        """
+        if self._archive_exists():
+            # SQLite reuses the ids of rows removed from the end of a table, so the
+            # id is chosen explicitly to stay clear of the archived tasks
+            return (
+                "INSERT INTO tasks (task_id, task, start_date) VALUES ("
+                "MAX(COALESCE((SELECT MAX(task_id) FROM tasks), 0), "
+                "COALESCE((SELECT MAX(task_id) FROM tasks_archive), 0)) + 1, ?, ?);"
+            )
+        return "INSERT INTO tasks (task, start_date) VALUES (?, ?);"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _recurrence_exists(self) -> bool:
+        """
+        Method to determine if the recurrences table exists, remembering a positive
+        answer for the life of the connection
+        """
+        if not self._has_recurrences:
+            self._has_recurrences, _ = self.table_exists("recurrences")
+        return self._has_recurrences
+
+    # ------------------------------------------------------------------------------------------
+
+    def _end_transaction(
+        self, owns_transaction: bool, success: bool, message: str
+    ) -> tuple[bool, str]:
+        """
+        Method to commit a transaction begun by a method if its statements
+        succeeded and to roll it back otherwise.  A transaction begun by the caller
+        is left open.
+        """
+        if not owns_transaction:
+            return success, message
+        if not success:
+            self.con.rollback()
+            return False, message
+        if not self.con.commit():
+            self.con.rollback()
+            return False, f"Failed to commit the changes to {self.db_name}"
+        return True, message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _count_changes(self, statement: str, params: tuple) -> tuple[bool, int, str]:
+        """
+        Method to run a statement and return the number of rows it changed
+        """
+        success, _, message = self.db_query(statement, params)
+        if not success:
+            return False, 0, message
+        success, result, message = self.db_query("SELECT changes();")
+        changed = int(result.value(0)) if success and result.next() else 0
+        return success, changed, message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _existing_task_ids(self, task_ids: list[int]) -> tuple[bool, list[int], str]:
+        """
+        Method to filter a list of task ids down to the tasks held in the tasks or
+        tasks_archive table, keeping their order
+        """
+        query = "SELECT 1 FROM tasks WHERE task_id = ?"
+        if self._archive_exists():
+            query += " UNION ALL SELECT 1 FROM tasks_archive WHERE task_id = ?"
+        repeats = query.count("?")
+        existing = []
+        for task_id in task_ids:
+            success, value, message = self._read_value(query, (task_id,) * repeats)
+            if not success:
+                return False, [], message
+            if value is not None:
+                existing.append(task_id)
+        return True, existing, f"{len(existing)} tasks found"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _delete_rows(self, task_ids: list[int]) -> tuple[bool, int, str]:
+        """
+        Method to delete tasks and their tags, returning the number of tasks deleted
+        """
+        tables = ["tasks"]
+        if self._archive_exists():
+            tables.append("tasks_archive")
+        deleted = 0
+        for table in tables:
+            query = f"DELETE FROM {table} WHERE task_id=?;"
+            for task_id in task_ids:
+                success, changed, message = self._count_changes(query, (task_id,))
+                if not success:
+                    return False, deleted, message
+                deleted += changed
+        if self._attributes_exist():
+            query = "DELETE FROM task_tags WHERE task_id=?;"
+            success, message = self.db_executemany(query, [(i,) for i in task_ids])
+            if not success:
+                return False, deleted, message
+        return True, deleted, f"{deleted} tasks deleted"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _read_value(self, query: str, params: tuple = ()) -> tuple[bool, Any, str]:
+        """
+        Method to read the first column of the first row of a query, None if there
+        is no row or the value is NULL
+        """
+        success, result, message = self.db_query(query, params)
+        if not success:
+            return False, None, message
+        rows = self.backend.fetch_block(result, 1)
+        return True, rows[0][0] if rows else None, message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _import_chunk(self, chunk: dict) -> tuple[bool, str]:
+        """
+        Method to add one chunk read from a task archive to the tasks and
+        tasks_archive tables, with the tags of its tasks
+        """
+        query = (
+            "INSERT INTO {} (task_id, task, start_date, end_date, priority, due_date) "
+            "VALUES (?, ?, ?, ?, ?, ?);"
+        )
+        task_ids = chunk["task_id"].tolist()
+        rows = list(
+            zip(
+                task_ids,
+                chunk["task"],
+                date_strings(chunk["start_day"]),
+                date_strings(chunk["end_day"]),
+                chunk["priority"].tolist(),
+                date_strings(chunk["due_day"]),
+            )
+        )
+        archived = chunk["archived"].tolist()
+        for flag, table in [(0, "tasks"), (1, "tasks_archive")]:
+            selected = [row for row, a in zip(rows, archived) if a == flag]
+            success, message = self.db_executemany(query.format(table), selected)
+            if not success:
+                return False, message
+        pairs = [
+            (task_id, name)
+            for task_id, names in zip(task_ids, chunk["tags"])
+            for name in names
+        ]
+        return self._insert_tag_pairs(pairs)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _insert_tags(self, task_id: int, tags: list[str]) -> tuple[bool, str]:
+        """
+        Method to create missing tags and attach them to a task
+        """
+        success, message = self._insert_tag_pairs([(task_id, tag) for tag in tags])
+        if not success:
+            return False, message
+        return True, f"{len(tags)} tags attached to task id {task_id}"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _insert_tag_pairs(self, pairs: list[tuple[int, str]]) -> tuple[bool, str]:
+        """
+        Method to create missing tags and attach each to its task, given pairs of a
+        task id and a tag name
+        """
+        for statement, rows in [
+            ("INSERT OR IGNORE INTO tags (name) VALUES (?);", [(t,) for _, t in pairs]),
+            (
+                "INSERT OR IGNORE INTO task_tags (tag_id, task_id) "
+                "SELECT tag_id, ? FROM tags WHERE name = ?;",
+                pairs,
+            ),
+        ]:
+            success, message = self.db_executemany(statement, rows)
+            if not success:
+                return False, message
+        return True, f"{len(pairs)} tags attached"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _journal_exists(self) -> bool:
+        """
+        Method to determine if the journal table exists, remembering a positive
+        answer for the life of the connection
+        """
+        if not self._has_journal:
+            self._has_journal, _ = self.table_exists("journal")
+        return self._has_journal
+
+    # ------------------------------------------------------------------------------------------
+
+    def _record(
+        self, kind: int, task_ids: list[int], end_date: str = None
+    ) -> tuple[bool, str]:
+        """
+        Method to record operations on tasks in the journal as one undo step.  The
+        operations that were undone can no longer be redone once a new one is
+        recorded.  An insert or completion is a single short row and a deletion
+        also saves the task, so each operation costs one insert into the journal.
+        The first row opens the group, so every task passed must exist.
+        """
+        if not self._journal_exists():
+            return True, "No journal"
+        query = "DELETE FROM journal WHERE undone = 1;"
+        success, _, message = self.db_query(query)
+        if not success:
+            return False, message
+        if kind == _DELETE:
+            statement = (
+                f"INSERT INTO journal (kind, grouped, task_id, {_SNAPSHOT_COLUMNS}) "
+                f"SELECT {_DELETE}, ?, ?, * FROM ({_SNAPSHOT});"
+            )
+            rows = [
+                (int(index > 0), task_id, task_id, task_id)
+                for index, task_id in enumerate(task_ids)
+            ]
+        else:
+            statement = (
+                "INSERT INTO journal (kind, grouped, task_id, end_date) "
+                f"VALUES ({kind}, ?, ?, ?);"
+            )
+            rows = [
+                (int(index > 0), task_id, end_date)
+                for index, task_id in enumerate(task_ids)
+            ]
+        return self.db_executemany(statement, rows)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _replay_group(self, undo: bool) -> tuple[bool, str, int]:
+        """
+        Method to apply the inverse of the latest group of operations that has not
+        been undone, or to apply again the first group that has, in one transaction
+        """
+        action = "undo" if undo else "redo"
+        if not self._journal_exists():
+            return False, f"{self.db_name} has no journal", 0
+        owns_transaction = self.con.transaction()
+        success, operations, message = self._journal_group(undo)
+        for operation in operations if success else []:
+            success, message = self._replay(operation, undo)
+            if not success:
+                break
+        if success and operations:
+            op_ids = [operation[0] for operation in operations]
+            query = "UPDATE journal SET undone = ? WHERE op_id BETWEEN ? AND ?;"
+            params = (int(undo), min(op_ids), max(op_ids))
+            success, _, message = self.db_query(query, params)
+        success, message = self._end_transaction(owns_transaction, success, message)
+        if not success:
+            return False, message, 0
+        if not operations:
+            return True, f"Nothing to {action}", 0
+        return True, f"{len(operations)} operations {action}ne", len(operations)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _journal_group(self, undo: bool) -> tuple[bool, list[tuple], str]:
+        """
+        Method to read the operations of the group to undo, latest first, or of the
+        group to redo, earliest first.  Undone operations always follow the others,
+        and the first operation of each group has ``grouped`` set to 0.
+        """
+        columns = "op_id, kind, task_id, tags, archived"
+        if undo:
+            success, first, message = self._read_value(
+                "SELECT op_id FROM journal WHERE undone = 0 AND grouped = 0 "
+                "ORDER BY op_id DESC LIMIT 1;"
+            )
+            query = (
+                f"SELECT {columns} FROM journal WHERE op_id >= ? AND undone = 0 "
+                "ORDER BY op_id DESC;"
+            )
+            params = (first,)
+        else:
+            success, first, message = self._read_value(
+                "SELECT MIN(op_id) FROM journal WHERE undone = 1;"
+            )
+            _, last, _ = self._read_value(
+                "SELECT op_id FROM journal WHERE op_id > ? AND grouped = 0 "
+                "ORDER BY op_id LIMIT 1;",
+                (first,),
+            )
+            query = (
+                f"SELECT {columns} FROM journal WHERE op_id >= ? AND op_id < ? "
+                "ORDER BY op_id;"
+            )
+            params = (first, last if last is not None else sys.maxsize)
+        if not success or first is None:
+            return success, [], message
+        success, result, message = self.db_query(query, params)
+        if not success:
+            return False, [], message
+        return True, self.backend.fetch_rows(result), message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _replay(self, operation: tuple, undo: bool) -> tuple[bool, str]:
+        """
+        Method to apply the inverse of a journal operation, or the operation again
+        """
+        op_id, kind, task_id, tags, archived = operation
+        if kind == _COMPLETE and undo:
+            statement = (
+                "UPDATE tasks SET end_date = NULL "
+                "WHERE task_id = ? AND end_date IS NOT NULL;"
+            )
+            params = (task_id,)
+        elif kind == _COMPLETE:
+            statement = (
+                "UPDATE tasks SET end_date = (SELECT end_date FROM journal "
+                "WHERE op_id = ?) WHERE task_id = ? AND end_date IS NULL;"
+            )
+            params = (op_id, task_id)
+        elif (kind == _DELETE) == undo:
+            return self._restore_task(op_id, task_id, tags, archived)
+        else:
+            return self._remove_task(op_id, task_id)
+        success, changed, message = self._count_changes(statement, params)
+        if success and not changed:
+            return False, f"Task id {task_id} has changed and cannot be restored"
+        return success, message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _restore_task(
+        self, op_id: int, task_id: int, tags: str, archived: int
+    ) -> tuple[bool, str]:
+        """
+        Method to insert a task and its tags saved in the journal, back into the
+        table it was deleted from
+        """
+        table = "tasks_archive" if archived else "tasks"
+        query = (
+            f"INSERT INTO {table} (task_id, task, start_date, end_date, priority, "
+            "due_date) SELECT task_id, task, start_date, end_date, priority, due_date "
+            "FROM journal WHERE op_id = ?;"
+        )
+        success, _, message = self.db_query(query, (op_id,))
+        if not success:
+            return False, f"Task id {task_id} cannot be restored: {message}"
+        if tags:
+            return self._insert_tags(task_id, tags.split("\n"))
+        return True, f"Task id {task_id} restored"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _remove_task(self, op_id: int, task_id: int) -> tuple[bool, str]:
+        """
+        Method to save a task and its tags in the journal and delete it
+        """
+        query = (
+            f"UPDATE journal SET ({_SNAPSHOT_COLUMNS}) = ({_SNAPSHOT}) WHERE op_id = ?;"
+        )
+        success, _, message = self.db_query(query, (task_id, task_id, op_id))
+        removed = 0
+        for table in ["tasks", "tasks_archive", "task_tags"]:
+            if not success:
+                return False, message
+            query = f"DELETE FROM {table} WHERE task_id = ?;"
+            success, changed, message = self._count_changes(query, (task_id,))
+            removed += changed if table != "task_tags" else 0
+        if success and not removed:
+            return False, f"Task id {task_id} has changed and cannot be removed"
+        return success, message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _attributes_exist(self) -> bool:
+        """
+        Method to determine if the priority, due date and tag schema exists,
+        remembering a positive answer for the life of the connection
+        """
+        if not self._has_attributes:
+            self._has_attributes, _ = self.table_exists("tags")
+        return self._has_attributes
+
+    # ------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _priority_level(priority: int | str) -> int | None:
+        """
+        Method to return the integer of a priority name or level, or None if it is
+        not a priority
+        """
+        if isinstance(priority, str):
+            return PRIORITIES.get(priority.lower())
+        return priority if priority in PRIORITIES.values() else None
+
+    # ------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _due_occurrences(rules: list[tuple], today) -> tuple[list, list, list]:
+        """
+        Method to split due recurrence rules into the tasks to insert, the rules to
+        advance to their next occurrence and the rules that have ended
+        """
+        tasks, advanced, expired = [], [], []
+        for rule_id, task, frequency, interval, anchor, until in rules:
+            anchor = datetime.strptime(anchor, "%Y-%m-%d").date()
+            last, following = due_occurrences(anchor, frequency, interval, today)
+            if until is None or last.isoformat() <= until:
+                tasks.append((task, last.isoformat()))
+            if until is not None and following.isoformat() > until:
+                expired.append((rule_id,))
+            else:
+                advanced.append((following.isoformat(), rule_id))
+        return tasks, advanced, expired
+
+    # ------------------------------------------------------------------------------------------
+
+    def _archive_exists(self) -> bool:
+        """
+        Method to determine if the tasks_archive table exists, remembering a
+        positive answer for the life of the connection
+        """
+        if not self._has_archive:
+            self._has_archive, _ = self.table_exists("tasks_archive")
+        return self._has_archive
+
+    # ------------------------------------------------------------------------------------------
+
+    def _task_source(self, first_date: str) -> str:
+        """
+        Method to return the table to select completed tasks from.  The archive is
+        only included when it holds a task completed on or after first_date, which
+        the end date index of the archive answers without reading any task.
+        """
+        if not self._archive_exists():
+            return "tasks"
+        query = "SELECT MAX(end_date) FROM tasks_archive;"
+        success, result, _ = self.db_query(query)
+        latest = result.value(0) if success and result.next() else None
+        if latest is None or latest < first_date:
+            return "tasks"
+        return _ALL_TASKS
+
+    # ------------------------------------------------------------------------------------------
+
+    def _create_end_date_index(self) -> tuple[bool, str]:
+        """
+        Migration that indexes the end date, so the open task select and the closed
+        task time frames read only the matching tasks instead of scanning the table
+        """
+        query = "CREATE INDEX IF NOT EXISTS tasks_end_date ON tasks (end_date);"
+        success, _, message = self.db_query(query)
+        if not success:
+            return False, message
+        return True, "End date index created"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _create_archive_table(self) -> tuple[bool, str]:
+        """
+        Migration that creates the table that archive_tasks moves completed tasks
+        into, with an index on the end date used to decide when to read it
+        """
+        statements = [
+            "CREATE TABLE IF NOT EXISTS tasks_archive (task_id INTEGER PRIMARY KEY, "
+            "task TEXT NOT NULL, start_date DATE, end_date DATE);",
+            "CREATE INDEX IF NOT EXISTS tasks_archive_end_date "
+            "ON tasks_archive (end_date);",
+        ]
+        for statement in statements:
+            success, _, message = self.db_query(statement)
+            if not success:
+                return False, message
+        self._has_archive = True
+        return True, "Archive table created"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _create_start_date_index(self) -> tuple[bool, str]:
+        """
+        Migration that indexes the start date of both task tables, so the oldest
+        date read when a database is opened is found without scanning them
+        """
+        statements = [
+            "CREATE INDEX IF NOT EXISTS tasks_start_date ON tasks (start_date);",
+            "CREATE INDEX IF NOT EXISTS tasks_archive_start_date "
+            "ON tasks_archive (start_date);",
+        ]
+        for statement in statements:
+            success, _, message = self.db_query(statement)
+            if not success:
+                return False, message
+        return True, "Start date index created"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _create_recurrence_table(self) -> tuple[bool, str]:
+        """
+        Migration that creates the table of recurrence rules, with an index on the
+        date each rule is next due so the due rules are found without reading the
+        others
+        """
+        statements = [
+            "CREATE TABLE IF NOT EXISTS recurrences (rule_id INTEGER PRIMARY KEY, "
+            "task TEXT NOT NULL, frequency TEXT NOT NULL CHECK (frequency IN "
+            f"({', '.join(repr(name) for name in FREQUENCIES)})), "
+            "interval INTEGER NOT NULL CHECK (interval > 0), anchor DATE NOT NULL, "
+            "next_due DATE NOT NULL, until DATE);",
+            "CREATE INDEX IF NOT EXISTS recurrences_next_due "
+            "ON recurrences (next_due);",
+        ]
+        for statement in statements:
+            success, _, message = self.db_query(statement)
+            if not success:
+                return False, message
+        self._has_recurrences = True
+        return True, "Recurrence table created"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _create_task_attributes(self) -> tuple[bool, str]:
+        """
+        Migration that adds a priority and a due date to both task tables, the tags
+        and task_tags tables, and partial indexes of the open tasks in each order
+        of the filtered select that hold every column it reads
+        """
+        statements = [
+            "CREATE TABLE IF NOT EXISTS tags (tag_id INTEGER PRIMARY KEY, "
+            "name TEXT NOT NULL UNIQUE COLLATE NOCASE);",
+            "CREATE TABLE IF NOT EXISTS task_tags (tag_id INTEGER NOT NULL, "
+            "task_id INTEGER NOT NULL, PRIMARY KEY (tag_id, task_id)) WITHOUT ROWID;",
+            "CREATE INDEX IF NOT EXISTS task_tags_task ON task_tags (task_id, tag_id);",
+        ]
+        for table in ["tasks", "tasks_archive"]:
+            success, schema, message = self.table_schema(table)
+            if not success:
+                return False, message
+            if "priority" not in schema:
+                statements.append(
+                    f"ALTER TABLE {table} ADD COLUMN priority INTEGER NOT NULL "
+                    "DEFAULT 0 CHECK (priority BETWEEN 0 AND 3);"
+                )
+            if "due_date" not in schema:
+                statements.append(f"ALTER TABLE {table} ADD COLUMN due_date DATE;")
+        # end_date is kept in each index, without it SQLite reads the table to
+        # check the condition of the partial index
+        statements += [
+            "CREATE INDEX IF NOT EXISTS tasks_open_added "
+            "ON tasks (task_id, task, priority, due_date, end_date) "
+            "WHERE end_date IS NULL;",
+            "CREATE INDEX IF NOT EXISTS tasks_open_priority "
+            "ON tasks (priority DESC, task_id, task, due_date, end_date) "
+            "WHERE end_date IS NULL;",
+            "CREATE INDEX IF NOT EXISTS tasks_open_due "
+            "ON tasks (due_date, task_id, task, priority, end_date) "
+            "WHERE end_date IS NULL;",
+        ]
+        for statement in statements:
+            success, _, message = self.db_query(statement)
+            if not success:
+                return False, message
+        self._has_attributes = True
+        return True, "Task attributes created"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _create_journal_table(self) -> tuple[bool, str]:
+        """
+        Migration that creates the journal of task operations used by undo and
+        redo, with a partial index of the operations that have been undone
+        """
+        statements = [
+            "CREATE TABLE IF NOT EXISTS journal (op_id INTEGER PRIMARY KEY, "
+            "kind INTEGER NOT NULL, task_id INTEGER NOT NULL, "
+            "grouped INTEGER NOT NULL DEFAULT 0, undone INTEGER NOT NULL DEFAULT 0, "
+            "task TEXT, start_date DATE, end_date DATE, priority INTEGER, "
+            "due_date DATE, tags TEXT, archived INTEGER NOT NULL DEFAULT 0);",
+            "CREATE INDEX IF NOT EXISTS journal_undone ON journal (op_id) "
+            "WHERE undone = 1;",
+        ]
+        for statement in statements:
+            success, _, message = self.db_query(statement)
+            if not success:
+                return False, message
+        self._has_journal = True
+        return True, "Journal table created"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _select_columns(
+        self, where: str, params: tuple, msg: str, source: str = "tasks"
+    ) -> tuple[bool, TaskColumns, str]:
+        """
+        Method to read the ids and day numbers of the tasks matching a WHERE clause
+        into a TaskColumns object, leaving the task text in the database
+        """
+        query = (
+            f"SELECT task_id, COALESCE({_DAY.format('start_date')}, ?), "
+            f"COALESCE({_DAY.format('end_date')}, ?) FROM {source} WHERE {where} "
+            "ORDER BY task_id;"
+        )
+        success, result, message = self.db_query(query, (NULL_DAY, NULL_DAY) + params)
+        if not success:
+            return False, TaskColumns(), message
+        values = self.backend.fetch_columns(result)
+        columns = TaskColumns(
+            np.ascontiguousarray(values[:, 0]),
+            np.ascontiguousarray(values[:, 1]),
+            np.ascontiguousarray(values[:, 2]),
+            self,
+            where,
+            params,
+            source,
+        )
+        return True, columns, msg
+
+    # ------------------------------------------------------------------------------------------
+
+    def _select_task_days(self) -> tuple[bool, np.ndarray, np.ndarray, str]:
+        """
+        Method to read the start and end date of every task, including archived
+        tasks, as day numbers counted from 1970-01-01, with NULL_DAY as the end day
+        of open tasks
+        """
+        source = _ALL_TASKS if self._archive_exists() else "tasks"
+        query = (
+            "SELECT CAST(julianday(start_date) - 2440587.5 AS INTEGER), "
+            "COALESCE(CAST(julianday(end_date) - 2440587.5 AS INTEGER), ?) "
+            f"FROM {source} WHERE start_date IS NOT NULL;"
+        )
+        success, result, message = self.db_query(query, (NULL_DAY,))
+        if not success:
+            empty = np.empty(0, dtype=np.int64)
+            return False, empty, empty.copy(), message
+        days = self.backend.fetch_columns(result)
+        return (
+            True,
+            np.ascontiguousarray(days[:, 0]),
+            np.ascontiguousarray(days[:, 1]),
+            message,
+        )
+
 
 # ==========================================================================================
 # ==========================================================================================
@@ -1,8 +1,9 @@
 # Import necessary packages here
 import os
 import sys
+from functools import partial
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QApplication,
@@ -15,9 +16,13 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from todo_six.backup import BackupScheduler, write_backup
 from todo_six.database import ToDoDatabase
 from todo_six.menu_bar import MenuBar
-from todo_six.widgets import DayNightRadioButton, OpacitySlider, Tab
+from todo_six.recurrence_scheduler import RecurrenceScheduler
+from todo_six.session import SessionState
+from todo_six.widgets import AggregateTab, DayNightRadioButton, OpacitySlider, Tab
+from todo_six.workers import DatabaseWorker, load_tasks_snapshot
 
 # ==========================================================================================
 # ==========================================================================================
@@ -75,6 +80,7 @@ class ToDoListView(QMainWindow, QWidget):
         self._arrange_widgets()
 
         self.tab_objects = {}
+        self.write_behind = False
 
     # ------------------------------------------------------------------------------------------
 
@@ -96,9 +102,9 @@ class ToDoListView(QMainWindow, QWidget):
 
     # ------------------------------------------------------------------------------------------
 
-    def add_new_tab(self, tab_name, ok, database) -> None:
+    def add_new_tab(self, tab_name, ok, database, loading=False) -> None:
         if ok and tab_name != "":
-            new_tab = Tab(self.fnt, tab_name, database)
+            new_tab = Tab(self.fnt, tab_name, database, loading, self.write_behind)
             self.tabs.addTab(new_tab, tab_name)
             self.tab_objects[tab_name] = new_tab
             new_tab_index = self.tabs.addTab(new_tab, tab_name)
@@ -159,10 +165,14 @@ class ToDoListController(ToDoListView):
                       time theme for the application
     :param night_theme: The title and path length to the .qss file containing the night
                         time theme for the application
+    :param session: A SessionState object used to save and restore the open
+                    databases and display settings, the application settings are
+                    used if None
     """
 
-    def __init__(self, day_sheet: str, night_sheet: str):
+    def __init__(self, day_sheet: str, night_sheet: str, session: SessionState = None):
         super().__init__(day_sheet, night_sheet)
+        self.session = session if session is not None else SessionState()
 
         self.day_night_radio_button.day_button.clicked.connect(self.set_day_theme)
         self.day_night_radio_button.night_button.clicked.connect(self.set_night_theme)
@@ -175,9 +185,35 @@ class ToDoListController(ToDoListView):
         # - List to store entire database path length
         self.db_path_length = []
 
+        # - Thread pool used for background database work and the tab that shows
+        #   the tasks of every open database
+        self.thread_pool = QThreadPool.globalInstance()
+        self.aggregate_tab = None
+
+        # - Workers loading databases in the background, keyed by path length
+        self.loading_workers = {}
+
+        # - Scheduler of the rolling backups, None while they are off, and the
+        #   workers of backups requested from the File menu, keyed by destination
+        self.backups = None
+        self.backup_workers = {}
+
+        # - Scheduler that adds the tasks of recurrence rules each new day
+        self.recurrences = RecurrenceScheduler(self.thread_pool, self)
+        self.recurrences.failed.connect(self._recurrence_failed)
+        self.recurrences.start()
+
         # IMport menu options
         self.menu_bar = MenuBar(
-            self.create_new_database, self.open_database, self.close_all_tabs
+            self.create_new_database,
+            self.open_database,
+            self.close_all_tabs,
+            self.show_all_databases,
+            self.set_write_behind,
+            self.backup_database,
+            self.set_rolling_backups,
+            self.undo,
+            self.redo,
         )
         self.setMenuBar(self.menu_bar)
 
@@ -218,14 +254,16 @@ class ToDoListController(ToDoListView):
                     msg.exec()
                     break
                 else:
-                    success, message = database.create_tasks_table()
+                    success, snapshot, message = database.bootstrap(create=True)
                 if success:
-                    file_name_only = os.path.splitext(os.path.basename(file_name))[0]
-                    if file_name_only in self.tab_database_map:
-                        file_name_only += "-1"
-                    self.add_new_tab(file_name_only, success, database)
+                    file_name_only = self._unique_tab_name(file_name)
+                    self.add_new_tab(file_name_only, success, database, loading=True)
+                    self.tab_objects[file_name_only].finish_loading(snapshot)
                     self.tab_database_map.append(file_name_only)
                     self.db_path_length.append(file_name)
+                    if self.backups is not None:
+                        self.backups.add_database(file_name)
+                    self.recurrences.add_database(file_name)
                     print(f"Database '{file_name}' and task table created successfully.")
                     break
                 else:
@@ -237,13 +275,20 @@ class ToDoListController(ToDoListView):
 
     # ------------------------------------------------------------------------------------------
 
-    def open_database(self) -> None:
+    def open_database(self, read_only: bool = False) -> None:
         """
         Method that is connected to the Open button and is used to open an existing
         database.
+
+        :param read_only: If True the database is opened read-only and its tab only
+                          displays the tasks.  A file the user cannot write, such
+                          as an archive on shared storage, is also opened
+                          immutable, so SQLite takes no locks on it
         """
         while True:
             msg1 = "Open Existing Database"
+            if read_only:
+                msg1 = "Open Database Read-Only"
             msg2 = "SQLite Databases (*.db);;All Files (*)"
             file_name, _ = QFileDialog.getOpenFileName(None, msg1, "", msg2)
             if file_name:
@@ -256,24 +301,8 @@ class ToDoListController(ToDoListView):
                     msg.setWindowTitle("Error")
                     msg.exec()
                 elif os.path.exists(file_name):
-                    database = ToDoDatabase(file_name)
-                    success, message = database.open_db()
-                    if not success:
-                        msg = QMessageBox()
-                        msg.setIcon(QMessageBox.Icon.Critical)
-                        msg.setText(message)
-                        msg.setWindowTitle("Error")
-                        msg.exec()
-                        return
-                    else:
-                        file_name_only = os.path.splitext(os.path.basename(file_name))[0]
-                        if file_name_only in self.tab_database_map:
-                            file_name_only += "-1"
-                        self.add_new_tab(file_name_only, success, database)
-                        self.tab_database_map.append(file_name_only)
-                        self.db_path_length.append(file_name)
-                        print(f"Database '{file_name}' opened successfully.")
-                        break
+                    self.load_database(file_name, read_only=read_only)
+                    break
                 else:
                     msg = QMessageBox()
                     msg.setIcon(QMessageBox.Icon.Critical)
@@ -286,12 +315,261 @@ class ToDoListController(ToDoListView):
 
     # ------------------------------------------------------------------------------------------
 
+    def set_write_behind(self, enabled: bool) -> None:
+        """
+        Method that is connected to the Write-Behind Task Entry option and turns the
+        write-behind mode of every open and future database tab on or off
+
+        :param enabled: True to show tasks at once and commit them in the
+                        background, False to commit each task before it is shown
+        """
+        self.write_behind = enabled
+        self.menu_bar.options_menu.write_behind_action.setChecked(enabled)
+        for index in range(self.tabs.count()):
+            tab = self.tabs.widget(index)
+            if isinstance(tab, Tab) and tab.isEnabled():
+                success, message = tab.set_write_behind(enabled)
+                if not success:
+                    QMessageBox.warning(self, "Error", message)
+            elif isinstance(tab, Tab):
+                tab.write_behind = enabled  # Applied once the tab has loaded
+
+    # ------------------------------------------------------------------------------------------
+
+    def backup_database(self) -> None:
+        """
+        Method that is connected to the Backup option and copies the database of
+        the current tab to a file chosen by the user.  The copy is made in the
+        background with the SQLite online backup API, so the tab remains usable
+        while a large database is copied.
+        """
+        tab = self.tabs.currentWidget()
+        if not isinstance(tab, Tab) or not tab.isEnabled():
+            QMessageBox.warning(self, "Error", "Select a database tab to back up.")
+            return
+        stem = os.path.splitext(tab.db.db_name)[0]
+        msg1 = "Backup Database"
+        msg2 = "SQLite Databases (*.db);;All Files (*)"
+        dest, _ = QFileDialog.getSaveFileName(None, msg1, f"{stem}-backup.db", msg2)
+        if not dest:
+            return
+        if os.path.abspath(dest) == os.path.abspath(tab.db.db_name):
+            QMessageBox.warning(self, "Error", "A database cannot replace itself.")
+            return
+        if tab.write_queue is not None:
+            tab.write_queue.flush()  # Queued tasks belong in the backup
+        worker = DatabaseWorker(dest, tab.db.db_name, partial(write_backup, dest=dest))
+        worker.signals.result.connect(self._backup_finished)
+        worker.signals.error.connect(self._backup_failed)
+        self.backup_workers[dest] = worker
+        self.thread_pool.start(worker)
+
+    # ------------------------------------------------------------------------------------------
+
+    def undo(self) -> None:
+        """
+        Method that is connected to the Undo option and undoes the latest task
+        insert, completion or deletion in the database of the current tab
+        """
+        self._replay_journal("undo")
+
+    # ------------------------------------------------------------------------------------------
+
+    def redo(self) -> None:
+        """
+        Method that is connected to the Redo option and applies again the task
+        changes last undone in the database of the current tab
+        """
+        self._replay_journal("redo")
+
+    # ------------------------------------------------------------------------------------------
+
+    def set_rolling_backups(self, enabled: bool, directory: str = None) -> None:
+        """
+        Method that is connected to the Rolling Backups option and turns the
+        scheduled backups of every open database on or off.  Each database is
+        copied into the backup directory every hour and its seven most recent
+        backups are kept.
+
+        :param enabled: True to make rolling backups, False to stop them
+        :param directory: The directory holding the backups, the user is asked to
+                          choose one if None
+        """
+        if self.backups is not None:
+            self.backups.stop()
+            self.backups.deleteLater()
+            self.backups = None
+        if enabled and directory is None:
+            msg1 = "Choose Backup Directory"
+            directory = QFileDialog.getExistingDirectory(None, msg1, "")
+        if enabled and directory:
+            self.backups = BackupScheduler(directory, parent=self)
+            for file_name in self.db_path_length:
+                self.backups.add_database(file_name)
+            self.backups.failed.connect(self._backup_failed_message)
+            self.backups.start()
+        self.menu_bar.file_menu.rolling_backup_action.setChecked(self.backups is not None)
+
+    # ------------------------------------------------------------------------------------------
+
+    def save_session(self) -> None:
+        """
+        Method that saves the open databases, the active tab, its selected time
+        frame, the theme and the opacity so they can be restored at the next launch.
+        """
+        current = self.tabs.currentWidget()
+        current_database = ""
+        time_frame = "Day"
+        if isinstance(current, Tab):
+            current_database = current.db.db_name
+            time_frame = current.widgets["drop_down_menu"].currentText()
+        theme = "night" if self.day_night_radio_button.night_button.isChecked() else "day"
+        self.session.save(
+            list(self.open_databases().values()),
+            current_database,
+            time_frame,
+            theme,
+            self.opacity_slider.get_opacity(),
+            self.write_behind,
+            self.backups.directory if self.backups is not None else "",
+            self._read_only_databases(),
+        )
+
+    # ------------------------------------------------------------------------------------------
+
+    def restore_session(self) -> None:
+        """
+        Method that restores the session saved by the last launch.  Every database
+        that still exists is given a placeholder tab at once and loaded in the
+        background, with the previously active database started first and
+        displayed as the current tab.
+        """
+        state = self.session.load()
+        if state["theme"] == "night":
+            self.day_night_radio_button.night_button.setChecked(True)
+            self.set_night_theme()
+        else:
+            self.day_night_radio_button.day_button.setChecked(True)
+            self.set_day_theme()
+        self.opacity_slider.set_opacity(state["opacity"])
+        self.set_write_behind(state["write_behind"])
+        if state["backup_directory"]:
+            self.set_rolling_backups(True, state["backup_directory"])
+
+        for file_name in state["databases"]:
+            if file_name in self.db_path_length or not os.path.exists(file_name):
+                continue
+            priority = 1 if file_name == state["current_database"] else 0
+            read_only = file_name in state["read_only_databases"]
+            self.load_database(file_name, priority, state["time_frame"], read_only)
+
+        tab = self._database_tab(state["current_database"])
+        if tab is not None:
+            self.tabs.setCurrentWidget(tab)
+
+    # ------------------------------------------------------------------------------------------
+
+    def load_database(
+        self, file_name: str, priority: int = 0, time_frame=None, read_only=False
+    ) -> None:
+        """
+        Method that adds a tab for an existing database and loads it in the
+        background.  The tab is shown immediately as a placeholder, while a worker
+        opens the file, checks its integrity and schema and reads the initial
+        tasks.  Closing the tab before the worker finishes cancels the load.
+
+        :param file_name: The name and path length to the database
+        :param priority: The QThreadPool priority of the worker, higher priorities
+                         are started first
+        :param time_frame: The time frame selected for the completed tasks, the
+                           default of the tab is used if None
+        :param read_only: If True the database is opened read-only, and immutable
+                          if the user cannot write the file
+        """
+        file_name_only = self._unique_tab_name(file_name)
+        immutable = read_only and not os.access(file_name, os.W_OK)
+        database = ToDoDatabase(file_name, read_only=read_only, immutable=immutable)
+        self.add_new_tab(file_name_only, True, database, loading=True)
+        self.tab_database_map.append(file_name_only)
+        self.db_path_length.append(file_name)
+        if not read_only:
+            self.recurrences.add_database(file_name)
+            if self.backups is not None:
+                self.backups.add_database(file_name)
+
+        drop_down_menu = self.tab_objects[file_name_only].widgets["drop_down_menu"]
+        if time_frame is not None:
+            # The tab has no connection yet, so it must not react to the change
+            drop_down_menu.blockSignals(True)
+            drop_down_menu.set_selected_option(time_frame)
+            drop_down_menu.blockSignals(False)
+        job = partial(load_tasks_snapshot, drop_down_menu.currentText())
+        worker = DatabaseWorker(file_name, file_name, job, read_only, immutable)
+        worker.signals.result.connect(self._database_loaded)
+        worker.signals.error.connect(self._database_failed)
+        self.loading_workers[file_name] = worker
+        self.thread_pool.start(worker, priority)
+
+    # ------------------------------------------------------------------------------------------
+
+    def show_all_databases(self) -> None:
+        """
+        Method that is connected to the All Databases button and displays the open
+        and completed tasks of every open database in a single tab.
+        """
+        if self.aggregate_tab is None:
+            self.aggregate_tab = AggregateTab(
+                self.fnt, self.open_databases, self.thread_pool
+            )
+            self.tabs.addTab(self.aggregate_tab, self.aggregate_tab.tab_name)
+            self.tabs.setTabsClosable(True)
+        self.tabs.setCurrentWidget(self.aggregate_tab)
+        self.aggregate_tab.refresh()
+
+    # ------------------------------------------------------------------------------------------
+
+    def open_databases(self) -> dict[str, str]:
+        """
+        Method that returns the databases open in the application
+
+        :return: A dictionary mapping the name of each database tab to the name and
+                 path length of its database
+        """
+        databases = {}
+        for index in range(self.tabs.count()):
+            tab = self.tabs.widget(index)
+            if isinstance(tab, Tab):
+                databases[tab.tab_name] = tab.db.db_name
+        return databases
+
+    # ------------------------------------------------------------------------------------------
+
     def close_tab(self, index):
         """
         Closes the tab at the given index.
         """
         tab = self.tabs.widget(index)
-        tab.db.remove_db()
+        if tab is self.aggregate_tab:
+            tab.cancel()
+            self.aggregate_tab = None
+        else:
+            worker = self.loading_workers.pop(tab.db.db_name, None)
+            if worker is not None:
+                worker.cancel()
+            tab.monitor.stop()
+            tab.close_write_queue()
+            if tab.db.con.isOpen() and not tab.db.read_only:
+                tab.maintenance.finish()
+            else:
+                tab.maintenance.stop()
+            tab.db.remove_db()
+            if tab.tab_name in self.tab_database_map:
+                self.tab_database_map.remove(tab.tab_name)
+            if tab.db.db_name in self.db_path_length:
+                self.db_path_length.remove(tab.db.db_name)
+            if self.backups is not None:
+                self.backups.remove_database(tab.db.db_name)
+            self.recurrences.remove_database(tab.db.db_name)
         self.tabs.removeTab(index)  # this will remove the tab from the QTabWidget
         tab.deleteLater()  # this will delete the tab from memory
 
@@ -310,10 +588,139 @@ class ToDoListController(ToDoListView):
         """
         Method that handles the close event of the application. It closes all open tabs
         and their corresponding database connections before closing the application.
+        The session is saved first so it can be restored at the next launch, and
+        the tasks queued by tabs in write-behind mode are committed as their tabs
+        close.
         """
+        self.save_session()
+        self.set_rolling_backups(False)
+        self.recurrences.stop()
         self.close_all_tabs()
+        self.thread_pool.waitForDone()
         super().closeEvent(event)
 
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _unique_tab_name(self, file_name: str) -> str:
+        """
+        Returns the file name of a database without its extension, followed by a
+        counter if a tab of that name is already open
+        """
+        base_name = os.path.splitext(os.path.basename(file_name))[0]
+        tab_name = base_name
+        counter = 1
+        while tab_name in self.tab_database_map:
+            tab_name = f"{base_name}-{counter}"
+            counter += 1
+        return tab_name
+
+    # ------------------------------------------------------------------------------------------
+
+    def _replay_journal(self, method: str) -> None:
+        """
+        Calls Tab.undo or Tab.redo on the current tab and reports a failure
+        """
+        tab = self.tabs.currentWidget()
+        if not isinstance(tab, Tab) or not tab.isEnabled():
+            return
+        success, message = getattr(tab, method)()
+        if not success:
+            QMessageBox.warning(self, "Error", message)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _backup_finished(self, dest: str, backup_name: str) -> None:
+        """
+        Reports a backup requested from the File menu that has been written
+        """
+        self.backup_workers.pop(dest, None)
+        print(f"Backup '{backup_name}' written successfully.")
+
+    # ------------------------------------------------------------------------------------------
+
+    def _backup_failed(self, dest: str, message: str) -> None:
+        """
+        Reports a backup requested from the File menu that could not be written
+        """
+        self.backup_workers.pop(dest, None)
+        self._backup_failed_message(message)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _backup_failed_message(self, message: str) -> None:
+        """
+        Displays the reason a backup failed
+        """
+        QMessageBox.warning(self, "Error", f"Backup failed: {message}")
+
+    # ------------------------------------------------------------------------------------------
+
+    def _recurrence_failed(self, message: str) -> None:
+        """
+        Displays the reason the recurring tasks of a database could not be added
+        """
+        QMessageBox.warning(self, "Error", f"Recurring tasks failed: {message}")
+
+    # ------------------------------------------------------------------------------------------
+
+    def _read_only_databases(self) -> list[str]:
+        """
+        Returns the name and path length of each database open read-only
+        """
+        databases = []
+        for index in range(self.tabs.count()):
+            tab = self.tabs.widget(index)
+            if isinstance(tab, Tab) and tab.db.read_only:
+                databases.append(tab.db.db_name)
+        return databases
+
+    # ------------------------------------------------------------------------------------------
+
+    def _database_tab(self, file_name: str) -> Tab:
+        """
+        Returns the tab that displays a database, or None if it is not open
+        """
+        for index in range(self.tabs.count()):
+            tab = self.tabs.widget(index)
+            if isinstance(tab, Tab) and tab.db.db_name == file_name:
+                return tab
+        return None
+
+    # ------------------------------------------------------------------------------------------
+
+    def _database_loaded(self, file_name: str, snapshot: dict) -> None:
+        """
+        Opens the tab's own connection and displays the tasks read by a worker
+        """
+        if self.loading_workers.pop(file_name, None) is None:
+            return  # The tab was closed while the database was loading
+        tab = self._database_tab(file_name)
+        if tab is None:
+            return
+        success, message = tab.db.open_db()
+        if not success:
+            self._database_failed(file_name, message)
+            return
+        tab.finish_loading(snapshot)
+        print(f"Database '{file_name}' opened successfully.")
+
+    # ------------------------------------------------------------------------------------------
+
+    def _database_failed(self, file_name: str, message: str) -> None:
+        """
+        Reports a database that could not be loaded and closes its tab
+        """
+        self.loading_workers.pop(file_name, None)
+        tab = self._database_tab(file_name)
+        if tab is not None:
+            self.close_tab(self.tabs.indexOf(tab))
+        msg = QMessageBox()
+        msg.setIcon(QMessageBox.Icon.Critical)
+        msg.setText(message)
+        msg.setWindowTitle("Error")
+        msg.exec()
+
 
 # ==========================================================================================
 # ==========================================================================================
@@ -328,7 +735,7 @@ def main(day_sheet: str, night_sheet: str) -> None:
     """
     app = QApplication(sys.argv)
     view = ToDoListController(day_sheet, night_sheet)
-    view.set_day_theme()
+    view.restore_session()
     view.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,480 @@
+# Import necessary packages here
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from functools import partial
+
+from PyQt6.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
+
+from todo_six.database import JOURNAL_LIMIT, SQLiteManager, ToDoDatabase
+from todo_six.workers import DatabaseWorker
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    maintenance.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the functions and classes that keep long-lived todo_six
+#          databases compact, with current planner statistics and a verified structure
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+# PRAGMA auto_vacuum value of a database that releases free pages on request
+INCREMENTAL = 2
+# Fraction of free pages above which a database without incremental vacuum is
+# rebuilt by a full VACUUM, which also converts it to incremental vacuum
+FULL_VACUUM_RATIO = 0.25
+# Rows sampled per index by ANALYZE, which bounds its cost on very large tables
+ANALYSIS_LIMIT = 1000
+
+
+def measure_fragmentation(database: SQLiteManager) -> tuple[bool, dict, str]:
+    """
+    Function to measure the size of a database and the pages left free by deleted
+    rows
+
+    :param database: An open SQLiteManager or ToDoDatabase object
+    :return: A tuple containing a boolean, a dictionary and a string.  The
+             dictionary contains the keys ``page_size``, ``page_count``,
+             ``freelist_count``, ``auto_vacuum``, ``free_ratio`` and ``file_bytes``,
+             the size of the database file and its -wal file
+    """
+    stats = {}
+    for pragma in ["page_size", "page_count", "freelist_count", "auto_vacuum"]:
+        success, result, message = database.db_query(f"PRAGMA {pragma};")
+        if not success or not result.next():
+            return False, {}, f"Failed to read PRAGMA {pragma}: {message}"
+        stats[pragma] = int(result.value(0))
+    stats["free_ratio"] = stats["freelist_count"] / max(stats["page_count"], 1)
+    stats["file_bytes"] = _file_bytes(database.db_name)
+    return True, stats, f"{database.db_name} fragmentation measured"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def run_maintenance(
+    database: SQLiteManager,
+    vacuum_pages: int = None,
+    full_vacuum_ratio: float = FULL_VACUUM_RATIO,
+    analyze: bool = True,
+    check: bool = True,
+    journal_limit: int = JOURNAL_LIMIT,
+) -> tuple[bool, dict, str]:
+    """
+    Function to vacuum, analyze and check a database.  The undo journal of a
+    ToDoDatabase is first cut to its latest operations.  Free pages are returned to
+    the file system with ``PRAGMA incremental_vacuum`` when the database uses
+    incremental vacuum, which is the case for every database created by
+    ToDoDatabase.create_tasks_table.  Older databases are rebuilt by a full
+    ``VACUUM`` once their free pages exceed ``full_vacuum_ratio`` of the file,
+    which converts them to incremental vacuum.  Planner statistics are refreshed
+    with a sampled ``ANALYZE`` followed by ``PRAGMA optimize``, and the structure
+    of the file is verified with ``PRAGMA quick_check``.
+
+    :param database: An open SQLiteManager or ToDoDatabase object
+    :param vacuum_pages: The most pages released by an incremental vacuum, every
+                         free page if None
+    :param full_vacuum_ratio: The free page ratio that triggers a full VACUUM, a
+                              full VACUUM is never run if None
+    :param analyze: True to refresh the planner statistics
+    :param check: True to run ``PRAGMA quick_check``
+    :param journal_limit: The number of operations kept in the undo journal of a
+                          ToDoDatabase, the journal is not pruned if None
+    :return: A tuple containing a boolean, a dictionary and a string.  The
+             dictionary contains the measurements of :func:`measure_fragmentation`
+             under the keys ``before`` and ``after``, the seconds spent on each step
+             under ``timings`` and the result of the integrity check under
+             ``integrity``.  A failed integrity check returns False
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.database import ToDoDatabase
+        from todo_six.maintenance import format_report, run_maintenance
+
+        db = ToDoDatabase("chores.db")
+        db.open_db()
+        success, report, message = run_maintenance(db)
+        print(format_report(report))
+        db.close_db()
+
+        >> chores.db: 3.1 MB -> 1.2 MB, 478 -> 0 free pages, vacuum 0.012 s, ...
+    """
+    start = time.perf_counter()
+    success, before, message = measure_fragmentation(database)
+    if not success:
+        return False, {}, message
+    report = {"db_name": database.db_name, "before": before, "timings": {}}
+
+    steps = []
+    if journal_limit is not None and isinstance(database, ToDoDatabase):
+        steps.append(("prune_journal", partial(_prune_journal, database, journal_limit)))
+    steps.append(
+        ("vacuum", partial(_vacuum, database, before, vacuum_pages, full_vacuum_ratio))
+    )
+    if analyze:
+        steps.append(("analyze", partial(_analyze, database)))
+    if check:
+        steps.append(("quick_check", partial(_quick_check, database, report)))
+    for name, step in steps:
+        step_start = time.perf_counter()
+        success, message = step()
+        report["timings"][name] = time.perf_counter() - step_start
+        if not success:
+            return False, report, message
+
+    success, after, message = measure_fragmentation(database)
+    if not success:
+        return False, report, message
+    report["after"] = after
+    report["timings"]["total"] = time.perf_counter() - start
+    return True, report, f"{database.db_name} maintenance complete"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def format_report(report: dict) -> str:
+    """
+    Function to describe a maintenance report in one line
+
+    :param report: The dictionary returned by :func:`run_maintenance`
+    :return: The size, free pages and step timings before and after maintenance
+    """
+    before = report["before"]
+    after = report.get("after", before)
+    parts = [
+        f"{report['db_name']}: {before['file_bytes'] / 1e6:.1f} MB -> "
+        f"{after['file_bytes'] / 1e6:.1f} MB",
+        f"{before['freelist_count']} -> {after['freelist_count']} free pages",
+    ]
+    parts.extend(f"{name} {seconds:.3f} s" for name, seconds in report["timings"].items())
+    if "integrity" in report:
+        parts.append(f"integrity {report['integrity']}")
+    return ", ".join(parts)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class MaintenanceScheduler(QObject):
+    """
+    Class that runs :func:`run_maintenance` on a database once it has been idle.
+    Each call to :meth:`touch` marks the database as in use and restarts the idle
+    timer, so maintenance runs once after each period of activity.  The maintenance
+    runs on its own connection in a QThreadPool, so it never blocks the user
+    interface.  The report is emitted through ``finished`` and failures are also
+    written to stderr.
+
+    :param db_name: The name and path length to the SQLite database
+    :param idle_interval: The milliseconds without activity before maintenance runs
+    :param thread_pool: The QThreadPool used to run the maintenance, the global
+                        thread pool is used if None
+    :param parent: The parent QObject
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.maintenance import MaintenanceScheduler
+
+        scheduler = MaintenanceScheduler("chores.db", idle_interval=60000)
+        scheduler.finished.connect(lambda report: print(report["after"]))
+        scheduler.start()
+        scheduler.touch()  # Called after every change made to the database
+    """
+
+    finished = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        db_name: str,
+        idle_interval: int = 300000,
+        thread_pool: QThreadPool = None,
+        parent: QObject = None,
+    ):
+        super().__init__(parent)
+        self.db_name = db_name
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._worker = None
+        self._started = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(idle_interval)
+        self._timer.timeout.connect(self.run_now)
+
+    # ------------------------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """
+        Method to begin waiting for the database to become idle
+        """
+        self._started = True
+        self._timer.start()
+
+    # ------------------------------------------------------------------------------------------
+
+    def touch(self) -> None:
+        """
+        Method to record activity on the database, which postpones the maintenance
+        """
+        if self._started:
+            self._timer.start()
+
+    # ------------------------------------------------------------------------------------------
+
+    def stop(self) -> None:
+        """
+        Method to stop the idle timer and cancel maintenance that has not started
+        """
+        self._started = False
+        self._timer.stop()
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    # ------------------------------------------------------------------------------------------
+
+    def finish(self) -> None:
+        """
+        Method to stop the idle timer and start the light maintenance of a database
+        whose tab is closing, see :meth:`run_now`.  A maintenance that is already
+        outstanding is left to finish instead.  The maintenance runs on a pool
+        thread, so closing the tab does not wait for it.
+        """
+        self._started = False
+        self._timer.stop()
+        if self._worker is None:
+            self.run_now(light=True)
+
+    # ------------------------------------------------------------------------------------------
+
+    def is_running(self) -> bool:
+        """
+        Method to determine if maintenance has been started and not yet reported
+
+        :return: True if a maintenance worker is outstanding, False otherwise
+        """
+        return self._worker is not None
+
+    # ------------------------------------------------------------------------------------------
+
+    def run_now(self, light: bool = False) -> None:
+        """
+        Method to start the maintenance immediately on a pool thread
+
+        :param light: If True only the free pages are released and the planner
+                      statistics refreshed, the full VACUUM and the integrity check
+                      are skipped
+        """
+        self._timer.stop()
+        if self._worker is not None:
+            return
+        job = run_maintenance
+        if light:
+            job = partial(run_maintenance, full_vacuum_ratio=None, check=False)
+        self._worker = DatabaseWorker(self.db_name, self.db_name, job)
+        self._worker.signals.result.connect(self._report)
+        self._worker.signals.error.connect(self._report_error)
+        self.thread_pool.start(self._worker)
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _report(self, key: str, report: dict) -> None:
+        """
+        Method to publish the report of a finished maintenance
+        """
+        if self._worker is None or self._worker.signals is not self.sender():
+            return
+        self._worker = None
+        self.finished.emit(report)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _report_error(self, key: str, message: str) -> None:
+        """
+        Method to publish a maintenance that failed
+        """
+        if self._worker is None or self._worker.signals is not self.sender():
+            return
+        self._worker = None
+        sys.stderr.write(f"Maintenance of {key} failed: {message}\n")
+        self.failed.emit(message)
+
+
+# ==========================================================================================
+# ==========================================================================================
+# PRIVATE-LIKE FUNCTIONS
+
+
+def _file_bytes(db_name: str) -> int:
+    """
+    Returns the size of a database file and its -wal file, zero for an in-memory
+    database
+    """
+    if not db_name or db_name == ":memory:":
+        return 0
+    total = 0
+    for path in [db_name, f"{db_name}-wal"]:
+        if os.path.exists(path):
+            total += os.path.getsize(path)
+    return total
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _read_rows(database: SQLiteManager, statement: str) -> tuple[bool, list, str]:
+    """
+    Executes a statement and returns the first column of every row it produces
+    """
+    success, result, message = database.db_query(statement)
+    if not success:
+        return False, [], message
+    rows = []
+    while result.next():
+        rows.append(result.value(0))
+    return True, rows, message
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _vacuum(
+    database: SQLiteManager, before: dict, pages: int, full_vacuum_ratio: float
+) -> tuple[bool, str]:
+    """
+    Releases free pages with an incremental vacuum, or a full VACUUM when the
+    database does not use incremental vacuum and is fragmented enough to need it
+    """
+    if before["freelist_count"] == 0:
+        return True, "No free pages"
+    if before["auto_vacuum"] == INCREMENTAL:
+        return _incremental_vacuum(database.db_name, pages or 0)
+    if full_vacuum_ratio is None or before["free_ratio"] < full_vacuum_ratio:
+        return True, "Fragmentation below the full vacuum threshold"
+    for statement in [f"PRAGMA auto_vacuum = {INCREMENTAL};", "VACUUM;"]:
+        success, _, message = database.db_query(statement)
+        if not success:
+            return False, message
+    return True, "Database rebuilt by VACUUM"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _incremental_vacuum(db_name: str, pages: int) -> tuple[bool, str]:
+    """
+    Releases free pages with PRAGMA incremental_vacuum.  Each step of the pragma
+    releases one page and both drivers only take the first step of a statement that
+    returns no columns, so the pragma is run as a script on a short-lived sqlite3
+    connection, which steps it to completion.
+    """
+    try:
+        with closing(sqlite3.connect(db_name, isolation_level=None)) as connection:
+            connection.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+    except sqlite3.Error as error:
+        return False, f"Failed to vacuum {db_name}: {error}"
+    return True, "Free pages released"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _prune_journal(database: ToDoDatabase, keep: int) -> tuple[bool, str]:
+    """
+    Removes all but the latest operations from the undo journal, before the vacuum
+    releases the pages they used
+    """
+    success, message, _ = database.prune_journal(keep)
+    return success, message
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _analyze(database: SQLiteManager) -> tuple[bool, str]:
+    """
+    Refreshes the planner statistics with a sampled ANALYZE and PRAGMA optimize
+    """
+    statements = [
+        f"PRAGMA analysis_limit = {ANALYSIS_LIMIT};",
+        "ANALYZE;",
+        "PRAGMA optimize;",
+    ]
+    for statement in statements:
+        success, _, message = _read_rows(database, statement)
+        if not success:
+            return False, message
+    return True, "Statistics refreshed"
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _quick_check(database: SQLiteManager, report: dict) -> tuple[bool, str]:
+    """
+    Verifies the structure of the database and records the result in the report
+    """
+    success, rows, message = _read_rows(database, "PRAGMA quick_check;")
+    if not success:
+        return False, message
+    report["integrity"] = "; ".join(str(row) for row in rows)
+    if rows != ["ok"]:
+        return (
+            False,
+            f"{database.db_name} failed the integrity check: {report['integrity']}",
+        )
+    return True, "Integrity check passed"
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Runs maintenance on each database named on the command line and prints its
+    report, with ``python -m todo_six.maintenance chores.db``
+
+    :param argv: The command line arguments, sys.argv is used if None
+    """
+    parser = argparse.ArgumentParser(description="Maintain todo_six databases")
+    parser.add_argument("databases", nargs="+", help="Paths of the databases")
+    parser.add_argument("--no-check", action="store_true", help="Skip quick_check")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for db_name in args.databases:
+        database = ToDoDatabase(db_name, backend="sqlite3")
+        success, message = database.open_db()
+        if success:
+            success, report, message = run_maintenance(database, check=not args.no_check)
+            database.remove_db()
+        if success:
+            sys.stdout.write(f"{format_report(report)}\n")
+        else:
+            sys.stderr.write(f"{message}\n")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -1,5 +1,5 @@
 # Import necessary packages here
-from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QAction, QKeySequence
 from PyQt6.QtWidgets import QMenu, QMenuBar
 
 # ==========================================================================================
@@ -21,12 +21,26 @@ class FileMenu:
     of the menu bar
 
     :param controller: A ToDoListController object
+    :param open_db_func: The function that opens a database, called with
+                         ``read_only=True`` by the Open Read-Only attribute
+    :param backup_func: The function that backs up the database of the current tab
+    :param rolling_backup_func: The function that turns scheduled rolling backups
+                                on or off, called with a boolean
     """
 
-    def __init__(self, create_db_func, open_db_func, close_db_func):
+    def __init__(
+        self,
+        create_db_func,
+        open_db_func,
+        close_db_func,
+        backup_func,
+        rolling_backup_func,
+    ):
         self.create_db_func = create_db_func
         self.open_db_func = open_db_func
         self.close_db_func = close_db_func
+        self.backup_func = backup_func
+        self.rolling_backup_func = rolling_backup_func
         self.menu = QMenu("File")
         self._create_actions()
         self._add_actions()
@@ -42,6 +56,15 @@ class FileMenu:
 
     # ------------------------------------------------------------------------------------------
 
+    def open_db_read_only(self):
+        """
+        Method that encodes the functionality of the Open Read-Only attribute
+        """
+        self.open_db_func(read_only=True)
+        print("Opened Database read-only")
+
+    # ------------------------------------------------------------------------------------------
+
     def new_db(self):
         """
         Method that encodes the functionality of the New attribute
@@ -58,6 +81,22 @@ class FileMenu:
         self.close_db_func()
         print("Closed databases")
 
+    # ------------------------------------------------------------------------------------------
+
+    def backup_db(self):
+        """
+        Method that encodes the functionality of the Backup attribute
+        """
+        self.backup_func()
+
+    # ------------------------------------------------------------------------------------------
+
+    def rolling_backup(self, checked: bool):
+        """
+        Method that encodes the functionality of the Rolling Backups attribute
+        """
+        self.rolling_backup_func(checked)
+
     # ==========================================================================================
     # PRIVATE LIKE METHODS
 
@@ -66,13 +105,20 @@ class FileMenu:
         Creates and connects slots for attributes of the File menu bar item
         """
         self.open_action = QAction("Open")
+        self.open_read_only_action = QAction("Open Read-Only...")
         self.new_action = QAction("New")
         self.close_action = QAction("Close")
+        self.backup_action = QAction("Backup...")
+        self.rolling_backup_action = QAction("Rolling Backups")
+        self.rolling_backup_action.setCheckable(True)
 
         # Connect actions to slots
         self.open_action.triggered.connect(self.open_db)
+        self.open_read_only_action.triggered.connect(self.open_db_read_only)
         self.new_action.triggered.connect(self.new_db)
         self.close_action.triggered.connect(self.close_db)
+        self.backup_action.triggered.connect(self.backup_db)
+        self.rolling_backup_action.triggered.connect(self.rolling_backup)
 
     # ------------------------------------------------------------------------------------------
 
@@ -81,8 +127,166 @@ class FileMenu:
         Adds slots for the File menu bar item
         """
         self.menu.addAction(self.open_action)
+        self.menu.addAction(self.open_read_only_action)
         self.menu.addAction(self.new_action)
         self.menu.addAction(self.close_action)
+        self.menu.addSeparator()
+        self.menu.addAction(self.backup_action)
+        self.menu.addAction(self.rolling_backup_action)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class EditMenu:
+    """
+    Class that builds all functionality necessary to impliment the Edit attributes
+    of the menu bar
+
+    :param undo_func: The function that undoes the latest task change of the
+                      current tab
+    :param redo_func: The function that redoes the latest task change undone in the
+                      current tab
+    """
+
+    def __init__(self, undo_func, redo_func):
+        self.undo_func = undo_func
+        self.redo_func = redo_func
+        self.menu = QMenu("Edit")
+        self._create_actions()
+        self._add_actions()
+
+    # ------------------------------------------------------------------------------------------
+
+    def undo(self):
+        """
+        Method that encodes the functionality of the Undo attribute
+        """
+        self.undo_func()
+
+    # ------------------------------------------------------------------------------------------
+
+    def redo(self):
+        """
+        Method that encodes the functionality of the Redo attribute
+        """
+        self.redo_func()
+
+    # ==========================================================================================
+    # PRIVATE LIKE METHODS
+
+    def _create_actions(self):
+        """
+        Creates and connects slots for attributes of the Edit menu bar item
+        """
+        self.undo_action = QAction("Undo")
+        self.undo_action.setShortcut(QKeySequence.StandardKey.Undo)
+        self.undo_action.triggered.connect(self.undo)
+        self.redo_action = QAction("Redo")
+        self.redo_action.setShortcut(QKeySequence.StandardKey.Redo)
+        self.redo_action.triggered.connect(self.redo)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _add_actions(self):
+        """
+        Adds slots for the Edit menu bar item
+        """
+        self.menu.addAction(self.undo_action)
+        self.menu.addAction(self.redo_action)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class ViewMenu:
+    """
+    Class that builds all functionality necessary to impliment the View attributes
+    of the menu bar
+
+    :param all_db_func: The function that displays the tasks of every open database
+    """
+
+    def __init__(self, all_db_func):
+        self.all_db_func = all_db_func
+        self.menu = QMenu("View")
+        self._create_actions()
+        self._add_actions()
+
+    # ------------------------------------------------------------------------------------------
+
+    def all_databases(self):
+        """
+        Method that encodes the functionality of the All Databases attribute
+        """
+        self.all_db_func()
+
+    # ==========================================================================================
+    # PRIVATE LIKE METHODS
+
+    def _create_actions(self):
+        """
+        Creates and connects slots for attributes of the View menu bar item
+        """
+        self.all_databases_action = QAction("All Databases")
+        self.all_databases_action.triggered.connect(self.all_databases)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _add_actions(self):
+        """
+        Adds slots for the View menu bar item
+        """
+        self.menu.addAction(self.all_databases_action)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class OptionsMenu:
+    """
+    Class that builds all functionality necessary to impliment the Options
+    attributes of the menu bar
+
+    :param write_behind_func: The function that turns write-behind task entry on
+                              or off, called with a boolean
+    """
+
+    def __init__(self, write_behind_func):
+        self.write_behind_func = write_behind_func
+        self.menu = QMenu("Options")
+        self._create_actions()
+        self._add_actions()
+
+    # ------------------------------------------------------------------------------------------
+
+    def write_behind(self, checked: bool):
+        """
+        Method that encodes the functionality of the Write-Behind Task Entry attribute
+        """
+        self.write_behind_func(checked)
+
+    # ==========================================================================================
+    # PRIVATE LIKE METHODS
+
+    def _create_actions(self):
+        """
+        Creates and connects slots for attributes of the Options menu bar item
+        """
+        self.write_behind_action = QAction("Write-Behind Task Entry")
+        self.write_behind_action.setCheckable(True)
+        self.write_behind_action.triggered.connect(self.write_behind)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _add_actions(self):
+        """
+        Adds slots for the Options menu bar item
+        """
+        self.menu.addAction(self.write_behind_action)
 
 
 # ==========================================================================================
@@ -97,12 +301,35 @@ class MenuBar(QMenuBar):
     :param controller: A ToDoListController object
     """
 
-    def __init__(self, create_db_func, open_db_func, close_db_func):
+    def __init__(
+        self,
+        create_db_func,
+        open_db_func,
+        close_db_func,
+        all_db_func,
+        write_behind_func,
+        backup_func,
+        rolling_backup_func,
+        undo_func,
+        redo_func,
+    ):
         super().__init__()
 
-        self.file_menu = FileMenu(create_db_func, open_db_func, close_db_func)
+        self.file_menu = FileMenu(
+            create_db_func,
+            open_db_func,
+            close_db_func,
+            backup_func,
+            rolling_backup_func,
+        )
+        self.edit_menu = EditMenu(undo_func, redo_func)
+        self.view_menu = ViewMenu(all_db_func)
+        self.options_menu = OptionsMenu(write_behind_func)
 
         self.addMenu(self.file_menu.menu)
+        self.addMenu(self.edit_menu.menu)
+        self.addMenu(self.view_menu.menu)
+        self.addMenu(self.options_menu.menu)
 
 
 # ==========================================================================================
@@ -0,0 +1,195 @@
+# Import necessary packages here
+import os
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from todo_six.database import SQLiteManager
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    monitor.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the class that detects changes made to a database by
+#          other connections, so the todo_six tabs only reload when data has changed
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+class ChangeMonitor(QObject):
+    """
+    Class that emits ``changed`` when another connection commits to a database.
+
+    SQLite increments ``PRAGMA data_version`` on a connection each time a different
+    connection commits, while commits made through the monitored connection leave it
+    unchanged, so the application is only notified of changes it did not make
+    itself.  To keep the cost near zero while the database is idle, the pragma is
+    only executed after the size or modification time of the database file or its
+    ``-wal`` file has changed.  Those files are checked every ``interval`` ms and
+    immediately when a QFileSystemWatcher reports a change.
+
+    :param db: An open SQLiteManager or ToDoDatabase object
+    :param interval: The polling interval in milliseconds
+    :param parent: The parent QObject, the monitor is stopped with its parent
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.monitor import ChangeMonitor
+
+        monitor = ChangeMonitor(db, interval=500)
+        monitor.changed.connect(lambda: print("Another program changed the tasks"))
+        monitor.start()
+    """
+
+    changed = pyqtSignal()
+
+    def __init__(self, db: SQLiteManager, interval: int = 1000, parent: QObject = None):
+        super().__init__(parent)
+        self.db = db
+        self._paths = self._watched_paths(db.db_name)
+        self._signature = None
+        self._data_version = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.check)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self.check)
+
+    # ------------------------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """
+        Method to record the current state of the database and begin monitoring it
+        """
+        self._signature = self._file_signature()
+        self._data_version = self._read_data_version()
+        self._watch_files()
+        self._timer.start()
+
+    # ------------------------------------------------------------------------------------------
+
+    def stop(self) -> None:
+        """
+        Method to stop monitoring the database.  This must be called before the
+        database connection is removed.
+        """
+        self._timer.stop()
+        watched = self._watcher.files()
+        if watched:
+            self._watcher.removePaths(watched)
+
+    # ------------------------------------------------------------------------------------------
+
+    def acknowledge(self) -> None:
+        """
+        Method to accept the current state of the database without emitting
+        ``changed``.  It is called after the application commits through a
+        connection of its own other than the monitored one.
+        """
+        if not self.db.con.isOpen():
+            return
+        self._signature = self._file_signature()
+        self._data_version = self._read_data_version()
+        self._watch_files()
+
+    # ------------------------------------------------------------------------------------------
+
+    def is_active(self) -> bool:
+        """
+        Method to determine if the database is being monitored
+
+        :return: True if the monitor is running, False otherwise
+        """
+        return self._timer.isActive()
+
+    # ------------------------------------------------------------------------------------------
+
+    def check(self) -> bool:
+        """
+        Method to determine if another connection has changed the database since the
+        last check, emitting ``changed`` if it has.  The method is called by the
+        timer and the file watcher, and can be called directly to check immediately.
+
+        :return: True if the database changed, False otherwise
+        """
+        if not self.db.con.isOpen():
+            self.stop()
+            return False
+        signature = self._file_signature()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        self._watch_files()
+
+        data_version = self._read_data_version()
+        if data_version is None or data_version == self._data_version:
+            return False
+        self._data_version = data_version
+        self.changed.emit()
+        return True
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    @staticmethod
+    def _watched_paths(db_name: str) -> tuple[str, ...]:
+        """
+        Returns the files that change when a connection commits, or an empty tuple
+        for an in-memory database
+        """
+        if not db_name or db_name == ":memory:":
+            return ()
+        path = os.path.abspath(db_name)
+        return path, f"{path}-wal"
+
+    # ------------------------------------------------------------------------------------------
+
+    def _file_signature(self) -> tuple:
+        """
+        Returns the size and modification time of each watched file.  A file that
+        does not exist is represented by None.
+        """
+        signature = []
+        for path in self._paths:
+            try:
+                status = os.stat(path)
+            except OSError:
+                signature.append(None)
+                continue
+            signature.append((status.st_size, status.st_mtime_ns))
+        return tuple(signature)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _read_data_version(self) -> int:
+        """
+        Returns the data version of the monitored connection, or None if it could
+        not be read
+        """
+        query = self.db.backend.query(self.db.con)
+        if not query.exec("PRAGMA data_version;") or not query.next():
+            return None
+        return int(query.value(0))
+
+    # ------------------------------------------------------------------------------------------
+
+    def _watch_files(self) -> None:
+        """
+        Adds the watched files that exist to the file watcher.  The -wal file is
+        created and removed by SQLite, so it is added again whenever it reappears.
+        """
+        watched = set(self._watcher.files())
+        missing = [
+            path for path in self._paths if path not in watched and os.path.exists(path)
+        ]
+        if missing:
+            self._watcher.addPaths(missing)
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
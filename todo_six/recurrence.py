@@ -0,0 +1,75 @@
+# Import necessary packages here
+import calendar
+from datetime import date
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    recurrence.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the date arithmetic of recurring task rules, which is
+#          used by ToDoDatabase to materialize the occurrences that are due
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+# Months in one step of each frequency, DAY and WEEK are counted in days instead
+FREQUENCIES = {"DAY": 0, "WEEK": 0, "MONTH": 1, "YEAR": 12}
+_DAYS = {"DAY": 1, "WEEK": 7}
+
+
+def occurrence(anchor: date, frequency: str, interval: int, index: int) -> date:
+    """
+    Returns an occurrence of a rule counted from its first occurrence.  Monthly and
+    yearly occurrences keep the day of the month of the anchor, moved back to the
+    last day of shorter months, so a rule anchored on the 31st never drifts.
+
+    :param anchor: The date of the first occurrence
+    :param frequency: 'DAY', 'WEEK', 'MONTH' or 'YEAR'
+    :param interval: The number of frequency units between occurrences
+    :param index: The number of the occurrence, 0 for the anchor
+    :return: The date of the occurrence
+    """
+    if frequency in _DAYS:
+        return date.fromordinal(anchor.toordinal() + index * interval * _DAYS[frequency])
+    months = anchor.month - 1 + index * interval * FREQUENCIES[frequency]
+    year = anchor.year + months // 12
+    month = months % 12 + 1
+    day = min(anchor.day, calendar.monthrange(year, month)[1])
+    return date(year, month, day)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def due_occurrences(
+    anchor: date, frequency: str, interval: int, today: date
+) -> tuple[date, date]:
+    """
+    Returns the last occurrence of a rule on or before a date and the occurrence
+    after it, computed directly rather than by stepping through every occurrence
+
+    :param anchor: The date of the first occurrence, on or before today
+    :param frequency: 'DAY', 'WEEK', 'MONTH' or 'YEAR'
+    :param interval: The number of frequency units between occurrences
+    :param today: The date occurrences are due by
+    :return: A tuple containing the last due occurrence and the next occurrence
+    """
+    if frequency in _DAYS:
+        index = (today.toordinal() - anchor.toordinal()) // (interval * _DAYS[frequency])
+    else:
+        months = (today.year - anchor.year) * 12 + today.month - anchor.month
+        index = months // (interval * FREQUENCIES[frequency])
+        if occurrence(anchor, frequency, interval, index) > today:
+            index -= 1
+    index = max(index, 0)
+    return (
+        occurrence(anchor, frequency, interval, index),
+        occurrence(anchor, frequency, interval, index + 1),
+    )
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
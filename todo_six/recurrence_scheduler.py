@@ -0,0 +1,111 @@
+# Import necessary packages here
+from datetime import datetime, time, timedelta
+
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+
+from todo_six.database import ToDoDatabase
+from todo_six.workers import DatabaseScheduler
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    recurrence_scheduler.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the job and class that add the tasks of recurrence rules
+#          to open databases when a new day begins
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+def materialize_due_tasks(database: ToDoDatabase) -> tuple[bool, int, str]:
+    """
+    Adds the tasks of every due recurrence rule with
+    :meth:`ToDoDatabase.materialize_recurrences`.  The function can be run as a
+    DatabaseWorker job.
+
+    :param database: An open ToDoDatabase object
+    :return: A tuple containing a boolean, the number of tasks added and a string
+             describing the result
+    """
+    success, message, count = database.materialize_recurrences()
+    return success, count, message
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class RecurrenceScheduler(DatabaseScheduler):
+    """
+    Class that adds the tasks of due recurrence rules to each registered database
+    shortly after midnight.  Each database is handled on its own connection in a
+    QThreadPool, and only reads the rules that are due, so many databases with
+    thousands of rules each are handled without blocking the user interface.  The
+    tabs of the databases pick up the new tasks through their ChangeMonitor.
+
+    :param thread_pool: The QThreadPool used to run the jobs, the global thread pool
+                        is used if None
+    :param parent: The parent QObject
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.recurrence_scheduler import RecurrenceScheduler
+
+        scheduler = RecurrenceScheduler()
+        scheduler.materialized.connect(lambda name, count: print(name, count))
+        scheduler.add_database("chores.db")
+        scheduler.start()
+    """
+
+    materialized = pyqtSignal(str, int)
+    _label = "Recurring tasks"
+
+    def __init__(self, thread_pool: QThreadPool = None, parent: QObject = None):
+        super().__init__(thread_pool, parent)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._new_day)
+
+    # ------------------------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """
+        Method to schedule a run shortly after the next midnight
+        """
+        tomorrow = datetime.combine(datetime.now().date() + timedelta(days=1), time())
+        delay = tomorrow + timedelta(seconds=1) - datetime.now()
+        self._timer.start(int(delay.total_seconds() * 1000))
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _new_day(self) -> None:
+        """
+        Method to run the jobs and schedule the run of the following day
+        """
+        self.run_now()
+        self.start()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _job(self):
+        """
+        Method to return the job run against each database
+        """
+        return materialize_due_tasks
+
+    # ------------------------------------------------------------------------------------------
+
+    def _publish(self, key: str, count: int) -> None:
+        """
+        Method to publish the number of tasks added to a database
+        """
+        self.materialized.emit(key, count)
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
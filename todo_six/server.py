@@ -0,0 +1,683 @@
+# Import necessary packages here
+import argparse
+import json
+import os
+import queue
+import re
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    server.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains a local HTTP JSON server that lets scripts and dashboards
+#          read and update todo_six databases without the user interface
+# Instruction: python -m todo_six.server chores.db work.db --port 8765
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+# Methods of ToDoDatabase that modify a database, and the JSON field of each argument
+WRITE_OPERATIONS = {
+    "insert_task": ("task",),
+    "complete_task": ("task_id",),
+    "delete_task": ("task_id",),
+}
+
+
+class DatabaseService:
+    """
+    Class that serializes the writes and parallelizes the reads of one database.
+
+    Every write is placed on a queue drained by a single writer thread that owns
+    the only writing connection.  The writer takes all the writes that are waiting,
+    up to ``batch_size``, and executes them in one transaction, so the cost of a
+    commit is shared by every request that arrived while the previous commit was
+    running.  Reads run on a pool of ``readers`` threads, each with its own
+    connection.  The sqlite3 backend is used by default, so the service does not
+    load Qt.
+
+    :param db_name: The name and path length to the SQLite database
+    :param readers: The number of reader threads and connections
+    :param batch_size: The largest number of writes committed in one transaction
+    :param backend: 'sqlite3' or 'qt', the storage backend of each connection
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.server import DatabaseService
+
+        service = DatabaseService("chores.db")
+        service.start()
+        success, message, task_id = service.write("insert_task", "Mow lawn")
+        success, df, message = service.read("select_open_tasks")
+        service.stop()
+    """
+
+    def __init__(
+        self,
+        db_name: str,
+        readers: int = 4,
+        batch_size: int = 256,
+        backend: str = "sqlite3",
+    ):
+        self.db_name = db_name
+        self.readers = readers
+        self.batch_size = batch_size
+        self.backend = backend
+        self._writes = queue.Queue()
+        self._writer = None
+        self._reader = None
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------------------------------
+
+    def start(self) -> tuple[bool, str]:
+        """
+        Method to open the database, creating the tasks table if it does not exist,
+        and start the writer and reader threads
+
+        :return: A tuple containing a boolean and a string.  A boolean of True
+                 indicates the operation was successful, and the string contains a
+                 description of the result
+        """
+        ready = Future()
+        self._writer = threading.Thread(
+            target=self._write_loop, args=(ready,), name=f"writer-{self.db_name}"
+        )
+        self._writer.start()
+        success, message = ready.result()
+        if not success:
+            self._writer.join()
+            return False, message
+        self._reader = ThreadPoolExecutor(
+            self.readers, thread_name_prefix=f"reader-{self.db_name}"
+        )
+        return True, f"{self.db_name} is being served"
+
+    # ------------------------------------------------------------------------------------------
+
+    def stop(self) -> None:
+        """
+        Method to commit the queued writes, close every connection and stop the
+        threads
+        """
+        if self._reader is not None:
+            # Each reader connection must be closed by the thread that opened it
+            barrier = threading.Barrier(self.readers)
+            jobs = [
+                self._reader.submit(self._close_reader, barrier)
+                for _ in range(self.readers)
+            ]
+            for job in jobs:
+                job.result()
+            self._reader.shutdown()
+            self._reader = None
+        if self._writer is not None:
+            self._writes.put(None)
+            self._writer.join()
+            self._writer = None
+
+    # ------------------------------------------------------------------------------------------
+
+    def read(self, method: str, *args) -> tuple:
+        """
+        Method to call a ToDoDatabase method that reads the database
+
+        :param method: The name of the ToDoDatabase method
+        :param args: The arguments of the method
+        :return: The tuple returned by the method
+        """
+        return self._reader.submit(self._call_reader, method, args).result()
+
+    # ------------------------------------------------------------------------------------------
+
+    def write(self, method: str, *args) -> tuple:
+        """
+        Method to call a ToDoDatabase method that modifies the database.  The call
+        returns once the transaction that contains the write has been committed.
+
+        :param method: A key of WRITE_OPERATIONS
+        :param args: The arguments of the method
+        :return: The tuple returned by the method
+        """
+        return self.write_many([(method, args)])[0]
+
+    # ------------------------------------------------------------------------------------------
+
+    def write_many(self, operations: list[tuple[str, tuple]]) -> list[tuple]:
+        """
+        Method to apply several writes in the same transaction
+
+        :param operations: A list of tuples, each containing a key of
+                           WRITE_OPERATIONS and the arguments of the method
+        :return: A list with the tuple returned by each method
+        """
+        for method, _ in operations:
+            if method not in WRITE_OPERATIONS:
+                raise ValueError(f"{method} is not a write operation")
+        done = Future()
+        self._writes.put((operations, done))
+        return done.result()
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _write_loop(self, ready: Future) -> None:
+        """
+        Runs on the writer thread, committing the queued writes in groups
+        """
+        database = ToDoDatabase(self.db_name, backend=self.backend)
+        success, message = database.open_db()
+        if success:
+            success, message = database.create_tasks_table()
+        ready.set_result((success, message))
+        if not success:
+            database.remove_db()
+            return
+
+        running = True
+        while running:
+            batch = [self._writes.get()]
+            while len(batch) < self.batch_size and not self._writes.empty():
+                batch.append(self._writes.get())
+            if None in batch:
+                running = False
+                batch = [item for item in batch if item is not None]
+            if batch:
+                self._commit(database, batch)
+        database.remove_db()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _commit(self, database: ToDoDatabase, batch: list) -> None:
+        """
+        Executes a group of queued writes in one transaction and delivers the result
+        of each write once the transaction is committed
+        """
+        owns_transaction = database.con.transaction()
+        results = []
+        for operations, _ in batch:
+            results.append([self._apply(database, m, args) for m, args in operations])
+        if owns_transaction and not database.con.commit():
+            database.con.rollback()
+            message = f"Failed to commit to {self.db_name}"
+            results = [
+                [_failure(method, message) for method, _ in operations]
+                for operations, _ in batch
+            ]
+        for (_, done), result in zip(batch, results):
+            done.set_result(result)
+
+    # ------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _apply(database: ToDoDatabase, method: str, args: tuple) -> tuple:
+        """
+        Applies one write, so an exception fails only that write and not the group
+        """
+        try:
+            return getattr(database, method)(*args)
+        except Exception as error:  # The writer thread must keep running
+            return _failure(method, str(error))
+
+    # ------------------------------------------------------------------------------------------
+
+    def _call_reader(self, method: str, args: tuple) -> tuple:
+        """
+        Calls a method on the connection of the current reader thread, opening the
+        connection the first time the thread is used
+        """
+        database = getattr(self._local, "database", None)
+        if database is None:
+            database = ToDoDatabase(self.db_name, backend=self.backend)
+            database.open_db()
+            self._local.database = database
+        return getattr(database, method)(*args)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _close_reader(self, barrier: threading.Barrier) -> None:
+        """
+        Closes the connection of the current reader thread
+        """
+        barrier.wait()
+        database = getattr(self._local, "database", None)
+        if database is not None:
+            database.remove_db()
+            self._local.database = None
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class TaskRequestHandler(BaseHTTPRequestHandler):
+    """
+    Class that answers the requests made to a TaskServer.  HTTP/1.1 is used and
+    every response carries a Content-Length, so clients can keep a connection open
+    for many requests.  Every response is a JSON object containing ``success`` and
+    ``message`` keys, mirroring the tuples returned by ToDoDatabase.
+
+    +--------+-------------------------------------------+----------------------------+
+    | Method | Path                                      | Operation                  |
+    +========+===========================================+============================+
+    | GET    | /databases                                | List the served databases  |
+    +--------+-------------------------------------------+----------------------------+
+    | GET    | /databases/<name>/tasks/open              | select_open_tasks          |
+    +--------+-------------------------------------------+----------------------------+
+    | GET    | /databases/<name>/tasks/closed            | select_closed_tasks, with  |
+    |        |                                           | ``time_frame`` and ``date``|
+    +--------+-------------------------------------------+----------------------------+
+    | GET    | /databases/<name>/tasks/history?date=     | get_former_open_tasks      |
+    +--------+-------------------------------------------+----------------------------+
+    | GET    | /databases/<name>/oldest_date             | get_oldest_date            |
+    +--------+-------------------------------------------+----------------------------+
+    | GET    | /databases/<name>/backlog?start=&end=     | backlog_series             |
+    +--------+-------------------------------------------+----------------------------+
+    | POST   | /databases/<name>/tasks                   | insert_task, ``{"task"}``  |
+    +--------+-------------------------------------------+----------------------------+
+    | POST   | /databases/<name>/tasks/<id>/complete     | complete_task              |
+    +--------+-------------------------------------------+----------------------------+
+    | DELETE | /databases/<name>/tasks/<id>              | delete_task                |
+    +--------+-------------------------------------------+----------------------------+
+    | POST   | /databases/<name>/batch                   | Several writes committed   |
+    |        |                                           | in one transaction         |
+    +--------+-------------------------------------------+----------------------------+
+
+    The body of a batch request contains a list of operations, such as
+    ``{"operations": [{"op": "insert_task", "task": "Mow lawn"},
+    {"op": "complete_task", "task_id": 4}]}``.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which Nagle's algorithm would delay
+    # on a keep-alive connection until the client acknowledged the headers
+    disable_nagle_algorithm = True
+
+    _ROUTES = [
+        ("GET", re.compile(r"^/databases$"), "_list_databases"),
+        ("GET", re.compile(r"^/databases/([^/]+)/tasks/open$"), "_open_tasks"),
+        ("GET", re.compile(r"^/databases/([^/]+)/tasks/closed$"), "_closed_tasks"),
+        ("GET", re.compile(r"^/databases/([^/]+)/tasks/history$"), "_history"),
+        ("GET", re.compile(r"^/databases/([^/]+)/oldest_date$"), "_oldest_date"),
+        ("GET", re.compile(r"^/databases/([^/]+)/backlog$"), "_backlog"),
+        ("POST", re.compile(r"^/databases/([^/]+)/tasks$"), "_insert_task"),
+        (
+            "POST",
+            re.compile(r"^/databases/([^/]+)/tasks/(\d+)/complete$"),
+            "_complete_task",
+        ),
+        ("DELETE", re.compile(r"^/databases/([^/]+)/tasks/(\d+)$"), "_delete_task"),
+        ("POST", re.compile(r"^/databases/([^/]+)/batch$"), "_batch"),
+    ]
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    # ------------------------------------------------------------------------------------------
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    # ------------------------------------------------------------------------------------------
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    # ------------------------------------------------------------------------------------------
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _dispatch(self, verb: str) -> None:
+        """
+        Routes a request to the method that answers it and sends the response
+        """
+        url = urlparse(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            body = self._read_body()
+        except ValueError:
+            self._send(400, {"success": False, "message": "Body is not valid JSON"})
+            return
+        for route_verb, pattern, handler in self._ROUTES:
+            match = pattern.match(url.path)
+            if match and route_verb == verb:
+                try:
+                    status, payload = getattr(self, handler)(body, *match.groups())
+                except Exception as error:  # Report failures to the client
+                    status, payload = 500, {"success": False, "message": str(error)}
+                self._send(status, payload)
+                return
+        self._send(404, {"success": False, "message": f"No route for {verb} {url.path}"})
+
+    # ------------------------------------------------------------------------------------------
+
+    def _read_body(self) -> dict:
+        """
+        Reads the JSON body of a request, an empty dictionary if there is none
+        """
+        length = int(self.headers.get("Content-Length", 0))
+        if length == 0:
+            return {}
+        return json.loads(self.rfile.read(length))
+
+    # ------------------------------------------------------------------------------------------
+
+    def _send(self, status: int, payload: dict) -> None:
+        """
+        Sends a JSON response with the length required for keep-alive connections
+        """
+        data = json.dumps(payload, default=_to_json).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _service(self, name: str) -> DatabaseService:
+        """
+        Returns the service of a database, raising KeyError if it is not served
+        """
+        return self.server.services[name]
+
+    # ------------------------------------------------------------------------------------------
+
+    def _list_databases(self, body: dict) -> tuple[int, dict]:
+        names = sorted(self.server.services)
+        return 200, {"success": True, "message": "Served databases", "databases": names}
+
+    # ------------------------------------------------------------------------------------------
+
+    def _read_tasks(self, name: str, method: str, *args) -> tuple[int, dict]:
+        if name not in self.server.services:
+            return 404, {"success": False, "message": f"No database named {name}"}
+        success, df, message = self._service(name).read(method, *args)
+        return _status(success), {
+            "success": success,
+            "message": message,
+            "tasks": df.to_dict("records") if success else [],
+        }
+
+    # ------------------------------------------------------------------------------------------
+
+    def _open_tasks(self, body: dict, name: str) -> tuple[int, dict]:
+        return self._read_tasks(name, "select_open_tasks")
+
+    # ------------------------------------------------------------------------------------------
+
+    def _closed_tasks(self, body: dict, name: str) -> tuple[int, dict]:
+        time_frame = self.query.get("time_frame", "DAY")
+        date = self.query.get("date", datetime.now().strftime("%Y-%m-%d"))
+        return self._read_tasks(name, "select_closed_tasks", time_frame, date)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _history(self, body: dict, name: str) -> tuple[int, dict]:
+        if "date" not in self.query:
+            return 400, {"success": False, "message": "The date parameter is required"}
+        return self._read_tasks(name, "get_former_open_tasks", self.query["date"])
+
+    # ------------------------------------------------------------------------------------------
+
+    def _oldest_date(self, body: dict, name: str) -> tuple[int, dict]:
+        if name not in self.server.services:
+            return 404, {"success": False, "message": f"No database named {name}"}
+        success, oldest_date, message = self._service(name).read("get_oldest_date")
+        payload = {"success": success, "message": message, "oldest_date": oldest_date}
+        return _status(success), payload
+
+    # ------------------------------------------------------------------------------------------
+
+    def _backlog(self, body: dict, name: str) -> tuple[int, dict]:
+        if name not in self.server.services:
+            return 404, {"success": False, "message": f"No database named {name}"}
+        if "start" not in self.query or "end" not in self.query:
+            message = "The start and end parameters are required"
+            return 400, {"success": False, "message": message}
+        success, backlog, durations, message = self._service(name).read(
+            "backlog_series", self.query["start"], self.query["end"]
+        )
+        payload = {"success": success, "message": message}
+        if success:
+            backlog = backlog.assign(date=backlog["date"].dt.strftime("%Y-%m-%d"))
+            payload["backlog"] = backlog.to_dict("records")
+            payload["days_to_close"] = {str(k): v for k, v in durations.items()}
+        return _status(success), payload
+
+    # ------------------------------------------------------------------------------------------
+
+    def _write(self, name: str, operations: list[tuple[str, tuple]]) -> list[tuple]:
+        return self._service(name).write_many(operations)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _insert_task(self, body: dict, name: str) -> tuple[int, dict]:
+        if name not in self.server.services:
+            return 404, {"success": False, "message": f"No database named {name}"}
+        if not isinstance(body.get("task"), str) or not body["task"]:
+            return 400, {"success": False, "message": "A task string is required"}
+        [(success, message, task_id)] = self._write(
+            name, [("insert_task", (body["task"],))]
+        )
+        payload = {"success": success, "message": message, "task_id": task_id}
+        return (201 if success else 500), payload
+
+    # ------------------------------------------------------------------------------------------
+
+    def _complete_task(self, body: dict, name: str, task_id: str) -> tuple[int, dict]:
+        if name not in self.server.services:
+            return 404, {"success": False, "message": f"No database named {name}"}
+        [(success, message)] = self._write(name, [("complete_task", (int(task_id),))])
+        return _status(success), {"success": success, "message": message}
+
+    # ------------------------------------------------------------------------------------------
+
+    def _delete_task(self, body: dict, name: str, task_id: str) -> tuple[int, dict]:
+        if name not in self.server.services:
+            return 404, {"success": False, "message": f"No database named {name}"}
+        [(success, message)] = self._write(name, [("delete_task", (int(task_id),))])
+        return _status(success), {"success": success, "message": message}
+
+    # ------------------------------------------------------------------------------------------
+
+    def _batch(self, body: dict, name: str) -> tuple[int, dict]:
+        if name not in self.server.services:
+            return 404, {"success": False, "message": f"No database named {name}"}
+        operations = []
+        for operation in body.get("operations", []):
+            method = operation.get("op")
+            if method not in WRITE_OPERATIONS:
+                return 400, {"success": False, "message": f"Unknown operation {method}"}
+            try:
+                args = tuple(operation[field] for field in WRITE_OPERATIONS[method])
+            except KeyError as error:
+                return 400, {"success": False, "message": f"Missing field {error}"}
+            operations.append((method, args))
+        results = self._write(name, operations) if operations else []
+        success = all(result[0] for result in results)
+        payload = {
+            "success": success,
+            "message": f"{len(results)} operations committed",
+            "results": [list(result) for result in results],
+        }
+        return _status(success), payload
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class TaskServer(ThreadingHTTPServer):
+    """
+    Class that serves one or more todo_six databases over a local HTTP JSON API.
+    Each database is served by its own DatabaseService and is addressed by the
+    name of its file without the extension.
+
+    :param databases: A list of database names and path lengths
+    :param host: The address the server listens on
+    :param port: The port the server listens on, 0 to choose a free port
+    :param readers: The number of reader connections per database
+    :param batch_size: The largest number of writes committed in one transaction
+    :param quiet: If True requests are not logged to stderr
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.server import TaskServer
+
+        server = TaskServer(["chores.db"], port=8765)
+        server.serve_forever()
+
+        # From another terminal
+        # curl http://127.0.0.1:8765/databases/chores/tasks/open
+        # curl -X POST -d '{"task": "Mow lawn"}' \\
+        #     http://127.0.0.1:8765/databases/chores/tasks
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        databases: list[str],
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        readers: int = 4,
+        batch_size: int = 256,
+        quiet: bool = True,
+    ):
+        self.quiet = quiet
+        self.services = {}
+        for db_name in databases:
+            name = os.path.splitext(os.path.basename(db_name))[0]
+            if name in self.services:
+                self.close_services()
+                raise ValueError(f"More than one database is named {name}")
+            service = DatabaseService(db_name, readers, batch_size)
+            success, message = service.start()
+            if not success:
+                self.close_services()
+                raise ConnectionError(message)
+            self.services[name] = service
+        super().__init__((host, port), TaskRequestHandler)
+
+    # ------------------------------------------------------------------------------------------
+
+    def close_services(self) -> None:
+        """
+        Method to commit the queued writes and close every database
+        """
+        for service in self.services.values():
+            service.stop()
+        self.services = {}
+
+    # ------------------------------------------------------------------------------------------
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.close_services()
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+def _status(success: bool) -> int:
+    """
+    Returns the HTTP status of a database operation
+    """
+    return 200 if success else 400
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _failure(method: str, message: str) -> tuple:
+    """
+    Returns the failure tuple of a write operation, which for insert_task also
+    carries a task id of 0
+    """
+    if method == "insert_task":
+        return False, message, 0
+    return False, message
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _to_json(value):
+    """
+    Converts the NumPy and pandas values found in query results to JSON types
+    """
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y-%m-%d")
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Function to serve databases from the command line
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m todo_six.server", description="Serve todo_six databases"
+    )
+    parser.add_argument("databases", nargs="+", help="Database files to serve")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    server = TaskServer(
+        args.databases,
+        args.host,
+        args.port,
+        args.readers,
+        args.batch_size,
+        quiet=not args.verbose,
+    )
+    host, port = server.server_address[:2]
+    sys.stdout.write(f"Serving {', '.join(server.services)} on http://{host}:{port}\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+if __name__ == "__main__":
+    main()
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,114 @@
+# Import necessary packages here
+from PyQt6.QtCore import QSettings
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    session.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the class that persists the todo_six session between
+#          launches of the application
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+class SessionState:
+    """
+    Class to save and restore the state of the application between launches.  The
+    state is stored with QSettings, which uses the native settings store of each
+    platform unless a settings object is provided.
+
+    :param settings: A QSettings object, the application settings are used if None
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.session import SessionState
+
+        session = SessionState()
+        chores = "/home/user/chores.db"
+        session.save([chores], chores, "Week", "night", 90)
+        print(session.load())
+
+        >> {'databases': ['/home/user/chores.db'], 'current_database': ...}
+    """
+
+    def __init__(self, settings: QSettings = None):
+        if settings is None:
+            settings = QSettings("todo_six", "todo_six")
+        self.settings = settings
+
+    # ------------------------------------------------------------------------------------------
+
+    def save(
+        self,
+        databases: list[str],
+        current_database: str,
+        time_frame: str,
+        theme: str,
+        opacity: int,
+        write_behind: bool = False,
+        backup_directory: str = "",
+        read_only_databases: list[str] = None,
+    ) -> None:
+        """
+        Method to save the state of the application
+
+        :param databases: The name and path length of each open database, in tab order
+        :param current_database: The name and path length of the database in the
+                                 active tab, or an empty string
+        :param time_frame: The time frame selected in the active tab
+        :param theme: 'day' or 'night'
+        :param opacity: The opacity of the application from 0 to 100
+        :param write_behind: True if tasks are committed by a WriteBehindQueue
+        :param backup_directory: The directory of the rolling backups, or an empty
+                                 string if they are off
+        :param read_only_databases: The databases of ``databases`` that are open
+                                    read-only
+        """
+        self.settings.beginGroup("session")
+        self.settings.setValue("databases", list(databases))
+        self.settings.setValue("current_database", current_database)
+        self.settings.setValue("time_frame", time_frame)
+        self.settings.setValue("theme", theme)
+        self.settings.setValue("opacity", int(opacity))
+        self.settings.setValue("write_behind", bool(write_behind))
+        self.settings.setValue("backup_directory", backup_directory)
+        self.settings.setValue("read_only_databases", list(read_only_databases or []))
+        self.settings.endGroup()
+        self.settings.sync()
+
+    # ------------------------------------------------------------------------------------------
+
+    def load(self) -> dict:
+        """
+        Method to load the saved state of the application
+
+        :return: A dictionary with the keys ``databases``, ``current_database``,
+                 ``time_frame``, ``theme``, ``opacity``, ``write_behind``,
+                 ``backup_directory`` and ``read_only_databases``.  Defaults are
+                 returned for values that have never been saved
+        """
+        self.settings.beginGroup("session")
+        state = {
+            "databases": self.settings.value("databases", [], type=list),
+            "current_database": self.settings.value("current_database", "", type=str),
+            "time_frame": self.settings.value("time_frame", "Day", type=str),
+            "theme": self.settings.value("theme", "day", type=str),
+            "opacity": self.settings.value("opacity", 100, type=int),
+            "write_behind": self.settings.value("write_behind", False, type=bool),
+            "backup_directory": self.settings.value("backup_directory", "", type=str),
+            "read_only_databases": self.settings.value(
+                "read_only_databases", [], type=list
+            ),
+        }
+        self.settings.endGroup()
+        return state
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
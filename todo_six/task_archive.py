@@ -0,0 +1,331 @@
+# Import necessary packages here
+import struct
+import zlib
+from collections.abc import Iterator
+from typing import BinaryIO
+
+import numpy as np
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    task_archive.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the compressed, columnar file format used to export and
+#          import the tasks of a todo_six database
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+MAGIC = b"TODO6ARC"
+# Version 2 adds the priority, due date and tags of each task
+VERSION = 2
+# Day number written for a missing date
+NULL_DATE = -(2**31)
+
+# File header: magic, format version
+_HEADER = struct.Struct("<8sH")
+# Chunk header: tag, rows, compressed length, CRC-32 of the uncompressed payload
+_CHUNK = struct.Struct("<4sIII")
+# End marker: tag, total rows
+_END = struct.Struct("<4sQ")
+_CHUNK_TAG = b"CHNK"
+_END_TAG = b"DONE"
+
+
+class ArchiveWriter:
+    """
+    Class that writes tasks to a binary file object in the todo_six archive format.
+
+    The file starts with a header holding ``MAGIC`` and ``VERSION``, followed by any
+    number of chunks and an end marker holding the total number of tasks.  Each
+    chunk stores its tasks column by column, with the task ids delta encoded, the
+    dates stored as day numbers counted from 1970-01-01, the end date stored as the
+    number of days after the start date, and the task text and the tags, joined by
+    newlines, each stored as a column of UTF-8 lengths followed by the text itself.
+    The priority and due date of each task are stored as their own columns.  The
+    columns of a chunk are
+    compressed together with zlib and protected by a CRC-32 of the uncompressed
+    bytes.  Only one chunk is held in memory at a time, so databases of any size
+    can be written.
+
+    :param file: A binary file object opened for writing
+    :param level: The zlib compression level from 0 to 9
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.task_archive import ArchiveWriter, read_archive
+
+        with open("chores.tda", "wb") as file, ArchiveWriter(file) as writer:
+            writer.write_chunk([1, 2], [19400, 19401], [19402, None], [0, 0],
+                               ["Mow lawn", "Wash car"])
+        with open("chores.tda", "rb") as file:
+            for chunk in read_archive(file):
+                print(chunk["task"])
+
+        >> ['Mow lawn', 'Wash car']
+    """
+
+    def __init__(self, file: BinaryIO, level: int = 6):
+        self.file = file
+        self.level = level
+        self.rows = 0
+        self.file.write(_HEADER.pack(MAGIC, VERSION))
+
+    # ------------------------------------------------------------------------------------------
+
+    def __enter__(self):
+        return self
+
+    # ------------------------------------------------------------------------------------------
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+
+    # ------------------------------------------------------------------------------------------
+
+    def write_chunk(
+        self,
+        task_ids,
+        start_days,
+        end_days,
+        archived,
+        tasks,
+        priorities=None,
+        due_days=None,
+        tags=None,
+    ) -> None:
+        """
+        Method to compress and write one chunk of tasks
+
+        :param task_ids: The database id of each task
+        :param start_days: The start date of each task as a day number, or None
+        :param end_days: The end date of each task as a day number, or None
+        :param archived: 1 for each task held in tasks_archive, 0 otherwise
+        :param tasks: The text of each task
+        :param priorities: The priority of each task from 0 to 3, 0 if not given
+        :param due_days: The due date of each task as a day number, or None
+        :param tags: A list of the tag names of each task
+        """
+        ids = np.asarray(task_ids, dtype=np.int64)
+        count = len(ids)
+        if count == 0:
+            return
+        starts = _to_days(start_days)
+        ends = _to_days(end_days)
+        offsets = np.where(
+            (ends == NULL_DATE) | (starts == NULL_DATE), ends, ends - starts
+        ).astype(np.int32)
+        if priorities is None:
+            priorities = [0] * count
+        if due_days is None:
+            due_days = [None] * count
+        if tags is None:
+            tags = [[]] * count
+        encoded = [task.encode("utf-8") for task in tasks]
+        encoded_tags = ["\n".join(names).encode("utf-8") for names in tags]
+        payload = b"".join(
+            [
+                np.diff(ids, prepend=0).tobytes(),
+                starts.tobytes(),
+                offsets.tobytes(),
+                np.asarray(archived, dtype=np.uint8).tobytes(),
+                np.asarray(priorities, dtype=np.uint8).tobytes(),
+                _to_days(due_days).tobytes(),
+                _lengths(encoded).tobytes(),
+                _lengths(encoded_tags).tobytes(),
+            ]
+            + encoded
+            + encoded_tags
+        )
+        compressed = zlib.compress(payload, self.level)
+        header = _CHUNK.pack(_CHUNK_TAG, len(ids), len(compressed), zlib.crc32(payload))
+        self.file.write(header)
+        self.file.write(compressed)
+        self.rows += len(ids)
+
+    # ------------------------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        Method to write the end marker.  The file object is left open.
+        """
+        self.file.write(_END.pack(_END_TAG, self.rows))
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+def read_archive(file: BinaryIO) -> Iterator[dict]:
+    """
+    Reads the chunks of a file written by ArchiveWriter, one chunk at a time
+
+    :param file: A binary file object opened for reading
+    :return: An iterator of dictionaries, one per chunk, with the keys ``task_id``,
+             ``start_day``, ``end_day``, ``archived``, ``priority`` and ``due_day``
+             holding NumPy arrays, the key ``task`` holding a list of strings and
+             the key ``tags`` holding a list of the tag names of each task.  Missing
+             dates are NULL_DATE, and the tasks of a version 1 file have no
+             priority, due date or tags
+    :raises ValueError: If the file is not an archive, is truncated or fails its
+                        checksum
+    """
+    header = file.read(_HEADER.size)
+    if len(header) < _HEADER.size or header[: len(MAGIC)] != MAGIC:
+        raise ValueError("The file is not a todo_six archive")
+    _, version = _HEADER.unpack(header)
+    if version > VERSION:
+        raise ValueError(f"Archive version {version} is newer than {VERSION}")
+
+    rows = 0
+    while True:
+        tag = file.read(4)
+        if tag == _END_TAG:
+            (total,) = struct.unpack("<Q", _read_exact(file, _END.size - 4))
+            if total != rows:
+                raise ValueError(f"The archive holds {rows} of its {total} tasks")
+            return
+        if tag != _CHUNK_TAG:
+            raise ValueError("The archive is truncated or corrupt")
+        count, length, checksum = struct.unpack(
+            "<III", _read_exact(file, _CHUNK.size - 4)
+        )
+        try:
+            payload = zlib.decompress(_read_exact(file, length))
+        except zlib.error as error:
+            raise ValueError(f"A chunk of the archive is corrupt: {error}") from error
+        if zlib.crc32(payload) != checksum:
+            raise ValueError("A chunk of the archive failed its checksum")
+        rows += count
+        yield _decode_chunk(payload, count, version)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def date_strings(days: np.ndarray) -> list:
+    """
+    Converts day numbers read from an archive to date strings
+
+    :param days: An array of day numbers counted from 1970-01-01
+    :return: A list of dates in the format "YYYY-MM-DD", with None for NULL_DATE
+    """
+    dates = days.astype(np.int64).astype("datetime64[D]").astype(str).astype(object)
+    dates[days == NULL_DATE] = None
+    return dates.tolist()
+
+
+# ==========================================================================================
+# ==========================================================================================
+# PRIVATE-LIKE FUNCTIONS
+
+
+def _to_days(days) -> np.ndarray:
+    """
+    Returns a sequence of day numbers as an int32 array, with None as NULL_DATE
+    """
+    return np.array(
+        [NULL_DATE if day is None else day for day in days], dtype=np.int64
+    ).astype(np.int32)
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _lengths(encoded: list[bytes]) -> np.ndarray:
+    """
+    Returns the length of each encoded string as a uint32 array
+    """
+    return np.fromiter((len(text) for text in encoded), np.uint32, len(encoded))
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _read_exact(file: BinaryIO, size: int) -> bytes:
+    """
+    Reads exactly size bytes, raising ValueError if the file ends first
+    """
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("The archive is truncated")
+    return data
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _decode_chunk(payload: bytes, count: int, version: int) -> dict:
+    """
+    Splits the uncompressed payload of a chunk into its columns
+    """
+    layout = [
+        ("task_id", np.int64),
+        ("start_day", np.int32),
+        ("end_day", np.int32),
+        ("archived", np.uint8),
+    ]
+    if version >= 2:
+        layout += [("priority", np.uint8), ("due_day", np.int32)]
+    layout.append(("lengths", np.uint32))
+    if version >= 2:
+        layout.append(("tag_lengths", np.uint32))
+    columns = {
+        "priority": np.zeros(count, np.uint8),
+        "due_day": np.full(count, NULL_DATE, np.int32),
+        "tag_lengths": np.zeros(count, np.uint32),
+    }
+    position = 0
+    for name, dtype in layout:
+        size = count * np.dtype(dtype).itemsize
+        columns[name] = np.frombuffer(payload, dtype, count, position)
+        position += size
+    text_length = int(columns["lengths"].sum()) + int(columns["tag_lengths"].sum())
+    if position + text_length != len(payload):
+        raise ValueError("A chunk of the archive has the wrong length")
+
+    starts = columns["start_day"]
+    offsets = columns["end_day"]
+    ends = np.where(
+        (offsets == NULL_DATE) | (starts == NULL_DATE), offsets, starts + offsets
+    ).astype(np.int32)
+    tasks, position = _decode_strings(payload, columns["lengths"], position)
+    tags, _ = _decode_strings(payload, columns["tag_lengths"], position)
+    return {
+        "task_id": np.cumsum(columns["task_id"]),
+        "start_day": starts,
+        "end_day": ends,
+        "archived": columns["archived"],
+        "priority": columns["priority"],
+        "due_day": columns["due_day"],
+        "task": tasks,
+        "tags": [names.split("\n") if names else [] for names in tags],
+    }
+
+
+# ------------------------------------------------------------------------------------------
+
+
+def _decode_strings(
+    payload: bytes, lengths: np.ndarray, position: int
+) -> tuple[list[str], int]:
+    """
+    Decodes a column of UTF-8 strings starting at position, returning the strings
+    and the position after them
+    """
+    strings = []
+    for length in lengths.tolist():
+        end = position + length
+        strings.append(payload[position:end].decode("utf-8"))
+        position = end
+    return strings, position
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -0,0 +1,242 @@
+# Import necessary packages here
+import sys
+from array import array
+from collections.abc import Iterable
+from itertools import accumulate
+
+import numpy as np
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    task_store.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the compact in-memory store that backs the task lists
+#          displayed in each tab of the todo_six application
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+class TaskStore:
+    """
+    Compact, array-backed store that maps the display ordinal of a task to its
+    database id and text.  Ordinals start at 1, matching the ``"1. task"`` labels
+    shown in the task lists.
+
+    Database ids are kept in an ``array('q')`` and the task text is kept as a single
+    UTF-8 encoded ``bytearray`` indexed by an ``array('q')`` of offsets, so no Python
+    object is held per task.  The memory budget per task is :attr:`BYTES_PER_TASK`
+    bytes of bookkeeping (an 8 byte id and an 8 byte offset) plus the UTF-8 length
+    of the task text.  A list of 100,000 tasks averaging 40 characters therefore
+    costs roughly 5.6 MB.
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.task_store import TaskStore
+
+        store = TaskStore()
+        store.load([4, 7], ["Wash car", "Mow lawn"])
+        ordinal = store.append(9, "Clean gutters")
+        print(ordinal, store.task_id(ordinal), store.text(ordinal))
+
+        >> 3 9 Clean gutters
+    """
+
+    BYTES_PER_TASK = 16
+
+    def __init__(self):
+        self._ids = array("q")
+        self._offsets = array("q", [0])
+        self._text = bytearray()
+
+    # ------------------------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # ------------------------------------------------------------------------------------------
+
+    def load(self, task_ids: Iterable[int], tasks: Iterable[str]) -> None:
+        """
+        Method to replace the contents of the store
+
+        :param task_ids: The database id of each task
+        :param tasks: The text of each task, in the same order as ``task_ids``
+        """
+        encoded = [task.encode("utf-8") for task in tasks]
+        self._ids = array("q", (int(task_id) for task_id in task_ids))
+        if len(self._ids) != len(encoded):
+            self.clear()
+            raise ValueError("task_ids and tasks must be of the same length")
+        self._offsets = array("q", accumulate((len(text) for text in encoded), initial=0))
+        self._text = bytearray(b"".join(encoded))
+
+    # ------------------------------------------------------------------------------------------
+
+    def append(self, task_id: int, task: str) -> int:
+        """
+        Method to add a task to the end of the store
+
+        :param task_id: The database id of the task
+        :param task: The text of the task
+        :return: The display ordinal assigned to the task
+        """
+        self._text += task.encode("utf-8")
+        self._ids.append(int(task_id))
+        self._offsets.append(len(self._text))
+        return len(self._ids)
+
+    # ------------------------------------------------------------------------------------------
+
+    def extend(self, task_ids: Iterable[int], tasks: Iterable[str]) -> None:
+        """
+        Method to add several tasks to the end of the store
+
+        :param task_ids: The database id of each task
+        :param tasks: The text of each task, in the same order as ``task_ids``
+        """
+        encoded = [task.encode("utf-8") for task in tasks]
+        new_ids = array("q", (int(task_id) for task_id in task_ids))
+        if len(new_ids) != len(encoded):
+            raise ValueError("task_ids and tasks must be of the same length")
+        lengths = accumulate((len(text) for text in encoded), initial=len(self._text))
+        next(lengths)  # The first offset is already the final entry of _offsets
+        self._ids.extend(new_ids)
+        self._offsets.extend(lengths)
+        self._text += b"".join(encoded)
+
+    # ------------------------------------------------------------------------------------------
+
+    def task_id(self, ordinal: int) -> int:
+        """
+        Method to return the database id of a task
+
+        :param ordinal: The display ordinal of the task, starting at 1
+        :return: The database id of the task
+        """
+        self._check_ordinal(ordinal)
+        return self._ids[ordinal - 1]
+
+    # ------------------------------------------------------------------------------------------
+
+    def text(self, ordinal: int) -> str:
+        """
+        Method to return the text of a task
+
+        :param ordinal: The display ordinal of the task, starting at 1
+        :return: The text of the task
+        """
+        self._check_ordinal(ordinal)
+        start = self._offsets[ordinal - 1]
+        end = self._offsets[ordinal]
+        return self._text[start:end].decode("utf-8")
+
+    # ------------------------------------------------------------------------------------------
+
+    def replace_ids(self, new_ids: dict[int, int]) -> int:
+        """
+        Method to change the database ids of tasks, for example when a task shown
+        under a provisional id has been saved
+
+        :param new_ids: A dictionary mapping current ids to their replacements
+        :return: The number of tasks whose id was changed
+        """
+        replaced = 0
+        for index, task_id in enumerate(self._ids):
+            new_id = new_ids.get(task_id)
+            if new_id is not None:
+                self._ids[index] = int(new_id)
+                replaced += 1
+        return replaced
+
+    # ------------------------------------------------------------------------------------------
+
+    def ordinals(self, task_ids: Iterable[int]) -> list[int]:
+        """
+        Method to find the display ordinals of tasks
+
+        :param task_ids: The database ids of the tasks
+        :return: The ordinals of the tasks in the store, in ascending order
+        """
+        wanted = {int(task_id) for task_id in task_ids}
+        return [index + 1 for index, task_id in enumerate(self._ids) if task_id in wanted]
+
+    # ------------------------------------------------------------------------------------------
+
+    def remove_range(self, first: int, last: int) -> None:
+        """
+        Method to remove a run of consecutive tasks from the store.  The ids and
+        text are moved down in place, so removing a run costs one copy of the tasks
+        that follow it.
+
+        :param first: The ordinal of the first task to remove
+        :param last: The ordinal of the last task to remove
+        """
+        self._check_ordinal(first)
+        self._check_ordinal(last)
+        start = self._offsets[first - 1]
+        end = self._offsets[last]
+        start_index, following = first - 1, last + 1
+        offsets = np.frombuffer(self._offsets, dtype=np.int64)
+        offsets[following:] -= end - start
+        del offsets  # The array cannot be resized while a view exports its buffer
+        del self._offsets[first:following]
+        del self._ids[start_index:last]
+        del self._text[start:end]
+
+    # ------------------------------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """
+        Method to remove all tasks from the store and release their memory
+        """
+        self._ids = array("q")
+        self._offsets = array("q", [0])
+        self._text = bytearray()
+
+    # ------------------------------------------------------------------------------------------
+
+    def memory_report(self) -> dict[str, int]:
+        """
+        Method to report the memory held by the store
+
+        :return: A dictionary containing the number of tasks, the bytes used by the
+                 ids, offsets and text, the budgeted total of
+                 ``BYTES_PER_TASK * tasks + text_bytes`` and the bytes actually
+                 allocated by the underlying containers, including over-allocation
+        """
+        id_bytes = len(self._ids) * self._ids.itemsize
+        offset_bytes = len(self._offsets) * self._offsets.itemsize
+        text_bytes = len(self._text)
+        allocated = (
+            sys.getsizeof(self._ids)
+            + sys.getsizeof(self._offsets)
+            + sys.getsizeof(self._text)
+        )
+        return {
+            "tasks": len(self._ids),
+            "id_bytes": id_bytes,
+            "offset_bytes": offset_bytes,
+            "text_bytes": text_bytes,
+            "budget_bytes": self.BYTES_PER_TASK * len(self._ids) + text_bytes,
+            "allocated_bytes": allocated,
+        }
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _check_ordinal(self, ordinal: int) -> None:
+        """
+        Raises an IndexError if the ordinal does not refer to a task in the store
+        """
+        if not 1 <= ordinal <= len(self._ids):
+            raise IndexError(f"Task ordinal {ordinal} is out of range")
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
@@ -1,13 +1,25 @@
 # Import necessary packages here
-from PyQt6.QtCore import QDate, Qt
+from collections.abc import Callable
+from functools import partial
+
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QDate,
+    QModelIndex,
+    Qt,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QFont, QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QButtonGroup,
     QComboBox,
     QDateEdit,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QMessageBox,
     QPushButton,
@@ -17,7 +29,12 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from todo_six.database import ToDoDatabase
+from todo_six.database import PRIORITIES, ToDoDatabase
+from todo_six.maintenance import MaintenanceScheduler
+from todo_six.monitor import ChangeMonitor
+from todo_six.task_store import TaskStore
+from todo_six.workers import DatabaseWorker
+from todo_six.write_behind import WriteBehindQueue
 
 # ==========================================================================================
 # ==========================================================================================
@@ -200,6 +217,280 @@ class ListWidget(QListWidget):
 # ==========================================================================================
 
 
+class TaskListModel(QAbstractListModel):
+    """
+    List model that presents the contents of a TaskStore to a view.  Item labels
+    are generated on demand, so the model holds no per-task objects.
+
+    :param store: The TaskStore that holds the tasks
+    """
+
+    def __init__(self, store: TaskStore):
+        super().__init__()
+        self.store = store
+
+    # ------------------------------------------------------------------------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Returns the number of tasks in the store
+        """
+        if parent.isValid():
+            return 0
+        return len(self.store)
+
+    # ------------------------------------------------------------------------------------------
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """
+        Returns the ``"ordinal. task"`` label of the task at the index
+        """
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        ordinal = index.row() + 1
+        return f"{ordinal}. {self.store.text(ordinal)}"
+
+    # ------------------------------------------------------------------------------------------
+
+    def load_tasks(self, task_ids, tasks) -> None:
+        """
+        Method to replace every task in the model
+
+        :param task_ids: The database id of each task
+        :param tasks: The text of each task
+        """
+        self.beginResetModel()
+        self.store.load(task_ids, tasks)
+        self.endResetModel()
+
+    # ------------------------------------------------------------------------------------------
+
+    def add_task(self, task_id: int, task: str) -> int:
+        """
+        Method to append a task to the model
+
+        :param task_id: The database id of the task
+        :param task: The text of the task
+        :return: The display ordinal of the new task
+        """
+        row = len(self.store)
+        self.beginInsertRows(QModelIndex(), row, row)
+        ordinal = self.store.append(task_id, task)
+        self.endInsertRows()
+        return ordinal
+
+    # ------------------------------------------------------------------------------------------
+
+    def append_tasks(self, task_ids, tasks) -> None:
+        """
+        Method to append several tasks to the model
+
+        :param task_ids: The database id of each task
+        :param tasks: The text of each task
+        """
+        if len(task_ids) == 0:
+            return
+        row = len(self.store)
+        self.beginInsertRows(QModelIndex(), row, row + len(task_ids) - 1)
+        self.store.extend(task_ids, tasks)
+        self.endInsertRows()
+
+    # ------------------------------------------------------------------------------------------
+
+    def remove_tasks(self, task_ids) -> int:
+        """
+        Method to remove tasks from the model.  Each run of consecutive rows is
+        removed on its own, so the view keeps the selection and scroll position of
+        the remaining tasks rather than being reset.
+
+        :param task_ids: The database ids of the tasks to remove
+        :return: The number of tasks removed
+        """
+        ordinals = self.store.ordinals(task_ids)
+        runs = []
+        for ordinal in ordinals:
+            if runs and runs[-1][1] == ordinal - 1:
+                runs[-1][1] = ordinal
+            else:
+                runs.append([ordinal, ordinal])
+        # Later runs are removed first, so the rows of earlier runs do not move
+        for first, last in reversed(runs):
+            self.beginRemoveRows(QModelIndex(), first - 1, last - 1)
+            self.store.remove_range(first, last)
+            self.endRemoveRows()
+        # The labels of the tasks after the first removed row are numbered again
+        if ordinals and ordinals[0] <= len(self.store):
+            self.dataChanged.emit(
+                self.index(ordinals[0] - 1), self.index(len(self.store) - 1)
+            )
+        return len(ordinals)
+
+    # ------------------------------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """
+        Method to remove every task from the model
+        """
+        self.beginResetModel()
+        self.store.clear()
+        self.endResetModel()
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class TaskList(QListView):
+    """
+    Custom QListView that displays tasks held in a compact TaskStore.  Unlike the
+    ListWidget, no QListWidgetItem is created per task, so very long lists only cost
+    the memory budget documented in TaskStore.
+
+    :param font: A QFont object with font type and font size
+    :param active_widget: Widget is active when created if set to True, inactive
+                          if set to false
+    """
+
+    itemSelectionChanged = pyqtSignal()
+
+    def __init__(self, font: QFont, active_widget: bool = True):
+        super().__init__()
+        self.setFont(font)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.store = TaskStore()
+        self.task_model = TaskListModel(self.store)
+        self.setModel(self.task_model)
+        self.selectionModel().selectionChanged.connect(self.itemSelectionChanged.emit)
+        self.setEnabled(active_widget)
+
+    # ------------------------------------------------------------------------------------------
+
+    def load_tasks(self, task_ids, tasks) -> None:
+        """
+        Method to replace every task in the list
+
+        :param task_ids: The database id of each task
+        :param tasks: The text of each task
+        """
+        self.task_model.load_tasks(task_ids, tasks)
+
+    # ------------------------------------------------------------------------------------------
+
+    def add_task(self, task_id: int, task: str) -> int:
+        """
+        Method to append a task to the list
+
+        :param task_id: The database id of the task
+        :param task: The text of the task
+        :return: The display ordinal of the new task
+        """
+        return self.task_model.add_task(task_id, task)
+
+    # ------------------------------------------------------------------------------------------
+
+    def append_tasks(self, task_ids, tasks) -> None:
+        """
+        Method to append several tasks to the list
+
+        :param task_ids: The database id of each task
+        :param tasks: The text of each task
+        """
+        self.task_model.append_tasks(task_ids, tasks)
+
+    # ------------------------------------------------------------------------------------------
+
+    def remove_tasks(self, task_ids) -> int:
+        """
+        Method to remove tasks from the list
+
+        :param task_ids: The database ids of the tasks to remove
+        :return: The number of tasks removed
+        """
+        return self.task_model.remove_tasks(task_ids)
+
+    # ------------------------------------------------------------------------------------------
+
+    def replace_task_ids(self, new_ids: dict[int, int]) -> int:
+        """
+        Method to change the database ids of tasks without changing their labels
+
+        :param new_ids: A dictionary mapping current ids to their replacements
+        :return: The number of tasks whose id was changed
+        """
+        return self.store.replace_ids(new_ids)
+
+    # ------------------------------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """
+        Method to remove every task from the list
+        """
+        self.task_model.clear()
+
+    # ------------------------------------------------------------------------------------------
+
+    def count(self) -> int:
+        """
+        Method to return the number of tasks in the list
+
+        :return: The number of tasks
+        """
+        return len(self.store)
+
+    # ------------------------------------------------------------------------------------------
+
+    def current_task_id(self) -> int:
+        """
+        Method to return the database id of the current task
+
+        :return: The database id of the current task, or None if there is no
+                 current task
+        """
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+        return self.store.task_id(index.row() + 1)
+
+    # ------------------------------------------------------------------------------------------
+
+    def selected_task_ids(self) -> list[int]:
+        """
+        Method to return the database ids of the selected tasks
+
+        :return: A list of database ids in display order
+        """
+        rows = sorted(index.row() for index in self.selectionModel().selectedRows())
+        return [self.store.task_id(row + 1) for row in rows]
+
+    # ------------------------------------------------------------------------------------------
+
+    def selected_tasks(self) -> tuple[list[int], list[str]]:
+        """
+        Method to return the database ids and text of the selected tasks
+
+        :return: A tuple containing a list of database ids and a list of task text,
+                 both in display order
+        """
+        rows = sorted(index.row() for index in self.selectionModel().selectedRows())
+        task_ids = [self.store.task_id(row + 1) for row in rows]
+        return task_ids, [self.store.text(row + 1) for row in rows]
+
+    # ------------------------------------------------------------------------------------------
+
+    def memory_report(self) -> dict[str, int]:
+        """
+        Method to report the memory held by the tasks in the list
+
+        :return: The dictionary returned by TaskStore.memory_report
+        """
+        return self.store.memory_report()
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
 class OpacitySlider(QWidget):
     """
     Custom QWidget that contains a QLabel and a QSlider for setting the opacity.
@@ -296,37 +587,78 @@ class Tab(QWidget):
     :param fnt: A QFont object
     :param tab_name: A string character name for the object
     :param db: A ToDoDatabase object
+    :param loading: If True the tab is created disabled, without querying the
+                    database, and is populated later by :meth:`finish_loading`.
+                    If False the tasks are loaded from the open database immediately
+                    by :meth:`ToDoDatabase.bootstrap`
+    :param write_behind: If True new, completed and deleted tasks are shown at once
+                         and committed in the background by a WriteBehindQueue.  See
+                         :meth:`set_write_behind`
+
+    A tab whose database was opened with ``read_only`` only displays the tasks.  The
+    entry field and the task buttons are disabled, and no maintenance or
+    write-behind queue is run.  An ``immutable`` database is not monitored for
+    changes either, since SQLite does not look for them.
+
+    A task entered while the repeat menu shows an option other than Once is stored
+    as a recurrence rule, see :meth:`ToDoDatabase.add_recurrence`, and its first
+    occurrence is added at once.
+
+    A one-off task can be given a priority, tags and a due date in the entry field,
+    after a ``--`` separator, for example ``Mow lawn -- !high #garden due:2026-10-24``.
+    Text without the separator is saved as typed.  The filter bar above the
+    todo list narrows today's open tasks by priority, tag and due date and sorts
+    them, with the filtering and sorting done by
+    :meth:`ToDoDatabase.select_filtered_tasks`.
     """
 
-    def __init__(self, fnt: QFont, tab_name: str, db: ToDoDatabase):
+    # Recurrence frequency of each option of the repeat menu
+    REPEAT_OPTIONS = {
+        "Daily": "DAY",
+        "Weekly": "WEEK",
+        "Monthly": "MONTH",
+        "Yearly": "YEAR",
+    }
+    # Days from today of the last due date of each option of the due date filter
+    DUE_OPTIONS = {"Overdue": -1, "Due today": 0, "Due this week": 6}
+    # Order of the open tasks of each option of the sort menu
+    SORT_OPTIONS = {
+        "Sort by added": "added",
+        "Sort by priority": "priority",
+        "Sort by due date": "due",
+    }
+    _FILTER_WIDGETS = ["priority_filter", "tag_filter", "due_filter", "sort_menu"]
+
+    def __init__(
+        self,
+        fnt: QFont,
+        tab_name: str,
+        db: ToDoDatabase,
+        loading=False,
+        write_behind=False,
+    ):
         super().__init__()
         self.tab_name = tab_name
         self.tab_layout = QVBoxLayout(self)
         self.db = db
-
-        success, oldest_date, _ = self.db.get_oldest_date()
-        if not success:
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Icon.Critical)
-            msg.setText("Error")
-            msg.setInformativeText("Failed to query the oldest date.")
-            msg.setWindowTitle("Error")
-            msg.exec()
-            return
-
-        # Convert the oldest_date and today's date to QDate objects
-        if oldest_date:
-            start_date = QDate.fromString(oldest_date, "yyyy-MM-dd")
-        else:
-            start_date = QDate.currentDate()
-        end_date = QDate.currentDate()
+        self.monitor = ChangeMonitor(db, parent=self)
+        self.monitor.changed.connect(self.reload)
+        self.maintenance = MaintenanceScheduler(db.db_name, parent=self)
+        self.write_behind = write_behind
+        self.write_queue = None
+        self._reload_deferred = False
 
         self.widgets = {
             "entry_field": LineEdit(fnt),
-            "todo_list": ListWidget(fnt),
+            "repeat_menu": DropDownMenu(["Once"] + list(self.REPEAT_OPTIONS)),
+            "priority_filter": DropDownMenu(["Any priority", "High", "Medium", "Low"]),
+            "tag_filter": DropDownMenu(["Any tag"]),
+            "due_filter": DropDownMenu(["Any due date"] + list(self.DUE_OPTIONS)),
+            "sort_menu": DropDownMenu(list(self.SORT_OPTIONS)),
+            "todo_list": TaskList(fnt),
             "todo_list_label": QLabel("Todo List"),
             "completed_list_label": QLabel("Completed List"),
-            "completed_list": ListWidget(fnt),
+            "completed_list": TaskList(fnt),
             "add_task_button": PushButton("Add Task", fnt),
             "retire_task_button": PushButton("Retire Task", fnt),
             "delete_task_button": PushButton("Delete Task", fnt),
@@ -334,8 +666,16 @@ class Tab(QWidget):
             "calendar": QDateEdit(),
         }
 
-        self.tab_layout.addWidget(self.widgets["entry_field"])
+        entry_row_layout = QHBoxLayout()
+        entry_row_layout.addWidget(self.widgets["entry_field"])
+        entry_row_layout.addWidget(self.widgets["repeat_menu"])
+        self.tab_layout.addLayout(entry_row_layout)
         self.tab_layout.addWidget(self.widgets["todo_list_label"])
+        filter_row_layout = QHBoxLayout()
+        for name in self._FILTER_WIDGETS:
+            filter_row_layout.addWidget(self.widgets[name])
+            self.widgets[name].currentTextChanged.connect(self._filter_changed)
+        self.tab_layout.addLayout(filter_row_layout)
         self.tab_layout.addWidget(self.widgets["todo_list"])
         self.tab_layout.addWidget(self.widgets["completed_list_label"])
         self.tab_layout.addWidget(self.widgets["completed_list"])
@@ -343,6 +683,9 @@ class Tab(QWidget):
         self.tab_layout.addWidget(self.widgets["retire_task_button"])
         self.tab_layout.addWidget(self.widgets["delete_task_button"])
 
+        self.widgets["entry_field"].setPlaceholderText(
+            "New task -- !high #tag due:YYYY-MM-DD"
+        )
         self.widgets["add_task_button"].clicked.connect(self._add_task)
         self.shortcut = QShortcut(QKeySequence(Qt.Key.Key_Return), self)
         self.shortcut.activated.connect(self._add_task)
@@ -359,23 +702,15 @@ class Tab(QWidget):
             self._update_completed_tasks
         )
 
-        self.widgets["todo_list"].itemSelectionChanged.connect(
-            self._clear_other_selections
-        )
-        self.widgets["completed_list"].itemSelectionChanged.connect(
-            self._clear_other_selections
-        )
-        self.delete_mode = False
-
-        self.todo_tasks = {}
-        self.completed_tasks = {}
-
-        self._load_tasks_from_database()
+        for name in ["todo_list", "completed_list"]:
+            self.widgets[name].setSelectionMode(
+                QAbstractItemView.SelectionMode.ExtendedSelection
+            )
+            self.widgets[name].itemSelectionChanged.connect(self._clear_other_selections)
 
         self.widgets["calendar"].setCalendarPopup(True)
-        # Set minimum and maximum dates
-        self.widgets["calendar"].setMinimumDate(start_date)
-        self.widgets["calendar"].setMaximumDate(end_date)
+        # Set maximum date, the minimum date is set once the oldest task is known
+        self.widgets["calendar"].setMaximumDate(QDate.currentDate())
         self.widgets["calendar"].setDate(QDate.currentDate())
 
         # Create a QHBoxLayout
@@ -391,16 +726,223 @@ class Tab(QWidget):
         # Create connections for calendar
         self.widgets["calendar"].dateChanged.connect(self._date_changed)
 
+        if loading:
+            # Placeholder until finish_loading receives the tasks
+            self.widgets["todo_list_label"].setText("Loading...")
+            self.setEnabled(False)
+            return
+
+        time_frame = self.widgets["drop_down_menu"].currentText().upper()
+        success, snapshot, message = self.db.bootstrap(time_frame, create=False)
+        if not success:
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Icon.Critical)
+            msg.setText("Error")
+            msg.setInformativeText(f"Failed to load the tasks: {message}")
+            msg.setWindowTitle("Error")
+            msg.exec()
+            return
+
+        self.finish_loading(snapshot)
+
     # ------------------------------------------------------------------------------------------
 
-    def _load_tasks_from_database(self):
+    def finish_loading(self, snapshot: dict) -> None:
         """
-        A method to load tasks from the database. The tasks will be added to the
-        appropriate task list and also to the corresponding task dictionary.
+        Method to populate a tab created with ``loading=True`` and enable it
+
+        :param snapshot: A dictionary containing the oldest start date under the key
+                         ``oldest_date`` and the open and completed task dataframes
+                         under the keys ``open_tasks`` and ``closed_tasks``
         """
+        self._set_date_range(snapshot["oldest_date"])
+        self._populate_tasks(snapshot["open_tasks"], self.widgets["todo_list"])
+        self._populate_tasks(snapshot["closed_tasks"], self.widgets["completed_list"])
+        self._refresh_tag_filter()
+        self.widgets["todo_list_label"].setText("Todo List")
+        self.setEnabled(True)
+        if self.db.read_only:
+            self._disable_editing()
+            if not self.db.immutable:
+                self.monitor.start()
+            return
+        self.monitor.start()
+        self.maintenance.start()
+        self.set_write_behind(self.write_behind)
 
-        # Query the database for open tasks
-        self._refresh_tasks()
+    # ------------------------------------------------------------------------------------------
+
+    def reload(self) -> None:
+        """
+        Method to reload the tasks shown for the selected date.  The method is
+        called when the ChangeMonitor detects that another program changed the
+        database.  While writes of the tab are still queued the reload is
+        postponed until they have been committed, so they are not hidden.
+        """
+        self.maintenance.touch()
+        if self.write_queue is not None and self.write_queue.pending():
+            self._reload_deferred = True
+            return
+        self._reload_deferred = False
+        self._update_date_range()
+        self._date_changed(self.widgets["calendar"].date())
+
+    # ------------------------------------------------------------------------------------------
+
+    def set_write_behind(self, enabled: bool) -> tuple[bool, str]:
+        """
+        Method to turn the write-behind mode of the tab on or off.  In write-behind
+        mode a task appears in the list as soon as it is entered, completed or
+        deleted, and a WriteBehindQueue commits the changes in groups every few
+        milliseconds, so task entry never waits on the disk.  Changes made in the
+        last few milliseconds before a crash or power failure can be lost, see
+        WriteBehindQueue.  Turning the mode off commits every queued change first.
+
+        :param enabled: True to queue writes, False to commit each write at once
+        :return: A tuple containing a boolean and a string.  A boolean of True
+                 indicates the operation was successful, and the string contains a
+                 description of the result
+        """
+        self.write_behind = enabled
+        if self.db.read_only:
+            return True, f"{self.tab_name} is read-only, nothing is written"
+        if enabled and self.write_queue is None:
+            write_queue = WriteBehindQueue(
+                self.db.db_name, backend=self.db.backend.name, parent=self
+            )
+            success, message = write_queue.start()
+            if not success:
+                self.write_behind = False
+                return False, message
+            write_queue.committed.connect(self._tasks_committed)
+            write_queue.failed.connect(self._write_failed)
+            self.write_queue = write_queue
+            return True, f"Write-behind mode enabled for {self.tab_name}"
+        if not enabled and self.write_queue is not None:
+            self.close_write_queue()
+            if self.db.con.isOpen():
+                self.reload()
+        return True, f"Write-behind mode is {'on' if enabled else 'off'}"
+
+    # ------------------------------------------------------------------------------------------
+
+    def undo(self) -> tuple[bool, str]:
+        """
+        Method to undo the latest task insert, completion or deletion recorded in
+        the journal of the database, see :meth:`ToDoDatabase.undo`, and show the
+        result.  Queued writes are committed first, so they are undone in order.
+
+        :return: A tuple containing a boolean and a string.  A boolean of True
+                 indicates the operation was successful, and the string contains a
+                 description of the result
+        """
+        return self._replay_journal(self.db.undo)
+
+    # ------------------------------------------------------------------------------------------
+
+    def redo(self) -> tuple[bool, str]:
+        """
+        Method to apply again the task changes last undone, see
+        :meth:`ToDoDatabase.redo`, and show the result
+
+        :return: A tuple containing a boolean and a string.  A boolean of True
+                 indicates the operation was successful, and the string contains a
+                 description of the result
+        """
+        return self._replay_journal(self.db.redo)
+
+    # ------------------------------------------------------------------------------------------
+
+    def close_write_queue(self) -> None:
+        """
+        Method to commit every queued write and stop the write-behind queue.  This
+        must be called before the database connection of the tab is removed.
+        """
+        if self.write_queue is None:
+            return
+        self.write_queue.close()
+        self.write_queue.deleteLater()
+        self.write_queue = None
+
+    # ------------------------------------------------------------------------------------------
+
+    def memory_report(self) -> dict[str, dict[str, int]]:
+        """
+        Method to report the memory held by the todo and completed task lists
+
+        :return: A dictionary with the keys ``todo_list``, ``completed_list`` and
+                 ``total``, each containing a TaskStore memory report
+        """
+        todo = self.widgets["todo_list"].memory_report()
+        completed = self.widgets["completed_list"].memory_report()
+        total = {key: todo[key] + completed[key] for key in todo}
+        return {"todo_list": todo, "completed_list": completed, "total": total}
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _disable_editing(self) -> None:
+        """
+        Method to disable the widgets that change the tasks of a read-only database
+        """
+        self._set_editing_enabled(False)
+        self.widgets["todo_list_label"].setText("Todo List (read-only)")
+
+    # ------------------------------------------------------------------------------------------
+
+    def _set_editing_enabled(self, enabled: bool) -> None:
+        """
+        Method to enable or disable the widgets that change the tasks
+        """
+        for name in [
+            "entry_field",
+            "repeat_menu",
+            "add_task_button",
+            "retire_task_button",
+            "delete_task_button",
+        ]:
+            self.widgets[name].setEnabled(enabled)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _replay_journal(self, replay: Callable) -> tuple[bool, str]:
+        """
+        Method to run ToDoDatabase.undo or ToDoDatabase.redo and reload the lists
+        if any task changed
+        """
+        if self.db.read_only:
+            return False, f"{self.tab_name} is read-only"
+        self.maintenance.touch()
+        self._flush_writes()
+        success, message, count = replay()
+        if success and count:
+            self.reload()
+        return success, message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _set_date_range(self, oldest_date: str) -> None:
+        """
+        Method to limit the calendar to dates between the oldest task and today
+        """
+        # Convert the oldest_date to a QDate object
+        if oldest_date:
+            start_date = QDate.fromString(oldest_date, "yyyy-MM-dd")
+        else:
+            start_date = QDate.currentDate()
+        self.widgets["calendar"].setDateRange(start_date, QDate.currentDate())
+
+    # ------------------------------------------------------------------------------------------
+
+    def _update_date_range(self) -> None:
+        """
+        Method to keep the calendar range in step with the tasks after a change.
+        The oldest date is served by the tasks_metadata table, so this does not
+        read any task.
+        """
+        success, oldest_date, _ = self.db.get_oldest_date()
+        if success:
+            self._set_date_range(oldest_date)
 
     # ------------------------------------------------------------------------------------------
 
@@ -408,8 +950,20 @@ class Tab(QWidget):
         """
         Method to add a task to the todo_list window of the appropriate tab
         """
-        task_text = self.widgets["entry_field"].text()
-        if task_text:
+        if self.db.read_only:
+            return
+        self.maintenance.touch()
+        task_text, attributes = self._parse_entry(self.widgets["entry_field"].text())
+        repeat = self.widgets["repeat_menu"].currentText()
+        if task_text and repeat in self.REPEAT_OPTIONS:
+            self._add_recurring_task(task_text, self.REPEAT_OPTIONS[repeat])
+        elif task_text and (attributes or self._task_filters()):
+            self._add_filtered_task(task_text, attributes)
+        elif task_text and self.write_queue is not None:
+            task_id = self.write_queue.insert_task(task_text)
+            self.widgets["todo_list"].add_task(task_id, task_text)
+            self.widgets["entry_field"].setText("")
+        elif task_text:
             success, message, task_id = self.db.insert_task(task_text)
             if not success:
                 # Display a message box if there's an error
@@ -420,42 +974,58 @@ class Tab(QWidget):
                 msg.setWindowTitle("Error")
                 msg.exec()
                 return
-            # Get the last inserted id from the database
-            last_id = self._get_largest_id_in_todo_list()
-            new_id = last_id + 1
-            self.widgets["todo_list"].addItem(f"{new_id}. {task_text}")
-            self.todo_tasks[new_id] = task_id
+            self.widgets["todo_list"].add_task(task_id, task_text)
             self.widgets["entry_field"].setText("")  # clear the entry field
+            self._update_date_range()
 
     # ------------------------------------------------------------------------------------------
 
-    def _get_largest_id_in_todo_list(self) -> int:
+    @staticmethod
+    def _parse_entry(text: str) -> tuple[str, dict]:
         """
-        Return the largest ID currently in the todo_list.
+        Method to split the priority, tags and due date out of the text of a new
+        task.  They are only read from a section after the last `` -- `` of the
+        text, in which ``!high``, ``!medium`` and ``!low`` set the priority, each
+        ``#name`` adds a tag and ``due:YYYY-MM-DD`` sets the due date.  Text
+        without that section, or whose section holds anything else, is returned
+        unchanged, so ordinary text such as ``Fix bug #123`` is never rewritten.
+
+        :return: A tuple containing the task text and a dictionary with the keys
+                 ``priority``, ``due_date`` and ``tags`` of the attributes found
         """
-        max_id = 0
-        for i in range(self.widgets["todo_list"].count()):
-            item_text = self.widgets["todo_list"].item(i).text()
-            item_id = int(
-                item_text.split(".")[0]
-            )  # assuming item_text is in "id: text" format
-            if item_id > max_id:
-                max_id = item_id
-        return max_id
+        task_text, separator, section = text.rpartition(" -- ")
+        if not separator or not section.split():
+            return text, {}
+        attributes = {}
+        for word in section.split():
+            if word.startswith("!") and word[1:].lower() in PRIORITIES:
+                attributes["priority"] = word[1:].lower()
+            elif word.startswith("#") and len(word) > 1:
+                attributes.setdefault("tags", []).append(word[1:])
+            elif (
+                word.startswith("due:")
+                and QDate.fromString(word[4:], "yyyy-MM-dd").isValid()
+            ):
+                attributes["due_date"] = word[4:]
+            else:
+                return text, {}
+        return task_text.rstrip(), attributes
 
     # ------------------------------------------------------------------------------------------
 
-    def _retire_task(self) -> None:
+    def _add_filtered_task(self, task_text: str, attributes: dict) -> None:
         """
-        Method to retire a task from the todo_list window of the appropriate tab
+        Method to add a task with its priority, tags and due date, and to reload the
+        open tasks so the task is placed by the filters and sort order
         """
-        # 1. Retire the selected task
-        current_task = self.widgets["todo_list"].currentItem()
-        if not current_task:
-            return  # If no item selected, do nothing
-        task_id, _ = current_task.text().split(". ", 1)
-        db_task_id = self.todo_tasks[int(task_id)]
-        success, message = self.db.complete_task(db_task_id)
+        self._flush_writes()
+        success, message, task_id = self.db.insert_task(task_text)
+        if success and "priority" in attributes:
+            success, message = self.db.set_priority(task_id, attributes["priority"])
+        if success and "due_date" in attributes:
+            success, message = self.db.set_due_date(task_id, attributes["due_date"])
+        if success and "tags" in attributes:
+            success, message = self.db.add_tags(task_id, attributes["tags"])
         if not success:
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Icon.Critical)
@@ -464,83 +1034,126 @@ class Tab(QWidget):
             msg.setWindowTitle("Error")
             msg.exec()
             return
+        self.widgets["entry_field"].setText("")
+        self._refresh_tag_filter()
+        self._refresh_open_tasks()
+        self._update_date_range()
 
-        # 4. Remove the updated task from the todo list
-        self.widgets["todo_list"].takeItem(self.widgets["todo_list"].row(current_task))
-        del self.todo_tasks[int(task_id)]  # remove from our tracking dictionary
-
-        # 2. Clear the completed list
-        self.widgets["completed_list"].clear()
+    # ------------------------------------------------------------------------------------------
 
-        # 3. Query the database for completed tasks
+    def _add_recurring_task(self, task_text: str, frequency: str) -> None:
+        """
+        Method to store a recurrence rule starting today and show its first task
+        """
+        success, message, _ = self.db.add_recurrence(task_text, frequency)
         if success:
-            self._refresh_tasks()
-        else:
+            success, message, _ = self.db.materialize_recurrences()
+        if not success:
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Icon.Critical)
             msg.setText("Error")
             msg.setInformativeText(message)
             msg.setWindowTitle("Error")
             msg.exec()
+            return
+        self.widgets["entry_field"].setText("")
+        self.widgets["repeat_menu"].set_selected_option("Once")
+        self.reload()
 
     # ------------------------------------------------------------------------------------------
 
-    def _clear_other_selections(self):
+    def _retire_task(self) -> None:
         """
-        Method to ensure that only one task can be highlighted at a time.
+        Method to retire the selected tasks from the todo_list window of the
+        appropriate tab.  The tasks are completed in one transaction and moved to
+        the completed list without reading the lists again.
         """
-        if not self.delete_mode:  # Skip clearing if we're in delete mode
-            sender = self.sender()
-            if sender is self.widgets["todo_list"]:
-                self.widgets["completed_list"].clearSelection()
+        if self.db.read_only:
+            return
+        self.maintenance.touch()
+        # 1. Retire the selected tasks
+        task_ids, tasks = self.widgets["todo_list"].selected_tasks()
+        if not task_ids:
+            return  # If no item selected, do nothing
+        if self.write_queue is not None:
+            self.write_queue.complete_tasks(task_ids)
         else:
-            self.widgets["todo_list"].clearSelection()
+            success, message = self.db.complete_tasks(task_ids)
+            if not success:
+                msg = QMessageBox()
+                msg.setIcon(QMessageBox.Icon.Critical)
+                msg.setText("Error")
+                msg.setInformativeText(message)
+                msg.setWindowTitle("Error")
+                msg.exec()
+                return
+
+        # 2. Move the tasks to the completed list
+        self.widgets["todo_list"].remove_tasks(task_ids)
+        self.widgets["completed_list"].append_tasks(task_ids, tasks)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _clear_other_selections(self):
+        """
+        Method to ensure that tasks are only highlighted in one list at a time.
+        """
+        sender = self.sender()
+        if not sender.selectionModel().hasSelection():
+            return
+        for name in ["todo_list", "completed_list"]:
+            if self.widgets[name] is not sender:
+                self.widgets[name].clearSelection()
 
     # ------------------------------------------------------------------------------------------
 
     def _delete_task(self) -> None:
         """
-        Method to delete the selected task from the database and the respective list
-        window.
+        Method to delete the selected tasks from the database and the respective
+        list window.  The tasks are deleted in one transaction and removed from the
+        list without reading the lists again.
         """
+        if self.db.read_only:
+            return
+        self.maintenance.touch()
         # 1. Determine which list the user is interacting with
-        selected_list = None
-        selected_item = None
-        task_dict = None
-        if self.widgets["todo_list"].selectedItems():
-            selected_list = self.widgets["todo_list"]
-            selected_item = selected_list.currentItem()
-            task_dict = self.todo_tasks
-        elif self.widgets["completed_list"].selectedItems():
+        selected_list = self.widgets["todo_list"]
+        if not selected_list.selected_task_ids():
             selected_list = self.widgets["completed_list"]
-            selected_item = selected_list.currentItem()
-            task_dict = self.completed_tasks
 
-        if selected_item is None:
+        # 2. Determine the task ids
+        task_ids = selected_list.selected_task_ids()
+        if not task_ids:
             QMessageBox.warning(self, "Error", "No task selected.")
             return
 
-        # 2. Determine the task id
-        task_id, _ = selected_item.text().split(". ", 1)
-        db_task_id = task_dict[int(task_id)]
-
         # 3. Confirmation window
+        selection = "the selected task"
+        if len(task_ids) > 1:
+            selection = f"the {len(task_ids)} selected tasks"
         confirm = QMessageBox.question(
             self,
             "Confirm Deletion",
-            "Are you sure you want to delete the selected task?",
+            f"Are you sure you want to delete {selection}?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
         )
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
 
-        # 4. Delete the task from the database
-        if confirm == QMessageBox.StandardButton.Yes:
-            success, message = self.db.delete_task(db_task_id)
-            if not success:
-                QMessageBox.warning(self, "Error", f"Failed to delete task: {message}")
-                return
+        # 4. Delete the tasks from the database
+        if self.write_queue is not None:
+            self.write_queue.delete_tasks(task_ids)
+            selected_list.remove_tasks(task_ids)
+            return
+        success, message = self.db.delete_tasks(task_ids)
+        if not success:
+            QMessageBox.warning(self, "Error", f"Failed to delete task: {message}")
+            return
 
-            # 5. Refresh the tasks
-            self._refresh_tasks()
+        # 5. Remove the tasks and refresh the tags and the calendar range
+        selected_list.remove_tasks(task_ids)
+        self._refresh_tag_filter()
+        self._update_date_range()
 
     # ------------------------------------------------------------------------------------------
 
@@ -549,12 +1162,13 @@ class Tab(QWidget):
         Method to refresh the completed tasks list based on the selected time frame
         from the drop_down_menu.
         """
+        self._flush_writes()
         time_frame = self.widgets["drop_down_menu"].currentText().upper()
         # Get selected date from the QDateEdit widget
         selected_date = self.widgets["calendar"].date().toString("yyyy-MM-dd")
         success, df, message = self.db.select_closed_tasks(time_frame, selected_date)
         if success:
-            self._populate_tasks(df, self.widgets["completed_list"], self.completed_tasks)
+            self._populate_tasks(df, self.widgets["completed_list"])
         else:
             msg = f"Failed to query completed tasks: {message}"
             QMessageBox.warning(self, "Error", msg)
@@ -565,18 +1179,16 @@ class Tab(QWidget):
         """
         Method to refresh the tasks from the database.
         """
+        self._flush_writes()
         # Refresh the todo tasks
-        success, df, message = self.db.select_open_tasks()
-        if success:
-            self._populate_tasks(df, self.widgets["todo_list"], self.todo_tasks)
-        else:
-            QMessageBox.warning(self, "Error", f"Failed to query open tasks: {message}")
+        self._refresh_tag_filter()
+        self._refresh_open_tasks()
 
         # Refresh the completed tasks
         time_frame = self.widgets["drop_down_menu"].currentText().upper()
         success, df, message = self.db.select_closed_tasks(time_frame)
         if success:
-            self._populate_tasks(df, self.widgets["completed_list"], self.completed_tasks)
+            self._populate_tasks(df, self.widgets["completed_list"])
         else:
             QMessageBox.warning(
                 self, "Error", f"Failed to query completed tasks: {message}"
@@ -584,18 +1196,127 @@ class Tab(QWidget):
 
     # ------------------------------------------------------------------------------------------
 
-    def _populate_tasks(self, df, list_widget, task_dict):
+    def _refresh_open_tasks(self) -> None:
+        """
+        Method to read today's open tasks, through the filtered select whenever an
+        option other than the default is chosen in the filter bar
+        """
+        self._flush_writes()
+        filters = self._task_filters()
+        if filters:
+            success, df, message = self.db.select_filtered_tasks(**filters)
+        else:
+            success, df, message = self.db.select_open_tasks()
+        if success:
+            self._populate_tasks(df, self.widgets["todo_list"])
+        else:
+            QMessageBox.warning(self, "Error", f"Failed to query open tasks: {message}")
+
+    # ------------------------------------------------------------------------------------------
+
+    def _task_filters(self) -> dict:
         """
-        Method to populate a list widget with tasks from a DataFrame and update a
-        corresponding task dictionary.
+        Method to return the arguments of ToDoDatabase.select_filtered_tasks chosen
+        in the filter bar, an empty dictionary if every filter is at its default
         """
-        list_widget.clear()
-        task_dict.clear()
-        for idx, row in enumerate(df.iterrows(), start=1):
-            task_id = row[1]["task_id"]
-            task = row[1]["task"]
-            list_widget.addItem(f"{idx}. {task}")
-            task_dict[idx] = task_id
+        filters = {}
+        if self.widgets["priority_filter"].currentIndex() > 0:
+            filters["priority"] = self.widgets["priority_filter"].currentText().lower()
+        if self.widgets["tag_filter"].currentIndex() > 0:
+            filters["tag"] = self.widgets["tag_filter"].currentText()
+        due = self.widgets["due_filter"].currentText()
+        if due in self.DUE_OPTIONS:
+            due_by = QDate.currentDate().addDays(self.DUE_OPTIONS[due])
+            filters["due_by"] = due_by.toString("yyyy-MM-dd")
+        order_by = self.SORT_OPTIONS[self.widgets["sort_menu"].currentText()]
+        if order_by != "added":
+            filters["order_by"] = order_by
+        return filters
+
+    # ------------------------------------------------------------------------------------------
+
+    def _filter_changed(self) -> None:
+        """
+        Method to reload the open tasks after an option of the filter bar changes.
+        The filters only apply to today's tasks.
+        """
+        if self.widgets["calendar"].date() == QDate.currentDate():
+            self._refresh_open_tasks()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _refresh_tag_filter(self) -> None:
+        """
+        Method to fill the tag filter with the tags in use, keeping the selected tag
+        """
+        success, tags, _ = self.db.select_tags()
+        menu = self.widgets["tag_filter"]
+        options = ["Any tag"] + tags
+        if not success or options == [menu.itemText(i) for i in range(menu.count())]:
+            return
+        selected = menu.currentText()
+        menu.blockSignals(True)
+        menu.clear()
+        menu.addItems(options)
+        menu.set_selected_option(selected)
+        menu.blockSignals(False)
+        if menu.currentText() != selected:
+            self._filter_changed()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _set_filters_enabled(self, enabled: bool) -> None:
+        """
+        Method to enable or disable the widgets of the filter bar
+        """
+        for name in self._FILTER_WIDGETS:
+            self.widgets[name].setEnabled(enabled)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _flush_writes(self) -> None:
+        """
+        Method to commit the queued writes before the lists are read from the
+        database again
+        """
+        if self.write_queue is not None:
+            self.write_queue.flush()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _tasks_committed(self, new_ids: dict) -> None:
+        """
+        Method to replace provisional ids once a group of writes is committed
+        """
+        if new_ids:
+            self.widgets["todo_list"].replace_task_ids(new_ids)
+            self.widgets["completed_list"].replace_task_ids(new_ids)
+        # The commit was made by this tab, so the monitor must not report it
+        self.monitor.acknowledge()
+        self._update_date_range()
+        if self._reload_deferred and not self.write_queue.pending():
+            self.reload()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _write_failed(self, message: str) -> None:
+        """
+        Method to report queued writes that could not be committed.  The lists are
+        reloaded from the database once the queue is empty.
+        """
+        self._reload_deferred = True
+        QMessageBox.warning(self, "Error", f"Failed to save tasks: {message}")
+
+    # ------------------------------------------------------------------------------------------
+
+    def _populate_tasks(self, df, list_widget):
+        """
+        Method to populate a task list with the tasks from a DataFrame.
+        """
+        if df.empty:
+            list_widget.clear()
+            return
+        list_widget.load_tasks(df["task_id"].to_numpy(), df["task"].to_numpy())
 
     # ------------------------------------------------------------------------------------------
 
@@ -610,24 +1331,18 @@ class Tab(QWidget):
 
         if selected_date == current_date:
             # Re-enable buttons and entry field if it's current date
-            self.widgets["entry_field"].setEnabled(True)
-            self.widgets["add_task_button"].setEnabled(True)
-            self.widgets["retire_task_button"].setEnabled(True)
-            self.widgets["delete_task_button"].setEnabled(True)
+            self._set_editing_enabled(not self.db.read_only)
+            self._set_filters_enabled(True)
             # Refresh tasks
             self._refresh_tasks()
         else:
             # Disable buttons and entry field if it's not current date
-            self.widgets["entry_field"].setEnabled(False)
-            self.widgets["add_task_button"].setEnabled(False)
-            self.widgets["retire_task_button"].setEnabled(False)
-            self.widgets["delete_task_button"].setEnabled(False)
+            self._set_editing_enabled(False)
+            self._set_filters_enabled(False)
             # Get tasks from selected date
             success, open_tasks, message = self.db.get_former_open_tasks(selected_date)
             if success:
-                self._populate_tasks(
-                    open_tasks, self.widgets["todo_list"], self.todo_tasks
-                )
+                self._populate_tasks(open_tasks, self.widgets["todo_list"])
             else:
                 QMessageBox.warning(
                     self, "Error", f"Failed to query open tasks: {message}"
@@ -638,15 +1353,163 @@ class Tab(QWidget):
                 time_frame, selected_date
             )
             if success:
-                self._populate_tasks(
-                    closed_tasks, self.widgets["completed_list"], self.completed_tasks
-                )
+                self._populate_tasks(closed_tasks, self.widgets["completed_list"])
             else:
                 QMessageBox.warning(
                     self, "Error", f"Failed to query completed tasks: {message}"
                 )
 
 
+# ==========================================================================================
+# ==========================================================================================
+
+
+class AggregateTab(QWidget):
+    """
+    Class to display the open and completed tasks of every open database in a
+    single read-only tab.  Each database is queried on its own worker connection in
+    a QThreadPool and the results are merged into the lists as they arrive, so a
+    slow database does not hold up the others.
+
+    :param fnt: A QFont object
+    :param database_func: A callable that returns a dictionary mapping the tab name
+                          of each open database to its name and path length
+    :param thread_pool: The QThreadPool used to run the queries, the global thread
+                        pool is used if None
+    """
+
+    def __init__(
+        self,
+        fnt: QFont,
+        database_func: Callable[[], dict[str, str]],
+        thread_pool: QThreadPool = None,
+    ):
+        super().__init__()
+        self.tab_name = "All Databases"
+        self.database_func = database_func
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self.tab_layout = QVBoxLayout(self)
+        self._workers = {}
+        self._pending = set()
+
+        self.widgets = {
+            "todo_list_label": QLabel("Todo List"),
+            "todo_list": TaskList(fnt),
+            "completed_list_label": QLabel("Completed List"),
+            "completed_list": TaskList(fnt),
+            "status_label": QLabel(""),
+            "refresh_button": PushButton("Refresh", fnt),
+            "drop_down_menu": DropDownMenu(["Day", "Week", "Month", "Year", "All"]),
+        }
+
+        self.tab_layout.addWidget(self.widgets["todo_list_label"])
+        self.tab_layout.addWidget(self.widgets["todo_list"])
+        self.tab_layout.addWidget(self.widgets["completed_list_label"])
+        self.tab_layout.addWidget(self.widgets["completed_list"])
+        self.tab_layout.addWidget(self.widgets["refresh_button"])
+
+        final_row_layout = QHBoxLayout()
+        final_row_layout.addWidget(self.widgets["drop_down_menu"])
+        final_row_layout.addWidget(self.widgets["status_label"])
+        self.tab_layout.addLayout(final_row_layout)
+
+        self.widgets["refresh_button"].clicked.connect(self.refresh)
+        self.widgets["drop_down_menu"].currentTextChanged.connect(self.refresh)
+
+    # ------------------------------------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """
+        Method to query every open database again.  Queries still running from a
+        previous refresh are cancelled and their results discarded.
+        """
+        self.cancel()
+        self.widgets["todo_list"].clear()
+        self.widgets["completed_list"].clear()
+
+        time_frame = self.widgets["drop_down_menu"].currentText().upper()
+        current_date = QDate.currentDate().toString("yyyy-MM-dd")
+        for name, db_name in self.database_func().items():
+            job = partial(self._select_tasks, time_frame, current_date)
+            worker = DatabaseWorker(name, db_name, job)
+            worker.signals.result.connect(self._merge_results)
+            worker.signals.error.connect(self._report_error)
+            self._workers[name] = worker
+        self._pending = set(self._workers)
+        self._update_status()
+        for worker in self._workers.values():
+            self.thread_pool.start(worker)
+
+    # ------------------------------------------------------------------------------------------
+
+    def cancel(self) -> None:
+        """
+        Method to cancel every outstanding query
+        """
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers = {}
+        self._pending = set()
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    @staticmethod
+    def _select_tasks(time_frame: str, date: str, database: ToDoDatabase):
+        """
+        Job run on a worker connection to select the open tasks and the tasks
+        completed in the time frame ending on date
+        """
+        success, open_tasks, message = database.select_open_tasks()
+        if not success:
+            return False, None, message
+        success, closed_tasks, message = database.select_closed_tasks(time_frame, date)
+        if not success:
+            return False, None, message
+        return True, (open_tasks, closed_tasks), message
+
+    # ------------------------------------------------------------------------------------------
+
+    def _merge_results(self, key: str, payload) -> None:
+        """
+        Method to append the tasks returned by one worker to the task lists
+        """
+        worker = self._workers.get(key)
+        if worker is None or worker.signals is not self.sender():
+            return  # Result from a cancelled refresh
+        for df, list_widget in zip(
+            payload, (self.widgets["todo_list"], self.widgets["completed_list"])
+        ):
+            if not df.empty:
+                labels = f"[{key}] " + df["task"].astype(str)
+                list_widget.append_tasks(df["task_id"].to_numpy(), labels.to_numpy())
+        self._pending.discard(key)
+        self._update_status()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _report_error(self, key: str, message: str) -> None:
+        """
+        Method to record a database that could not be queried
+        """
+        worker = self._workers.get(key)
+        if worker is None or worker.signals is not self.sender():
+            return
+        self._pending.discard(key)
+        self._update_status()
+        QMessageBox.warning(self, "Error", f"Failed to query {key}: {message}")
+
+    # ------------------------------------------------------------------------------------------
+
+    def _update_status(self) -> None:
+        """
+        Method to display how many databases have been loaded
+        """
+        total = len(self._workers)
+        loaded = total - len(self._pending)
+        self.widgets["status_label"].setText(f"Loaded {loaded} of {total} databases")
+
+
 # ==========================================================================================
 # ==========================================================================================
 # eof
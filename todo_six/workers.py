@@ -0,0 +1,316 @@
+# Import necessary packages here
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    workers.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the classes used to run database work on background
+#          threads so the todo_six user interface remains responsive
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a DatabaseWorker.  The ``result`` signal carries the worker
+    key and the payload returned by the job, and the ``error`` signal carries the
+    worker key and a description of the failure.
+    """
+
+    result = pyqtSignal(str, object)
+    error = pyqtSignal(str, str)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class DatabaseWorker(QRunnable):
+    """
+    Class that runs a job against a database on a QThreadPool thread.
+
+    Qt SQL connections may only be used from the thread that created them, so the
+    worker opens its own ToDoDatabase connection inside the pool thread, passes it
+    to the job and removes the connection before it finishes.  Results are delivered
+    through the ``signals`` attribute, which is safe to connect to slots on the GUI
+    thread.
+
+    :param key: A string that identifies the worker in the emitted signals
+    :param db_name: The name and path length to the SQLite database
+    :param job: A callable that accepts an open ToDoDatabase and returns a tuple
+                containing a boolean, a payload and a string, following the
+                convention of the ToDoDatabase methods
+    :param read_only: If True the worker opens the database read-only
+    :param immutable: If True the worker opens the database read-only and
+                      immutable, see SQLiteManager
+
+    Example:
+
+    .. code-block::
+
+        from PyQt6.QtCore import QThreadPool
+        from todo_six.workers import DatabaseWorker
+
+        worker = DatabaseWorker("chores", "chores.db", lambda db: db.select_open_tasks())
+        worker.signals.result.connect(lambda key, df: print(key, len(df)))
+        QThreadPool.globalInstance().start(worker)
+    """
+
+    def __init__(
+        self,
+        key: str,
+        db_name: str,
+        job: Callable[[ToDoDatabase], tuple[bool, Any, str]],
+        read_only: bool = False,
+        immutable: bool = False,
+    ):
+        super().__init__()
+        self.key = key
+        self.db_name = db_name
+        self.job = job
+        self.read_only = read_only
+        self.immutable = immutable
+        self.signals = WorkerSignals()
+        self._cancelled = False
+
+    # ------------------------------------------------------------------------------------------
+
+    def cancel(self) -> None:
+        """
+        Method to cancel the worker.  A cancelled worker that has not started will
+        not run, and a running worker will not emit its result.
+        """
+        self._cancelled = True
+
+    # ------------------------------------------------------------------------------------------
+
+    def is_cancelled(self) -> bool:
+        """
+        Method to determine if the worker has been cancelled
+
+        :return: True if the worker has been cancelled, False otherwise
+        """
+        return self._cancelled
+
+    # ------------------------------------------------------------------------------------------
+
+    def run(self) -> None:
+        """
+        Opens a connection, runs the job and emits the result.  This method is
+        called by the QThreadPool and should not be called directly.
+        """
+        if self._cancelled:
+            return
+        try:
+            success, payload, message = self._run_job()
+        except Exception as error:  # Exceptions must not escape a pool thread
+            sys.stderr.write(f"Worker {self.key} failed: {error}\n")
+            success, payload, message = False, None, str(error)
+
+        if self._cancelled:
+            return
+        if success:
+            self.signals.result.emit(self.key, payload)
+        else:
+            self.signals.error.emit(self.key, message)
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _run_job(self) -> tuple[bool, Any, str]:
+        """
+        Opens the worker's own connection, runs the job and removes the connection
+        """
+        database = ToDoDatabase(
+            self.db_name, read_only=self.read_only, immutable=self.immutable
+        )
+        try:
+            success, message = database.open_db()
+            if not success:
+                return False, None, message
+            return self.job(database)
+        finally:
+            database.remove_db()
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+class DatabaseScheduler(QObject):
+    """
+    Base class of the schedulers that run a job against each registered database on
+    a QThreadPool.  Every job runs in its own DatabaseWorker, and so on its own
+    connection, and a database whose previous job is still running is skipped.
+    Subclasses return the job from ``_job``, publish its payload from ``_publish``
+    and start ``_timer`` when the jobs are due.  Failures are written to stderr and
+    emitted through ``failed``.
+
+    :param thread_pool: The QThreadPool used to run the jobs, the global thread pool
+                        is used if None
+    :param parent: The parent QObject
+    """
+
+    failed = pyqtSignal(str)
+    # Name of the job in the messages of failures
+    _label = "Job"
+
+    def __init__(self, thread_pool: QThreadPool = None, parent: QObject = None):
+        super().__init__(parent)
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._databases = []
+        self._workers = {}
+        self._timer = QTimer(self)
+
+    # ------------------------------------------------------------------------------------------
+
+    def add_database(self, db_name: str) -> None:
+        """
+        Method to include a database in the scheduled runs
+
+        :param db_name: The name and path length of the database
+        """
+        if db_name not in self._databases:
+            self._databases.append(db_name)
+
+    # ------------------------------------------------------------------------------------------
+
+    def remove_database(self, db_name: str) -> None:
+        """
+        Method to exclude a database from the scheduled runs.  A job for the
+        database that is already running is allowed to finish.
+
+        :param db_name: The name and path length of the database
+        """
+        if db_name in self._databases:
+            self._databases.remove(db_name)
+
+    # ------------------------------------------------------------------------------------------
+
+    def stop(self) -> None:
+        """
+        Method to stop the timer and cancel jobs that have not started
+        """
+        self._timer.stop()
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers = {}
+
+    # ------------------------------------------------------------------------------------------
+
+    def is_active(self) -> bool:
+        """
+        Method to determine if runs are being scheduled
+
+        :return: True if the timer is running, False otherwise
+        """
+        return self._timer.isActive()
+
+    # ------------------------------------------------------------------------------------------
+
+    def is_running(self) -> bool:
+        """
+        Method to determine if a job has been started and not yet reported
+
+        :return: True if a worker is outstanding, False otherwise
+        """
+        return bool(self._workers)
+
+    # ------------------------------------------------------------------------------------------
+
+    def run_now(self) -> None:
+        """
+        Method to start the job of every registered database on pool threads.  A
+        database whose previous job is still running is skipped.
+        """
+        job = self._job()
+        for db_name in self._databases:
+            if db_name in self._workers:
+                continue
+            worker = DatabaseWorker(db_name, db_name, job)
+            worker.signals.result.connect(self._report)
+            worker.signals.error.connect(self._report_error)
+            self._workers[db_name] = worker
+            self.thread_pool.start(worker)
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _job(self) -> Callable[[ToDoDatabase], tuple[bool, Any, str]]:
+        """
+        Method to return the job run against each database
+        """
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------------------------------
+
+    def _publish(self, key: str, payload: Any) -> None:
+        """
+        Method to publish the payload of a job that succeeded
+        """
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------------------------------
+
+    def _report(self, key: str, payload: Any) -> None:
+        """
+        Method to publish a finished job of a worker that is still outstanding
+        """
+        if self._workers.pop(key, None) is None:
+            return
+        self._publish(key, payload)
+
+    # ------------------------------------------------------------------------------------------
+
+    def _report_error(self, key: str, message: str) -> None:
+        """
+        Method to publish a job that failed
+        """
+        if self._workers.pop(key, None) is None:
+            return
+        sys.stderr.write(f"{self._label} of {key} failed: {message}\n")
+        self.failed.emit(message)
+
+
+# ==========================================================================================
+# ==========================================================================================
+
+
+def load_tasks_snapshot(
+    time_frame: str, database: ToDoDatabase
+) -> tuple[bool, dict, str]:
+    """
+    Job that validates a database and reads everything a Tab needs to display it.
+    The database must pass ``PRAGMA quick_check`` and contain a tasks table, and is
+    then read by :meth:`ToDoDatabase.bootstrap`.
+
+    :param time_frame: 'DAY', 'WEEEK', 'MONTH', 'YEAR', 'ALL', the time frame of the
+                       completed tasks
+    :param database: An open ToDoDatabase object
+    :return: A tuple containing a boolean, a dictionary and a string.  The dictionary
+             contains the keys ``oldest_date``, ``open_tasks`` and ``closed_tasks``
+             expected by Tab.finish_loading
+    """
+    success, result, message = database.db_query("PRAGMA quick_check;")
+    if not success:
+        return False, {}, message
+    check = result.value(0) if result.next() else ""
+    if check != "ok":
+        return False, {}, f"{database.db_name} failed the integrity check: {check}"
+
+    return database.bootstrap(time_frame, create=False)
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof
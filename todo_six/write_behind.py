@@ -0,0 +1,342 @@
+# Import necessary packages here
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from todo_six.database import ToDoDatabase
+
+# ==========================================================================================
+# ==========================================================================================
+
+# File:    write_behind.py
+# Date:    October 19, 2026
+# Author:  Jonathan A. Webb
+# Purpose: This file contains the queue that lets a todo_six tab display new and
+#          completed tasks at once while a background thread commits them in groups
+# ==========================================================================================
+# ==========================================================================================
+# Insert Code here
+
+
+class WriteBehindQueue(QObject):
+    """
+    Class that queues task writes in memory and commits them on a background thread.
+
+    Each write is added to an in-memory queue and the method returns immediately, so
+    the caller never waits on the disk.  A committer thread with its own connection
+    waits ``interval`` ms after the first queued write for more writes to arrive and
+    then commits every queued write in a single transaction, so a burst of entries
+    costs one disk sync rather than one per task.  A task inserted through the queue
+    is identified by a negative provisional id until its group is committed, and
+    provisional ids may be passed to :meth:`complete_task` and :meth:`delete_task`
+    at any time.  ``committed`` is emitted after each group with a dictionary that
+    maps the provisional ids of the group to their database ids.
+
+    Durability: a write is only durable once the group containing it has been
+    committed, which normally happens within ``interval`` ms plus the time of one
+    commit.  Writes still in the queue are lost if the process is killed or the
+    machine loses power, although the database itself is never left inconsistent.
+    :meth:`flush` blocks until every queued write is committed and :meth:`close`
+    flushes before stopping the thread, so an orderly shutdown loses nothing.  If a
+    group fails to commit it is rolled back and ``failed`` is emitted.
+
+    :param db_name: The name and path length to the SQLite database
+    :param interval: The time in milliseconds that writes are gathered into a group
+    :param backend: 'qt' or 'sqlite3', the storage backend of the committer
+    :param parent: The parent QObject
+
+    Example:
+
+    .. code-block::
+
+        from todo_six.write_behind import WriteBehindQueue
+
+        writes = WriteBehindQueue("chores.db", interval=5)
+        writes.start()
+        task_id = writes.insert_task("Mow lawn")
+        writes.complete_task(task_id)
+        writes.close()
+        print(task_id)
+
+        >> -1
+    """
+
+    committed = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+    _group_done = pyqtSignal(int, dict, str)
+
+    def __init__(
+        self, db_name: str, interval: int = 5, backend: str = "qt", parent: QObject = None
+    ):
+        super().__init__(parent)
+        self.db_name = db_name
+        self.interval = interval
+        self.backend = backend
+        self._writes = queue.Queue()
+        self._provisional = itertools.count(-1, -1)
+        self._outstanding = 0
+        self._thread = None
+        self._group_done.connect(self._finish_group)
+
+    # ------------------------------------------------------------------------------------------
+
+    def start(self) -> tuple[bool, str]:
+        """
+        Method to open the committer connection and start the committer thread
+
+        :return: A tuple containing a boolean and a string.  A boolean of True
+                 indicates the operation was successful, and the string contains a
+                 description of the result
+        """
+        if self.is_active():
+            return True, f"Write-behind queue of {self.db_name} is already running"
+        ready = Future()
+        self._thread = threading.Thread(
+            target=self._commit_loop, args=(ready,), name="todo_six-write-behind"
+        )
+        self._thread.start()
+        success, message = ready.result()
+        if not success:
+            self._thread.join()
+            self._thread = None
+        return success, message
+
+    # ------------------------------------------------------------------------------------------
+
+    def is_active(self) -> bool:
+        """
+        Method to determine if the committer thread is running
+
+        :return: True if writes are being committed, False otherwise
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    # ------------------------------------------------------------------------------------------
+
+    def insert_task(self, task: str) -> int:
+        """
+        Method to queue the insertion of a task
+
+        :param task: A todo list task represented as a character string
+        :return: The negative provisional id of the task
+        """
+        task_id = next(self._provisional)
+        self._put("insert_task", task_id, task)
+        return task_id
+
+    # ------------------------------------------------------------------------------------------
+
+    def complete_task(self, task_id: int) -> None:
+        """
+        Method to queue the completion of a task
+
+        :param task_id: The database id or provisional id of the task
+        """
+        self._put("complete_task", task_id)
+
+    # ------------------------------------------------------------------------------------------
+
+    def delete_task(self, task_id: int) -> None:
+        """
+        Method to queue the deletion of a task
+
+        :param task_id: The database id or provisional id of the task
+        """
+        self._put("delete_task", task_id)
+
+    # ------------------------------------------------------------------------------------------
+
+    def complete_tasks(self, task_ids: list[int]) -> None:
+        """
+        Method to queue the completion of several tasks as one write, which is
+        recorded as one operation in the journal of the database
+
+        :param task_ids: The database ids or provisional ids of the tasks
+        """
+        self._put("complete_tasks", tuple(task_ids))
+
+    # ------------------------------------------------------------------------------------------
+
+    def delete_tasks(self, task_ids: list[int]) -> None:
+        """
+        Method to queue the deletion of several tasks as one write, which is
+        recorded as one operation in the journal of the database
+
+        :param task_ids: The database ids or provisional ids of the tasks
+        """
+        self._put("delete_tasks", tuple(task_ids))
+
+    # ------------------------------------------------------------------------------------------
+
+    def pending(self) -> int:
+        """
+        Method to return the number of queued writes whose group has not yet been
+        reported through ``committed``
+
+        :return: The number of outstanding writes
+        """
+        return self._outstanding
+
+    # ------------------------------------------------------------------------------------------
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Method to block until every write queued so far has been committed
+
+        :param timeout: The longest time in seconds to wait, no limit if None
+        :return: True if the writes were committed, False if the timeout expired
+        """
+        if not self.is_active() or self._outstanding == 0:
+            return True
+        done = threading.Event()
+        self._writes.put(done)
+        return done.wait(timeout)
+
+    # ------------------------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        Method to commit every queued write, close the committer connection and stop
+        the thread.  The queue can be started again afterwards.
+        """
+        if not self.is_active():
+            return
+        self._writes.put(None)
+        self._thread.join()
+        self._thread = None
+
+    # ==========================================================================================
+    # PRIVATE-LIKE METHODS
+
+    def _put(self, method: str, task_id: int, *args) -> None:
+        """
+        Adds a write to the queue
+        """
+        if not self.is_active():
+            raise RuntimeError(f"Write-behind queue of {self.db_name} is not running")
+        self._outstanding += 1
+        self._writes.put((method, task_id, args))
+
+    # ------------------------------------------------------------------------------------------
+
+    def _commit_loop(self, ready: Future) -> None:
+        """
+        Runs on the committer thread, gathering queued writes into groups until the
+        None sentinel is received
+        """
+        database = ToDoDatabase(self.db_name, backend=self.backend)
+        success, message = database.open_db()
+        ready.set_result((success, message))
+        if not success:
+            database.remove_db()
+            return
+
+        database_ids = {}
+        running = True
+        while running:
+            group = self._gather()
+            writes = [item for item in group if isinstance(item, tuple)]
+            if writes:
+                self._commit(database, writes, database_ids)
+            for item in group:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    item.set()
+        database.remove_db()
+
+    # ------------------------------------------------------------------------------------------
+
+    def _gather(self) -> list:
+        """
+        Waits for a queued item and collects the writes that arrive within the
+        interval, stopping early at a flush event or the sentinel
+        """
+        group = [self._writes.get()]
+        deadline = time.monotonic() + self.interval / 1000
+        while isinstance(group[-1], tuple):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                group.append(self._writes.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return group
+
+    # ------------------------------------------------------------------------------------------
+
+    def _commit(self, database: ToDoDatabase, writes: list, database_ids: dict) -> None:
+        """
+        Applies a group of writes in one transaction and reports the new database
+        ids and any errors to the thread of the queue
+        """
+        owns_transaction = database.con.transaction()
+        new_ids = {}
+        errors = []
+        for method, task_id, args in writes:
+            # A failed write is rolled back alone, the rest of the group commits
+            database.db_query("SAVEPOINT queued_write;")
+            success, message = self._apply(
+                database, method, task_id, args, new_ids, database_ids
+            )
+            if not success:
+                database.db_query("ROLLBACK TO queued_write;")
+                errors.append(message)
+            database.db_query("RELEASE queued_write;")
+        if owns_transaction and not database.con.commit():
+            database.con.rollback()
+            new_ids = {}
+            errors = [f"Failed to commit {len(writes)} tasks to {self.db_name}"]
+        database_ids.update(new_ids)
+        self._group_done.emit(len(writes), new_ids, "\n".join(errors))
+
+    # ------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _apply(
+        database: ToDoDatabase,
+        method: str,
+        task_id,
+        args: tuple,
+        new_ids: dict,
+        database_ids: dict,
+    ) -> tuple[bool, str]:
+        """
+        Applies one queued write.  A new task is added to ``new_ids``, and the
+        provisional ids of a completion or deletion, or of the tuple of tasks of a
+        bulk write, are replaced by the ids the tasks were saved under.
+        """
+        if method == "insert_task":
+            success, message, database_id = database.insert_task(*args)
+            if success:
+                new_ids[task_id] = int(database_id)
+            return success, message
+        task_ids = task_id if isinstance(task_id, tuple) else (task_id,)
+        task_ids = [new_ids.get(i, database_ids.get(i, i)) for i in task_ids]
+        unsaved = [str(task_id) for task_id in task_ids if task_id < 0]
+        if unsaved:
+            return False, f"Task id {', '.join(unsaved)} was never saved"
+        if isinstance(task_id, tuple):
+            return getattr(database, method)(task_ids)
+        return getattr(database, method)(task_ids[0])
+
+    # ------------------------------------------------------------------------------------------
+
+    def _finish_group(self, count: int, new_ids: dict, error: str) -> None:
+        """
+        Runs on the thread of the queue once a group has been committed
+        """
+        self._outstanding = max(self._outstanding - count, 0)
+        if error:
+            self.failed.emit(error)
+        self.committed.emit(new_ids)
+
+
+# ==========================================================================================
+# ==========================================================================================
+# eof